@@ -0,0 +1,129 @@
+from typing import Any, Callable
+from argparse import ArgumentParser
+from json import dumps
+from pathlib import Path
+from platform import python_version
+from resource import getrusage, RUSAGE_SELF
+from sys import path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+import tracemalloc
+path.insert(0, str(Path(__file__).parent.parent))
+from jsonclasses.cgraph import CGraph
+from jsonclasses_cli.package import render
+from jsonclasses_cli.utils.import_app import reload_app
+from jsonclasses_cli.utils.resolve_cgraph import resolve_cgraph
+from jsonclasses_cli.utils.write_file import write_file
+from jsonclasses_cli.version import version
+from synthetic import synthetic_app
+
+
+CGRAPH_NAME = 'benchmark'
+
+
+def benchmark(models: int,
+              fields: int,
+              enums: int,
+              links: float,
+              join_table_ratio: float,
+              langs: list[str],
+              validate: bool = False,
+              repeat: int = 3,
+              seed: int = 0) -> dict[str, Any]:
+    with TemporaryDirectory() as temp_dir:
+        dest = Path(temp_dir)
+        app_file = dest / 'benchmark_app.py'
+        app_file.write_text(synthetic_app(models, fields, enums, links, join_table_ratio, CGRAPH_NAME, seed))
+        runs = [_run(dest, app_file, langs, validate, False) for _ in range(repeat)]
+        traced = _run(dest, app_file, langs, validate, True)
+        cgraph = CGraph(CGRAPH_NAME)
+        stages = {
+            name: {
+                'seconds': min(run[name] for run in runs),
+                'runs': [run[name] for run in runs],
+                'peak_bytes': traced[name],
+            } for name in runs[0].keys()
+        }
+        return {
+            'params': {
+                'models': models,
+                'fields': fields,
+                'enums': enums,
+                'links': links,
+                'join_table_ratio': join_table_ratio,
+                'langs': langs,
+                'validate': validate,
+                'repeat': repeat,
+                'seed': seed,
+            },
+            'environment': {
+                'python': python_version(),
+                'jsonclasses_cli': version,
+            },
+            'schema': {
+                'models': len(cgraph._map),
+                'enums': len(cgraph._enum_map),
+                'fields': sum(len(cdef.fields) for cdef in cgraph._map.values()),
+            },
+            'output_bytes': {
+                lang: sum(len(c) for c in render(dest, cgraph, lang, validate).values()) for lang in langs
+            },
+            'stages': stages,
+            'maxrss_kb': getrusage(RUSAGE_SELF).ru_maxrss,
+        }
+
+
+def _run(dest: Path, app_file: Path, langs: list[str], validate: bool, trace: bool) -> dict[str, float]:
+    result: dict[str, float] = {}
+    measure = _traced if trace else _timed
+    result['import'] = measure(lambda: reload_app(app_file, CGRAPH_NAME))
+    cgraph = CGraph(CGRAPH_NAME)
+    result['analysis'] = measure(lambda: resolve_cgraph(cgraph))
+    rendered: dict[Path, str] = {}
+    for lang in langs:
+        result[f'render.{lang}'] = measure(lambda: rendered.update(render(dest, cgraph, lang, validate)))
+    result['write'] = measure(lambda: _write(rendered))
+    return result
+
+
+def _timed(stage: Callable[[], Any]) -> float:
+    start = perf_counter()
+    stage()
+    return perf_counter() - start
+
+
+def _traced(stage: Callable[[], Any]) -> float:
+    tracemalloc.start()
+    try:
+        stage()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _write(rendered: dict[Path, str]) -> None:
+    for (file, content) in rendered.items():
+        file.unlink(missing_ok=True)
+        write_file(file, content, True)
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Benchmark code generation over a synthetic schema.')
+    parser.add_argument('--models', type=int, default=50, help='number of models')
+    parser.add_argument('--fields', type=int, default=10, help='number of scalar fields per model')
+    parser.add_argument('--enums', type=int, default=5, help='number of enums')
+    parser.add_argument('--links', type=float, default=0.1, help='probability that two models are linked')
+    parser.add_argument('--join-table-ratio', type=float, default=0.3, help='fraction of links using a join table')
+    parser.add_argument('--lang', action='append', choices=['ts', 'swift', 'kotlin', 'python'], help='languages to render')
+    parser.add_argument('--validate', action='store_true', help='render client side input validators')
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs per stage')
+    parser.add_argument('--seed', type=int, default=0, help='random seed for links')
+    parser.add_argument('--output', type=Path, help='write JSON results to this file')
+    args = parser.parse_args()
+    result = benchmark(args.models, args.fields, args.enums, args.links, args.join_table_ratio,
+                       args.lang or ['ts', 'swift'], args.validate, args.repeat, args.seed)
+    content = dumps(result, indent=2)
+    if args.output is not None:
+        args.output.write_text(content + '\n')
+    else:
+        print(content)
@@ -0,0 +1,76 @@
+from random import Random
+
+
+SCALAR_TYPES = [
+    ('str', 'types.str.maxlength(255)'),
+    ('int', 'types.int.min(0)'),
+    ('float', 'types.float'),
+    ('bool', 'types.bool'),
+    ('datetime', 'types.datetime'),
+]
+
+
+def synthetic_app(models: int,
+                  fields: int,
+                  enums: int,
+                  links: float,
+                  join_table_ratio: float,
+                  cgraph_name: str = 'benchmark',
+                  seed: int = 0) -> str:
+    random = Random(seed)
+    body: dict[int, list[str]] = {i: [] for i in range(models)}
+    for i in range(models):
+        for j in range(fields):
+            body[i].append(_scalar_field(i, j, enums))
+    link = 0
+    for i in range(models):
+        for j in range(i + 1, models):
+            if random.random() >= links:
+                continue
+            if random.random() < join_table_ratio:
+                body[i].append(f"    many{link}: Annotated[list[Model{j}], linkedthru('rev{link}')]")
+                body[j].append(f"    rev{link}: Annotated[list[Model{i}], linkedthru('many{link}')]")
+            else:
+                body[i].append(f"    one{link}: Annotated[Model{j}, linkto]")
+                body[j].append(f"    rev{link}: Annotated[list[Model{i}], linkedby('one{link}')]")
+            link += 1
+    lines = [
+        'from __future__ import annotations',
+        'from datetime import datetime',
+        'from enum import Enum',
+        'from typing import Annotated',
+        'from jsonclasses import jsonclass, jsonenum, types, linkto, linkedby, linkedthru',
+        'from jsonclasses_server import api',
+        '',
+    ]
+    for k in range(enums):
+        lines.extend([
+            '',
+            f"@jsonenum(class_graph='{cgraph_name}')",
+            f'class Enum{k}(Enum):',
+            *[f'    VALUE{v} = {v}' for v in range(4)],
+            '',
+        ])
+    for i in range(models):
+        lines.extend([
+            '',
+            '@api',
+            f"@jsonclass(class_graph='{cgraph_name}')",
+            f'class Model{i}:',
+            '    id: str = types.readonly.str.primary.mongoid.required',
+            *body[i],
+            '    created_at: datetime = types.readonly.datetime.tscreated.required',
+            '    updated_at: datetime = types.readonly.datetime.tsupdated.required',
+            '',
+        ])
+    return '\n'.join(lines)
+
+
+def _scalar_field(model: int, field: int, enums: int) -> str:
+    kinds = len(SCALAR_TYPES) + (1 if enums > 0 else 0)
+    kind = (model + field) % kinds
+    required = '.required' if field % 3 == 0 else ''
+    if kind == len(SCALAR_TYPES):
+        return f"    field{field}: Enum{(model + field) % enums} = types.enum('Enum{(model + field) % enums}'){required}"
+    (annotation, type_) = SCALAR_TYPES[kind]
+    return f'    field{field}: {annotation} = {type_}{required}'
@@ -1,13 +1,13 @@
 from os import getcwd
+from sys import exit as sys_exit
 from pathlib import Path
-from click import group, argument, option, echo
-from .new import new as execute_new
-from .upgrade import upgrade as execute_upgrade
-from .package import package as execute_package
-from .console import console as execute_console
+from click import group, argument, option, echo, BadParameter, Path as click_path
 from .version import version
 
 
+DAEMON_SOCKET = '.jsonclasses.sock'
+
+
 def print_version(ctx, param, value):
     if not value or ctx.resilient_parsing:
         return
@@ -15,6 +15,16 @@ def print_version(ctx, param, value):
     ctx.exit()
 
 
+def parse_model_counts(ctx, param, value):
+    counts: dict[str, int] = {}
+    for item in value:
+        (name, _, count) = item.partition('=')
+        if not count.isdigit():
+            raise BadParameter(f'{item} is not like Model=N.')
+        counts[name] = int(count)
+    return counts
+
+
 @group()
 @option('-v', '--version', is_flag=True, callback=print_version, expose_value=False, is_eager=True, help='Show version and exit.')
 def app():
@@ -23,6 +33,7 @@ def app():
 
 @app.command(help='Upgrade this CLI to the newest version.')
 def upgrade():
+    from .upgrade import upgrade as execute_upgrade
     execute_upgrade()
 
 
@@ -33,35 +44,240 @@ def upgrade():
 @option('-a', '--include-admin', is_flag=True, required=False, default=None, help='Whether include admin.')
 @option('-g', '--git-init/--no-git-init', ' /-G', is_flag=True, required=False, default=None, help='Whether create a git repo.')
 @option('-m', '--venv/--no-venv', ' /-M', is_flag=True, required=False, default=None, help='Whether create a venv.')
+@option('-p', '--production', is_flag=True, required=False, default=None, help='Whether include production serving config.')
+@option('--refresh', is_flag=True, default=False, help='Whether rebuild the cached dependency wheels, which otherwise expire after a day.')
 def new(name: str,
         interactive: bool | None,
         include_user: bool | None,
         include_admin: bool | None,
         git_init: bool | None,
-        venv: bool | None):
+        venv: bool | None,
+        production: bool | None,
+        refresh: bool):
+    from .new import new as execute_new
     execute_new(Path(getcwd()) / name,
                 interactive=interactive,
                 include_user=include_user,
                 include_admin=include_admin,
                 git_init=git_init,
-                venv=venv)
+                venv=venv,
+                production=production,
+                refresh=refresh)
+
+
+@app.command(help='Start the production server.')
+@argument('file', default='app.py')
+@option('-h', '--host', default=None, help='Host to bind, defaults to the config\'s.')
+@option('-p', '--port', type=int, default=None, help='Port to bind, defaults to the config\'s.')
+@option('-w', '--workers', type=int, default=None, help='Number of worker processes, defaults to the config\'s.')
+def serve(file: str | None, host: str | None, port: int | None, workers: int | None):
+    from .serve import serve as execute_serve
+    dest = Path(getcwd())
+    execute_serve(dest, dest / file, host, port, workers)
 
 
 @app.command(help='Launch an interactive console.')
 @argument('file', default='app.py')
-def console(file: str | None):
+@option('--fast', is_flag=True, default=False, help='Whether show the prompt before the app is imported.')
+def console(file: str | None, fast: bool):
+    from .console import console as execute_console
     dest = Path(getcwd())
     app_file = dest / file
-    execute_console(dest, app_file)
+    execute_console(dest, app_file, fast)
 
 
 @app.command(help='Generate a client package.')
 @argument('lang')
 @argument('file', default='app.py')
-def package(lang: str, file: str | None):
+@option('--validate', is_flag=True, default=False, help='Whether generate client side input validators.')
+@option('-w', '--watch', is_flag=True, default=False, help='Whether regenerate when app files change.')
+@option('-j', '--jobs', type=int, default=1, help='Number of processes rendering models in parallel, not with --profile or --watch.')
+@option('--profile', is_flag=True, default=False, help='Whether print per phase and per model timings.')
+@option('--profile-trace', type=click_path(dir_okay=False, path_type=Path), default=None, help='Write a Chrome trace event JSON file.')
+@option('--profile-stats', type=click_path(dir_okay=False, path_type=Path), default=None, help='Write a cProfile stats file.')
+def package(lang: str,
+            file: str | None,
+            validate: bool,
+            watch: bool,
+            jobs: int,
+            profile: bool,
+            profile_trace: Path | None,
+            profile_stats: Path | None):
     dest = Path(getcwd())
     app_file = dest / file
-    execute_package(dest, app_file, lang)
+    profiling = profile or profile_trace is not None or profile_stats is not None
+    if jobs != 1 and (profiling or watch):
+        echo('--jobs cannot be combined with --profile or --watch', err=True)
+        sys_exit(1)
+    if profiling:
+        from .package.profile import profile as execute_profile
+        execute_profile(dest, app_file, lang, validate=validate, trace_file=profile_trace, stats_file=profile_stats)
+    elif watch:
+        from .package.watch import watch as execute_watch
+        execute_watch(dest, app_file, lang, validate=validate)
+    else:
+        from .package import package as execute_package
+        execute_package(dest, app_file, lang, validate=validate, jobs=jobs)
+
+
+@app.group(help='Run or talk to a code generation daemon.')
+def daemon():
+    pass
+
+
+@daemon.command(help='Start a daemon which keeps the app loaded.')
+@argument('file', default='app.py')
+def start(file: str | None):
+    from .daemon.server import daemon as execute_daemon
+    dest = Path(getcwd())
+    execute_daemon(dest, dest / file, dest / DAEMON_SOCKET)
+
+
+@daemon.command(help='Stop the running daemon.')
+def stop():
+    from .daemon import client as daemon_client
+    if not daemon_client.stop(Path(getcwd()) / DAEMON_SOCKET):
+        sys_exit(1)
+
+
+@daemon.command(help='Generate a client package through the daemon, or in process without one.')
+@argument('lang')
+@argument('file', default='app.py')
+@option('--validate', is_flag=True, default=False, help='Whether generate client side input validators.')
+def generate(lang: str, file: str | None, validate: bool):
+    from .daemon import client as daemon_client
+    dest = Path(getcwd())
+    if not daemon_client.generate(dest / DAEMON_SOCKET, lang, validate, dest / file):
+        sys_exit(1)
+
+
+@daemon.command(help='Show what generating a client package would change.')
+@argument('lang')
+@argument('file', default='app.py')
+@option('--validate', is_flag=True, default=False, help='Whether generate client side input validators.')
+def diff(lang: str, file: str | None, validate: bool):
+    from .daemon import client as daemon_client
+    dest = Path(getcwd())
+    if not daemon_client.diff(dest / DAEMON_SOCKET, lang, validate, dest / file):
+        sys_exit(1)
+
+
+@daemon.command(help='Print the schema of the loaded app.')
+@argument('file', default='app.py')
+def schema(file: str | None):
+    from .daemon import client as daemon_client
+    dest = Path(getcwd())
+    if not daemon_client.schema(dest / DAEMON_SOCKET, dest / file):
+        sys_exit(1)
+
+
+@app.group(help='Generate load tests for the API.')
+def loadtest():
+    pass
+
+
+@loadtest.command(name='generate', help='Generate an asyncio load test script for the API.')
+@argument('file', default='app.py')
+@option('-o', '--output', type=click_path(dir_okay=False, path_type=Path), default=Path('loadtest.py'), help='Script file to write.')
+@option('--url', default='http://127.0.0.1:8000', help='Default base url of the server under test.')
+def loadtest_generate(file: str | None, output: Path, url: str):
+    from .loadtest import generate as execute_generate
+    dest = Path(getcwd())
+    execute_generate(dest, dest / file, output, url)
+
+
+@app.command(help='Recommend MongoDB indexes for the app.')
+@argument('file', default='app.py')
+@option('-o', '--output', type=click_path(dir_okay=False, path_type=Path), default=None, help='Write a script which creates the indexes.')
+@option('--check', is_flag=True, default=False, help='Whether compare the plan with indexes of a running database.')
+@option('--url', default=None, help='MongoDB connection string, defaults to the app\'s.')
+def indexes(file: str | None, output: Path | None, check: bool, url: str | None):
+    from .indexes import indexes as execute_indexes
+    dest = Path(getcwd())
+    execute_indexes(dest, dest / file, output, url, check)
+
+
+@app.command(help='Insert fake records into the database.')
+@argument('file', default='app.py')
+@option('-c', '--count', type=int, default=100, help='Number of records per model.')
+@option('-m', '--model', 'counts', multiple=True, callback=parse_model_counts, help='Number of records for a model, like User=1000.')
+@option('-b', '--batch-size', type=int, default=1000, help='Number of records per insert.')
+@option('-j', '--jobs', type=int, default=1, help='Number of processes generating and inserting records.')
+@option('--seed', 'random_seed', type=int, default=0, help='Seed of the random generator.')
+@option('--dry-run', is_flag=True, default=False, help='Whether generate records without inserting them.')
+def seed(file: str | None,
+         count: int,
+         counts: dict[str, int],
+         batch_size: int,
+         jobs: int,
+         random_seed: int,
+         dry_run: bool):
+    from .seed import seed as execute_seed
+    try:
+        execute_seed(Path(getcwd()) / file, count, counts, batch_size, jobs, dry_run, random_seed)
+    except ValueError as error:
+        echo(str(error), err=True)
+        sys_exit(1)
+
+
+@app.command(help='Start an in-memory mock API server.')
+@argument('file', default='app.py')
+@option('-h', '--host', default='127.0.0.1', help='Host to bind.')
+@option('-p', '--port', type=int, default=8000, help='Port to bind.')
+@option('-c', '--count', type=int, default=100, help='Number of fake records per model.')
+@option('-m', '--model', 'counts', multiple=True, callback=parse_model_counts, help='Number of fake records for a model, like User=1000.')
+@option('-l', '--latency', type=float, default=0, help='Milliseconds added to every response.')
+@option('--jitter', type=float, default=0, help='Maximum random milliseconds added on top of latency.')
+@option('--seed', 'random_seed', type=int, default=0, help='Seed of the random generator.')
+def mock(file: str | None,
+         host: str,
+         port: int,
+         count: int,
+         counts: dict[str, int],
+         latency: float,
+         jitter: float,
+         random_seed: int):
+    from .mock import mock as execute_mock
+    try:
+        execute_mock(Path(getcwd()) / file, host, port, count, counts, latency, jitter, random_seed)
+    except ValueError as error:
+        echo(str(error), err=True)
+        sys_exit(1)
+
+
+@app.command(name='export', help='Export model collections as NDJSON files.')
+@argument('models', nargs=-1)
+@option('-f', '--file', default='app.py', help='The app file.')
+@option('-d', '--dir', 'directory', type=click_path(file_okay=False, path_type=Path), default=Path('.'), help='Directory to write files into.')
+@option('-z', '--gzip', 'compress', is_flag=True, default=False, help='Whether gzip the files.')
+@option('-b', '--batch-size', type=int, default=1000, help='Number of records per cursor batch.')
+@option('-j', '--jobs', type=int, default=1, help='Number of collections exported in parallel.')
+@option('--url', default=None, help='MongoDB connection string, defaults to the app\'s.')
+def export(models: tuple[str, ...], file: str, directory: Path, compress: bool, batch_size: int, jobs: int, url: str | None):
+    from .transfer import export_models
+    dest = Path(getcwd())
+    try:
+        export_models(dest / directory, dest / file, list(models), url, compress, batch_size, jobs)
+    except ValueError as error:
+        echo(str(error), err=True)
+        sys_exit(1)
+
+
+@app.command(name='import', help='Import model collections from NDJSON files.')
+@argument('models', nargs=-1)
+@option('-f', '--file', default='app.py', help='The app file.')
+@option('-d', '--dir', 'directory', type=click_path(file_okay=False, path_type=Path), default=Path('.'), help='Directory to read files from.')
+@option('-b', '--batch-size', type=int, default=1000, help='Number of records per insert.')
+@option('-j', '--jobs', type=int, default=4, help='Number of inserts in flight.')
+@option('--url', default=None, help='MongoDB connection string, defaults to the app\'s.')
+def import_(models: tuple[str, ...], file: str, directory: Path, batch_size: int, jobs: int, url: str | None):
+    from .transfer import import_models
+    dest = Path(getcwd())
+    try:
+        import_models(dest / directory, dest / file, list(models), url, batch_size, jobs)
+    except ValueError as error:
+        echo(str(error), err=True)
+        sys_exit(1)
 
 
 if __name__ == '__main__':
@@ -1,17 +1,38 @@
+from typing import Any
 from pathlib import Path
 from code import interact
-from sys import path
-from os.path import splitext
-from importlib import import_module
+import sys
 from jsonclasses.isjsonclass import isjsonclass
+from .helpers import install
+from .display import Pager
+from .snapshot import AppLoader, LazyNamespace, read_snapshot, write_snapshot
+from ..utils.import_app import import_app
 
 
-def console(dest: Path, app_file: Path):
-    path.append(str(dest))
-    result = import_module(splitext(app_file.name)[0], str(dest)).__dict__
-    locals = {}
-    for (k, v) in result.items():
-        if isjsonclass(v):
-            locals[k] = v
-    models = ", ".join(list(locals.keys()))
-    interact(banner=f"JSONClasses Console\nAvailable Models: {models}", local=locals)
+def console(dest: Path, app_file: Path, fast: bool = False):
+    (locals, models) = console_namespace(dest, app_file, fast)
+    install(locals)
+    pager = Pager()
+    locals['more'] = pager.more
+    sys.displayhook = pager
+    try:
+        interact(banner=f"JSONClasses Console\nAvailable Models: {models}\nHelpers: bench, profile, explain, sizeof, more", local=locals)
+    finally:
+        sys.displayhook = sys.__displayhook__
+
+
+def console_namespace(dest: Path, app_file: Path, fast: bool = False) -> tuple[dict[str, Any], str]:
+    names = read_snapshot(dest, app_file) if fast else None
+    if names is None:
+        locals = load_models(app_file)
+        if fast:
+            write_snapshot(dest, app_file, list(locals.keys()))
+        return (locals, ", ".join(list(locals.keys())))
+    locals = LazyNamespace(names)
+    locals.loader = AppLoader(dest, app_file, locals)
+    locals.loader.start()
+    return (locals, ", ".join(names) + " (loading app in background)")
+
+
+def load_models(app_file: Path) -> dict[str, Any]:
+    return {k: v for (k, v) in import_app(app_file).__dict__.items() if isjsonclass(v)}
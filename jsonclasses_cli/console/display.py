@@ -0,0 +1,97 @@
+from __future__ import annotations
+from typing import Any
+import builtins
+from sys import __displayhook__
+
+
+COUNT_TIMEOUT_MS = 1000
+
+
+class ListSource:
+
+    def __init__(self, items: list[Any]) -> None:
+        self.items = items
+
+    def count(self) -> int | None:
+        return len(self.items)
+
+    def page(self, offset: int, size: int) -> list[Any]:
+        return self.items[offset:offset + size]
+
+
+class QuerySource:
+
+    def __init__(self, query: Any) -> None:
+        self.query = query
+        self.pipeline = query._build_aggregate_pipeline()
+
+    def count(self) -> int | None:
+        from pymongo.errors import ExecutionTimeout
+        try:
+            result = self.aggregate([*self.pipeline, {'$count': 'count'}], maxTimeMS=COUNT_TIMEOUT_MS)
+        except ExecutionTimeout:
+            return None
+        return result[0]['count'] if len(result) > 0 else 0
+
+    def page(self, offset: int, size: int) -> list[Any]:
+        from jsonclasses_pymongo.decoder import Decoder
+        documents = self.aggregate([*self.pipeline, {'$skip': offset}, {'$limit': size}])
+        return Decoder().decode_root_list(documents, self.query._cls, None, self.query)
+
+    def aggregate(self, pipeline: list[dict[str, Any]], **kwargs: Any) -> list[dict[str, Any]]:
+        from jsonclasses_pymongo.connection import Connection
+        return list(Connection.get_collection(self.query._cls).aggregate(pipeline, **kwargs))
+
+
+class Pager:
+
+    def __init__(self, page_size: int = 20) -> None:
+        self.page_size = page_size
+        self.source: ListSource | QuerySource | None = None
+        self.total: int | None = None
+        self.offset = 0
+
+    def __call__(self, value: Any) -> None:
+        if is_list_query(value):
+            source = QuerySource(value)
+        elif isinstance(value, list) and len(value) > self.page_size:
+            source = ListSource(value)
+        else:
+            __displayhook__(value)
+            return
+        builtins._ = None
+        self.source = source
+        self.total = None
+        self.offset = 0
+        self.show()
+        builtins._ = value
+
+    def more(self, page_size: int | None = None) -> None:
+        if self.source is None:
+            print('nothing to show, display a list or a query first')
+            return
+        self.show(page_size)
+
+    def show(self, page_size: int | None = None) -> None:
+        size = page_size or self.page_size
+        items = self.source.page(self.offset, size + 1)
+        if self.total is None:
+            self.total = len(items) if self.offset == 0 and len(items) <= size else self.source.count()
+        for (index, item) in enumerate(items[:size]):
+            print(f'[{self.offset + index}] {item!r}')
+        shown = self.offset + min(size, len(items))
+        total = 'unknown' if self.total is None else str(self.total)
+        if len(items) > size:
+            print(f'-- {shown} of {total}, more() to show the next {self.page_size} --')
+            self.offset = shown
+        else:
+            print(f'-- {shown} of {total} --')
+            self.source = None
+
+
+def is_list_query(value: Any) -> bool:
+    try:
+        from jsonclasses_pymongo.query import ListQuery, IterateQuery
+    except ImportError:
+        return False
+    return isinstance(value, (ListQuery, IterateQuery))
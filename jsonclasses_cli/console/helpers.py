@@ -0,0 +1,171 @@
+from __future__ import annotations
+from typing import Any, Callable
+from sys import getsizeof
+from time import perf_counter
+from io import StringIO
+from cProfile import Profile
+from pstats import Stats
+from jsonclasses.isjsonclass import isjsonobject
+
+
+Expr = Callable[[], Any] | str
+
+
+_namespace: dict[str, Any] = {}
+
+
+def install(namespace: dict[str, Any]) -> dict[str, Any]:
+    global _namespace
+    _namespace = namespace
+    namespace.update({'bench': bench, 'profile': profile, 'explain': explain, 'sizeof': sizeof})
+    return namespace
+
+
+class Timings:
+
+    def __init__(self, name: str, seconds: list[float], size: int) -> None:
+        self.name = name
+        self.seconds = sorted(seconds)
+        self.size = size
+
+    def percentile(self, p: float) -> float:
+        index = min(len(self.seconds) - 1, max(0, round(p / 100 * len(self.seconds)) - 1))
+        return self.seconds[index]
+
+    @property
+    def mean(self) -> float:
+        return sum(self.seconds) / len(self.seconds)
+
+    def __repr__(self) -> str:
+        items = [('mean', self.mean), ('p50', self.percentile(50)), ('p90', self.percentile(90)),
+                 ('p99', self.percentile(99)), ('min', self.seconds[0]), ('max', self.seconds[-1])]
+        timings = '  '.join(f'{k} {_ms(v)}' for (k, v) in items)
+        return f'{self.name}: {len(self.seconds)} runs  {timings}  result {format_size(self.size)}'
+
+
+def bench(expr: Expr, n: int = 100, warmup: int = 1) -> Timings:
+    func = _callable(expr)
+    for _ in range(warmup):
+        func()
+    seconds: list[float] = []
+    result = None
+    for _ in range(n):
+        start = perf_counter()
+        result = func()
+        seconds.append(perf_counter() - start)
+    return Timings(_name(expr), seconds, sizeof(result))
+
+
+def profile(expr: Expr, top: int = 20, sort: str = 'cumulative') -> Any:
+    func = _callable(expr)
+    profiler = Profile()
+    start = perf_counter()
+    result = profiler.runcall(func)
+    seconds = perf_counter() - start
+    output = StringIO()
+    Stats(profiler, stream=output).strip_dirs().sort_stats(sort).print_stats(top)
+    print(output.getvalue().strip())
+    print(f'{_name(expr)}: {_ms(seconds)}  result {format_size(sizeof(result))}')
+    return result
+
+
+def explain(query: Any, verbosity: str = 'executionStats') -> dict[str, Any]:
+    from jsonclasses_pymongo.connection import Connection
+    if not hasattr(query, '_build_aggregate_pipeline'):
+        raise TypeError('explain takes a query like User.find(), not its results')
+    pipeline = query._build_aggregate_pipeline()
+    collection = Connection.get_collection(query._cls)
+    result = collection.database.command('explain', {
+        'aggregate': collection.name, 'pipeline': pipeline, 'cursor': {}
+    }, verbosity=verbosity)
+    print(explain_summary(collection.name, pipeline, result))
+    return result
+
+
+def explain_summary(collection: str, pipeline: list[dict[str, Any]], result: dict[str, Any]) -> str:
+    planner = _find(result, 'queryPlanner') or {}
+    stats = _find(result, 'executionStats') or {}
+    stages = _stages(planner.get('winningPlan', {}))
+    lines = [f'collection: {collection}',
+             f'pipeline: {pipeline}',
+             f'plan: {" <- ".join(stages) if stages else "unknown"}']
+    if 'COLLSCAN' in stages:
+        lines.append('warning: collection scan')
+    if stats:
+        lines.append(f'returned: {stats.get("nReturned")}  '
+                     f'keys examined: {stats.get("totalKeysExamined")}  '
+                     f'docs examined: {stats.get("totalDocsExamined")}  '
+                     f'time: {stats.get("executionTimeMillis")}ms')
+    return '\n'.join(lines)
+
+
+def sizeof(value: Any) -> int:
+    seen: set[int] = set()
+    size = 0
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        size += getsizeof(item)
+        if isjsonobject(item):
+            size += getsizeof(item.__dict__)
+            stack.extend(getattr(item, f.name, None) for f in item.__class__.cdef.fields)
+        elif isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+    return size
+
+
+def format_size(size: int) -> str:
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024:
+            return f'{size:.0f}{unit}' if unit == 'B' else f'{size:.1f}{unit}'
+        size /= 1024
+    return f'{size:.1f}GB'
+
+
+def _callable(expr: Expr) -> Callable[[], Any]:
+    if isinstance(expr, str):
+        code = compile(expr, '<console>', 'eval')
+        return lambda: _exec(eval(code, _namespace))
+    return lambda: _exec(expr())
+
+
+def _exec(result: Any) -> Any:
+    return result.exec() if hasattr(result, '_build_aggregate_pipeline') else result
+
+
+def _name(expr: Expr) -> str:
+    return expr if isinstance(expr, str) else getattr(expr, '__name__', repr(expr))
+
+
+def _find(value: Any, key: str) -> Any:
+    if isinstance(value, dict):
+        if key in value:
+            return value[key]
+        value = list(value.values())
+    if isinstance(value, list):
+        for item in value:
+            found = _find(item, key)
+            if found is not None:
+                return found
+    return None
+
+
+def _stages(plan: dict[str, Any]) -> list[str]:
+    stages: list[str] = []
+    while plan:
+        stage = plan.get('stage')
+        if stage is not None:
+            index = plan.get('indexName')
+            stages.append(f'{stage}({index})' if index else stage)
+        plan = plan.get('inputStage') or plan.get('queryPlan') or {}
+    return stages
+
+
+def _ms(seconds: float) -> str:
+    return f'{seconds * 1000:.2f}ms'
@@ -0,0 +1,79 @@
+from __future__ import annotations
+from typing import Any
+from pathlib import Path
+from json import loads, dumps
+from threading import Thread
+from ..utils.import_app import app_files, file_mtimes
+
+
+SNAPSHOT = '.jsonclasses.console.json'
+
+
+def read_snapshot(dest: Path, app_file: Path) -> list[str] | None:
+    try:
+        snapshot = loads((dest / SNAPSHOT).read_text())
+    except (OSError, ValueError):
+        return None
+    if snapshot.get('app') != str(app_file.resolve()):
+        return None
+    mtimes = {Path(k): v for (k, v) in snapshot.get('mtimes', {}).items()}
+    if len(mtimes) == 0 or file_mtimes(set(mtimes.keys())) != mtimes:
+        return None
+    return snapshot.get('models')
+
+
+def write_snapshot(dest: Path, app_file: Path, models: list[str]) -> None:
+    mtimes = file_mtimes(app_files(app_file))
+    snapshot = {
+        'app': str(app_file.resolve()),
+        'mtimes': {str(k): v for (k, v) in mtimes.items()},
+        'models': models
+    }
+    try:
+        (dest / SNAPSHOT).write_text(dumps(snapshot, indent=2))
+    except OSError:
+        pass
+
+
+class AppLoader(Thread):
+
+    def __init__(self, dest: Path, app_file: Path, namespace: dict[str, Any]) -> None:
+        super().__init__(name='app-loader', daemon=True)
+        self.dest = dest
+        self.app_file = app_file
+        self.namespace = namespace
+        self.models: dict[str, Any] = {}
+        self.error: BaseException | None = None
+
+    def run(self) -> None:
+        from . import load_models
+        try:
+            self.models = load_models(self.app_file)
+        except BaseException as error:
+            self.error = error
+            return
+        for (name, model) in self.models.items():
+            self.namespace.setdefault(name, model)
+        write_snapshot(self.dest, self.app_file, list(self.models.keys()))
+
+    def wait(self) -> dict[str, Any]:
+        self.join()
+        if self.error is not None:
+            raise ImportError(f'failed to import {self.app_file.name}: {self.error!r}') from self.error
+        return self.models
+
+
+class LazyNamespace(dict):
+
+    def __init__(self, names: list[str]) -> None:
+        super().__init__()
+        self.names = set(names)
+        self.loader: AppLoader | None = None
+
+    def __missing__(self, key: str) -> Any:
+        if key not in self.names or self.loader is None:
+            raise KeyError(key)
+        models = self.loader.wait()
+        if key not in models:
+            raise KeyError(key)
+        return self.setdefault(key, models[key])
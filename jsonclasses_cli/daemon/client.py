@@ -0,0 +1,82 @@
+from typing import Any
+from pathlib import Path
+from json import loads, dumps
+from socket import socket, AF_UNIX, SOCK_STREAM
+from sys import stdout
+from rich import print
+
+
+def request(socket_path: Path, payload: dict[str, Any]) -> dict[str, Any]:
+    with socket(AF_UNIX, SOCK_STREAM) as client:
+        client.connect(str(socket_path))
+        client.sendall((dumps(payload) + '\n').encode())
+        with client.makefile('r') as reader:
+            line = reader.readline()
+    if line == '':
+        raise ConnectionResetError(f'daemon on {socket_path} closed the connection without replying')
+    return loads(line)
+
+
+def send(socket_path: Path,
+         payload: dict[str, Any],
+         app_file: Path | None = None,
+         cgraph_name: str = 'default') -> dict[str, Any] | None:
+    try:
+        response = request(socket_path, payload)
+    except (ConnectionError, FileNotFoundError) as e:
+        if app_file is None:
+            print(f"[bold red]FAILED[/bold red] {_unavailable(socket_path, e)}")
+            return None
+        from .server import Daemon
+        print(f"[bold yellow]LOCAL[/bold yellow] {_unavailable(socket_path, e)}, running in process")
+        response = Daemon(socket_path.parent, app_file, cgraph_name).handle(payload)
+    if not response['ok']:
+        print(f"[bold red]FAILED[/bold red] {response['error']}")
+        return None
+    return response
+
+
+def generate(socket_path: Path,
+             lang: str,
+             validate: bool = False,
+             app_file: Path | None = None,
+             cgraph_name: str = 'default') -> bool:
+    response = send(socket_path, {'command': 'generate', 'lang': lang, 'validate': validate}, app_file, cgraph_name)
+    if response is None:
+        return False
+    for file in response['files']:
+        if file['written']:
+            print(f"[bold green]CREATE[/bold green] {file['path']}")
+        else:
+            print(f"[bold blue]IDENTICAL[/bold blue] {file['path']}")
+    return True
+
+
+def diff(socket_path: Path,
+         lang: str,
+         validate: bool = False,
+         app_file: Path | None = None,
+         cgraph_name: str = 'default') -> bool:
+    response = send(socket_path, {'command': 'diff', 'lang': lang, 'validate': validate}, app_file, cgraph_name)
+    if response is None:
+        return False
+    stdout.write(response['diff'])
+    return True
+
+
+def schema(socket_path: Path, app_file: Path | None = None, cgraph_name: str = 'default') -> bool:
+    response = send(socket_path, {'command': 'schema'}, app_file, cgraph_name)
+    if response is None:
+        return False
+    stdout.write(dumps(response['schema'], indent=2) + '\n')
+    return True
+
+
+def stop(socket_path: Path) -> bool:
+    return send(socket_path, {'command': 'stop'}) is not None
+
+
+def _unavailable(socket_path: Path, error: Exception) -> str:
+    if isinstance(error, ConnectionResetError):
+        return str(error)
+    return f'no daemon listens on {socket_path}'
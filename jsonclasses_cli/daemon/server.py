@@ -0,0 +1,131 @@
+from typing import Any
+from pathlib import Path
+from json import loads, dumps
+from time import perf_counter
+from difflib import unified_diff
+from socket import socket, AF_UNIX, SOCK_STREAM
+from socketserver import UnixStreamServer, StreamRequestHandler
+from rich import print
+from jsonclasses.cgraph import CGraph
+from ..package import render
+from ..utils.import_app import reload_app, app_files, file_mtimes
+from ..utils.cgraph_schema import cgraph_schema
+from ..utils.write_file import write_file
+
+
+class Daemon:
+
+    def __init__(self, dest: Path, app_file: Path, cgraph_name: str = 'default') -> None:
+        self.dest = dest
+        self.app_file = app_file
+        self.cgraph_name = cgraph_name
+        self.loaded = False
+        self.running = True
+        self.mtimes: dict[Path, float] = {}
+        self.rendered: dict[tuple[str, bool], dict[Path, str]] = {}
+
+    def refresh(self) -> None:
+        if self.loaded:
+            current = file_mtimes(self.mtimes.keys() | app_files(self.app_file))
+            if current == self.mtimes:
+                return
+        self.loaded = False
+        self.rendered = {}
+        snapshot = file_mtimes(self.mtimes.keys() | {self.app_file.resolve()})
+        reload_app(self.app_file, self.cgraph_name)
+        self.mtimes = {**file_mtimes(app_files(self.app_file)), **snapshot}
+        self.loaded = True
+
+    def render(self, lang: str, validate: bool) -> dict[Path, str]:
+        key = (lang, validate)
+        if key not in self.rendered:
+            self.rendered[key] = render(self.dest, CGraph(self.cgraph_name), lang, validate)
+        return self.rendered[key]
+
+    def handle(self, request: dict[str, Any]) -> dict[str, Any]:
+        start = perf_counter()
+        try:
+            command = request.get('command')
+            if command == 'stop':
+                self.running = False
+                return {'ok': True}
+            self.refresh()
+            match command:
+                case 'ping':
+                    result = {}
+                case 'generate':
+                    result = self.generate(request['lang'], request.get('validate', False))
+                case 'diff':
+                    result = self.diff(request['lang'], request.get('validate', False))
+                case 'schema':
+                    result = {'schema': cgraph_schema(CGraph(self.cgraph_name))}
+                case _:
+                    raise ValueError(f'unknown command: {command}')
+        except Exception as e:
+            return {'ok': False, 'error': f'{type(e).__name__}: {e}'}
+        return {'ok': True, **result, 'ms': (perf_counter() - start) * 1000}
+
+    def generate(self, lang: str, validate: bool) -> dict[str, Any]:
+        files: list[dict[str, Any]] = []
+        for (path, content) in self.render(lang, validate).items():
+            written = write_file(path, content, True)
+            files.append({'path': str(path.relative_to(self.dest)), 'written': written})
+        return {'files': files}
+
+    def diff(self, lang: str, validate: bool) -> dict[str, Any]:
+        lines: list[str] = []
+        for (path, content) in self.render(lang, validate).items():
+            name = str(path.relative_to(self.dest))
+            current = path.read_text() if path.is_file() else ''
+            lines.extend(unified_diff(current.splitlines(True),
+                                      content.splitlines(True),
+                                      f'a/{name}', f'b/{name}'))
+        return {'diff': ''.join(lines)}
+
+
+class _Handler(StreamRequestHandler):
+
+    def handle(self) -> None:
+        daemon: Daemon = self.server.daemon
+        for line in self.rfile:
+            try:
+                request = loads(line)
+            except ValueError as e:
+                response = {'ok': False, 'error': f'invalid request: {e}'}
+            else:
+                response = daemon.handle(request)
+            self.wfile.write((dumps(response) + '\n').encode())
+            self.wfile.flush()
+            if not daemon.running:
+                return
+
+
+def daemon(dest: Path, app_file: Path, socket_path: Path, cgraph_name: str = 'default'):
+    if socket_path.exists():
+        if _is_alive(socket_path):
+            print(f"[bold red]RUNNING[/bold red] a daemon already listens on {socket_path}")
+            return
+        socket_path.unlink()
+    server = UnixStreamServer(str(socket_path), _Handler)
+    server.daemon = Daemon(dest, app_file, cgraph_name)
+    response = server.daemon.handle({'command': 'ping'})
+    if not response['ok']:
+        print(f"[bold red]FAILED[/bold red] {response['error']}")
+    print(f"[bold green]LISTEN[/bold green] {socket_path}")
+    try:
+        with server:
+            while server.daemon.running:
+                server.handle_request()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        socket_path.unlink(missing_ok=True)
+
+
+def _is_alive(socket_path: Path) -> bool:
+    with socket(AF_UNIX, SOCK_STREAM) as client:
+        try:
+            client.connect(str(socket_path))
+        except (ConnectionRefusedError, FileNotFoundError):
+            return False
+    return True
@@ -0,0 +1,66 @@
+from pathlib import Path
+from rich import print
+from rich.table import Table
+from jsonclasses.cgraph import CGraph
+from .plan import Index, index_plan
+from .compare import compare, live_indexes
+from .script_content import script_content
+from ..utils.import_app import import_app
+from ..utils.resolve_cgraph import resolve_cgraph
+from ..utils.write_file import write_file
+
+
+def indexes(dest: Path,
+            app_file: Path,
+            output: Path | None = None,
+            url: str | None = None,
+            check: bool = False,
+            cgraph_name: str = 'default',
+            silent: bool = False) -> list[Index]:
+    import_app(app_file)
+    cgraph = CGraph(cgraph_name)
+    resolve_cgraph(cgraph)
+    plan = index_plan(cgraph)
+    if url is None and (output is not None or check):
+        from jsonclasses_pymongo.connection import Connection
+        url = Connection(cgraph_name).url
+    if not silent:
+        _print_plan(plan)
+    if output is not None:
+        write_file(dest / output, script_content(plan, url), silent)
+    if check:
+        collections = list(dict.fromkeys(i.collection for i in plan))
+        rows = compare(plan, live_indexes(url, collections))
+        if not silent:
+            _print_rows(rows, url)
+    return plan
+
+
+def _print_plan(plan: list[Index]):
+    table = Table(title='Index plan')
+    table.add_column('Collection')
+    table.add_column('Index')
+    table.add_column('Keys')
+    table.add_column('Options')
+    table.add_column('Reason')
+    table.add_column('Source')
+    for index in plan:
+        options = ', '.join(k for k in ('unique', 'sparse') if getattr(index, k))
+        source = 'declared' if index.declared else 'advised'
+        table.add_row(index.collection, index.name, ', '.join(index.keys), options, index.reason, source)
+    print(table)
+    if any(not i.declared for i in plan):
+        print('[yellow]Advised indexes are dropped by jsonclasses-pymongo when the app connects '
+              'unless they are declared on fields.[/yellow]')
+
+
+def _print_rows(rows: list[tuple[str, str, list[str], str]], url: str):
+    styles = {'ok': 'green', 'covered': 'green', 'missing': 'red', 'redundant': 'yellow', 'unplanned': 'dim'}
+    table = Table(title=f'Indexes on {url}')
+    table.add_column('Collection')
+    table.add_column('Index')
+    table.add_column('Keys')
+    table.add_column('Status')
+    for (collection, name, keys, status) in rows:
+        table.add_row(collection, name, ', '.join(keys), f'[{styles[status]}]{status}[/{styles[status]}]')
+    print(table)
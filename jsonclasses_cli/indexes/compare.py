@@ -0,0 +1,51 @@
+from __future__ import annotations
+from typing import Any
+from .plan import Index
+
+
+LiveIndexes = dict[str, dict[str, list[str]]]
+
+
+def live_indexes(url: str, collections: list[str], timeout: int = 5000) -> LiveIndexes:
+    from pymongo import MongoClient
+    client = MongoClient(url, serverSelectionTimeoutMS=timeout)
+    try:
+        database = client.get_database()
+        result: LiveIndexes = {}
+        existing = set(database.list_collection_names())
+        for name in collections:
+            if name not in existing:
+                result[name] = {}
+                continue
+            info: dict[str, Any] = database[name].index_information()
+            result[name] = {n: [k for (k, _) in i['key']] for (n, i) in info.items()}
+        return result
+    finally:
+        client.close()
+
+
+def compare(plan: list[Index], live: LiveIndexes) -> list[tuple[str, str, list[str], str]]:
+    rows: list[tuple[str, str, list[str], str]] = []
+    for index in plan:
+        indexes = live.get(index.collection, {})
+        if index.name in indexes or index.keys in indexes.values():
+            status = 'ok'
+        elif not index.declared and any(k[:len(index.keys)] == index.keys for k in indexes.values()):
+            status = 'covered'
+        else:
+            status = 'missing'
+        rows.append((index.collection, index.name, index.keys, status))
+    for (collection, indexes) in live.items():
+        planned = [i for i in plan if i.collection == collection]
+        for (name, keys) in indexes.items():
+            if name == '_id_' or any(i.name == name or i.keys == keys for i in planned):
+                continue
+            rows.append((collection, name, keys, 'redundant' if _is_prefix(name, keys, indexes) else 'unplanned'))
+    return rows
+
+
+def _is_prefix(name: str, keys: list[str], indexes: dict[str, list[str]]) -> bool:
+    for (other, other_keys) in indexes.items():
+        if other != name and len(other_keys) > len(keys) and other_keys[:len(keys)] == keys:
+            return True
+    return False
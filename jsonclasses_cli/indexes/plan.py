@@ -0,0 +1,141 @@
+from __future__ import annotations
+from typing import Any
+from jsonclasses.cdef import CDef
+from jsonclasses.cgraph import CGraph
+from jsonclasses.fdef import FStore, FType, ReadRule, Queryability
+from jsonclasses.jfield import JField
+from ..utils.fake_utils import ordered_cdefs
+
+
+SORTABLE = (FType.STR, FType.INT, FType.FLOAT, FType.DATE, FType.DATETIME, FType.ENUM)
+
+
+class Index:
+
+    def __init__(self,
+                 collection: str,
+                 keys: list[str],
+                 name: str,
+                 reason: str,
+                 declared: bool,
+                 unique: bool = False,
+                 sparse: bool = False) -> None:
+        self.collection = collection
+        self.keys = keys
+        self.name = name
+        self.reason = reason
+        self.declared = declared
+        self.unique = unique
+        self.sparse = sparse
+
+    @property
+    def options(self) -> dict[str, Any]:
+        options: dict[str, Any] = {'name': self.name}
+        if self.unique:
+            options['unique'] = True
+        if self.sparse:
+            options['sparse'] = True
+        return options
+
+
+def index_plan(cgraph: CGraph) -> list[Index]:
+    plan: list[Index] = []
+    cdefs = ordered_cdefs(list(cgraph._map.values()), is_class_pymongo)
+    for cdef in cdefs:
+        plan.extend(_class_indexes(cdef))
+    tables: set[str] = set()
+    for cdef in cdefs:
+        for field in cdef.fields:
+            if field.fdef.ftype != FType.LIST or not field.fdef.use_join_table:
+                continue
+            name = join_table_name(field)
+            if name not in tables:
+                tables.add(name)
+                plan.extend(_join_table_indexes(field, name))
+    return plan
+
+
+def is_class_pymongo(cdef: CDef) -> bool:
+    return hasattr(cdef.cls, 'pconf') and not cdef.jconf.abstract
+
+
+def join_table_name(field: JField) -> str:
+    that = field.foreign_field
+    (this_cls, that_cls) = (field.cdef.cls, that.cdef.cls)
+    ca = this_cls.pconf.collection_name + this_cls.pconf.to_db_key(field.name).lower()
+    cb = that_cls.pconf.collection_name + that_cls.pconf.to_db_key(that.name).lower()
+    return ca + cb if ca < cb else cb + ca
+
+
+def _class_indexes(cdef: CDef) -> list[Index]:
+    from jsonclasses_pymongo.utils import ref_db_field_key, ref_db_field_keys
+    cls = cdef.cls
+    collection = cls.pconf.collection_name
+    declared: list[Index] = []
+    advised: list[Index] = []
+    compounds: dict[str, tuple[list[str], bool, bool]] = {}
+    for field in cdef.fields:
+        fdef = field.fdef
+        key = cls.pconf.to_db_key(field.name)
+        if fdef.unique or fdef.index:
+            reason = 'unique' if fdef.unique else 'index'
+            declared.append(Index(collection, [key], f'{key}_1', reason, True, fdef.unique, not fdef.required))
+        for (names, unique) in ((fdef.cindex_names if fdef.cindex else [], False),
+                                (fdef.cunique_names if fdef.cunique else [], True)):
+            for name in names:
+                (keys, _, sparse) = compounds.setdefault(name, ([], unique, False))
+                keys.append(_compound_key(field, unique))
+                compounds[name] = (keys, unique, sparse or not fdef.required)
+        if field.is_local_one_ref:
+            ref_key = ref_db_field_key(field.name, cls)
+            advised.append(Index(collection, [ref_key], f'{ref_key}_1', 'reference', False,
+                                 sparse=not fdef.required))
+        elif field.is_local_many_ref:
+            ref_key = ref_db_field_keys(field.name, cls)
+            advised.append(Index(collection, [ref_key], f'{ref_key}_1', 'reference', False))
+        elif _is_field_sortable(field):
+            advised.append(Index(collection, [key], f'{key}_1', 'filter and sort', False,
+                                 sparse=not fdef.required))
+    for (name, (keys, unique, sparse)) in compounds.items():
+        declared.append(Index(collection, keys, name, 'compound unique' if unique else 'compound', True,
+                              unique, sparse))
+    return declared + [i for i in advised if not _is_covered(i, declared)]
+
+
+def _join_table_indexes(field: JField, name: str) -> list[Index]:
+    from jsonclasses_pymongo.utils import ref_db_field_key
+    this_cls = field.cdef.cls
+    that_cls = field.foreign_cdef.cls
+    this_key = ref_db_field_key(this_cls.__name__, this_cls)
+    that_key = ref_db_field_key(that_cls.__name__, that_cls)
+    (first, second) = sorted([this_key, that_key])
+    return [
+        Index(name, [first, second], 'ref', 'join table', True, True),
+        Index(name, [second], f'{second}_1', 'join table', False)
+    ]
+
+
+def _compound_key(field: JField, unique: bool) -> str:
+    # jsonclasses-pymongo only encodes compound index keys of non unique
+    # indexes, keep the same keys so plans match real indexes
+    cls = field.cdef.cls
+    key = field.cdef.jconf.ref_name_strategy(field) if field.fdef.fstore == FStore.LOCAL_KEY else field.name
+    return key if unique and field.fdef.fstore == FStore.LOCAL_KEY else cls.pconf.to_db_key(key)
+
+
+def _is_field_sortable(field: JField) -> bool:
+    fdef = field.fdef
+    if fdef.primary or fdef.ftype not in SORTABLE:
+        return False
+    if fdef.fstore != FStore.EMBEDDED:
+        return False
+    if fdef.read_rule == ReadRule.NO_READ:
+        return False
+    return fdef.queryability != Queryability.UNQUERYABLE
+
+
+def _is_covered(index: Index, indexes: list[Index]) -> bool:
+    for other in indexes:
+        if other.collection == index.collection and other.keys[:len(index.keys)] == index.keys:
+            return True
+    return False
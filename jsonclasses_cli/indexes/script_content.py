@@ -0,0 +1,65 @@
+from .plan import Index
+from ..utils.join_lines import join_lines
+
+
+def script_content(plan: list[Index], url: str) -> str:
+    return join_lines([
+        _header(),
+        _indexes(plan),
+        _main(url)
+    ], 3)
+
+
+def _header() -> str:
+    return '''#!/usr/bin/env python3
+"""Create the recommended MongoDB indexes.
+
+Generated by `jsonclasses indexes`. Running it again only creates the
+indexes which are missing.
+
+jsonclasses-pymongo drops indexes which are not declared with `unique`,
+`index`, `cindex` or `cunique` when the app connects. Declare indexes
+on fields to keep them, or run this script after the app started.
+"""
+from argparse import ArgumentParser
+from pymongo import ASCENDING, MongoClient'''
+
+
+def _indexes(plan: list[Index]) -> str:
+    lines = ['INDEXES = [']
+    for (i, index) in enumerate(plan):
+        keys = ', '.join(f'({key!r}, ASCENDING)' for key in index.keys)
+        comma = ',' if i < len(plan) - 1 else ''
+        lines.append(f'    ({index.collection!r}, [{keys}], {index.options!r}){comma}')
+    lines.append(']')
+    return join_lines(lines)
+
+
+def _main(url: str) -> str:
+    return f'''def create_indexes(url: str, dry_run: bool = False) -> list[str]:
+    client = MongoClient(url)
+    database = client.get_database()
+    created: list[str] = []
+    try:
+        for (collection, keys, options) in INDEXES:
+            name = f'{'{'}collection{'}'}.{'{'}options["name"]{'}'}'
+            existing = database[collection].index_information()
+            names = [k for (k, _) in keys]
+            if options['name'] in existing or any([k for (k, _) in i['key']] == names for i in existing.values()):
+                print(f'exists  {'{'}name{'}'}')
+                continue
+            if not dry_run:
+                database[collection].create_index(keys, **options)
+            created.append(name)
+            print(f'missing {'{'}name{'}'}' if dry_run else f'created {'{'}name{'}'}')
+    finally:
+        client.close()
+    return created
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Create the recommended MongoDB indexes.')
+    parser.add_argument('--url', default={url!r}, help='MongoDB connection string.')
+    parser.add_argument('--dry-run', action='store_true', help='Only print missing indexes.')
+    args = parser.parse_args()
+    create_indexes(args.url, args.dry_run)'''
@@ -0,0 +1,16 @@
+from pathlib import Path
+from jsonclasses.cgraph import CGraph
+from .script_content import script_content
+from ..utils.import_app import import_app
+from ..utils.write_file import write_file
+
+
+def generate(dest: Path,
+             app_file: Path,
+             output: Path,
+             url: str = 'http://127.0.0.1:8000',
+             cgraph_name: str = 'default',
+             silent: bool = False):
+    import_app(app_file)
+    cgraph = CGraph(cgraph_name)
+    write_file(dest / output, script_content(cgraph, url), silent)
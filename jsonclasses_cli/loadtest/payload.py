@@ -0,0 +1,116 @@
+from inflection import underscore
+from jsonclasses.cdef import CDef
+from jsonclasses.fdef import FDef, FType
+from jsonclasses.jfield import JField
+from jsonclasses.types import Types
+from .shared_utils import aconf_of, field_ref_id_name
+from ..utils.fake_utils import (
+    field_can_create, field_can_update, is_field_local_key, is_field_ref,
+    is_field_required_for_create, number_bounds, str_spec
+)
+from ..utils.join_lines import join_lines
+
+
+def to_create_payload(cdef: CDef) -> str:
+    return '_create_' + underscore(cdef.name)
+
+
+def to_update_payload(cdef: CDef) -> str:
+    return '_update_' + underscore(cdef.name)
+
+
+def create_payload(cdef: CDef) -> str:
+    lines: list[str] = []
+    for field in cdef.fields:
+        if not field_can_create(field):
+            continue
+        if is_field_local_key(field):
+            lines.append(_ref_line(field))
+            continue
+        if is_field_ref(field):
+            continue
+        expr = value_expr(field.fdef, field.types)
+        if expr is None:
+            if is_field_required_for_create(field):
+                lines.append(f'    # {field.json_name}: no generator for this field type or pattern')
+            continue
+        required = is_field_required_for_create(field)
+        lines.append(_value_line(field.json_name, expr, not required))
+    return _payload_function(to_create_payload(cdef), lines)
+
+
+def update_payload(cdef: CDef) -> str:
+    lines: list[str] = []
+    for field in cdef.fields:
+        if not field_can_update(field) or is_field_ref(field):
+            continue
+        if field.fdef.auth_identity or field.fdef.auth_by:
+            continue
+        expr = value_expr(field.fdef, field.types)
+        if expr is None:
+            continue
+        lines.append(_value_line(field.json_name, expr, True))
+    return _payload_function(to_update_payload(cdef), lines)
+
+
+def value_expr(fdef: FDef, types: Types) -> str | None:
+    match fdef.ftype:
+        case FType.STR:
+            spec = str_spec(types)
+            if spec is None:
+                return None
+            (kind, minlength, maxlength) = spec
+            if kind in ('email', 'url'):
+                return f'_{kind}(rng)'
+            return f'_{kind}(rng, {minlength}, {maxlength})'
+        case FType.INT:
+            (minimum, maximum) = number_bounds(types)
+            return f'rng.randint({int(minimum)}, {int(maximum)})'
+        case FType.FLOAT:
+            (minimum, maximum) = number_bounds(types)
+            return f'round(rng.uniform({minimum}, {maximum}), 2)'
+        case FType.BOOL:
+            return 'rng.random() < 0.5'
+        case FType.DATE:
+            return '_date(rng)'
+        case FType.DATETIME:
+            return '_datetime(rng)'
+        case FType.ENUM:
+            names = ', '.join(map(lambda o: repr(o.name), fdef.enum_class))
+            return f'rng.choice([{names}])'
+        case FType.LIST:
+            item = value_expr(fdef.item_types.fdef, fdef.item_types)
+            if item is None:
+                return None
+            return f'[{item} for _ in range(rng.randint(1, 3))]'
+        case _:
+            return None
+
+
+def _ref_line(field: JField) -> str:
+    name = aconf_of(field.foreign_cdef).name if hasattr(field.foreign_cdef.cls, 'aconf') else None
+    if name is None:
+        return f'    # {field.json_name}: linked class has no api'
+    key = field_ref_id_name(field)
+    return join_lines([
+        f"    if ids['{name}']:",
+        f"        data['{key}'] = rng.choice(ids['{name}'])",
+    ])
+
+
+def _value_line(name: str, expr: str, optional: bool) -> str:
+    if not optional:
+        return f"    data['{name}'] = {expr}"
+    return join_lines([
+        '    if rng.random() < 0.5:',
+        f"        data['{name}'] = {expr}",
+    ])
+
+
+def _payload_function(name: str, lines: list[str]) -> str:
+    return join_lines([
+        f'def {name}(rng: Random, ids: dict[str, list[str]]) -> dict[str, Any]:',
+        '    data: dict[str, Any] = {}',
+        *lines,
+        '    return data',
+    ])
@@ -0,0 +1,25 @@
+from typing import cast
+from jsonclasses.cdef import CDef
+from jsonclasses.jfield import JField
+from jsonclasses_server.aconf import AConf
+from ..utils.fake_utils import ordered_cdefs
+from ..utils.package_utils import class_needs_api
+
+
+def api_cdefs(cdefs: list[CDef]) -> list[CDef]:
+    return ordered_cdefs(cdefs, class_needs_api)
+
+
+def aconf_of(cdef: CDef) -> AConf:
+    return cast(AConf, cdef.cls.aconf)
+
+
+def primary_name(cdef: CDef) -> str:
+    field = cdef.primary_field
+    return field.json_name if field is not None else 'id'
+
+
+def field_ref_id_name(field: JField) -> str:
+    rkes = field.cdef.jconf.ref_name_strategy
+    kes = field.cdef.jconf.input_key_strategy
+    return kes(rkes(field))
@@ -0,0 +1,77 @@
+from pathlib import Path
+from random import Random
+from rich import print
+from rich.table import Table
+from jsonclasses.cgraph import CGraph
+from .schema import Model, api_models
+from .store import Store
+from .server import MockServer
+from ..seed.fake import fake_input
+from ..utils.import_app import import_app
+from ..utils.resolve_cgraph import resolve_cgraph
+
+
+def mock(app_file: Path,
+         host: str = '127.0.0.1',
+         port: int = 8000,
+         count: int = 100,
+         counts: dict[str, int] | None = None,
+         latency: float = 0,
+         jitter: float = 0,
+         random_seed: int = 0,
+         cgraph_name: str = 'default'):
+    from uvicorn import run
+    server = mock_server(app_file, count, counts, latency, jitter, random_seed, cgraph_name)
+    _print_routes(server)
+    run(server, host=host, port=port, lifespan='off', access_log=False)
+
+
+def mock_server(app_file: Path,
+                count: int = 100,
+                counts: dict[str, int] | None = None,
+                latency: float = 0,
+                jitter: float = 0,
+                random_seed: int = 0,
+                cgraph_name: str = 'default') -> MockServer:
+    import_app(app_file)
+    cgraph = CGraph(cgraph_name)
+    resolve_cgraph(cgraph)
+    models = api_models(cgraph)
+    if len(models) == 0:
+        raise ValueError('no API models found')
+    counts = counts or {}
+    unknown = set(counts.keys()) - {m.name for m in models}
+    if len(unknown) > 0:
+        raise ValueError(f'unknown models: {", ".join(sorted(unknown))}')
+    store = Store(models)
+    rng = Random(random_seed)
+    ids: dict[str, list[str]] = {}
+    for model in models:
+        cdef = cgraph.fetch(model.name)
+        for _ in range(counts.get(model.name, count)):
+            store.create(model, fake_input(cdef, rng, ids))
+        ids[model.name] = list(store.records[model.name].keys())
+    return MockServer(store, latency / 1000, jitter / 1000, random_seed)
+
+
+def _routes(model: Model) -> list[str]:
+    routes: list[str] = []
+    url = '/' + model.path
+    for (action, methods) in [('L', [f'GET {url}']), ('R', [f'GET {url}/:id']), ('C', [f'POST {url}']),
+                              ('U', [f'PATCH {url}/:id', f'PATCH {url}']),
+                              ('D', [f'DELETE {url}/:id', f'DELETE {url}']), ('E', [f'POST {url}/ensure'])]:
+        if action in model.actions:
+            routes.extend(methods)
+    if model.session:
+        routes.append(f'POST {url}/session')
+    return routes
+
+
+def _print_routes(server: MockServer):
+    table = Table(title='Mock')
+    table.add_column('Model')
+    table.add_column('Records', justify='right')
+    table.add_column('Routes')
+    for model in server.store.models.values():
+        table.add_row(model.name, str(len(server.store.records[model.name])), '\n'.join(_routes(model)))
+    print(table)
@@ -0,0 +1,129 @@
+from __future__ import annotations
+from typing import Any, Callable, cast
+from datetime import date, datetime, timezone
+from jsonclasses.cdef import CDef
+from jsonclasses.cgraph import CGraph
+from jsonclasses.jfield import JField
+from jsonclasses.fdef import FDef, FStore, FType, ReadRule
+from jsonclasses.modifiers.default_modifier import DefaultModifier
+from jsonclasses.modifiers.setonsave_modifier import SetOnSaveModifier
+from jsonclasses_server.aconf import AConf
+from ..utils.fake_utils import ordered_cdefs
+from ..utils.package_utils import class_needs_api, class_needs_session
+
+
+class Relation:
+
+    def __init__(self, field: JField) -> None:
+        jconf = field.cdef.jconf
+        self.name = field.json_name
+        self.target = field.foreign_cdef.name
+        self.many = field.fdef.ftype == FType.LIST
+        self.local = field.fdef.fstore == FStore.LOCAL_KEY
+        self.join = field.fdef.fstore == FStore.FOREIGN_KEY and field.fdef.use_join_table
+        self.id_key = ref_key(field) if self.local or self.join else None
+        self.foreign_key: str | None = None
+        self.foreign_many = False
+        foreign = field.foreign_field
+        if foreign is not None and not self.local:
+            self.foreign_key = ref_key(foreign)
+            self.foreign_many = foreign.fdef.ftype == FType.LIST
+        self.input_names = {field.name, self.name}
+        if self.id_key is not None:
+            self.input_names |= {jconf.ref_name_strategy(field), self.id_key}
+
+
+class Model:
+
+    def __init__(self, cdef: CDef) -> None:
+        aconf = cast(AConf, cdef.cls.aconf)
+        jconf = cdef.jconf
+        self.name = cdef.name
+        self.path = aconf.name
+        self.actions = set(aconf.actions)
+        primary = cdef.primary_field
+        self.primary = primary.json_name if primary is not None else 'id'
+        self.fields: dict[str, FDef] = {}
+        self.hidden: set[str] = set()
+        self.defaults: dict[str, Callable[[], Any]] = {}
+        self.touch: set[str] = set()
+        self.relations: dict[str, Relation] = {}
+        self.keys: dict[str, str] = {}
+        self.order: list[str] = []
+        for field in cdef.fields:
+            if field.fdef.fstore in (FStore.TEMP, FStore.CALCULATED):
+                continue
+            if field.foreign_cdef is not None and field.fdef.fstore != FStore.EMBEDDED:
+                relation = Relation(field)
+                self.relations[relation.name] = relation
+                for name in relation.input_names:
+                    self.keys[name] = relation.id_key or relation.name
+                if relation.id_key is not None:
+                    self.order.append(relation.id_key)
+                continue
+            name = field.json_name
+            self.order.append(name)
+            self.keys[field.name] = name
+            self.keys[name] = name
+            self.fields[name] = field.fdef
+            if field.fdef.read_rule == ReadRule.NO_READ:
+                self.hidden.add(name)
+            for modifier in field.types.modifier.vs:
+                if isinstance(modifier, DefaultModifier):
+                    self.defaults[name] = default_factory(modifier, field.fdef)
+                if isinstance(modifier, SetOnSaveModifier):
+                    self.touch.add(name)
+        if self.primary not in self.order:
+            self.order.insert(0, self.primary)
+        self.id_keys = {r.id_key for r in self.relations.values() if r.local and r.id_key is not None}
+        self.virtual_keys = {r.id_key for r in self.relations.values() if r.join and r.id_key is not None}
+        self.unique = {f.json_name for f in cdef.unique_fields}
+        self.session = class_needs_session(cdef)
+        self.srname = aconf.cname_to_srname(cdef.cls.__name__) if self.session else None
+        self.identities = [f.json_name for f in cdef._auth_identity_fields] if self.session else []
+        self.input_key = jconf.input_key_strategy
+        self.output_key = jconf.output_key_strategy
+
+    def key(self, name: str) -> str | None:
+        return self.keys.get(name) or self.keys.get(self.output_key(name))
+
+
+def api_models(cgraph: CGraph) -> list[Model]:
+    return [Model(cdef) for cdef in ordered_cdefs(list(cgraph._map.values()), class_needs_api)]
+
+
+def ref_key(field: JField) -> str:
+    jconf = field.cdef.jconf
+    return jconf.output_key_strategy(jconf.ref_name_strategy(field))
+
+
+def default_factory(modifier: DefaultModifier, fdef: FDef) -> Callable[[], Any]:
+    default = modifier.default
+    if callable(default):
+        return lambda: encode_value(default(), fdef)
+    return lambda: encode_value(default, fdef)
+
+
+def encode_value(value: Any, fdef: FDef) -> Any:
+    if value is None:
+        return None
+    match fdef.ftype:
+        case FType.LIST:
+            return [encode_value(v, fdef.item_types.fdef) for v in value]
+        case FType.DICT:
+            return {k: encode_value(v, fdef.item_types.fdef) for (k, v) in value.items()}
+        case FType.DATETIME if isinstance(value, str):
+            return format_datetime(datetime.fromisoformat(value.replace('Z', '+00:00')))
+        case FType.DATETIME if isinstance(value, datetime):
+            return format_datetime(value)
+        case FType.DATE if isinstance(value, (str, date)):
+            day = date.fromisoformat(value[:10]) if isinstance(value, str) else value
+            return format_datetime(datetime(day.year, day.month, day.day, tzinfo=timezone.utc))
+        case FType.ENUM if not isinstance(value, str):
+            return value.name
+    return value
+
+
+def format_datetime(value: datetime) -> str:
+    value = value.astimezone(timezone.utc) if value.tzinfo is not None else value
+    return value.strftime('%Y-%m-%dT%H:%M:%S.') + f'{value.microsecond // 1000:03d}Z'
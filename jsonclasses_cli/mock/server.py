@@ -0,0 +1,139 @@
+from __future__ import annotations
+from typing import Any
+from json import dumps, loads
+from random import Random
+from asyncio import sleep
+from qsparser import parse
+from .schema import Model
+from .store import Store, QueryError
+
+
+Response = tuple[int, Any]
+
+
+class MockServer:
+
+    def __init__(self, store: Store, latency: float = 0, jitter: float = 0, random_seed: int = 0) -> None:
+        self.store = store
+        self.routes = {m.path: m for m in store.models.values()}
+        self.latency = latency
+        self.jitter = jitter
+        self.rng = Random(random_seed)
+        self.requests = 0
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope['type'] != 'http':
+            return
+        body = b''
+        while True:
+            message = await receive()
+            body += message.get('body', b'')
+            if not message.get('more_body'):
+                break
+        self.requests += 1
+        delay = self.latency + (self.rng.uniform(0, self.jitter) if self.jitter > 0 else 0)
+        if delay > 0:
+            await sleep(delay)
+        headers = [(b'access-control-allow-origin', b'*')]
+        if scope['method'] == 'OPTIONS':
+            headers += [(b'access-control-allow-methods', b'OPTIONS, POST, GET, PATCH, DELETE'),
+                        (b'access-control-allow-headers', b'*')]
+            (status, data) = (204, None)
+        else:
+            try:
+                input = loads(body) if body else None
+                (status, data) = self.handle(scope['method'], scope['path'], scope['query_string'].decode(), input)
+            except (QueryError, ValueError, TypeError, AttributeError) as error:
+                (status, data) = (400, _error('ValidationException', str(error)))
+        content = b'' if status == 204 else dumps(data).encode()
+        if status != 204:
+            headers.append((b'content-type', b'application/json'))
+        await send({'type': 'http.response.start', 'status': status, 'headers': headers})
+        await send({'type': 'http.response.body', 'body': content})
+
+    def handle(self, method: str, path: str, qs: str, body: Any) -> Response:
+        query = parse(qs.replace('%5B', '[').replace('%5D', ']')) if qs else {}
+        segments = [s for s in path.split('/') if s != '']
+        model = self.routes.get(segments[0]) if len(segments) > 0 else None
+        if model is None or len(segments) > 2:
+            return (404, _error('NotFound', f'route {method} {path} not found'))
+        store = self.store
+        match (method, segments[1:]):
+            case ('POST', ['session']) if model.session:
+                return self.sign_in(model, body or {}, query)
+            case ('POST', ['ensure']) if 'E' in model.actions:
+                return self.ensure(model, body or {}, query)
+            case ('GET', []) if 'L' in model.actions:
+                return _data([store.render(model, r, query) for r in store.find(model, query)])
+            case ('GET', [id]) if 'R' in model.actions:
+                return self.one(model, id, query)
+            case ('POST', []) if 'C' in model.actions:
+                return self.create(model, body or {}, query)
+            case ('PATCH', []) if 'U' in model.actions:
+                update = (body or {}).get('_update')
+                if not isinstance(update, dict) or not isinstance(update.get('_query'), dict):
+                    return (400, _error('ValidationException', 'update many requires _update._query'))
+                records = store.find(model, {**update['_query'], **query})
+                return _data([store.render(model, store.update(model, r, update.get('_data')), query)
+                              for r in records])
+            case ('PATCH', [id]) if 'U' in model.actions:
+                record = store.get(model, id)
+                if record is None:
+                    return _not_found(model, id)
+                return _data(store.render(model, store.update(model, record, body), query))
+            case ('DELETE', []) if 'D' in model.actions:
+                for record in store.find(model, query):
+                    store.delete(model, record[model.primary])
+                return (204, None)
+            case ('DELETE', [id]) if 'D' in model.actions:
+                return (204, None) if store.delete(model, id) else _not_found(model, id)
+        return (404, _error('NotFound', f'route {method} {path} not found'))
+
+    def one(self, model: Model, id: str, query: dict[str, Any]) -> Response:
+        record = self.store.get(model, id)
+        if record is None:
+            return _not_found(model, id)
+        return _data(self.store.render(model, record, query))
+
+    def create(self, model: Model, body: dict[str, Any], query: dict[str, Any]) -> Response:
+        store = self.store
+        upsert = body.get('_upsert')
+        create = body.get('_create')
+        if upsert is not None and create is None:
+            matched = store.find(model, {**(upsert.get('_query') or {}), '_limit': 1})
+            record = store.update(model, matched[0], upsert.get('_data')) if matched \
+                else store.create(model, upsert.get('_data'))
+            return _data(store.render(model, record, query))
+        if isinstance(create, list):
+            return _data([store.render(model, store.create(model, i), query) for i in create])
+        if isinstance(create, dict):
+            return _data(store.render(model, store.create(model, create.get('_data')), query))
+        return _data(store.render(model, store.create(model, body), query))
+
+    def ensure(self, model: Model, body: dict[str, Any], query: dict[str, Any]) -> Response:
+        matcher = {k: v for (k, v) in body.items() if k in model.unique and v is not None}
+        matched = self.store.find(model, {**matcher, '_limit': 1}) if matcher else []
+        record = self.store.update(model, matched[0], body) if matched else self.store.create(model, body)
+        return _data(self.store.render(model, record, query))
+
+    def sign_in(self, model: Model, body: dict[str, Any], query: dict[str, Any]) -> Response:
+        identities = [k for k in body if model.key(k) in model.identities]
+        if len(identities) != 1:
+            return (400, _error('AuthenticationException', 'no identity provided'))
+        found = self.store.find(model, {identities[0]: body[identities[0]], '_limit': 1})
+        if not found:
+            return (400, _error('AuthenticationException', 'authorizable unit not found'))
+        id = found[0][model.primary]
+        return _data({'token': f'mock-{id}', model.srname: self.store.render(model, found[0], query)})
+
+
+def _data(data: Any) -> Response:
+    return (200, {'data': data})
+
+
+def _not_found(model: Model, id: str) -> Response:
+    return (404, _error('ObjectNotFoundException', f'{model.name} with id \'{id}\' is not found'))
+
+
+def _error(type: str, message: str) -> dict[str, Any]:
+    return {'error': {'type': type, 'message': message}}
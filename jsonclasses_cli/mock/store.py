@@ -0,0 +1,279 @@
+from __future__ import annotations
+from typing import Any, Iterable
+from datetime import datetime, timezone
+from re import compile, escape, IGNORECASE
+from jsonclasses.fdef import FDef, FType
+from .schema import Model, Relation, encode_value, format_datetime
+
+
+Record = dict[str, Any]
+NULLS = ('null', 'NULL', 'nil', 'None', 'NONE')
+
+
+class QueryError(ValueError):
+    pass
+
+
+class Store:
+
+    def __init__(self, models: list[Model]) -> None:
+        self.models = {m.name: m for m in models}
+        self.records: dict[str, dict[str, Record]] = {m.name: {} for m in models}
+        self.sequence = 0
+
+    def next_id(self) -> str:
+        self.sequence += 1
+        return f'{self.sequence:024x}'
+
+    def create(self, model: Model, data: dict[str, Any]) -> Record:
+        values: Record = {model.primary: self.next_id()}
+        for (name, default) in model.defaults.items():
+            values[name] = default()
+        self.assign(model, values, data)
+        record = {k: values[k] for k in model.order if k in values}
+        self.records[model.name][record[model.primary]] = record
+        return record
+
+    def update(self, model: Model, record: Record, data: dict[str, Any]) -> Record:
+        self.assign(model, record, data)
+        now = format_datetime(datetime.now(timezone.utc))
+        for name in model.touch:
+            record[name] = now
+        return record
+
+    def assign(self, model: Model, record: Record, data: dict[str, Any]) -> None:
+        for (name, value) in (data or {}).items():
+            key = model.key(name)
+            if key is None or key == model.primary:
+                continue
+            if key in model.fields:
+                record[key] = encode_value(value, model.fields[key])
+            elif key in model.id_keys or key in model.virtual_keys:
+                if isinstance(value, (str, list)) or value is None:
+                    record[key] = value
+
+    def delete(self, model: Model, id: str) -> bool:
+        return self.records[model.name].pop(id, None) is not None
+
+    def get(self, model: Model, id: str) -> Record | None:
+        return self.records[model.name].get(id)
+
+    def find(self, model: Model, query: dict[str, Any]) -> list[Record]:
+        return self.select(model, self.records[model.name].values(), query)
+
+    def select(self, model: Model, records: Iterable[Record], query: dict[str, Any]) -> list[Record]:
+        result = [r for r in records if self.matches(model, r, query)]
+        for (key, direction) in reversed(orders(model, query.get('_order'))):
+            present = [r for r in result if r.get(key) is not None]
+            absent = [r for r in result if r.get(key) is None]
+            present.sort(key=lambda r: sort_key(model.fields.get(key), r[key]), reverse=direction < 0)
+            result = absent + present if direction > 0 else present + absent
+        page_number = read_int(first(query, '_pageNo', '_pageNumber', '_page_no', '_page_number'))
+        page_size = read_int(first(query, '_pageSize', '_page_size'))
+        if page_number is not None and page_size is not None:
+            skip = (page_number - 1) * page_size
+            return result[skip:skip + page_size]
+        skip = read_int(query.get('_skip')) or 0
+        limit = read_int(query.get('_limit'))
+        return result[skip:] if limit is None else result[skip:skip + limit]
+
+    def matches(self, model: Model, record: Record, query: dict[str, Any]) -> bool:
+        for (name, value) in query.items():
+            if name in ('_or', '_and'):
+                items = value if isinstance(value, list) else list(value.values())
+                results = (self.matches(model, record, item) for item in items)
+                if not (any(results) if name == '_or' else all(results)):
+                    return False
+                continue
+            if name.startswith('_'):
+                continue
+            key = model.key(name)
+            if key is None:
+                raise QueryError(f'unexist field {name}')
+            if key in model.id_keys or key in model.virtual_keys:
+                if not match_ids(record.get(key), value):
+                    return False
+            elif key == model.primary:
+                if not match_value(None, record.get(key), value):
+                    return False
+            elif key in model.fields:
+                if not match_value(model.fields[key], record.get(key), value):
+                    return False
+        return True
+
+    def render(self, model: Model, record: Record, query: dict[str, Any]) -> Record:
+        result = {k: v for (k, v) in record.items() if k not in model.hidden and k not in model.virtual_keys}
+        pick = names(model, query.get('_pick'))
+        if pick:
+            result = {k: v for (k, v) in result.items() if k in pick or k == model.primary}
+        for name in names(model, query.get('_omit')):
+            result.pop(name, None)
+        for (name, subquery) in includes(query.get('_includes')):
+            relation = model.relations.get(name) or model.relations.get(model.output_key(name))
+            if relation is None:
+                raise QueryError(f'unexist relationship {name}')
+            result[relation.name] = self.related(model, record, relation, subquery)
+        return result
+
+    def related(self, model: Model, record: Record, relation: Relation, query: dict[str, Any]) -> Any:
+        target = self.models[relation.target]
+        records = self.records[relation.target]
+        record_id = record[model.primary]
+        if relation.local:
+            value = record.get(relation.id_key)
+            ids = value if isinstance(value, list) else [value] if value is not None else []
+        else:
+            ids = list(record.get(relation.id_key) or []) if relation.join else []
+            for (other_id, other) in records.items():
+                value = other.get(relation.foreign_key)
+                if value == record_id or (isinstance(value, list) and record_id in value):
+                    ids.append(other_id)
+        items = [records[i] for i in dict.fromkeys(ids) if i in records]
+        if not relation.many:
+            return self.render(target, items[0], query) if items else None
+        return [self.render(target, r, query) for r in self.select(target, items, query)]
+
+
+def includes(value: Any) -> list[tuple[str, dict[str, Any]]]:
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [(value, {})]
+    if isinstance(value, dict):
+        return [(k, v if isinstance(v, dict) else {}) for (k, v) in value.items()]
+    result: list[tuple[str, dict[str, Any]]] = []
+    for item in value:
+        result.extend(includes(item))
+    return result
+
+
+def names(model: Model, value: Any) -> set[str]:
+    if value is None:
+        return set()
+    items = [value] if isinstance(value, str) else list(value.values()) if isinstance(value, dict) else value
+    return {model.key(item) or item for item in items}
+
+
+def orders(model: Model, value: Any) -> list[tuple[str, int]]:
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return [o for item in value for o in orders(model, item)]
+    if isinstance(value, dict):
+        return [(model.key(k) or k, -1 if str(v).lower() in ('-1', 'desc') else 1) for (k, v) in value.items()]
+    (name, direction) = (value[1:], -1) if value.startswith('-') else (value, 1)
+    return [(model.key(name) or name, direction)]
+
+
+def sort_key(fdef: FDef | None, value: Any) -> Any:
+    if fdef is not None and fdef.ftype in (FType.DATE, FType.DATETIME):
+        return read_instant(value)
+    return value
+
+
+def match_ids(actual: Any, expected: Any) -> bool:
+    if isinstance(expected, dict):
+        items = expected.get('_or') or expected.get('_and') or []
+        wanted = items if isinstance(items, list) else list(items.values())
+        have = set(actual or []) if isinstance(actual, list) else {actual}
+        return set(wanted) <= have if '_and' in expected else len(have & set(wanted)) > 0
+    if isinstance(expected, list):
+        have = set(actual or []) if isinstance(actual, list) else {actual}
+        return len(have & set(expected)) > 0
+    expected = None if expected in NULLS else expected
+    if isinstance(actual, list):
+        return expected in actual
+    return actual == expected
+
+
+def match_value(fdef: FDef | None, actual: Any, expected: Any) -> bool:
+    if not isinstance(expected, dict):
+        return compare(fdef, actual, expected) == 0
+    insensitive = 'insensitive' == str(expected.get('_mode', '')).lower()
+    flags = IGNORECASE if insensitive else 0
+    for (op, value) in expected.items():
+        match op:
+            case '_eq' | '_equal':
+                if compare(fdef, actual, value) != 0:
+                    return False
+            case '_neq':
+                if compare(fdef, actual, value) == 0:
+                    return False
+            case '_not':
+                if isinstance(value, dict) and match_value(fdef, actual, value):
+                    return False
+                if not isinstance(value, dict) and compare(fdef, actual, value) == 0:
+                    return False
+            case '_null':
+                if (actual is None) != (str(value).lower() in ('true', '1', 'yes')):
+                    return False
+            case '_gt' | '_gte' | '_lt' | '_lte':
+                if actual is None:
+                    return False
+                result = compare(fdef, actual, value)
+                if not {'_gt': result > 0, '_gte': result >= 0, '_lt': result < 0, '_lte': result <= 0}[op]:
+                    return False
+            case '_contains' | '_prefix' | '_suffix' | '_match':
+                pattern = {'_contains': escape(value), '_prefix': '^' + escape(value),
+                           '_suffix': escape(value) + '$', '_match': value}[op]
+                if not isinstance(actual, str) or compile(pattern, flags).search(actual) is None:
+                    return False
+            case '_mode':
+                continue
+            case _:
+                raise QueryError(f'unrecognized matcher key {op}')
+    return True
+
+
+def compare(fdef: FDef | None, actual: Any, expected: Any) -> int:
+    expected = read_value(fdef, expected)
+    if fdef is not None and fdef.ftype in (FType.DATE, FType.DATETIME) and actual is not None:
+        actual = read_instant(actual)
+    if fdef is not None and fdef.ftype == FType.ENUM and actual is not None:
+        (actual, expected) = (str(actual).upper(), None if expected is None else str(expected).upper())
+    if actual == expected:
+        return 0
+    if actual is None or expected is None:
+        return -1
+    try:
+        return -1 if actual < expected else 1
+    except TypeError:
+        return -1
+
+
+def read_value(fdef: FDef | None, value: Any) -> Any:
+    if value is None or value in NULLS:
+        return None
+    if fdef is None or not isinstance(value, str):
+        return value
+    try:
+        match fdef.ftype:
+            case FType.INT:
+                return int(value)
+            case FType.FLOAT:
+                return float(value)
+            case FType.BOOL:
+                return value.lower() in ('true', 'yes', '1')
+            case FType.DATE | FType.DATETIME:
+                return read_instant(value)
+    except ValueError:
+        raise QueryError(f'invalid value {value}')
+    return value
+
+
+def read_instant(value: str) -> datetime:
+    result = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    return result if result.tzinfo is not None else result.replace(tzinfo=timezone.utc)
+
+
+def first(query: dict[str, Any], *names: str) -> Any:
+    return next((query[name] for name in names if query.get(name) is not None), None)
+
+
+def read_int(value: Any) -> int | None:
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise QueryError(f'invalid number {value}')
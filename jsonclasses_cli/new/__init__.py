@@ -7,9 +7,10 @@ from .conf_content import conf_content
 from .mypy_content import mypy_content
 from .gitignore_content import gitignore_content
 from .readme_content import readme_content
+from .service_content import service_content
+from .bootstrap import bootstrap, venv_dir
 from ..utils.yesno import yesno
 from ..utils.write_file import write_file
-from ..utils.run import run
 
 
 def new(dest: Path,
@@ -18,7 +19,9 @@ def new(dest: Path,
         include_admin: bool | None,
         git_init: bool | None,
         venv: bool | None,
-        silent: bool = False):
+        silent: bool = False,
+        production: bool | None = None,
+        refresh: bool = False):
     if interactive:
         if include_user is None:
             include_user = yesno(Prompt.ask('Do you want a user model?', choices=['Yes', 'No'], default='Yes'))
@@ -28,6 +31,8 @@ def new(dest: Path,
             git_init = yesno(Prompt.ask('Init git repo?', choices=['Yes', 'No'], default='Yes'))
         if venv is None:
             venv = yesno(Prompt.ask('Create a virtual env?', choices=['Yes', 'No'], default='Yes'))
+        if production is None:
+            production = yesno(Prompt.ask('Configure production serving?', choices=['Yes', 'No'], default='No'))
     else:
         if include_user is None:
             include_user = False
@@ -37,25 +42,20 @@ def new(dest: Path,
             git_init = True
         if venv is None:
             venv = True
+        if production is None:
+            production = False
     write_file(dest / 'app.py', app_content(include_user=include_user, include_admin=include_admin), silent)
-    write_file(dest / 'requirements.txt', req_content(include_user=include_user, include_admin=include_admin), silent)
-    write_file(dest / 'config.json', conf_content(dest.name), silent)
+    req = req_content(include_user=include_user, include_admin=include_admin, production=production)
+    write_file(dest / 'requirements.txt', req, silent)
+    write_file(dest / 'config.json', conf_content(dest.name, production), silent)
     write_file(dest / 'mypy.ini', mypy_content(), silent)
     write_file(dest / '.gitignore', gitignore_content(), silent)
-    write_file(dest / 'README.md', readme_content(dest), silent)
-    if git_init:
-        if not (dest / '.git').is_dir():
-            run('git init', silent)
-    if venv:
-        if not ((dest / 'venv').is_dir() or (dest / '.venv').is_dir()):
-            dest_venv = dest / '.venv'
-            run(f'python3 -m venv {dest_venv}', silent)
-    if venv:
-        venv_dir = dest / 'venv' if (dest / 'venv').is_dir() else dest / '.venv'
-        venv_act = venv_dir / 'bin/activate'
-        run(f'source {venv_act}; pip install -r requirements.txt', silent)
-    else:
-        run('pip install -r requirements.txt', silent)
+    write_file(dest / 'README.md', readme_content(dest, production), silent)
+    if production:
+        write_file(dest / 'deploy' / f'{dest.name}.service', service_content(dest, venv_dir(dest) if venv else None), silent)
+    bootstrap(dest, req, git_init, venv, silent, refresh)
     if not silent:
         print("🎉[green]Project is successfully created.[/green]")
         print("\n    Run 'uvicorn app:app --reload' to start the development server.\n")
+        if production:
+            print("    Run 'jsonclasses serve' to start the production server.\n")
@@ -0,0 +1,65 @@
+from __future__ import annotations
+from pathlib import Path
+from os import environ
+from sys import executable, version_info, platform
+from shutil import rmtree
+from hashlib import sha256
+from time import time
+from tempfile import mkdtemp
+from platform import machine
+from concurrent.futures import ThreadPoolExecutor
+from ..utils.run import run
+
+
+CACHE_TTL = 24 * 60 * 60
+
+
+def wheel_cache_dir(req: str) -> Path:
+    tag = f'{version_info.major}.{version_info.minor}-{platform}-{machine()}'
+    key = sha256(f'{tag}\n{req}'.encode()).hexdigest()[:16]
+    root = Path(environ.get('XDG_CACHE_HOME') or Path.home() / '.cache')
+    return root / 'jsonclasses' / 'wheels' / key
+
+
+def venv_dir(dest: Path) -> Path:
+    return dest / 'venv' if (dest / 'venv').is_dir() else dest / '.venv'
+
+
+def build_wheels(req_file: Path, cache_dir: Path, refresh: bool = False) -> bool:
+    complete = cache_dir / '.complete'
+    if not refresh and complete.is_file() and time() - complete.stat().st_mtime < CACHE_TTL:
+        return True
+    cache_dir.parent.mkdir(parents=True, exist_ok=True)
+    temp_dir = Path(mkdtemp(dir=cache_dir.parent))
+    if not run([executable, '-m', 'pip', 'wheel', '-q', '-r', str(req_file), '-w', str(temp_dir)]):
+        rmtree(temp_dir, ignore_errors=True)
+        return False
+    (temp_dir / '.complete').touch()
+    rmtree(cache_dir, ignore_errors=True)
+    try:
+        temp_dir.rename(cache_dir)
+    except OSError:
+        rmtree(temp_dir, ignore_errors=True)
+    return complete.is_file()
+
+
+def bootstrap(dest: Path, req: str, git_init: bool, venv: bool, silent: bool = False,
+              refresh: bool = False) -> None:
+    if silent:
+        return
+    req_file = dest / 'requirements.txt'
+    cache_dir = wheel_cache_dir(req)
+    with ThreadPoolExecutor(3) as executor:
+        if git_init and not (dest / '.git').is_dir():
+            executor.submit(run, ['git', 'init', '-q'], False, dest)
+        wheels = executor.submit(build_wheels, req_file, cache_dir, refresh)
+        python = executable
+        if venv:
+            venv_path = venv_dir(dest)
+            if not venv_path.is_dir():
+                run([executable, '-m', 'venv', str(venv_path)])
+            python = str(venv_path / 'bin' / 'python')
+        install = [python, '-m', 'pip', 'install', '-q', '-r', str(req_file)]
+        offline = [*install[:5], '--no-index', '--find-links', str(cache_dir), *install[5:]]
+        if not wheels.result() or not run(offline, False, dest):
+            run(install, False, dest)
@@ -2,11 +2,12 @@ from random import sample
 from jsonclasses_cli.utils.join_lines import join_lines
 
 
-def conf_content(name: str) -> str:
+def conf_content(name: str, production: bool = False) -> str:
     return join_lines([
         '{',
         _pymongo_conf(name),
         _operator_conf(),
+        _serve_conf() if production else '',
         _package_conf(),
         '}'
     ])
@@ -34,6 +35,25 @@ def _pymongo_conf(dbname: str) -> str:
         "url": "mongodb://localhost:27017/{dbname}"
     {'}'},""".strip('\n')
 
+
+def _serve_conf() -> str:
+    return f"""
+    "serve": {'{'}
+        "host": "0.0.0.0",
+        "port": 8000,
+        "workers": "auto",
+        "loop": "uvloop",
+        "http": "httptools",
+        "backlog": 2048,
+        "keepAlive": 5,
+        "gracefulTimeout": 30,
+        "maxRequests": 0,
+        "maxMemory": 0,
+        "statsInterval": 10,
+        "statsPort": 0
+    {'}'},""".strip('\n')
+
+
 def _package_conf() -> str:
     return f"""
     "package": {'{'}
@@ -45,5 +65,8 @@ def _package_conf() -> str:
         {'}'},
         "kotlin": {'{'}
             "url": "http://127.0.0.1:8000"
+        {'}'},
+        "python": {'{'}
+            "url": "http://127.0.0.1:8000"
         {'}'}
     {'}'}""".strip('\n')
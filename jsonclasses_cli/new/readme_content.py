@@ -1,10 +1,30 @@
 from pathlib import Path
 
 
-def readme_content(dest: Path) -> str:
+def readme_content(dest: Path, production: bool = False) -> str:
     return f"""
 {dest.name}
 ========
 
-This project is created with JSONClasses CLI.
+This project is created with JSONClasses CLI.{_production_content(dest) if production else ''}
     """.strip() + '\n'
+
+
+def _production_content(dest: Path) -> str:
+    return f"""
+
+Production
+----------
+
+Run `jsonclasses serve` to start the server with the settings in the
+`serve` section of `config.json`. `"workers": "auto"` starts one worker per
+CPU core.
+
+Every `statsInterval` seconds the server logs requests per second, latency
+percentiles and worker memory. Set `statsPort` to also serve them as JSON on
+`127.0.0.1`. A worker is replaced after `maxRequests` requests or once it uses
+`maxMemory` MB, and `kill -HUP` replaces all workers. The replacement starts
+before the old worker stops, so no request is dropped.
+
+To run it under systemd, copy `deploy/{dest.name}.service` to
+`/etc/systemd/system/` and run `systemctl enable --now {dest.name}`."""
@@ -1,9 +1,18 @@
-def req_content(include_user: bool, include_admin: bool) -> str:
+from ..version import version
+
+
+def req_content(include_user: bool, include_admin: bool, production: bool = False) -> str:
     nl = '\n'
     return f"""
 jsonclasses>=3.2.0,<4.0.0
 jsonclasses-pymongo>=3.2.0,<4.0.0
 jsonclasses-server>=3.2.0,<4.0.0
 thunderlight>=0.1.2,<1.0.0
-inflection-plus>=0.1.0,<1.0.0{f'{nl}bcrypt>=3.2.0,<4.0.0' if include_admin or include_user else ''}
+inflection-plus>=0.1.0,<1.0.0{f'{nl}bcrypt>=3.2.0,<4.0.0' if include_admin or include_user else ''}{_production_reqs() if production else ''}
     """.strip() + '\n'
+
+
+def _production_reqs() -> str:
+    return f"""
+jsonclasses-cli>={version},<4.0.0
+uvicorn[standard]>=0.16.0,<1.0.0"""
@@ -0,0 +1,25 @@
+from pathlib import Path
+from sys import executable
+
+
+def service_content(dest: Path, venv_dir: Path | None, graceful_timeout: int = 30) -> str:
+    bin_dir = venv_dir / 'bin' if venv_dir is not None else Path(executable).parent
+    return f"""
+[Unit]
+Description={dest.name} server
+After=network.target
+
+[Service]
+Type=simple
+WorkingDirectory={dest}
+ExecStart={bin_dir}/jsonclasses serve app.py
+Restart=always
+RestartSec=2
+KillSignal=SIGTERM
+TimeoutStopSec={graceful_timeout + 5}
+LimitNOFILE=65536
+Environment=PYTHONUNBUFFERED=1
+
+[Install]
+WantedBy=multi-user.target
+    """.strip() + '\n'
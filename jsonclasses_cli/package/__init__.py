@@ -1,24 +1,60 @@
 from typing import Literal
 from pathlib import Path
-from sys import path
-from importlib import import_module
-from os.path import splitext
-from unittest.mock import patch
 from jsonclasses.cgraph import CGraph
-from .kotlin import kotlin
-from .swift import swift
-from .ts import ts
+from .kotlin import kotlin, kotlin_files
+from .python import python, python_files
+from .swift import swift, swift_files
+from .ts import ts, ts_files, js, js_files
+from .parallel import Fragments, model_fragments
+from ..utils.import_app import import_app
 
 
-
-def package(dest: Path, app_file: Path, lang: Literal['ts', 'swift', 'kotlin'], cgraph_name: str = 'default', silent: bool = False):
-    path.append(str(app_file.parent))
-    import_module(splitext(app_file.name)[0], str(app_file.parent)).__dict__
+def package(dest: Path,
+            app_file: Path,
+            lang: Literal['ts', 'js', 'swift', 'kotlin', 'python'],
+            cgraph_name: str = 'default',
+            silent: bool = False,
+            validate: bool = False,
+            jobs: int = 1):
+    import_app(app_file)
     cgraph = CGraph(cgraph_name)
+    fragments = model_fragments(app_file, cgraph, lang, validate, jobs)
+    generate(dest, cgraph, lang, silent, validate, fragments)
+
+
+def generate(dest: Path,
+             cgraph: CGraph,
+             lang: Literal['ts', 'js', 'swift', 'kotlin', 'python'],
+             silent: bool = False,
+             validate: bool = False,
+             fragments: Fragments | None = None):
+    match lang:
+        case 'swift':
+            swift(dest, cgraph, silent, fragments)
+        case 'kotlin':
+            kotlin(dest, cgraph, silent, fragments)
+        case 'python':
+            python(dest, cgraph, silent, fragments)
+        case 'ts':
+            ts(dest, cgraph, silent, validate, fragments)
+        case 'js':
+            js(dest, cgraph, silent, validate, fragments)
+
+
+def render(dest: Path,
+           cgraph: CGraph,
+           lang: Literal['ts', 'js', 'swift', 'kotlin', 'python'],
+           validate: bool = False,
+           fragments: Fragments | None = None) -> dict[Path, str]:
     match lang:
         case 'swift':
-            swift(dest, cgraph, silent)
+            return swift_files(dest, cgraph, fragments)
         case 'kotlin':
-            kotlin(dest, cgraph, silent)
+            return kotlin_files(dest, cgraph, fragments)
+        case 'python':
+            return python_files(dest, cgraph, fragments)
         case 'ts':
-            ts(dest, cgraph, silent)
+            return ts_files(dest, cgraph, validate, fragments)
+        case 'js':
+            return js_files(dest, cgraph, validate, fragments)
+    raise ValueError(f'unsupported language: {lang}')
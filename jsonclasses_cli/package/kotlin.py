@@ -1,6 +0,0 @@
-from pathlib import Path
-from jsonclasses.cgraph import CGraph
-
-
-def kotlin(dest: Path, cgraph: CGraph, silent: bool = False):
-    print("KOTLIN")
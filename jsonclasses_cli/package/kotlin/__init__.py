@@ -0,0 +1,29 @@
+from pathlib import Path
+from jsonclasses.cgraph import CGraph
+from .main_program_content import Fragments, main_program_content
+from .build_gradle_content import build_gradle_content
+from .settings_gradle_content import settings_gradle_content
+from .gitignore_content import gitignore_content
+from .readme_content import readme_content
+from ...utils.write_file import write_file
+
+
+def kotlin(dest: Path,
+           cgraph: CGraph,
+           silent: bool = False,
+           fragments: Fragments | None = None):
+    for (path, content) in kotlin_files(dest, cgraph, fragments).items():
+        write_file(path, content, silent)
+
+
+def kotlin_files(dest: Path,
+                 cgraph: CGraph,
+                 fragments: Fragments | None = None) -> dict[Path, str]:
+    package_dest = dest / 'packages' / 'kotlin'
+    return {
+        package_dest / 'src' / 'main' / 'kotlin' / 'API.kt': main_program_content(cgraph, fragments),
+        package_dest / 'build.gradle.kts': build_gradle_content(),
+        package_dest / 'settings.gradle.kts': settings_gradle_content(),
+        package_dest / 'README.md': readme_content(),
+        package_dest / '.gitignore': gitignore_content(),
+    }
@@ -0,0 +1,165 @@
+from inflection import camelize, pascalize
+from jsonclasses.cdef import CDef
+from .serializable_class import SerializableClassItem, serializable_class, serializable_class_item
+from .serializable_enum import serializable_enum, serializable_enum_item
+from .jtype_to_kotlin_type import jtype_to_kotlin_type
+from .shared_utils import (
+    class_create_input_items, class_update_input_items, class_include_items,
+    list_query_items, is_field_primary, is_field_local_key, is_field_queryable,
+    is_field_ref, field_can_read, field_ref_id_name,
+    constant_name, kotlin_name
+)
+from ...utils.join_lines import join_lines
+from ...utils.package_utils import (
+    to_create_input, to_update_input, to_sort_orders, to_result_picks,
+    to_single_query, to_seek_query, to_query_data, to_list_query, to_result
+)
+from ...utils.profile import traced
+
+
+@traced
+def data_class(cdef: CDef) -> str:
+    return join_lines([
+        _class_create_input(cdef),
+        _class_update_input(cdef),
+        _class_sort_orders(cdef),
+        _class_result_picks(cdef),
+        _class_single_query(cdef),
+        _class_seek_query(cdef),
+        _class_query_data(cdef),
+        _class_list_query(cdef),
+        _class_result(cdef),
+    ], 2)
+
+
+def _input_items(items: list[tuple[str, str, bool]]) -> list[SerializableClassItem]:
+    return [serializable_class_item(kotlin_name(n), t, o) for (n, t, o) in items]
+
+
+def _class_create_input(cdef: CDef) -> str:
+    return serializable_class(to_create_input(cdef), _input_items(class_create_input_items(cdef)))
+
+
+def _class_update_input(cdef: CDef) -> str:
+    return serializable_class(to_update_input(cdef), _input_items(class_update_input_items(cdef)))
+
+
+def _class_sort_orders(cdef: CDef) -> str:
+    names: list[str] = []
+    for field in cdef.fields:
+        if not is_field_queryable(field):
+            continue
+        if is_field_primary(field):
+            continue
+        if is_field_ref(field):
+            continue
+        if not field_can_read(field):
+            continue
+        names.append(camelize(field.name))
+    items: list[str] = []
+    cases: list[str] = []
+    for name in names:
+        asc = constant_name(name)
+        desc = asc + '_DESC'
+        items.append(serializable_enum_item(asc, name))
+        items.append(serializable_enum_item(desc, '-' + name))
+        cases.append(f'        {asc} -> {desc}')
+        cases.append(f'        {desc} -> {asc}')
+    if len(names) == 0:
+        return serializable_enum(to_sort_orders(cdef), items)
+    return serializable_enum(to_sort_orders(cdef), items, [join_lines([
+        f'    operator fun unaryMinus(): {to_sort_orders(cdef)} = when (this) {"{"}',
+        *cases,
+        '    }',
+    ], 1)])
+
+
+def _class_result_picks(cdef: CDef) -> str:
+    items: list[str] = []
+    for field in cdef.fields:
+        if not field_can_read(field):
+            continue
+        name = camelize(field.name)
+        items.append(serializable_enum_item(constant_name(name), name))
+        if is_field_local_key(field):
+            idname = field_ref_id_name(field)
+            items.append(serializable_enum_item(constant_name(idname), idname))
+    return serializable_enum(to_result_picks(cdef), items)
+
+
+def _picks_omits_items(cdef: CDef) -> list[SerializableClassItem]:
+    items = [
+        serializable_class_item('_pick', f'List<{to_result_picks(cdef)}>', True),
+        serializable_class_item('_omit', f'List<{to_result_picks(cdef)}>', True),
+    ]
+    if len(class_include_items(cdef)) > 0:
+        items.append(serializable_class_item('_includes', 'List<JsonElement>', True))
+    return items
+
+
+def _picks_omits_methods(cdef: CDef, query: str) -> list[str]:
+    rpname = to_result_picks(cdef)
+    return [
+        f'    fun pick(vararg picks: {rpname}): {query} = copy(_pick = picks.toList())',
+        f'    fun omit(vararg omits: {rpname}): {query} = copy(_omit = omits.toList())',
+        *map(lambda i: _include_method(query, i[0], i[1]), class_include_items(cdef)),
+    ]
+
+
+def _include_method(query: str, name: str, qtype: str) -> str:
+    return join_lines([
+        f'    fun include{pascalize(name)}(query: {qtype}? = null): {query} =',
+        f'        copy(_includes = _includes.orEmpty() + include("{name}", {qtype}.serializer(), query))',
+    ], 1)
+
+
+def _class_single_query(cdef: CDef) -> str:
+    name = to_single_query(cdef)
+    return serializable_class(name, _picks_omits_items(cdef), [
+        join_lines(_picks_omits_methods(cdef, name), 1)
+    ])
+
+
+def _class_seek_query(cdef: CDef) -> str:
+    items = [serializable_class_item(kotlin_name(n), t, True) for (n, t) in list_query_items(cdef)]
+    return serializable_class(to_seek_query(cdef), items)
+
+
+def _class_query_data(cdef: CDef) -> str:
+    return serializable_class(to_query_data(cdef), [
+        serializable_class_item('_query', to_seek_query(cdef), False),
+        serializable_class_item('_data', to_update_input(cdef), False),
+    ])
+
+
+def _class_list_query(cdef: CDef) -> str:
+    name = to_list_query(cdef)
+    items = [serializable_class_item(kotlin_name(n), t, True) for (n, t) in list_query_items(cdef)]
+    items.extend([
+        serializable_class_item('_order', f'List<{to_sort_orders(cdef)}>', True),
+        serializable_class_item('_limit', 'Int', True),
+        serializable_class_item('_skip', 'Int', True),
+        serializable_class_item('_pageNo', 'Int', True),
+        serializable_class_item('_pageSize', 'Int', True),
+        *_picks_omits_items(cdef),
+    ])
+    return serializable_class(name, items, [join_lines([
+        f'    fun order(vararg orders: {to_sort_orders(cdef)}): {name} = copy(_order = _order.orEmpty() + orders)',
+        f'    fun limit(limit: Int): {name} = copy(_limit = limit)',
+        f'    fun skip(skip: Int): {name} = copy(_skip = skip)',
+        f'    fun pageNo(pageNo: Int): {name} = copy(_pageNo = pageNo)',
+        f'    fun pageSize(pageSize: Int): {name} = copy(_pageSize = pageSize)',
+        *_picks_omits_methods(cdef, name),
+    ], 1)])
+
+
+def _class_result(cdef: CDef) -> str:
+    items: list[SerializableClassItem] = []
+    for field in cdef.fields:
+        if not field_can_read(field):
+            continue
+        name = kotlin_name(camelize(field.name))
+        items.append(serializable_class_item(name, jtype_to_kotlin_type(field.fdef, 'R'), True))
+        if is_field_local_key(field):
+            items.append(serializable_class_item(field_ref_id_name(field), 'String', True))
+    return serializable_class(to_result(cdef), items)
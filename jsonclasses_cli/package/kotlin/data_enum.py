@@ -0,0 +1,8 @@
+from enum import Enum
+from .serializable_enum import serializable_enum, serializable_enum_item
+from ...utils.profile import traced
+
+
+@traced
+def data_enum(enum: type[Enum]) -> str:
+    return serializable_enum(enum.__name__, [serializable_enum_item(o.name) for o in enum])
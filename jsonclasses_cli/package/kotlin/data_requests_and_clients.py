@@ -0,0 +1,346 @@
+from typing import cast
+from inflection import camelize, pascalize, pluralize
+from jsonclasses.cdef import CDef
+from jsonclasses_server.aconf import AConf
+from .shared_utils import (
+    class_create_input_items, class_update_input_items, class_include_items, list_query_items
+)
+from ...utils.join_lines import join_lines
+from ...utils.package_utils import (
+    class_needs_api, class_needs_session, to_client, to_create_input, to_create_many_request,
+    to_create_request, to_delete_many_request, to_delete_request, to_id_request, to_list_query,
+    to_list_request, to_query_data, to_result, to_result_picks, to_seek_query, to_session_input,
+    to_sign_in_request, to_single_query, to_sort_orders, to_update_input, to_update_many_request,
+    to_update_request, to_upsert_request
+)
+from ...utils.profile import traced
+
+
+@traced
+def data_client_instances(cdef: CDef) -> str:
+    if not class_needs_api(cdef):
+        return ''
+    var_name = camelize(pluralize(cdef.name))
+    return f'val {var_name} = {to_client(cdef)}()'
+
+
+@traced
+def data_requests_and_clients(cdef: CDef) -> str:
+    if not class_needs_api(cdef):
+        return ''
+    aconf = cast(AConf, cdef.cls.aconf)
+    url = '/' + aconf.name
+    return join_lines([
+        _data_create_request(cdef, url) if 'C' in aconf.actions else '',
+        _data_update_request(cdef, url) if 'U' in aconf.actions else '',
+        _data_delete_request(cdef, url) if 'D' in aconf.actions else '',
+        _data_id_request(cdef, url) if 'R' in aconf.actions else '',
+        _data_upsert_request(cdef, url) if 'C' in aconf.actions and 'U' in aconf.actions else '',
+        _data_create_many_request(cdef, url) if 'C' in aconf.actions else '',
+        _data_update_many_request(cdef, url) if 'U' in aconf.actions else '',
+        _data_delete_many_request(cdef, url) if 'D' in aconf.actions else '',
+        _data_list_request(cdef, url) if 'L' in aconf.actions else '',
+        _data_sign_in_request(cdef, url) if class_needs_session(cdef) else '',
+        _data_client(cdef, aconf),
+    ], 2)
+
+
+def _request_class(name: str, params: list[str], body: list[str]) -> str:
+    return join_lines([
+        f'class {name} internal constructor(',
+        *map(lambda p: f'    {p},', params),
+        ') {',
+        join_lines(body, 2),
+        '}',
+    ], 1)
+
+
+def _single_query_methods(cdef: CDef, request: str) -> list[str]:
+    rpname = to_result_picks(cdef)
+    return [
+        join_lines([
+            f'    fun pick(vararg picks: {rpname}): {request} = apply {"{"} query = query.pick(*picks) {"}"}',
+            f'    fun omit(vararg omits: {rpname}): {request} = apply {"{"} query = query.omit(*omits) {"}"}',
+            *map(lambda i: _include_method(request, i[0], i[1]), class_include_items(cdef)),
+        ], 1)
+    ]
+
+
+def _include_method(request: str, name: str, qtype: str) -> str:
+    method = 'include' + pascalize(name)
+    return join_lines([
+        f'    fun {method}(query: {qtype}? = null): {request} =',
+        f'        apply {"{"} this.query = this.query.{method}(query) {"}"}',
+    ], 1)
+
+
+def _exec(result: str, call: str, args: list[str]) -> str:
+    return join_lines([
+        f'    suspend fun exec(){result} = with(RequestManager) {"{"}',
+        f'        {call}(',
+        *map(lambda a: f'            {a},', args),
+        '        )',
+        '    }',
+    ], 1)
+
+
+def _single_query_arg(cdef: CDef) -> str:
+    return f'encode({to_single_query(cdef)}.serializer(), query)'
+
+
+def _result_serializer(cdef: CDef, many: bool = False) -> str:
+    if many:
+        return f'ListSerializer({to_result(cdef)}.serializer())'
+    return f'{to_result(cdef)}.serializer()'
+
+
+def _data_create_request(cdef: CDef, url: str) -> str:
+    name = to_create_request(cdef)
+    return _request_class(name, [
+        f'private val input: {to_create_input(cdef)}',
+        f'private var query: {to_single_query(cdef)} = {to_single_query(cdef)}()',
+    ], [
+        *_single_query_methods(cdef, name),
+        _exec(f': {to_result(cdef)}', 'post', [
+            f'"{url}"',
+            f'encode({to_create_input(cdef)}.serializer(), input)',
+            _single_query_arg(cdef),
+            _result_serializer(cdef),
+        ]),
+    ])
+
+
+def _data_update_request(cdef: CDef, url: str) -> str:
+    name = to_update_request(cdef)
+    return _request_class(name, [
+        'private val id: String',
+        f'private val input: {to_update_input(cdef)}',
+        f'private var query: {to_single_query(cdef)} = {to_single_query(cdef)}()',
+    ], [
+        *_single_query_methods(cdef, name),
+        _exec(f': {to_result(cdef)}', 'patch', [
+            f'"{url}/$id"',
+            f'encode({to_update_input(cdef)}.serializer(), input)',
+            _single_query_arg(cdef),
+            _result_serializer(cdef),
+        ]),
+    ])
+
+
+def _data_delete_request(cdef: CDef, url: str) -> str:
+    return _request_class(to_delete_request(cdef), [
+        'private val id: String',
+    ], [
+        _exec('', 'delete', [f'"{url}/$id"']),
+    ])
+
+
+def _data_id_request(cdef: CDef, url: str) -> str:
+    name = to_id_request(cdef)
+    return _request_class(name, [
+        'private val id: String',
+        f'private var query: {to_single_query(cdef)} = {to_single_query(cdef)}()',
+    ], [
+        *_single_query_methods(cdef, name),
+        _exec(f': {to_result(cdef)}', 'get', [
+            f'"{url}/$id"',
+            _single_query_arg(cdef),
+            _result_serializer(cdef),
+        ]),
+    ])
+
+
+def _data_upsert_request(cdef: CDef, url: str) -> str:
+    name = to_upsert_request(cdef)
+    return _request_class(name, [
+        f'private val input: {to_query_data(cdef)}',
+        f'private var query: {to_single_query(cdef)} = {to_single_query(cdef)}()',
+    ], [
+        *_single_query_methods(cdef, name),
+        _exec(f': {to_result(cdef)}', 'post', [
+            f'"{url}"',
+            f'buildJsonObject {"{"} put("_upsert", encode({to_query_data(cdef)}.serializer(), input)) {"}"}',
+            _single_query_arg(cdef),
+            _result_serializer(cdef),
+        ]),
+    ])
+
+
+def _data_create_many_request(cdef: CDef, url: str) -> str:
+    name = to_create_many_request(cdef)
+    return _request_class(name, [
+        f'private val input: List<{to_create_input(cdef)}>',
+        f'private var query: {to_single_query(cdef)} = {to_single_query(cdef)}()',
+    ], [
+        *_single_query_methods(cdef, name),
+        _exec(f': List<{to_result(cdef)}>', 'post', [
+            f'"{url}"',
+            f'buildJsonObject {"{"} put("_create", encode(ListSerializer({to_create_input(cdef)}.serializer()), input)) {"}"}',
+            _single_query_arg(cdef),
+            _result_serializer(cdef, True),
+        ]),
+    ])
+
+
+def _data_update_many_request(cdef: CDef, url: str) -> str:
+    name = to_update_many_request(cdef)
+    return _request_class(name, [
+        f'private val input: {to_query_data(cdef)}',
+        f'private var query: {to_single_query(cdef)} = {to_single_query(cdef)}()',
+    ], [
+        *_single_query_methods(cdef, name),
+        _exec(f': List<{to_result(cdef)}>', 'patch', [
+            f'"{url}"',
+            f'buildJsonObject {"{"} put("_update", encode({to_query_data(cdef)}.serializer(), input)) {"}"}',
+            _single_query_arg(cdef),
+            _result_serializer(cdef, True),
+        ]),
+    ])
+
+
+def _data_delete_many_request(cdef: CDef, url: str) -> str:
+    return _request_class(to_delete_many_request(cdef), [
+        f'private val query: {to_seek_query(cdef)}',
+    ], [
+        _exec('', 'delete', [
+            f'"{url}"',
+            f'encode({to_seek_query(cdef)}.serializer(), query)',
+        ]),
+    ])
+
+
+def _data_list_request(cdef: CDef, url: str) -> str:
+    name = to_list_request(cdef)
+    rpname = to_result_picks(cdef)
+    return _request_class(name, [
+        f'private var query: {to_list_query(cdef)} = {to_list_query(cdef)}()',
+    ], [
+        join_lines([
+            f'    fun order(vararg orders: {to_sort_orders(cdef)}): {name} = apply {"{"} query = query.order(*orders) {"}"}',
+            f'    fun limit(limit: Int): {name} = apply {"{"} query = query.limit(limit) {"}"}',
+            f'    fun skip(skip: Int): {name} = apply {"{"} query = query.skip(skip) {"}"}',
+            f'    fun pageNo(pageNo: Int): {name} = apply {"{"} query = query.pageNo(pageNo) {"}"}',
+            f'    fun pageSize(pageSize: Int): {name} = apply {"{"} query = query.pageSize(pageSize) {"}"}',
+            f'    fun pick(vararg picks: {rpname}): {name} = apply {"{"} query = query.pick(*picks) {"}"}',
+            f'    fun omit(vararg omits: {rpname}): {name} = apply {"{"} query = query.omit(*omits) {"}"}',
+            *map(lambda i: _include_method(name, i[0], i[1]), class_include_items(cdef)),
+        ], 1),
+        _exec(f': List<{to_result(cdef)}>', 'get', [
+            f'"{url}"',
+            f'encode({to_list_query(cdef)}.serializer(), query)',
+            _result_serializer(cdef, True),
+        ]),
+        _list_request_flow(cdef, name),
+    ])
+
+
+def _list_request_flow(cdef: CDef, name: str) -> str:
+    return f"""
+    fun asFlow(pageSize: Int = 100): Flow<{to_result(cdef)}> = flow {'{'}
+        var skip = query._skip ?: 0
+        var remaining = query._limit
+        while (remaining == null || remaining > 0) {'{'}
+            val limit = if (remaining == null) pageSize else minOf(pageSize, remaining)
+            val page = {name}(query.copy(_skip = skip, _limit = limit, _pageNo = null, _pageSize = null)).exec()
+            page.forEach {'{'} emit(it) {'}'}
+            if (page.size < limit) {'{'}
+                break
+            {'}'}
+            skip += limit
+            remaining = remaining?.minus(limit)
+        {'}'}
+    {'}'}""".strip('\n')
+
+
+def _data_sign_in_request(cdef: CDef, url: str) -> str:
+    name = to_sign_in_request(cdef)
+    return _request_class(name, [
+        f'private val input: {to_session_input(cdef)}',
+        f'private var query: {to_single_query(cdef)} = {to_single_query(cdef)}()',
+    ], [
+        *_single_query_methods(cdef, name),
+        join_lines([
+            '    suspend fun exec(): Session {',
+            '        val session = RequestManager.post(',
+            f'            "{url}/session",',
+            f'            RequestManager.encode({to_session_input(cdef)}.serializer(), input),',
+            f'            RequestManager.encode({to_single_query(cdef)}.serializer(), query),',
+            '            Session.serializer(),',
+            '        )',
+            '        SessionManager.session = session',
+            '        return session',
+            '    }',
+        ], 1),
+    ])
+
+
+def _params(items: list[tuple[str, str, bool]]) -> list[str]:
+    return [f"        {n}: {t}{'? = null' if o else ''}," for (n, t, o) in items]
+
+
+def _args(items: list[tuple[str, str, bool]]) -> list[str]:
+    return [f'            {n} = {n},' for (n, _, _) in items]
+
+
+def _data_client(cdef: CDef, aconf: AConf) -> str:
+    create_items = class_create_input_items(cdef)
+    update_items = class_update_input_items(cdef)
+    query_items = [(n, t, True) for (n, t) in list_query_items(cdef)]
+    methods: list[str] = []
+    if 'C' in aconf.actions:
+        methods.append(join_lines([
+            f'    fun create(input: {to_create_input(cdef)}): {to_create_request(cdef)} = {to_create_request(cdef)}(input)',
+            '\n',
+            '    fun create(',
+            *_params(create_items),
+            f'    ): {to_create_request(cdef)} = create(',
+            f'        {to_create_input(cdef)}(',
+            *_args(create_items),
+            '        )',
+            '    )',
+        ], 1))
+    if 'U' in aconf.actions:
+        methods.append(join_lines([
+            f'    fun update(id: String, input: {to_update_input(cdef)}): {to_update_request(cdef)} = {to_update_request(cdef)}(id, input)',
+            '\n',
+            '    fun update(',
+            '        id: String,',
+            *_params(update_items),
+            f'    ): {to_update_request(cdef)} = update(',
+            '        id,',
+            f'        {to_update_input(cdef)}(',
+            *_args(update_items),
+            '        )',
+            '    )',
+        ], 1))
+    if 'D' in aconf.actions:
+        methods.append(f'    suspend fun delete(id: String): Unit = {to_delete_request(cdef)}(id).exec()')
+    if 'R' in aconf.actions:
+        methods.append(f'    fun id(id: String): {to_id_request(cdef)} = {to_id_request(cdef)}(id)')
+    if 'L' in aconf.actions:
+        methods.append(join_lines([
+            f'    fun find(query: {to_list_query(cdef)}): {to_list_request(cdef)} = {to_list_request(cdef)}(query)',
+            '\n',
+            '    fun find(',
+            *_params(query_items),
+            f'    ): {to_list_request(cdef)} = find(',
+            f'        {to_list_query(cdef)}(',
+            *_args(query_items),
+            '        )',
+            '    )',
+        ], 1))
+    if 'C' in aconf.actions and 'U' in aconf.actions:
+        methods.append(f'    fun upsert(query: {to_seek_query(cdef)}, data: {to_update_input(cdef)}): {to_upsert_request(cdef)} =\n        {to_upsert_request(cdef)}({to_query_data(cdef)}(query, data))')
+    if 'C' in aconf.actions:
+        methods.append(f'    fun createMany(input: List<{to_create_input(cdef)}>): {to_create_many_request(cdef)} = {to_create_many_request(cdef)}(input)')
+    if 'U' in aconf.actions:
+        methods.append(f'    fun updateMany(query: {to_seek_query(cdef)}, data: {to_update_input(cdef)}): {to_update_many_request(cdef)} =\n        {to_update_many_request(cdef)}({to_query_data(cdef)}(query, data))')
+    if 'D' in aconf.actions:
+        methods.append(f'    suspend fun deleteMany(query: {to_seek_query(cdef)} = {to_seek_query(cdef)}()): Unit = {to_delete_many_request(cdef)}(query).exec()')
+    if class_needs_session(cdef):
+        methods.append(f'    fun signIn(input: {to_session_input(cdef)}): {to_sign_in_request(cdef)} = {to_sign_in_request(cdef)}(input)')
+    return join_lines([
+        f'class {to_client(cdef)} internal constructor() {"{"}',
+        join_lines(methods, 2),
+        '}',
+    ], 1)
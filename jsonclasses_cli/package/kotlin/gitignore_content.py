@@ -0,0 +1,9 @@
+def gitignore_content() -> str:
+    return """
+.DS_Store
+.gradle/
+build/
+.idea/
+*.iml
+local.properties
+    """.strip() + '\n'
@@ -0,0 +1,48 @@
+def links() -> str:
+    return """
+@Serializable
+data class LinkAction(
+    @SerialName("_add") val add: String? = null,
+    @SerialName("_del") val del: String? = null,
+)
+
+@Serializable(with = CreateOrLinkSerializer::class)
+sealed class CreateOrLink<out T> {
+    data class Create<T>(val input: T) : CreateOrLink<T>()
+    data class Link(val id: String) : CreateOrLink<Nothing>()
+}
+
+@Serializable(with = UpdateOrLinkSerializer::class)
+sealed class UpdateOrLink<out T> {
+    data class Update<T>(val input: T) : UpdateOrLink<T>()
+    data class Link(val id: String) : UpdateOrLink<Nothing>()
+    data class Unlink(val id: String) : UpdateOrLink<Nothing>()
+}
+
+class CreateOrLinkSerializer<T>(private val inputSerializer: KSerializer<T>) : KSerializer<CreateOrLink<T>> {
+
+    override val descriptor: SerialDescriptor = inputSerializer.descriptor
+
+    override fun serialize(encoder: Encoder, value: CreateOrLink<T>) = when (value) {
+        is CreateOrLink.Create -> encoder.encodeSerializableValue(inputSerializer, value.input)
+        is CreateOrLink.Link -> encoder.encodeSerializableValue(LinkAction.serializer(), LinkAction(add = value.id))
+    }
+
+    override fun deserialize(decoder: Decoder): CreateOrLink<T> =
+        CreateOrLink.Create(decoder.decodeSerializableValue(inputSerializer))
+}
+
+class UpdateOrLinkSerializer<T>(private val inputSerializer: KSerializer<T>) : KSerializer<UpdateOrLink<T>> {
+
+    override val descriptor: SerialDescriptor = inputSerializer.descriptor
+
+    override fun serialize(encoder: Encoder, value: UpdateOrLink<T>) = when (value) {
+        is UpdateOrLink.Update -> encoder.encodeSerializableValue(inputSerializer, value.input)
+        is UpdateOrLink.Link -> encoder.encodeSerializableValue(LinkAction.serializer(), LinkAction(add = value.id))
+        is UpdateOrLink.Unlink -> encoder.encodeSerializableValue(LinkAction.serializer(), LinkAction(del = value.id))
+    }
+
+    override fun deserialize(decoder: Decoder): UpdateOrLink<T> =
+        UpdateOrLink.Update(decoder.decodeSerializableValue(inputSerializer))
+}
+    """.strip() + '\n'
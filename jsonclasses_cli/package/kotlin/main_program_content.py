@@ -0,0 +1,52 @@
+from jsonclasses.cdef import CDef
+from jsonclasses.cgraph import CGraph
+from jsonclasses.uconf import uconf
+from .import_lines import import_lines
+from .query_classes import query_classes
+from .instant_serializer import instant_serializer
+from .links import links
+from .response import response_class
+from .data_enum import data_enum
+from .data_class import data_class
+from .session_items import session_items
+from .session_input import session_input
+from .session import session
+from .session_manager import session_manager
+from .request_manager import request_manager
+from .data_requests_and_clients import data_requests_and_clients, data_client_instances
+from ...utils.join_lines import join_lines
+from ...utils.package_utils import session_input_cdefs
+
+
+Fragments = dict[str, dict[str, str]]
+
+
+def main_program_content(cgraph: CGraph, fragments: Fragments | None = None) -> str:
+    if fragments is None:
+        fragments = {c.name: model_fragments(c) for c in cgraph._map.values()}
+    session_classes = session_items(cgraph)
+    use_session = len(session_classes) > 0
+    request_url = uconf()['package.kotlin.url']
+    return join_lines([
+        import_lines(use_session),
+        instant_serializer(),
+        query_classes(),
+        links(),
+        response_class(),
+        *map(lambda e: data_enum(e), cgraph._enum_map.values()),
+        *map(lambda c: fragments[c.name]['class'], cgraph._map.values()),
+        *map(lambda c: session_input(c), session_input_cdefs(cgraph)),
+        session(session_classes) if use_session else '',
+        session_manager() if use_session else '',
+        request_manager(request_url, use_session),
+        *map(lambda c: fragments[c.name]['requests'], cgraph._map.values()),
+        join_lines(map(lambda c: fragments[c.name]['client_instances'], cgraph._map.values()), 1),
+    ], 2)
+
+
+def model_fragments(cdef: CDef) -> dict[str, str]:
+    return {
+        'class': data_class(cdef),
+        'requests': data_requests_and_clients(cdef),
+        'client_instances': data_client_instances(cdef),
+    }
@@ -0,0 +1,38 @@
+from .serializable_class import serializable_class, serializable_class_item
+from .serializable_enum import serializable_enum, serializable_enum_item
+from ...utils.join_lines import join_lines
+
+
+def query_classes() -> str:
+    return join_lines([
+        _mode_enum(),
+        _query_class('StringQuery', 'String', ['eq', 'neq', 'null', 'gt', 'gte', 'lt', 'lte', 'contains', 'prefix', 'suffix', 'match', 'mode', 'or', 'and']),
+        _query_class('IntQuery', 'Int', ['eq', 'neq', 'null', 'gt', 'gte', 'lt', 'lte', 'or', 'and']),
+        _query_class('FloatQuery', 'Double', ['eq', 'neq', 'null', 'gt', 'gte', 'lt', 'lte', 'or', 'and']),
+        _query_class('BoolQuery', 'Boolean', ['eq', 'neq', 'null', 'or', 'and']),
+        _query_class('DateQuery', 'Instant', ['eq', 'neq', 'null', 'gt', 'gte', 'lt', 'lte', 'or', 'and']),
+        _query_class('IDQuery', 'String', ['eq', 'neq', 'null']),
+    ], 2)
+
+
+def _mode_enum() -> str:
+    return serializable_enum('Mode', [
+        serializable_enum_item('DEFAULT', 'default'),
+        serializable_enum_item('INSENSITIVE', 'insensitive'),
+    ])
+
+
+def _query_class(name: str, value_type: str, operators: list[str]) -> str:
+    return serializable_class(name, [_query_item(name, value_type, o) for o in operators])
+
+
+def _query_item(name: str, value_type: str, operator: str) -> tuple[str, str, bool, str]:
+    match operator:
+        case 'null':
+            return serializable_class_item('isNull', 'Boolean', True, '_null')
+        case 'mode':
+            return serializable_class_item('mode', 'Mode', True, '_mode')
+        case 'or' | 'and':
+            return serializable_class_item(operator, f'List<{name}>', True, '_' + operator)
+        case _:
+            return serializable_class_item(operator, value_type, True, '_' + operator)
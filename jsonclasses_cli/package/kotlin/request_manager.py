@@ -0,0 +1,85 @@
+def request_manager(url: str, use_session: bool) -> str:
+    return f"""
+object RequestManager {'{'}
+
+    var baseUrl: String = "{url}"
+
+    internal val json = Json {'{'}
+        ignoreUnknownKeys = true
+        explicitNulls = false
+    {'}'}
+
+    private val mediaType = "application/json; charset=utf-8".toMediaType()
+
+    private val client = OkHttpClient.Builder()
+        .connectionPool(ConnectionPool(8, 5, TimeUnit.MINUTES))
+        .dispatcher(Dispatcher().apply {'{'} maxRequestsPerHost = 8 {'}'})
+        .build()
+
+    internal fun <T> encode(serializer: SerializationStrategy<T>, value: T): JsonElement =
+        json.encodeToJsonElement(serializer, value)
+
+    internal suspend fun <T> get(url: String, query: JsonElement?, serializer: KSerializer<T>): T =
+        decode(send("GET", url, null, query), serializer)
+
+    internal suspend fun <T> post(url: String, input: JsonElement, query: JsonElement?, serializer: KSerializer<T>): T =
+        decode(send("POST", url, input, query), serializer)
+
+    internal suspend fun <T> patch(url: String, input: JsonElement, query: JsonElement?, serializer: KSerializer<T>): T =
+        decode(send("PATCH", url, input, query), serializer)
+
+    internal suspend fun delete(url: String, query: JsonElement? = null) {'{'}
+        send("DELETE", url, null, query)
+    {'}'}
+
+    private fun <T> decode(content: String, serializer: KSerializer<T>): T =
+        json.decodeFromString(Response.serializer(serializer), content).data
+
+    private suspend fun send(method: String, url: String, input: JsonElement?, query: JsonElement?): String {'{'}
+        val body = input?.let {'{'} json.encodeToString(JsonElement.serializer(), it).toRequestBody(mediaType) {'}'}
+        val builder = Request.Builder()
+            .url((baseUrl + url + qs(query)).toHttpUrl())
+            .method(method, body){_authorization() if use_session else ''}
+        return client.newCall(builder.build()).await().use {'{'} response ->
+            val content = response.body?.string() ?: ""
+            if (!response.isSuccessful) {'{'}
+                throw RequestException(response.code, content)
+            {'}'}
+            content
+        {'}'}
+    {'}'}
+
+    private fun qs(query: JsonElement?): String {'{'}
+        val items = mutableListOf<String>()
+        if (query is JsonObject) {'{'}
+            query.forEach {'{'} (key, value) -> flatten(key, value, items) {'}'}
+        {'}'}
+        return if (items.isEmpty()) "" else "?" + items.joinToString("&")
+    {'}'}
+
+    private fun flatten(key: String, value: JsonElement, items: MutableList<String>) {'{'}
+        when (value) {'{'}
+            is JsonObject -> value.forEach {'{'} (k, v) -> flatten("$key[$k]", v, items) {'}'}
+            is JsonArray -> value.forEachIndexed {'{'} index, v -> flatten("$key[$index]", v, items) {'}'}
+            is JsonPrimitive -> items.add(key + "=" + URLEncoder.encode(value.content, Charsets.UTF_8).replace("+", "%20"))
+        {'}'}
+    {'}'}
+{'}'}
+
+private suspend fun Call.await(): okhttp3.Response = suspendCancellableCoroutine {'{'} continuation ->
+    continuation.invokeOnCancellation {'{'} cancel() {'}'}
+    enqueue(object : Callback {'{'}
+        override fun onResponse(call: Call, response: okhttp3.Response) {'{'}
+            continuation.resume(response)
+        {'}'}
+
+        override fun onFailure(call: Call, e: IOException) {'{'}
+            continuation.resumeWithException(e)
+        {'}'}
+    {'}'})
+{'}'}
+    """.strip() + '\n'
+
+
+def _authorization() -> str:
+    return '\n        SessionManager.authorization?.let { builder.header("Authorization", it) }'
@@ -0,0 +1,10 @@
+def response_class() -> str:
+    return """
+@Serializable
+class Response<T>(val data: T)
+
+class RequestException(val status: Int, val body: String) : IOException("request failed with status $status")
+
+internal fun <T> include(name: String, serializer: SerializationStrategy<T>, query: T?): JsonElement =
+    if (query == null) JsonPrimitive(name) else buildJsonObject { put(name, RequestManager.encode(serializer, query)) }
+    """.strip() + '\n'
@@ -0,0 +1,39 @@
+from ...utils.join_lines import join_lines
+
+
+SerializableClassItem = tuple[str, str, bool, str | None]
+
+
+def serializable_class(name: str, items: list[SerializableClassItem], body: list[str] = []) -> str:
+    if len(items) == 0:
+        return join_lines([
+            '@Serializable',
+            f'class {name}' + (' {' if len(body) > 0 else ''),
+            *_serializable_class_body(body),
+        ], 1)
+    return join_lines([
+        '@Serializable',
+        f'data class {name}(',
+        *map(_serializable_class_item_line, items),
+        ')' + (' {' if len(body) > 0 else ''),
+        *_serializable_class_body(body),
+    ], 1)
+
+
+def _serializable_class_body(body: list[str]) -> list[str]:
+    if len(body) == 0:
+        return []
+    return [join_lines(body, 2), '}']
+
+
+def _serializable_class_item_line(item: SerializableClassItem) -> str:
+    (name, ktype, optional, serial_name) = item
+    annotation = f'@SerialName("{serial_name}") ' if serial_name is not None else ''
+    return f"    {annotation}val {name}: {ktype}{'? = null' if optional else ''},"
+
+
+def serializable_class_item(name: str,
+                            ktype: str,
+                            optional: bool,
+                            serial_name: str | None = None) -> SerializableClassItem:
+    return (name, ktype, optional, serial_name)
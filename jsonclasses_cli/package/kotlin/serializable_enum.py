@@ -0,0 +1,21 @@
+from ...utils.join_lines import join_lines
+
+
+def serializable_enum(name: str, items: list[str], body: list[str] = []) -> str:
+    lines = list(items)
+    if len(body) > 0 and len(lines) > 0:
+        lines[-1] = lines[-1].removesuffix(',') + ';'
+        lines.append('\n')
+        lines.extend(body)
+    return join_lines([
+        '@Serializable',
+        f'enum class {name} {"{"}',
+        *lines,
+        '}',
+    ], 1)
+
+
+def serializable_enum_item(name: str, value: str | None = None) -> str:
+    if value is None:
+        return f'    {name},'
+    return f'    @SerialName("{value}") {name},'
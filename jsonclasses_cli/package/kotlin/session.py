@@ -0,0 +1,10 @@
+from .serializable_class import serializable_class, serializable_class_item
+from .shared_utils import kotlin_name
+
+
+def session(items: dict[str, str]) -> str:
+    optional = len(items) != 1
+    return serializable_class('Session', [
+        serializable_class_item('token', 'String', False),
+        *[serializable_class_item(kotlin_name(s), c, optional) for (s, c) in items.items()],
+    ])
@@ -0,0 +1,30 @@
+from jsonclasses.cdef import CDef
+from .serializable_class import serializable_class, serializable_class_item
+from .jtype_to_kotlin_type import jtype_to_kotlin_type
+from .shared_utils import kotlin_name
+from ...utils.package_utils import to_session_input
+from ...utils.profile import traced
+
+
+@traced
+def session_input(cdef: CDef) -> str:
+    (identities, bys) = _session_input_items(cdef)
+    identities_optional = len(identities) != 1
+    bys_optional = len(bys) != 1
+    return serializable_class(to_session_input(cdef), [
+        *[serializable_class_item(kotlin_name(n), t, identities_optional) for (n, t) in identities.items()],
+        *[serializable_class_item(kotlin_name(n), t, bys_optional) for (n, t) in bys.items()],
+    ])
+
+
+def _session_input_items(cdef: CDef) -> tuple[dict[str, str], dict[str, str]]:
+    identities: dict[str, str] = {}
+    bys: dict[str, str] = {}
+    for field in cdef.fields:
+        fname = field.json_name
+        ftype = jtype_to_kotlin_type(field.fdef, 'C')
+        if field.fdef.auth_identity:
+            identities[fname] = ftype
+        elif field.fdef.auth_by:
+            bys[fname] = ftype
+    return (identities, bys)
@@ -0,0 +1,81 @@
+def session_manager() -> str:
+    return """
+interface SessionStorage {
+    fun load(): String?
+    fun save(value: String?)
+}
+
+class MemorySessionStorage : SessionStorage {
+
+    @Volatile
+    private var value: String? = null
+
+    override fun load(): String? = value
+
+    override fun save(value: String?) {
+        this.value = value
+    }
+}
+
+class FileSessionStorage(private val file: File) : SessionStorage {
+
+    override fun load(): String? = if (file.exists()) file.readText() else null
+
+    override fun save(value: String?) {
+        if (value == null) {
+            file.delete()
+        } else {
+            file.writeText(value)
+        }
+    }
+}
+
+object SessionManager {
+
+    private var storage: SessionStorage = MemorySessionStorage()
+    private var loaded = false
+    private var cachedSession: Session? = null
+    private var cachedAuthorization: String? = null
+
+    var session: Session?
+        @Synchronized get() {
+            loadIfNeeded()
+            return cachedSession
+        }
+        @Synchronized internal set(value) {
+            loaded = true
+            cache(value)
+            storage.save(value?.let { RequestManager.json.encodeToString(Session.serializer(), it) })
+        }
+
+    internal val authorization: String?
+        @Synchronized get() {
+            loadIfNeeded()
+            return cachedAuthorization
+        }
+
+    @Synchronized
+    fun use(storage: SessionStorage) {
+        this.storage = storage
+        loaded = false
+    }
+
+    private fun loadIfNeeded() {
+        if (loaded) {
+            return
+        }
+        loaded = true
+        val content = storage.load()
+        cache(content?.let { runCatching { RequestManager.json.decodeFromString(Session.serializer(), it) }.getOrNull() })
+    }
+
+    private fun cache(session: Session?) {
+        cachedSession = session
+        cachedAuthorization = session?.let { "Bearer ${it.token}" }
+    }
+}
+
+fun signOut() {
+    SessionManager.session = null
+}
+    """.strip() + '\n'
@@ -0,0 +1,4 @@
+def settings_gradle_content() -> str:
+    return """
+rootProject.name = "api"
+    """.strip() + '\n'
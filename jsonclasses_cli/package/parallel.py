@@ -0,0 +1,52 @@
+from typing import Any, Literal
+from pathlib import Path
+from multiprocessing import get_context, get_all_start_methods
+from jsonclasses.cgraph import CGraph
+from .ts.main_program_content import model_fragments as ts_model_fragments
+from .swift.main_program_content import model_fragments as swift_model_fragments
+from .kotlin.main_program_content import model_fragments as kotlin_model_fragments
+from .python.main_program_content import model_fragments as python_model_fragments
+from ..utils.import_app import import_app
+from ..utils.resolve_cgraph import resolve_cgraph
+
+
+Fragments = dict[str, dict[str, Any]]
+
+_cgraph_name = 'default'
+
+
+def model_fragments(app_file: Path,
+                    cgraph: CGraph,
+                    lang: Literal['ts', 'js', 'swift', 'kotlin', 'python'],
+                    validate: bool,
+                    jobs: int) -> Fragments | None:
+    names = list(cgraph._map.keys())
+    if jobs < 2 or len(names) < 2:
+        return None
+    jobs = min(jobs, len(names))
+    method = 'fork' if 'fork' in get_all_start_methods() else None
+    context = get_context(method)
+    if method == 'fork':
+        resolve_cgraph(cgraph)
+    tasks = [(name, lang, validate) for name in names]
+    with context.Pool(jobs, _init_worker, (app_file, cgraph.name)) as pool:
+        results = pool.map(_render_model, tasks, chunksize=max(1, len(tasks) // (jobs * 4)))
+    return dict(results)
+
+
+def _init_worker(app_file: Path, cgraph_name: str):
+    global _cgraph_name
+    _cgraph_name = cgraph_name
+    import_app(app_file)
+
+
+def _render_model(task: tuple[str, str, bool]) -> tuple[str, dict[str, Any]]:
+    (name, lang, validate) = task
+    cdef = CGraph(_cgraph_name).fetch(name)
+    if lang in ('ts', 'js'):
+        return (name, ts_model_fragments(cdef, validate))
+    if lang == 'kotlin':
+        return (name, kotlin_model_fragments(cdef))
+    if lang == 'python':
+        return (name, python_model_fragments(cdef))
+    return (name, swift_model_fragments(cdef))
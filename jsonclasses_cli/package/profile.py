@@ -0,0 +1,80 @@
+from typing import Literal
+from pathlib import Path
+from json import dumps
+from cProfile import Profile as CProfile
+from rich import print
+from rich.table import Table
+from jsonclasses.cgraph import CGraph
+from . import render
+from ..utils.import_app import import_app
+from ..utils.resolve_cgraph import resolve_cgraph
+from ..utils.write_file import write_file
+from ..utils.profile import Profile, start_profile, stop_profile, span
+
+
+def profile(dest: Path,
+            app_file: Path,
+            lang: Literal['ts', 'js', 'swift', 'kotlin', 'python'],
+            cgraph_name: str = 'default',
+            silent: bool = False,
+            validate: bool = False,
+            trace_file: Path | None = None,
+            stats_file: Path | None = None,
+            top: int = 10):
+    cprofile = CProfile() if stats_file is not None else None
+    result = start_profile()
+    if cprofile is not None:
+        cprofile.enable()
+    try:
+        with span('import'):
+            import_app(app_file)
+        cgraph = CGraph(cgraph_name)
+        with span('resolve'):
+            resolve_cgraph(cgraph)
+        with span('render', lang=lang):
+            files = render(dest, cgraph, lang, validate)
+        with span('write'):
+            for (path, content) in files.items():
+                write_file(path, content, silent)
+    finally:
+        if cprofile is not None:
+            cprofile.disable()
+        stop_profile()
+    if not silent:
+        _print_summary(result, top)
+    if trace_file is not None:
+        trace_file.write_text(dumps(result.trace_events()))
+        if not silent:
+            print(f"[bold green]TRACE[/bold green] {trace_file}")
+    if cprofile is not None:
+        cprofile.dump_stats(stats_file)
+        if not silent:
+            print(f"[bold green]STATS[/bold green] {stats_file}")
+
+
+def _print_summary(result: Profile, top: int):
+    phases = result.phases()
+    table = Table(title='Phases')
+    table.add_column('Phase')
+    table.add_column('Time', justify='right')
+    for (name, duration) in phases.items():
+        table.add_row(name, _ms(duration))
+    table.add_row('total', _ms(sum(phases.values())), style='bold')
+    print(table)
+    models = result.models()
+    if len(models) == 0:
+        return
+    fragments = sorted({name for items in models.values() for name in items.keys()})
+    table = Table(title=f'Slowest {min(top, len(models))} of {len(models)} models')
+    table.add_column('Model')
+    table.add_column('Total', justify='right')
+    for fragment in fragments:
+        table.add_column(fragment.split('.')[-1], justify='right')
+    ranked = sorted(models.items(), key=lambda item: sum(item[1].values()), reverse=True)
+    for (model, items) in ranked[:top]:
+        table.add_row(model, _ms(sum(items.values())), *[_ms(items.get(f, 0)) for f in fragments])
+    print(table)
+
+
+def _ms(seconds: float) -> str:
+    return f'{seconds * 1000:.1f}ms'
@@ -0,0 +1,28 @@
+from pathlib import Path
+from jsonclasses.cgraph import CGraph
+from .main_program_content import Fragments, main_program_content
+from .pyproject_content import pyproject_content
+from .gitignore_content import gitignore_content
+from .readme_content import readme_content
+from ...utils.write_file import write_file
+
+
+def python(dest: Path,
+           cgraph: CGraph,
+           silent: bool = False,
+           fragments: Fragments | None = None):
+    for (path, content) in python_files(dest, cgraph, fragments).items():
+        write_file(path, content, silent)
+
+
+def python_files(dest: Path,
+                 cgraph: CGraph,
+                 fragments: Fragments | None = None) -> dict[Path, str]:
+    package_dest = dest / 'packages' / 'python'
+    return {
+        package_dest / 'api' / '__init__.py': main_program_content(cgraph, fragments),
+        package_dest / 'api' / 'py.typed': '',
+        package_dest / 'pyproject.toml': pyproject_content(dest),
+        package_dest / 'README.md': readme_content(),
+        package_dest / '.gitignore': gitignore_content(),
+    }
@@ -0,0 +1,129 @@
+from inflection import camelize
+from jsonclasses.cdef import CDef
+from .typed_dict import TypedDictItem, typed_dict, typed_dict_item
+from .literal_alias import literal, literal_alias
+from .jtype_to_python_type import jtype_to_python_type
+from .shared_utils import (
+    class_create_input_items, class_update_input_items, class_include_items,
+    list_query_items, is_field_primary, is_field_local_key, is_field_queryable,
+    is_field_ref, is_field_required_for_read, field_can_read, field_ref_id_name
+)
+from ...utils.join_lines import join_lines
+from ...utils.package_utils import (
+    to_create_input, to_update_input, to_sort_orders, to_result_picks, to_include,
+    to_include_key, to_single_query, to_seek_query, to_query_data, to_list_query,
+    to_result
+)
+from ...utils.profile import traced
+
+
+@traced
+def data_class(cdef: CDef) -> str:
+    return join_lines([
+        _class_create_input(cdef),
+        _class_update_input(cdef),
+        _class_sort_orders(cdef),
+        _class_result_picks(cdef),
+        _class_includes(cdef),
+        _class_single_query(cdef),
+        _class_seek_query(cdef),
+        _class_query_data(cdef),
+        _class_list_query(cdef),
+        _class_result(cdef),
+    ], 3)
+
+
+def _class_create_input(cdef: CDef) -> str:
+    return typed_dict(to_create_input(cdef), class_create_input_items(cdef))
+
+
+def _class_update_input(cdef: CDef) -> str:
+    return typed_dict(to_update_input(cdef), class_update_input_items(cdef))
+
+
+def _class_sort_orders(cdef: CDef) -> str:
+    names: list[str] = []
+    for field in cdef.fields:
+        if not is_field_queryable(field):
+            continue
+        if is_field_primary(field):
+            continue
+        if is_field_ref(field):
+            continue
+        if not field_can_read(field):
+            continue
+        name = camelize(field.name)
+        names.extend([name, '-' + name])
+    return literal_alias(to_sort_orders(cdef), names)
+
+
+def _class_result_picks(cdef: CDef) -> str:
+    names: list[str] = []
+    for field in cdef.fields:
+        if not field_can_read(field):
+            continue
+        names.append(camelize(field.name))
+        if is_field_local_key(field):
+            names.append(field_ref_id_name(field))
+    return literal_alias(to_result_picks(cdef), names)
+
+
+def _class_includes(cdef: CDef) -> str:
+    items = class_include_items(cdef)
+    if len(items) == 0:
+        return ''
+    keys = [to_include_key(cdef.name, n) for (n, _) in items]
+    return join_lines([
+        *map(lambda i: typed_dict(to_include_key(cdef.name, i[0]), [typed_dict_item(i[0], i[1], False)]), items),
+        f'{to_include(cdef)} = ' + ' | '.join([literal([n for (n, _) in items]), *keys]),
+    ], 3)
+
+
+def _picks_omits_items(cdef: CDef) -> list[TypedDictItem]:
+    items = [
+        typed_dict_item('_pick', f'list[{to_result_picks(cdef)}]', True),
+        typed_dict_item('_omit', f'list[{to_result_picks(cdef)}]', True),
+    ]
+    if len(class_include_items(cdef)) > 0:
+        items.append(typed_dict_item('_includes', f'list[{to_include(cdef)}]', True))
+    return items
+
+
+def _class_single_query(cdef: CDef) -> str:
+    return typed_dict(to_single_query(cdef), _picks_omits_items(cdef))
+
+
+def _class_seek_query(cdef: CDef) -> str:
+    items = [typed_dict_item(n, t, True) for (n, t) in list_query_items(cdef)]
+    return typed_dict(to_seek_query(cdef), items)
+
+
+def _class_query_data(cdef: CDef) -> str:
+    return typed_dict(to_query_data(cdef), [
+        typed_dict_item('_query', to_seek_query(cdef), False),
+        typed_dict_item('_data', to_update_input(cdef), False),
+    ])
+
+
+def _class_list_query(cdef: CDef) -> str:
+    return typed_dict(to_list_query(cdef), [
+        typed_dict_item('_order', f'list[{to_sort_orders(cdef)}]', True),
+        typed_dict_item('_limit', 'int', True),
+        typed_dict_item('_skip', 'int', True),
+        typed_dict_item('_pageNo', 'int', True),
+        typed_dict_item('_pageSize', 'int', True),
+        *_picks_omits_items(cdef),
+    ], to_seek_query(cdef))
+
+
+def _class_result(cdef: CDef) -> str:
+    items: list[TypedDictItem] = []
+    for field in cdef.fields:
+        if not field_can_read(field):
+            continue
+        optional = is_field_ref(field) or not is_field_required_for_read(field)
+        name = camelize(field.name)
+        items.append(typed_dict_item(name, jtype_to_python_type(field.fdef, 'R'), optional))
+        if is_field_local_key(field):
+            items.append(typed_dict_item(field_ref_id_name(field), 'str', optional))
+    return typed_dict(to_result(cdef), items)
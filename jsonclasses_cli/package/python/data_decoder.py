@@ -0,0 +1,105 @@
+from inflection import camelize
+from jsonclasses.cdef import CDef
+from jsonclasses.cgraph import CGraph
+from jsonclasses.fdef import FDef, FType
+from .shared_utils import field_can_read, to_decoder
+from ...utils.join_lines import join_lines
+from ...utils.profile import traced
+
+
+@traced
+def data_decoder(cdef: CDef) -> str:
+    if not class_needs_decoder(cdef):
+        return ''
+    items: list[str] = []
+    for field in cdef.fields:
+        if not field_can_read(field):
+            continue
+        name = camelize(field.name)
+        expr = _decode_expr(field.fdef, f"data['{name}']")
+        if expr is None:
+            continue
+        items.append(_decoder_item(name, expr))
+    return join_lines([
+        f'def {to_decoder(cdef)}(data: Any) -> Any:',
+        '    if data is None:',
+        '        return data',
+        *items,
+        '    return data',
+    ])
+
+
+def session_decoder(items: dict[str, str], cgraph: CGraph) -> str:
+    lines: list[str] = []
+    for (s, c) in items.items():
+        cdef = cgraph.fetch(c)
+        if class_needs_decoder(cdef):
+            lines.append(_decoder_item(s, f"{to_decoder(cdef)}(data['{s}'])"))
+    return join_lines([
+        'def _decode_session(data: Any) -> Any:',
+        *lines,
+        '    return data',
+    ])
+
+
+def decoded_result(cdef: CDef, request: str, many: bool = False) -> str:
+    if not class_needs_decoder(cdef):
+        return f'await {request}'
+    if many:
+        return f'[{to_decoder(cdef)}(v) for v in await {request}]'
+    return f'{to_decoder(cdef)}(await {request})'
+
+
+def class_needs_decoder(cdef: CDef, visited: set[str] | None = None) -> bool:
+    visited = visited if visited is not None else set()
+    visited.add(cdef.name)
+    for field in cdef.fields:
+        if not field_can_read(field):
+            continue
+        if _fdef_needs_decoder(field.fdef, visited):
+            return True
+    return False
+
+
+def _fdef_needs_decoder(fdef: FDef, visited: set[str]) -> bool:
+    match fdef.ftype:
+        case FType.DATE | FType.DATETIME | FType.ENUM:
+            return True
+        case FType.LIST:
+            return _fdef_needs_decoder(fdef.item_types.fdef, visited)
+        case FType.INSTANCE:
+            cdef = fdef.inst_cls.cdef
+            if cdef.name in visited:
+                return False
+            return class_needs_decoder(cdef, visited)
+        case _:
+            return False
+
+
+def _decode_expr(fdef: FDef, value: str) -> str | None:
+    match fdef.ftype:
+        case FType.DATE:
+            return f'_decode_date({value})'
+        case FType.DATETIME:
+            return f'_decode_datetime({value})'
+        case FType.ENUM:
+            return f'{fdef.enum_class.__name__}({value})'
+        case FType.LIST:
+            item_fdef = fdef.item_types.fdef
+            if item_fdef.ftype == FType.INSTANCE:
+                cdef = item_fdef.inst_cls.cdef
+                return f'[{to_decoder(cdef)}(v) for v in {value}]' if class_needs_decoder(cdef) else None
+            item = _decode_expr(item_fdef, 'v')
+            return f'[{item} for v in {value}]' if item else None
+        case FType.INSTANCE:
+            cdef = fdef.inst_cls.cdef
+            return f'{to_decoder(cdef)}({value})' if class_needs_decoder(cdef) else None
+        case _:
+            return None
+
+
+def _decoder_item(name: str, expr: str) -> str:
+    return join_lines([
+        f"    if data.get('{name}') is not None:",
+        f"        data['{name}'] = {expr}",
+    ])
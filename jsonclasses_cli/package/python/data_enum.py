@@ -0,0 +1,11 @@
+from enum import Enum
+from ...utils.join_lines import join_lines
+from ...utils.profile import traced
+
+
+@traced
+def data_enum(enum: type[Enum]) -> str:
+    return join_lines([
+        f'class {enum.__name__}(str, Enum):',
+        *map(lambda o: f"    {o.name} = '{o.name}'", enum),
+    ])
@@ -0,0 +1,343 @@
+from typing import cast
+from jsonclasses.cdef import CDef
+from jsonclasses_server.aconf import AConf
+from .data_decoder import class_needs_decoder, decoded_result
+from .shared_utils import class_include_items, to_client_instance, to_decoder
+from ...utils.join_lines import join_lines
+from ...utils.package_utils import (
+    class_needs_api, class_needs_session, to_client, to_create_input, to_create_many_request,
+    to_create_request, to_delete_many_request, to_delete_request, to_id_request, to_include,
+    to_list_query, to_list_request, to_query_data, to_result, to_result_picks, to_seek_query,
+    to_session_input, to_sign_in_request, to_single_query, to_sort_orders, to_update_input,
+    to_update_many_request, to_update_request, to_upsert_request
+)
+from ...utils.profile import traced
+
+
+@traced
+def data_client_instances(cdef: CDef) -> str:
+    if not class_needs_api(cdef):
+        return ''
+    return f'{to_client_instance(cdef)} = {to_client(cdef)}()'
+
+
+@traced
+def data_requests_and_clients(cdef: CDef) -> str:
+    if not class_needs_api(cdef):
+        return ''
+    aconf = cast(AConf, cdef.cls.aconf)
+    url = '/' + aconf.name
+    return join_lines([
+        _data_create_request(cdef, url) if 'C' in aconf.actions else '',
+        _data_update_request(cdef, url) if 'U' in aconf.actions else '',
+        _data_delete_request(cdef, url) if 'D' in aconf.actions else '',
+        _data_id_request(cdef, url) if 'R' in aconf.actions else '',
+        _data_upsert_request(cdef, url) if 'C' in aconf.actions and 'U' in aconf.actions else '',
+        _data_create_many_request(cdef, url) if 'C' in aconf.actions else '',
+        _data_update_many_request(cdef, url) if 'U' in aconf.actions else '',
+        _data_delete_many_request(cdef, url) if 'D' in aconf.actions else '',
+        _data_list_request(cdef, url) if 'L' in aconf.actions else '',
+        _data_sign_in_request(cdef, url) if class_needs_session(cdef) else '',
+        _data_client(cdef, aconf),
+    ], 3)
+
+
+def _request_class(name: str, params: list[str], assigns: list[str], body: list[str]) -> str:
+    return join_lines([
+        f'class {name}:',
+        '\n',
+        f"    def __init__(self, {', '.join(params)}) -> None:",
+        *map(lambda a: f'        {a}', assigns),
+        '\n',
+        join_lines(body, 2),
+    ])
+
+
+def _single_query_params(cdef: CDef) -> list[str]:
+    return [f'query: {to_single_query(cdef)} | None = None']
+
+
+def _single_query_assigns(cdef: CDef) -> list[str]:
+    return [f'self._query: {to_single_query(cdef)} = query or {"{}"}']
+
+
+def _single_query_methods(cdef: CDef, request: str) -> list[str]:
+    rpname = to_result_picks(cdef)
+    methods = [
+        join_lines([
+            f'    def pick(self, *picks: {rpname}) -> {request}:',
+            "        self._query['_pick'] = list(picks)",
+            '        return self',
+        ]),
+        join_lines([
+            f'    def omit(self, *omits: {rpname}) -> {request}:',
+            "        self._query['_omit'] = list(omits)",
+            '        return self',
+        ]),
+    ]
+    if len(class_include_items(cdef)) > 0:
+        methods.append(join_lines([
+            f'    def include(self, *includes: {to_include(cdef)}) -> {request}:',
+            "        self._query['_includes'] = [*self._query.get('_includes', []), *includes]",
+            '        return self',
+        ]))
+    return methods
+
+
+def _exec(result: str, expr: str) -> str:
+    return join_lines([
+        f'    async def exec(self) -> {result}:',
+        f'        return {expr}',
+        '\n',
+        f'    def __await__(self) -> Generator[Any, None, {result}]:',
+        '        return self.exec().__await__()',
+    ])
+
+
+def _data_create_request(cdef: CDef, url: str) -> str:
+    name = to_create_request(cdef)
+    return _request_class(name, [
+        f'input: {to_create_input(cdef)}',
+        *_single_query_params(cdef),
+    ], [
+        'self._input = input',
+        *_single_query_assigns(cdef),
+    ], [
+        *_single_query_methods(cdef, name),
+        _exec(to_result(cdef), decoded_result(cdef, f"request_manager.post('{url}', self._input, self._query)")),
+    ])
+
+
+def _data_update_request(cdef: CDef, url: str) -> str:
+    name = to_update_request(cdef)
+    return _request_class(name, [
+        'id: str',
+        f'input: {to_update_input(cdef)}',
+        *_single_query_params(cdef),
+    ], [
+        'self._id = id',
+        'self._input = input',
+        *_single_query_assigns(cdef),
+    ], [
+        *_single_query_methods(cdef, name),
+        _exec(to_result(cdef), decoded_result(cdef, f"request_manager.patch('{url}/' + self._id, self._input, self._query)")),
+    ])
+
+
+def _data_delete_request(cdef: CDef, url: str) -> str:
+    return _request_class(to_delete_request(cdef), [
+        'id: str',
+    ], [
+        'self._id = id',
+    ], [
+        _exec('None', f"await request_manager.delete('{url}/' + self._id)"),
+    ])
+
+
+def _data_id_request(cdef: CDef, url: str) -> str:
+    name = to_id_request(cdef)
+    return _request_class(name, [
+        'id: str',
+        *_single_query_params(cdef),
+    ], [
+        'self._id = id',
+        *_single_query_assigns(cdef),
+    ], [
+        *_single_query_methods(cdef, name),
+        _exec(to_result(cdef), decoded_result(cdef, f"request_manager.get('{url}/' + self._id, self._query)")),
+    ])
+
+
+def _data_upsert_request(cdef: CDef, url: str) -> str:
+    name = to_upsert_request(cdef)
+    return _request_class(name, [
+        f'input: {to_query_data(cdef)}',
+        *_single_query_params(cdef),
+    ], [
+        'self._input = input',
+        *_single_query_assigns(cdef),
+    ], [
+        *_single_query_methods(cdef, name),
+        _exec(to_result(cdef), decoded_result(cdef, f"request_manager.post('{url}', {'{'}'_upsert': self._input{'}'}, self._query)")),
+    ])
+
+
+def _data_create_many_request(cdef: CDef, url: str) -> str:
+    name = to_create_many_request(cdef)
+    return _request_class(name, [
+        f'input: list[{to_create_input(cdef)}]',
+        'chunk_size: int | None = None',
+        *_single_query_params(cdef),
+    ], [
+        'self._input = input',
+        'self._chunk_size = chunk_size',
+        *_single_query_assigns(cdef),
+    ], [
+        *_single_query_methods(cdef, name),
+        join_lines([
+            f'    async def exec(self) -> list[{to_result(cdef)}]:',
+            '        size = self._chunk_size or len(self._input) or 1',
+            '        chunks = [self._input[i:i + size] for i in range(0, len(self._input), size)]',
+            f"        pages = await gather(*[request_manager.post('{url}', {'{'}'_create': c{'}'}, self._query) for c in chunks])",
+            _create_many_return(cdef),
+            '\n',
+            f'    def __await__(self) -> Generator[Any, None, list[{to_result(cdef)}]]:',
+            '        return self.exec().__await__()',
+        ]),
+    ])
+
+
+def _create_many_return(cdef: CDef) -> str:
+    item = f'{to_decoder(cdef)}(v)' if class_needs_decoder(cdef) else 'v'
+    return f'        return [{item} for page in pages for v in page]'
+
+
+def _data_update_many_request(cdef: CDef, url: str) -> str:
+    name = to_update_many_request(cdef)
+    return _request_class(name, [
+        f'input: {to_query_data(cdef)}',
+        *_single_query_params(cdef),
+    ], [
+        'self._input = input',
+        *_single_query_assigns(cdef),
+    ], [
+        *_single_query_methods(cdef, name),
+        _exec(f'list[{to_result(cdef)}]', decoded_result(cdef, f"request_manager.patch('{url}', {'{'}'_update': self._input{'}'}, self._query)", True)),
+    ])
+
+
+def _data_delete_many_request(cdef: CDef, url: str) -> str:
+    return _request_class(to_delete_many_request(cdef), [
+        f'query: {to_seek_query(cdef)}',
+    ], [
+        'self._query = query',
+    ], [
+        _exec('None', f"await request_manager.delete('{url}', self._query)"),
+    ])
+
+
+def _data_list_request(cdef: CDef, url: str) -> str:
+    name = to_list_request(cdef)
+    return _request_class(name, [
+        f'query: {to_list_query(cdef)} | None = None',
+    ], [
+        f'self._query: {to_list_query(cdef)} = query or {"{}"}',
+    ], [
+        join_lines([
+            f'    def order(self, *orders: {to_sort_orders(cdef)}) -> {name}:',
+            "        self._query['_order'] = [*self._query.get('_order', []), *orders]",
+            '        return self',
+        ]),
+        *map(lambda i: join_lines([
+            f'    def {i[0]}(self, {i[0]}: int) -> {name}:',
+            f"        self._query['{i[1]}'] = {i[0]}",
+            '        return self',
+        ]), [('limit', '_limit'), ('skip', '_skip'), ('page_no', '_pageNo'), ('page_size', '_pageSize')]),
+        *_single_query_methods(cdef, name),
+        _exec(f'list[{to_result(cdef)}]', decoded_result(cdef, f"request_manager.get('{url}', self._query)", True)),
+        _list_request_iter(cdef, name),
+    ])
+
+
+def _list_request_iter(cdef: CDef, name: str) -> str:
+    return join_lines([
+        f'    async def iter(self, page_size: int = 100) -> AsyncIterator[{to_result(cdef)}]:',
+        f'        query: {to_list_query(cdef)} = {"{"}**self._query{"}"}',
+        "        query.pop('_pageNo', None)",
+        "        query.pop('_pageSize', None)",
+        "        skip = query.get('_skip', 0)",
+        "        remaining = query.get('_limit')",
+        '        while remaining is None or remaining > 0:',
+        '            limit = page_size if remaining is None else min(page_size, remaining)',
+        f"            page = await {name}({'{'}**query, '_skip': skip, '_limit': limit{'}'})",
+        '            for item in page:',
+        '                yield item',
+        '            if len(page) < limit:',
+        '                break',
+        '            skip += limit',
+        '            remaining = None if remaining is None else remaining - limit',
+        '\n',
+        f'    def __aiter__(self) -> AsyncIterator[{to_result(cdef)}]:',
+        '        return self.iter()',
+    ])
+
+
+def _data_sign_in_request(cdef: CDef, url: str) -> str:
+    name = to_sign_in_request(cdef)
+    return _request_class(name, [
+        f'input: {to_session_input(cdef)}',
+        *_single_query_params(cdef),
+    ], [
+        'self._input = input',
+        *_single_query_assigns(cdef),
+    ], [
+        *_single_query_methods(cdef, name),
+        join_lines([
+            '    async def exec(self) -> Session:',
+            f"        session = _decode_session(await request_manager.post('{url}/session', self._input, self._query))",
+            '        session_manager.session = session',
+            '        return session',
+            '\n',
+            '    def __await__(self) -> Generator[Any, None, Session]:',
+            '        return self.exec().__await__()',
+        ]),
+    ])
+
+
+def _data_client(cdef: CDef, aconf: AConf) -> str:
+    methods: list[str] = []
+    if 'C' in aconf.actions:
+        methods.append(join_lines([
+            f'    def create(self, input: {to_create_input(cdef)}) -> {to_create_request(cdef)}:',
+            f'        return {to_create_request(cdef)}(input)',
+        ]))
+    if 'U' in aconf.actions:
+        methods.append(join_lines([
+            f'    def update(self, id: str, input: {to_update_input(cdef)}) -> {to_update_request(cdef)}:',
+            f'        return {to_update_request(cdef)}(id, input)',
+        ]))
+    if 'D' in aconf.actions:
+        methods.append(join_lines([
+            '    async def delete(self, id: str) -> None:',
+            f'        await {to_delete_request(cdef)}(id)',
+        ]))
+    if 'R' in aconf.actions:
+        methods.append(join_lines([
+            f'    def id(self, id: str) -> {to_id_request(cdef)}:',
+            f'        return {to_id_request(cdef)}(id)',
+        ]))
+    if 'L' in aconf.actions:
+        methods.append(join_lines([
+            f'    def find(self, query: {to_list_query(cdef)} | None = None) -> {to_list_request(cdef)}:',
+            f'        return {to_list_request(cdef)}(query)',
+        ]))
+    if 'C' in aconf.actions and 'U' in aconf.actions:
+        methods.append(join_lines([
+            f'    def upsert(self, query: {to_seek_query(cdef)}, data: {to_update_input(cdef)}) -> {to_upsert_request(cdef)}:',
+            f"        return {to_upsert_request(cdef)}({'{'}'_query': query, '_data': data{'}'})",
+        ]))
+    if 'C' in aconf.actions:
+        methods.append(join_lines([
+            f'    def create_many(self, input: list[{to_create_input(cdef)}], chunk_size: int | None = None) -> {to_create_many_request(cdef)}:',
+            f'        return {to_create_many_request(cdef)}(input, chunk_size)',
+        ]))
+    if 'U' in aconf.actions:
+        methods.append(join_lines([
+            f'    def update_many(self, query: {to_seek_query(cdef)}, data: {to_update_input(cdef)}) -> {to_update_many_request(cdef)}:',
+            f"        return {to_update_many_request(cdef)}({'{'}'_query': query, '_data': data{'}'})",
+        ]))
+    if 'D' in aconf.actions:
+        methods.append(join_lines([
+            f'    async def delete_many(self, query: {to_seek_query(cdef)} | None = None) -> None:',
+            f"        await {to_delete_many_request(cdef)}(query or {'{}'})",
+        ]))
+    if class_needs_session(cdef):
+        methods.append(join_lines([
+            f'    def sign_in(self, input: {to_session_input(cdef)}) -> {to_sign_in_request(cdef)}:',
+            f'        return {to_sign_in_request(cdef)}(input)',
+        ]))
+    return join_lines([
+        f'class {to_client(cdef)}:',
+        '\n',
+        join_lines(methods, 2) if len(methods) > 0 else '    pass',
+    ])
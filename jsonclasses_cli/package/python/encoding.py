@@ -0,0 +1,56 @@
+def encoding() -> str:
+    return """
+class RequestError(Exception):
+
+    def __init__(self, status: int, content: str) -> None:
+        super().__init__(f'{status}: {content}')
+        self.status = status
+        self.content = content
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value.isoformat(timespec='milliseconds') + 'Z'
+    if isinstance(value, date):
+        return value.isoformat() + 'T00:00:00.000Z'
+    if isinstance(value, Enum):
+        return value.name
+    if isinstance(value, dict):
+        return {k: _encode(v) for (k, v) in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode(v) for v in value]
+    return value
+
+
+def _decode_date(value: str) -> date:
+    return datetime.fromisoformat(value).date()
+
+
+def _decode_datetime(value: str) -> datetime:
+    return datetime.fromisoformat(value)
+
+
+def _qs(query: Any) -> str:
+    items: list[str] = []
+    if isinstance(query, dict):
+        for (key, value) in _encode(query).items():
+            _flatten(key, value, items)
+    return '' if len(items) == 0 else '?' + '&'.join(items)
+
+
+def _flatten(key: str, value: Any, items: list[str]) -> None:
+    if isinstance(value, dict):
+        for (k, v) in value.items():
+            _flatten(f'{key}[{k}]', v, items)
+    elif isinstance(value, list):
+        for (index, v) in enumerate(value):
+            _flatten(f'{key}[{index}]', v, items)
+    elif value is None:
+        items.append(f'{key}=null')
+    elif isinstance(value, bool):
+        items.append(f'{key}=true' if value else f'{key}=false')
+    else:
+        items.append(f'{key}=' + quote(str(value), safe=''))
+    """.strip() + '\n'
@@ -0,0 +1,9 @@
+def gitignore_content() -> str:
+    return """
+.DS_Store
+__pycache__/
+*.egg-info/
+build/
+dist/
+.venv/
+    """.strip() + '\n'
@@ -0,0 +1,15 @@
+from ...utils.join_lines import join_lines
+
+
+def import_lines(use_session: bool) -> str:
+    return join_lines([
+        'from __future__ import annotations',
+        'from typing import Any, AsyncIterator, Generator, Literal, NotRequired, Protocol, TypedDict',
+        'from asyncio import Semaphore, gather',
+        'from datetime import date, datetime, timezone',
+        'from enum import Enum',
+        'from json import dumps, loads' if use_session else '',
+        'from pathlib import Path' if use_session else '',
+        'from urllib.parse import quote',
+        'from httpx import AsyncBaseTransport, AsyncClient, Limits',
+    ])
@@ -0,0 +1,60 @@
+from typing import Literal
+from jsonclasses.fdef import FDef, FType
+from ...utils.package_utils import is_field_link
+
+
+def jtype_to_python_type(fdef: FDef, mode: Literal['C', 'U', 'R', 'Q'], is_link: bool = False) -> str:
+    match fdef.ftype:
+        case FType.STR:
+            if mode == 'Q':
+                return 'StringQuery'
+            else:
+                return 'str'
+        case FType.INT:
+            if mode == 'Q':
+                return 'IntQuery'
+            else:
+                return 'int'
+        case FType.FLOAT:
+            if mode == 'Q':
+                return 'FloatQuery'
+            else:
+                return 'float'
+        case FType.BOOL:
+            if mode == 'Q':
+                return 'BoolQuery'
+            else:
+                return 'bool'
+        case FType.DATE:
+            if mode == 'Q':
+                return 'DateQuery'
+            else:
+                return 'date'
+        case FType.DATETIME:
+            if mode == 'Q':
+                return 'DateQuery'
+            else:
+                return 'datetime'
+        case FType.ENUM:
+            return fdef.enum_class.__name__
+        case FType.LIST:
+            return 'list[' + jtype_to_python_type(fdef.item_types.fdef, mode, is_field_link(fdef)) + ']'
+        case FType.DICT:
+            return 'dict[str, ' + jtype_to_python_type(fdef.item_types.fdef, mode) + ']'
+        case FType.INSTANCE:
+            if mode == 'R':
+                return fdef.inst_cls.__name__
+            elif mode == 'C':
+                result = fdef.inst_cls.__name__ + 'CreateInput'
+                if is_link:
+                    return f'{result} | Link'
+                return result
+            elif mode == 'U':
+                result = fdef.inst_cls.__name__ + 'UpdateInput'
+                if is_link:
+                    return f'{result} | Link | UnLink'
+                return result
+            else:
+                return 'Any'
+        case _:
+            return 'Any'
@@ -0,0 +1,8 @@
+def literal_alias(name: str, values: list[str]) -> str:
+    return f'{name} = {literal(values)}'
+
+
+def literal(values: list[str]) -> str:
+    if len(values) == 0:
+        return 'str'
+    return 'Literal[' + ', '.join(map(lambda v: repr(v), values)) + ']'
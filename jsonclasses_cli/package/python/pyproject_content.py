@@ -0,0 +1,26 @@
+from pathlib import Path
+from inflection import underscore, dasherize
+
+
+def pyproject_content(dest: Path) -> str:
+    pkg_name = dasherize(underscore(dest.name))
+    return f"""
+[project]
+name = "{pkg_name}"
+version = "0.1.0"
+description = "This API client package is generated by JSONClasses CLI."
+requires-python = ">=3.11"
+dependencies = [
+    "httpx>=0.24"
+]
+
+[build-system]
+requires = ["setuptools>=61"]
+build-backend = "setuptools.build_meta"
+
+[tool.setuptools]
+packages = ["api"]
+
+[tool.setuptools.package-data]
+api = ["py.typed"]
+    """.strip() + '\n'
@@ -0,0 +1,38 @@
+from .typed_dict import typed_dict, typed_dict_item
+from ...utils.join_lines import join_lines
+
+
+def query_types() -> str:
+    return join_lines([
+        "Mode = Literal['default', 'insensitive']",
+        _query_type('StringQuery', 'str', ['eq', 'neq', 'null', 'gt', 'gte', 'lt', 'lte', 'contains', 'prefix', 'suffix', 'match', 'mode', 'or', 'and']),
+        _query_type('IntQuery', 'int', ['eq', 'neq', 'null', 'gt', 'gte', 'lt', 'lte', 'or', 'and']),
+        _query_type('FloatQuery', 'float', ['eq', 'neq', 'null', 'gt', 'gte', 'lt', 'lte', 'or', 'and']),
+        _query_type('BoolQuery', 'bool', ['eq', 'neq', 'null', 'or', 'and']),
+        _query_type('DateQuery', 'date | datetime', ['eq', 'neq', 'null', 'gt', 'gte', 'lt', 'lte', 'or', 'and']),
+        _query_type('IDQuery', 'str', ['eq', 'neq', 'null']),
+        typed_dict('Link', [typed_dict_item('_add', 'str', False)]),
+        typed_dict('UnLink', [typed_dict_item('_del', 'str', False)]),
+    ], 3)
+
+
+def _query_type(name: str, value_type: str, operators: list[str]) -> str:
+    value_name = name.removesuffix('Query') + 'ValueQuery'
+    return join_lines([
+        typed_dict(value_name, [_query_item(name, value_type, o) for o in operators]),
+        '\n',
+        '\n',
+        f'{name} = {value_type} | {value_name}',
+    ])
+
+
+def _query_item(name: str, value_type: str, operator: str) -> tuple[str, str, bool]:
+    match operator:
+        case 'null':
+            return typed_dict_item('_null', 'bool', True)
+        case 'mode':
+            return typed_dict_item('_mode', 'Mode', True)
+        case 'or' | 'and':
+            return typed_dict_item('_' + operator, f'list[{name}]', True)
+        case _:
+            return typed_dict_item('_' + operator, value_type, True)
@@ -0,0 +1,5 @@
+def readme_content() -> str:
+    return """
+# API
+This package is generated by JSONClasses CLI.
+    """.strip() + '\n'
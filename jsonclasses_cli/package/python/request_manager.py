@@ -0,0 +1,98 @@
+from ...utils.join_lines import join_lines
+
+
+def request_manager(url: str, use_session: bool) -> str:
+    return join_lines([
+        """
+class RequestManager:
+
+    def __init__(self, base_url: str, concurrency: int = 8) -> None:
+        self.base_url = base_url
+        self.concurrency = concurrency
+        self.transport: AsyncBaseTransport | None = None
+        self._client: AsyncClient | None = None
+        self._semaphore: Semaphore | None = None
+
+    def configure(self,
+                  base_url: str | None = None,
+                  concurrency: int | None = None,
+                  transport: AsyncBaseTransport | None = None) -> None:
+        if self._client is not None:
+            raise RuntimeError('cannot configure an open request manager, call aclose first')
+        if base_url is not None:
+            self.base_url = base_url
+        if concurrency is not None:
+            self.concurrency = concurrency
+        if transport is not None:
+            self.transport = transport
+
+    @property
+    def client(self) -> AsyncClient:
+        if self._client is None:
+            limits = Limits(max_connections=self.concurrency,
+                            max_keepalive_connections=self.concurrency,
+                            keepalive_expiry=30)
+            self._client = AsyncClient(base_url=self.base_url,
+                                       transport=self.transport,
+                                       limits=limits,
+                                       timeout=30)
+            self._semaphore = Semaphore(self.concurrency)
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+        self._client = None
+        self._semaphore = None
+
+    async def __aenter__(self) -> RequestManager:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    async def get(self, url: str, query: Any = None) -> Any:
+        return await self.send('GET', url, None, query)
+
+    async def post(self, url: str, input: Any, query: Any = None) -> Any:
+        return await self.send('POST', url, input, query)
+
+    async def patch(self, url: str, input: Any, query: Any = None) -> Any:
+        return await self.send('PATCH', url, input, query)
+
+    async def delete(self, url: str, query: Any = None) -> None:
+        await self.send('DELETE', url, None, query)
+
+    async def send(self, method: str, url: str, input: Any, query: Any) -> Any:
+        client = self.client
+        assert self._semaphore is not None
+        async with self._semaphore:
+            response = await client.request(method,
+                                            url + _qs(query),
+                                            json=None if input is None else _encode(input),
+                                            headers=self.headers())
+        if response.is_error:
+            raise RequestError(response.status_code, response.text)
+        if len(response.content) == 0:
+            return None
+        return response.json().get('data')
+""".strip('\n'),
+        '\n',
+        _headers(use_session),
+        '\n',
+        '\n',
+        f"request_manager = RequestManager('{url}')",
+    ])
+
+
+def _headers(use_session: bool) -> str:
+    if not use_session:
+        return join_lines([
+            '    def headers(self) -> dict[str, str]:',
+            '        return {}',
+        ])
+    return join_lines([
+        '    def headers(self) -> dict[str, str]:',
+        '        authorization = session_manager.authorization',
+        "        return {} if authorization is None else {'Authorization': authorization}",
+    ])
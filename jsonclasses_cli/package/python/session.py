@@ -0,0 +1,9 @@
+from .typed_dict import typed_dict, typed_dict_item
+
+
+def session(items: dict[str, str]) -> str:
+    optional = len(items) != 1
+    return typed_dict('Session', [
+        typed_dict_item('token', 'str', False),
+        *[typed_dict_item(s, c, optional) for (s, c) in items.items()],
+    ])
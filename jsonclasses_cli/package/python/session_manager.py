@@ -0,0 +1,75 @@
+def session_manager() -> str:
+    return """
+class SessionStorage(Protocol):
+
+    def load(self) -> str | None:
+        ...
+
+    def save(self, value: str | None) -> None:
+        ...
+
+
+class MemorySessionStorage:
+
+    def __init__(self) -> None:
+        self.value: str | None = None
+
+    def load(self) -> str | None:
+        return self.value
+
+    def save(self, value: str | None) -> None:
+        self.value = value
+
+
+class FileSessionStorage:
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+
+    def load(self) -> str | None:
+        return self.path.read_text() if self.path.is_file() else None
+
+    def save(self, value: str | None) -> None:
+        if value is None:
+            self.path.unlink(missing_ok=True)
+        else:
+            self.path.write_text(value)
+
+
+class SessionManager:
+
+    def __init__(self) -> None:
+        self.storage: SessionStorage = MemorySessionStorage()
+        self._loaded = False
+        self._session: Session | None = None
+
+    def use(self, storage: SessionStorage) -> None:
+        self.storage = storage
+        self._loaded = False
+
+    @property
+    def session(self) -> Session | None:
+        if not self._loaded:
+            self._loaded = True
+            content = self.storage.load()
+            self._session = None if content is None else _decode_session(loads(content))
+        return self._session
+
+    @session.setter
+    def session(self, session: Session | None) -> None:
+        self._loaded = True
+        self._session = session
+        self.storage.save(None if session is None else dumps(_encode(session)))
+
+    @property
+    def authorization(self) -> str | None:
+        session = self.session
+        return None if session is None else 'Bearer ' + session['token']
+
+
+session_manager = SessionManager()
+
+
+def sign_out() -> None:
+    session_manager.session = None
+    """.strip() + '\n'
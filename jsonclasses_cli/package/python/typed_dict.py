@@ -0,0 +1,25 @@
+from ...utils.join_lines import join_lines
+
+
+TypedDictItem = tuple[str, str, bool]
+
+
+def typed_dict(name: str, items: list[TypedDictItem], base: str = 'TypedDict') -> str:
+    total = len(items) == 0 or any(not o for (_, _, o) in items)
+    head = base if total else f'{base}, total=False'
+    return join_lines([
+        f'class {name}({head}):',
+        *map(lambda i: _typed_dict_line(i, total), items),
+        '    pass' if len(items) == 0 else '',
+    ])
+
+
+def typed_dict_item(name: str, ptype: str, optional: bool) -> TypedDictItem:
+    return (name, ptype, optional)
+
+
+def _typed_dict_line(item: TypedDictItem, total: bool) -> str:
+    (name, ptype, optional) = item
+    if optional and total:
+        return f'    {name}: NotRequired[{ptype}]'
+    return f'    {name}: {ptype}'
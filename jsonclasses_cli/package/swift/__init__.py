@@ -1,38 +1,27 @@
 from pathlib import Path
 from jsonclasses.cgraph import CGraph
-from .main_program_content import main_program_content
+from .main_program_content import Fragments, main_program_content
 from .gitignore_content import gitignore_content
 from .package_content import package_content
 from .readme_content import readme_content
 from ...utils.write_file import write_file
 
 
-def swift(dest: Path, cgraph: CGraph, silent: bool = False):
-    dest = _create_dest_dir_if_needed(dest)
-    _generate_main_program_file(dest, cgraph, silent)
-    _generate_package_file(dest, silent)
-    _generate_readme_file(dest, silent)
-    _generate_gitignore_file(dest, silent)
-
-
-def _create_dest_dir_if_needed(dest: Path) -> Path:
-    dest = dest / 'packages' / 'swift'
-    if not dest.is_dir():
-        dest.mkdir(parents=True)
-    return dest
-
-
-def _generate_main_program_file(dest: Path, cgraph: CGraph, silent: bool = False):
-    write_file(dest / 'Sources' / 'API' / 'API.swift', main_program_content(cgraph), silent)
-
-
-def _generate_package_file(dest: Path, silent: bool = False):
-    write_file(dest / 'Package.swift', package_content(), silent)
-
-
-def _generate_gitignore_file(dest: Path, silent: bool = False):
-    write_file(dest / '.gitignore', gitignore_content(), silent)
-
-
-def _generate_readme_file(dest: Path, silent: bool = False):
-    write_file(dest / 'README.md', readme_content(), silent)
+def swift(dest: Path,
+          cgraph: CGraph,
+          silent: bool = False,
+          fragments: Fragments | None = None):
+    for (path, content) in swift_files(dest, cgraph, fragments).items():
+        write_file(path, content, silent)
+
+
+def swift_files(dest: Path,
+                cgraph: CGraph,
+                fragments: Fragments | None = None) -> dict[Path, str]:
+    package_dest = dest / 'packages' / 'swift'
+    return {
+        package_dest / 'Sources' / 'API' / 'API.swift': main_program_content(cgraph, fragments),
+        package_dest / 'Package.swift': package_content(),
+        package_dest / 'README.md': readme_content(),
+        package_dest / '.gitignore': gitignore_content(),
+    }
@@ -17,8 +17,10 @@ from ...utils.package_utils import (
     to_create_input, to_include_key, to_query_data, to_seek_query, to_update_input,
     to_single_query, to_list_query, to_result, to_result_picks, to_include, to_sort_orders
 )
+from ...utils.profile import traced
 
 
+@traced
 def data_class(cdef: CDef) -> str:
     return join_lines([
         _class_create_input(cdef),
@@ -1,8 +1,10 @@
 from enum import Enum
 from inflection import camelize
 from .codable_enum import codable_enum, codable_enum_item
+from ...utils.profile import traced
 
 
+@traced
 def data_enum(enum: type[Enum]) -> str:
     return codable_enum(enum.__name__, 'String', map(_data_enum_item, enum))
 
@@ -10,8 +10,10 @@ from ...utils.package_utils import (
     to_id_request, to_include_key, to_list_query, to_list_request, to_list_result, to_query_data, to_result_picks, to_seek_query, to_session, to_session_input, to_sign_in_request, to_single_query,
     to_update_input, to_result, to_update_many_request, to_update_request, to_sort_orders, to_upsert_request
 )
+from ...utils.profile import traced
 
 
+@traced
 def data_client_instances(cdef: CDef) -> str:
     if not class_needs_api(cdef):
         return ''
@@ -19,6 +21,7 @@ def data_client_instances(cdef: CDef) -> str:
     return f'public var {var_name} = {to_client(cdef)}()'
 
 
+@traced
 def data_requests_and_clients(cdef: CDef) -> str:
     if not class_needs_api(cdef):
         return ''
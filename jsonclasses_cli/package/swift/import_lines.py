@@ -1,5 +1,9 @@
-def import_lines() -> str:
-    return """
+def import_lines(use_session: bool = False) -> str:
+    return f"""
 import Foundation
-import QSParser
+import QSParser{_security_import() if use_session else ''}
     """.strip() + '\n'
+
+
+def _security_import() -> str:
+    return '\nimport Security'
@@ -1,3 +1,4 @@
+from jsonclasses.cdef import CDef
 from jsonclasses.cgraph import CGraph
 from jsonclasses.uconf import uconf
 from jsonclasses_cli.package.swift.link_codable import link_codable
@@ -15,7 +16,7 @@ from .data_class import data_class
 from .session_items import session_items
 from .session import session
 from .response import response_struct
-from .user_default import user_default
+from .session_storage import session_storage
 from .session_manager import session_manager
 from .sign_out import sign_out
 from .request_manager import request_manager
@@ -24,12 +25,17 @@ from ...utils.join_lines import join_lines
 from ...utils.package_utils import session_input_cdefs
 
 
-def main_program_content(cgraph: CGraph) -> str:
+Fragments = dict[str, dict[str, str]]
+
+
+def main_program_content(cgraph: CGraph, fragments: Fragments | None = None) -> str:
+    if fragments is None:
+        fragments = {c.name: model_fragments(c) for c in cgraph._map.values()}
     session_classes = session_items(cgraph)
     use_session = len(session_classes) > 0
     request_url = uconf()['package.swift.url']
     return join_lines([
-        import_lines(),
+        import_lines(use_session),
         string_query(),
         int_query(),
         float_query(),
@@ -41,14 +47,22 @@ def main_program_content(cgraph: CGraph) -> str:
         sort_order(),
         link_codable(),
         *map(lambda e: data_enum(e), cgraph._enum_map.values()),
-        *map(lambda c: data_class(c), cgraph._map.values()),
+        *map(lambda c: fragments[c.name]['class'], cgraph._map.values()),
         *map(lambda c: session_input(c), session_input_cdefs(cgraph)),
         session(session_classes) if use_session else '',
         response_struct(),
-        user_default(),
+        session_storage() if use_session else '',
         session_manager() if use_session else '',
         sign_out() if use_session else '',
         request_manager(request_url, use_session),
-        *map(lambda c: data_requests_and_clients(c), cgraph._map.values()),
-        join_lines(map(lambda c: data_client_instances(c), cgraph._map.values()), 1),
+        *map(lambda c: fragments[c.name]['requests'], cgraph._map.values()),
+        join_lines(map(lambda c: fragments[c.name]['client_instances'], cgraph._map.values()), 1),
     ], 2)
+
+
+def model_fragments(cdef: CDef) -> dict[str, str]:
+    return {
+        'class': data_class(cdef),
+        'requests': data_requests_and_clients(cdef),
+        'client_instances': data_client_instances(cdef),
+    }
@@ -100,6 +100,6 @@ struct RequestManager {'{'}
 
 def _session_setter() -> str:
     return '\n' + """
-        if let session = SessionManager.shared.session {
-            request.setValue("Bearer \(session.token)", forHTTPHeaderField: "Authorization")
+        if let authorization = SessionManager.shared.authorization {
+            request.setValue(authorization, forHTTPHeaderField: "Authorization")
         }""".strip('\n')
@@ -2,8 +2,10 @@ from jsonclasses.cdef import CDef
 from jsonclasses_cli.utils.package_utils import to_session_input
 from .codable_struct import codable_struct, codable_struct_item
 from .jtype_to_swift_type import jtype_to_swift_type
+from jsonclasses_cli.utils.profile import traced
 
 
+@traced
 def session_input(cdef: CDef) -> str:
     name = to_session_input(cdef)
     struct_items: list[str] = []
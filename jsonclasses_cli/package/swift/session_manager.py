@@ -1,11 +1,82 @@
 def session_manager() -> str:
     return """
-public struct SessionManager {
+public final class SessionManager {
 
-    public static var shared = SessionManager()
+    public static let shared = SessionManager()
 
-    @UserDefault(key: "session") public fileprivate(set) var session: Session?
+    private let lock = NSLock()
+    private let queue = DispatchQueue(label: "jsonclasses.session", qos: .utility)
+    private var storage: SessionStorage = UserDefaultsSessionStorage()
+    private var pendingSave: DispatchWorkItem?
+    private var loaded = false
+    private var cachedSession: Session?
+    private var cachedAuthorization: String?
 
     private init() { }
+
+    public fileprivate(set) var session: Session? {
+        get {
+            lock.lock()
+            defer { lock.unlock() }
+            loadIfNeeded()
+            return cachedSession
+        }
+        set {
+            lock.lock()
+            defer { lock.unlock() }
+            loaded = true
+            cache(newValue)
+            scheduleSave(newValue)
+        }
+    }
+
+    internal var authorization: String? {
+        lock.lock()
+        defer { lock.unlock() }
+        loadIfNeeded()
+        return cachedAuthorization
+    }
+
+    public func use(storage: SessionStorage) {
+        lock.lock()
+        defer { lock.unlock() }
+        self.storage = storage
+        loaded = false
+    }
+
+    private func loadIfNeeded() {
+        if loaded {
+            return
+        }
+        loaded = true
+        if let data = storage.load() {
+            cache(try? JSONDecoder().decode(Session.self, from: data))
+        } else {
+            cache(nil)
+        }
+    }
+
+    private func cache(_ session: Session?) {
+        cachedSession = session
+        if let session = session {
+            cachedAuthorization = "Bearer \\(session.token)"
+        } else {
+            cachedAuthorization = nil
+        }
+    }
+
+    private func scheduleSave(_ session: Session?) {
+        pendingSave?.cancel()
+        let storage = self.storage
+        let item = DispatchWorkItem {
+            if let session = session {
+                storage.save(try? JSONEncoder().encode(session))
+            } else {
+                storage.save(nil)
+            }
+        }
+        pendingSave = item
+        queue.asyncAfter(deadline: .now() + .milliseconds(100), execute: item)
+    }
 }
     """.strip() + '\n'
@@ -0,0 +1,68 @@
+def session_storage() -> str:
+    return """
+public protocol SessionStorage {
+    func load() -> Data?
+    func save(_ data: Data?)
+}
+
+public struct UserDefaultsSessionStorage: SessionStorage {
+
+    private let key: String
+
+    public init(key: String = "session") {
+        self.key = key
+    }
+
+    public func load() -> Data? {
+        return UserDefaults.standard.string(forKey: key)?.data(using: .utf8)
+    }
+
+    public func save(_ data: Data?) {
+        if let data = data {
+            UserDefaults.standard.setValue(String(data: data, encoding: .utf8), forKey: key)
+        } else {
+            UserDefaults.standard.removeObject(forKey: key)
+        }
+    }
+}
+
+public struct KeychainSessionStorage: SessionStorage {
+
+    private let service: String
+    private let account: String
+
+    public init(service: String = "jsonclasses", account: String = "session") {
+        self.service = service
+        self.account = account
+    }
+
+    private var query: [String: Any] {
+        return [
+            kSecClass as String: kSecClassGenericPassword,
+            kSecAttrService as String: service,
+            kSecAttrAccount as String: account
+        ]
+    }
+
+    public func load() -> Data? {
+        var query = self.query
+        query[kSecReturnData as String] = true
+        query[kSecMatchLimit as String] = kSecMatchLimitOne
+        var result: AnyObject?
+        guard SecItemCopyMatching(query as CFDictionary, &result) == errSecSuccess else {
+            return nil
+        }
+        return result as? Data
+    }
+
+    public func save(_ data: Data?) {
+        SecItemDelete(query as CFDictionary)
+        if let data = data {
+            var query = self.query
+            query[kSecValueData as String] = data
+            query[kSecAttrAccessible as String] = kSecAttrAccessibleAfterFirstUnlock
+            SecItemAdd(query as CFDictionary, nil)
+        }
+    }
+}
+    """.strip() + '\n'
@@ -2,36 +2,53 @@ from pathlib import Path
 from jsonclasses.cgraph import CGraph
 from .package_json_content import package_json_content
 from .tsconfig_json_content import tsconfig_json_content
-from .main_program_content import main_program_content
+from .main_program_content import Fragments, main_program_content, program
+from .gitignore_content import gitignore_content
+from .js_content import js_content
+from .dts_content import dts_content
 from ...utils.write_file import write_file
 
 
-def ts(dest: Path, cgraph: CGraph, silent: bool = False):
-    package_dest = _create_dest_dir_if_needed(dest)
-    _generate_main_program_file(package_dest, cgraph, silent)
-    _generate_package_json_file(package_dest, dest, silent)
-    _generate_tsconfig_json_file(package_dest, silent)
-    _generate_gitignore_file(package_dest, silent)
-
-
-def _create_dest_dir_if_needed(dest: Path) -> Path:
-    dest = dest / 'packages' / 'ts'
-    if not dest.is_dir():
-        dest.mkdir(parents=True)
-    return dest
-
-
-def _generate_main_program_file(dest: Path, cgraph: CGraph, silent: bool = False):
-    write_file(dest / 'src/index.ts', main_program_content(cgraph), silent)
-
-
-def _generate_package_json_file(dest: Path, original_dest: Path, silent: bool = False):
-    write_file(dest / 'package.json', package_json_content(original_dest), silent)
-
-
-def _generate_tsconfig_json_file(dest: Path, silent: bool = False):
-    write_file(dest / 'tsconfig.json', tsconfig_json_content(), silent)
-
-
-def _generate_gitignore_file(dest: Path, silent: bool = False):
-    write_file(dest / '.gitignore', tsconfig_json_content(), silent)
+def ts(dest: Path,
+       cgraph: CGraph,
+       silent: bool = False,
+       validate: bool = False,
+       fragments: Fragments | None = None):
+    for (path, content) in ts_files(dest, cgraph, validate, fragments).items():
+        write_file(path, content, silent)
+
+
+def ts_files(dest: Path,
+             cgraph: CGraph,
+             validate: bool = False,
+             fragments: Fragments | None = None) -> dict[Path, str]:
+    package_dest = dest / 'packages' / 'ts'
+    return {
+        package_dest / 'src/index.ts': main_program_content(cgraph, validate, fragments),
+        package_dest / 'package.json': package_json_content(dest),
+        package_dest / 'tsconfig.json': tsconfig_json_content(),
+        package_dest / '.gitignore': tsconfig_json_content(),
+    }
+
+
+def js(dest: Path,
+       cgraph: CGraph,
+       silent: bool = False,
+       validate: bool = False,
+       fragments: Fragments | None = None):
+    for (path, content) in js_files(dest, cgraph, validate, fragments).items():
+        write_file(path, content, silent)
+
+
+def js_files(dest: Path,
+             cgraph: CGraph,
+             validate: bool = False,
+             fragments: Fragments | None = None) -> dict[Path, str]:
+    package_dest = dest / 'packages' / 'ts'
+    declarations = program(cgraph, validate, fragments)
+    return {
+        package_dest / 'lib/index.js': js_content(declarations),
+        package_dest / 'lib/index.d.ts': dts_content(declarations),
+        package_dest / 'package.json': package_json_content(dest, True),
+        package_dest / '.gitignore': gitignore_content().removeprefix('lib\n\n'),
+    }
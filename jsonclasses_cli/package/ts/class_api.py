@@ -1,42 +1,47 @@
-from typing import cast
 from jsonclasses.cdef import CDef
 from jsonclasses_cli.utils.package_utils import to_client
-from jsonclasses_server.aconf import AConf
 from jsonclasses.cgraph import CGraph
-from ...utils.join_lines import join_lines
-from ...utils.package_utils import session_input_cdefs, to_session, to_session_input, to_sign_in_request, to_single_query
+from .declarations import Class, Const, Field, Method, Param
 from inflection import camelize,pluralize
 
-def class_api(cgraph: CGraph, use_session:bool) -> str:
-    return join_lines([
-        'class API {',
+def class_api(cgraph: CGraph, use_session:bool) -> Class:
+    return Class('API', _client_fields(cgraph), [
+        _constructor(),
         *map(lambda c: _client_item(c), cgraph._map.values()),
-        _session() if use_session else '',
-        _sign_out() if use_session else '',
-        '}'
-    ], 2)
-
-
-def _client_item(cdef: CDef) -> str:
-    name  = camelize(pluralize(cdef.name))
-    return join_lines([
-        f"    get {name}(): {to_client(cdef)} {'{'}",
-        f"        return new {to_client(cdef)}()",
-        "    }"
-    ])
+        *(_session() if use_session else [])
+    ], exported=True)
 
 
-def _session() -> str:
-    return join_lines([
-        '    get session(): SessionManager {',
-        '       return SessionManager.share',
-        '    }'
-    ])
+def export_api() -> Const:
+    return Const('api', 'new API()', declared='API', exported=True)
+
 
+def _client_fields(cgraph: CGraph) -> list[Field]:
+    return [
+        Field('#manager', 'RequestManager'),
+        *map(lambda c: Field(f'#{_client_name(c)}', to_client(c), optional=True), cgraph._map.values())
+    ]
 
-def _sign_out() -> str:
-    return join_lines([
-        '    signOut(): void {',
-        '       SessionManager.share.clearSession()',
-        '    }'
+
+def _constructor() -> Method:
+    return Method('constructor', [Param('config', 'APIConfig', '{}')], body=[
+        '        this.#manager = new RequestManager(config)'
     ])
+
+
+def _client_item(cdef: CDef) -> Method:
+    name  = _client_name(cdef)
+    return Method(name, [], to_client(cdef), [
+        f"        return this.#{name} ??= new {to_client(cdef)}(this.#manager)"
+    ], 'get ')
+
+
+def _client_name(cdef: CDef) -> str:
+    return camelize(pluralize(cdef.name))
+
+
+def _session() -> list[Method]:
+    return [
+        Method('session', [], 'SessionManager', ['        return SessionManager.share'], 'get '),
+        Method('signOut', [], 'void', ['        SessionManager.share.clearSession()'])
+    ]
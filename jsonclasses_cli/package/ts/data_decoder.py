@@ -0,0 +1,101 @@
+from inflection import camelize
+from jsonclasses.cdef import CDef
+from jsonclasses.cgraph import CGraph
+from jsonclasses.fdef import FDef, FType
+from .shared_utils import field_can_read
+from .declarations import Code, Function, Param, TS, parts
+from ...utils.package_utils import to_decoder
+from ...utils.profile import traced
+
+
+@traced
+def data_decoder(cdef: CDef) -> list[Function]:
+    if not class_needs_decoder(cdef):
+        return []
+    items: list[Code] = []
+    for field in cdef.fields:
+        if not field_can_read(field):
+            continue
+        name = camelize(field.name)
+        expr = _decode_expr(field.fdef, f'data.{name}')
+        if expr is None:
+            continue
+        items.extend(_decoder_item(name, expr))
+    return [Function(to_decoder(cdef), [Param('data', 'any')], 'any', [
+        '    if (data == null) {',
+        '        return data',
+        '    }',
+        *items,
+        '    return data'
+    ])]
+
+
+def session_decoder(items: dict[str, str], cgraph: CGraph) -> list[Function]:
+    lines: list[Code] = []
+    for (s, c) in items.items():
+        cdef = cgraph.fetch(c)
+        if class_needs_decoder(cdef):
+            lines.append(f'    data.{s} = {to_decoder(cdef)}(data.{s})')
+    if len(lines) == 0:
+        return []
+    return [Function('decodeSession', [Param('data', 'any')], 'any', [*lines, '    return data'])]
+
+
+def decoded_result(cdef: CDef, request: str, many: bool = False) -> list[str]:
+    if not class_needs_decoder(cdef):
+        return [f'await {request}']
+    if many:
+        return [f'(await {request}', TS(' as any[]'), f').map({to_decoder(cdef)})']
+    return [f'{to_decoder(cdef)}(await {request})']
+
+
+def class_needs_decoder(cdef: CDef, visited: set[str] | None = None) -> bool:
+    visited = visited if visited is not None else set()
+    visited.add(cdef.name)
+    for field in cdef.fields:
+        if not field_can_read(field):
+            continue
+        if _fdef_needs_decoder(field.fdef, visited):
+            return True
+    return False
+
+
+def _fdef_needs_decoder(fdef: FDef, visited: set[str]) -> bool:
+    match fdef.ftype:
+        case FType.DATE | FType.DATETIME:
+            return True
+        case FType.LIST:
+            return _fdef_needs_decoder(fdef.item_types.fdef, visited)
+        case FType.INSTANCE:
+            cdef = fdef.inst_cls.cdef
+            if cdef.name in visited:
+                return False
+            return class_needs_decoder(cdef, visited)
+        case _:
+            return False
+
+
+def _decode_expr(fdef: FDef, value: str) -> Code | None:
+    match fdef.ftype:
+        case FType.DATE | FType.DATETIME:
+            return f'new Date({value})'
+        case FType.LIST:
+            item_fdef = fdef.item_types.fdef
+            if item_fdef.ftype == FType.INSTANCE:
+                cdef = item_fdef.inst_cls.cdef
+                return f'{value}.map({to_decoder(cdef)})' if class_needs_decoder(cdef) else None
+            item = _decode_expr(item_fdef, 'v')
+            return [f'{value}.map((v', TS(': any'), ') => ', *parts(item), ')'] if item else None
+        case FType.INSTANCE:
+            cdef = fdef.inst_cls.cdef
+            return f'{to_decoder(cdef)}({value})' if class_needs_decoder(cdef) else None
+        case _:
+            return None
+
+
+def _decoder_item(name: str, expr: Code) -> list[Code]:
+    return [
+        f'    if (data.{name} != null) {"{"}',
+        [f'        data.{name} = ', *parts(expr)],
+        '    }'
+    ]
@@ -1,13 +1,13 @@
-from enum import Enum
+from enum import Enum as PyEnum
 from inflection import camelize
-from jsonclasses_cli.package.ts.interface_enum import interface_enum, interface_enum_item
+from jsonclasses_cli.package.ts.declarations import Enum
+from jsonclasses_cli.utils.profile import traced
 
 
-def data_enum(enum: type[Enum]) -> str:
-    return interface_enum(enum.__name__, map(_data_enum_item, enum))
+@traced
+def data_enum(enum: type[PyEnum]) -> Enum:
+    return Enum(enum.__name__, [_data_enum_item(option) for option in enum])
 
 
-def _data_enum_item(option: Enum):
-    name = camelize(option.name.lower())
-    value = option.name
-    return interface_enum_item(name, value)
+def _data_enum_item(option: PyEnum) -> tuple[str, str]:
+    return (camelize(option.name.lower()), option.name)
@@ -14,8 +14,10 @@ from ...utils.package_utils import (
     to_sort_orders, to_update_input, to_query_data, is_field_link)
 from ...utils.join_lines import join_lines
 from .jtype_to_ts_type import jtype_to_ts_type
+from ...utils.profile import traced
 
 
+@traced
 def data_interface(cdef: CDef) -> str:
     return join_lines([
         _interface_result(cdef),
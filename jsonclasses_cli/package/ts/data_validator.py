@@ -0,0 +1,254 @@
+from enum import Enum
+from json import dumps
+from typing import Literal
+from inflection import camelize
+from jsonclasses.cdef import CDef
+from jsonclasses.cgraph import CGraph
+from jsonclasses.fdef import FType
+from jsonclasses.jfield import JField
+from jsonclasses.modifiers.modifier import Modifier
+from jsonclasses.modifiers.type_modifier import TypeModifier
+from jsonclasses.modifiers.enum_modifier import EnumModifier
+from jsonclasses.modifiers.length_modifier import LengthModifier
+from jsonclasses.modifiers.minlength_modifier import MinlengthModifier
+from jsonclasses.modifiers.maxlength_modifier import MaxlengthModifier
+from jsonclasses.modifiers.min_modifier import MinModifier
+from jsonclasses.modifiers.max_modifier import MaxModifier
+from jsonclasses.modifiers.range_modifier import RangeModifier
+from jsonclasses.modifiers.email_modifier import EmailModifier
+from jsonclasses.modifiers.match_modifier import MatchModifier
+from jsonclasses.modifiers.alnum_modifier import AlnumModifier
+from .shared_utils import (
+    field_can_create, field_can_update, is_field_ref, is_field_required_for_create,
+    is_field_required_null_for_update, string
+)
+from .declarations import Class, Code, Const, Declaration, Field, Function, Method, Param, TS, Types
+from ...utils.join_lines import join_lines
+from ...utils.package_utils import (
+    class_needs_api, to_create_input, to_update_input, to_create_input_validator, to_update_input_validator
+)
+from ...utils.profile import traced
+
+
+Check = tuple[str, str]
+
+
+def validation_helpers(cgraph: CGraph) -> list[Declaration]:
+    return [
+        *_validation_error(),
+        *_shared_patterns(),
+        *map(lambda e: _enum_values(e), cgraph._enum_map.values())
+    ]
+
+
+@traced
+def data_validator(cdef: CDef) -> list[Declaration]:
+    if not class_needs_api(cdef):
+        return []
+    return [
+        *_match_patterns(cdef),
+        _validator(cdef, 'C'),
+        _validator(cdef, 'U')
+    ]
+
+
+def validated_input(cdef: CDef, mode: Literal['C', 'U'], value: str, many: bool = False) -> list[Code]:
+    validator = to_create_input_validator(cdef) if mode == 'C' else to_update_input_validator(cdef)
+    if many:
+        return [
+            f'        for (const input of {value}) {"{"}',
+            f'            const errors = {validator}(input)',
+            '            if (errors) {',
+            '                throw new ValidationError(errors)',
+            '            }',
+            '        }'
+        ]
+    return [
+        f'        const errors = {validator}({value})',
+        '        if (errors) {',
+        '            throw new ValidationError(errors)',
+        '        }'
+    ]
+
+
+def _validation_error() -> list[Declaration]:
+    return [
+        Types('export type ValidationErrors = {[key: string]: string}'),
+        Class('ValidationError', [Field('keypathMessages', 'ValidationErrors')], [
+            Method('constructor', [Param('keypathMessages', 'ValidationErrors')], body=[
+                "        super('Client side validation failed.')",
+                '        this.keypathMessages = keypathMessages'
+            ])
+        ], extends='Error', exported=True)
+    ]
+
+
+def _shared_patterns() -> list[Declaration]:
+    return [
+        Const('emailPattern', "/^\\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\\.[A-Z|a-z]{2,}\\b/", declared='RegExp'),
+        Const('alnumPattern', "new RegExp('^[\\\\p{L}\\\\p{N}]+$', 'u')", declared='RegExp')
+    ]
+
+
+def _enum_values(enum: type[Enum]) -> Const:
+    return Const(_enum_values_name(enum), ['new Set', TS('<string>'), f'(Object.values({enum.__name__}))'],
+                 declared='Set<string>')
+
+
+def _enum_values_name(enum: type[Enum]) -> str:
+    return camelize(enum.__name__) + 'Values'
+
+
+def _match_patterns(cdef: CDef) -> list[Declaration]:
+    items: list[Declaration] = []
+    for field in cdef.fields:
+        if not field_can_create(field) and not field_can_update(field):
+            continue
+        for modifier in _compiled_modifiers(field):
+            if isinstance(modifier, MatchModifier) and isinstance(modifier.pattern, str):
+                pattern = modifier.pattern.replace('(?P<', '(?<')
+                items.append(Const(_pattern_name(cdef, field), f'new RegExp({dumps(pattern)})', declared='RegExp'))
+    return items
+
+
+def _pattern_name(cdef: CDef, field: JField) -> str:
+    return camelize(cdef.name + '_' + field.name) + 'Pattern'
+
+
+def _validator(cdef: CDef, mode: Literal['C', 'U']) -> Function:
+    items: list[str] = []
+    for field in cdef.fields:
+        if is_field_ref(field):
+            continue
+        if mode == 'C' and not field_can_create(field):
+            continue
+        if mode == 'U' and not field_can_update(field):
+            continue
+        item = _field_validation(cdef, field, mode)
+        if item != '':
+            items.append(item.rstrip('\n'))
+    name = to_create_input_validator(cdef) if mode == 'C' else to_update_input_validator(cdef)
+    input = to_create_input(cdef) if mode == 'C' else to_update_input(cdef)
+    return Function(name, [Param('input', input)], 'ValidationErrors | undefined', [
+        ['    let errors', TS(': ValidationErrors | undefined')],
+        *items,
+        '    return errors'
+    ], exported=True)
+
+
+def _field_validation(cdef: CDef, field: JField, mode: Literal['C', 'U']) -> str:
+    name = camelize(field.name)
+    value = f'input.{name}'
+    checks = _field_checks(cdef, field, value)
+    if mode == 'C' and is_field_required_for_create(field):
+        lines = [f'    if ({value} == null) {"{"}', _error(name, 'value required', 2)]
+        if len(checks):
+            lines.extend(['    } else {', _checks(name, checks, 2)])
+        lines.append('    }')
+        return join_lines(lines)
+    if len(checks) == 0:
+        return ''
+    if mode == 'U' and is_field_required_null_for_update(field):
+        return join_lines([
+            f'    if ({value} === null) {"{"}',
+            _error(name, 'value required', 2),
+            f'    {"}"} else if ({value} !== undefined) {"{"}',
+            _checks(name, checks, 2),
+            '    }'
+        ])
+    return join_lines([
+        f'    if ({value} != null) {"{"}',
+        _checks(name, checks, 2),
+        '    }'
+    ])
+
+
+def _checks(name: str, checks: list[Check], level: int) -> str:
+    indent = '    ' * level
+    lines: list[str] = []
+    for (i, (cond, message)) in enumerate(checks):
+        lines.append(f'{indent}{"" if i == 0 else "} else "}if ({cond}) {"{"}')
+        lines.append(_error(name, message, level + 1))
+    lines.append(f'{indent}{"}"}')
+    return join_lines(lines)
+
+
+def _error(name: str, message: str, level: int) -> str:
+    return f"{'    ' * level}(errors ??= {'{}'})[{string(name)}] = {string(message)}"
+
+
+def _field_checks(cdef: CDef, field: JField, value: str) -> list[Check]:
+    checks: list[Check] = []
+    type_check = _type_check(field, value)
+    if type_check is not None:
+        checks.append(type_check)
+    for modifier in _compiled_modifiers(field):
+        match modifier:
+            case LengthModifier(minlength=minlength, maxlength=maxlength):
+                if _is_number(minlength) and _is_number(maxlength):
+                    if minlength == maxlength:
+                        checks.append((f'{value}.length !== {minlength}', f'length of value is not {minlength}'))
+                    else:
+                        checks.append((f'{value}.length < {minlength} || {value}.length > {maxlength}',
+                                       f'length of value is not between {minlength} and {maxlength}'))
+            case MinlengthModifier(minlength=minlength):
+                if _is_number(minlength):
+                    checks.append((f'{value}.length < {minlength}',
+                                   f'length of value is not greater than or equal {minlength}'))
+            case MaxlengthModifier(maxlength=maxlength):
+                if _is_number(maxlength):
+                    checks.append((f'{value}.length > {maxlength}',
+                                   f'length of value is not less than or equal {maxlength}'))
+            case MinModifier(min_value=min_value):
+                if _is_number(min_value):
+                    checks.append((f'{value} < {min_value}', f'value is not greater than or equal {min_value}'))
+            case MaxModifier(max_value=max_value):
+                if _is_number(max_value):
+                    checks.append((f'{value} > {max_value}', f'value is not less than or equal {max_value}'))
+            case RangeModifier(min=min_value, max=max_value):
+                if _is_number(min_value):
+                    checks.append((f'{value} < {min_value}', f'value is not greater than or equal {min_value}'))
+                if _is_number(max_value):
+                    checks.append((f'{value} > {max_value}', f'value is not less than or equal {max_value}'))
+            case EmailModifier():
+                checks.append((f'!emailPattern.test({value})', 'value is not email string'))
+            case AlnumModifier():
+                checks.append((f'!alnumPattern.test({value})', 'value is not alnum str'))
+            case MatchModifier(pattern=pattern):
+                if isinstance(pattern, str):
+                    checks.append((f'!{_pattern_name(cdef, field)}.test({value})', 'value does not match pattern'))
+    return checks
+
+
+def _type_check(field: JField, value: str) -> Check | None:
+    match field.fdef.ftype:
+        case FType.STR:
+            return (f"typeof {value} !== 'string'", 'value is not str')
+        case FType.INT:
+            return (f'!Number.isInteger({value})', 'value is not int')
+        case FType.FLOAT:
+            return (f"typeof {value} !== 'number'", 'value is not float')
+        case FType.BOOL:
+            return (f"typeof {value} !== 'boolean'", 'value is not bool')
+        case FType.LIST:
+            return (f'!Array.isArray({value})', 'value is not list')
+        case FType.ENUM:
+            return (f'!{_enum_values_name(field.fdef.enum_class)}.has({value})', 'unknown enum value')
+        case _:
+            return None
+
+
+def _compiled_modifiers(field: JField) -> list[Modifier]:
+    items: list[Modifier] = []
+    for modifier in field.types.modifier.vs:
+        if isinstance(modifier, (TypeModifier, EnumModifier)):
+            items.append(modifier)
+            continue
+        if type(modifier).transform is not Modifier.transform:
+            break
+        items.append(modifier)
+    return items
+
+
+def _is_number(value: object) -> bool:
+    return type(value) is int or type(value) is float
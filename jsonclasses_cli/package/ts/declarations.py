@@ -0,0 +1,223 @@
+from __future__ import annotations
+from typing import Literal, Sequence, Union
+
+
+Target = Literal['ts', 'js', 'dts']
+
+
+class TS(str):
+    pass
+
+
+Code = Union[str, list[str]]
+
+
+def code(value: Code | None, target: Target) -> str:
+    if value is None:
+        return ''
+    if isinstance(value, str):
+        return '' if isinstance(value, TS) and target != 'ts' else str(value)
+    return ''.join(str(part) for part in value if target == 'ts' or not isinstance(part, TS))
+
+
+def parts(value: Code) -> list[str]:
+    return [value] if isinstance(value, str) else value
+
+
+def _export(exported: bool) -> str:
+    return 'export ' if exported else ''
+
+
+def _body(lines: list[Code], target: Target) -> list[str]:
+    return [code(line, target) for line in lines]
+
+
+class Param:
+
+    def __init__(self, name: str, type: str | None = None, default: str | None = None,
+                 optional: bool = False) -> None:
+        self.name = name
+        self.type = type
+        self.default = default
+        self.optional = optional
+
+    def render(self, target: Target) -> str:
+        if target == 'js':
+            return self.name + (f' = {self.default}' if self.default is not None else '')
+        optional = self.optional or (target == 'dts' and self.default is not None)
+        result = self.name + ('?' if optional else '') + (f': {self.type}' if self.type is not None else '')
+        if target == 'ts' and self.default is not None:
+            result += f' = {self.default}'
+        return result
+
+
+def _params(params: list[Param], target: Target) -> str:
+    return ', '.join(p.render(target) for p in params)
+
+
+class Field:
+
+    def __init__(self, name: str, type: str | None = None, init: Code | None = None, static: bool = False,
+                 optional: bool = False, declared: str | None = None) -> None:
+        self.name = name
+        self.type = type
+        self.init = init
+        self.static = static
+        self.optional = optional
+        self.declared = declared
+
+    @property
+    def private(self) -> bool:
+        return self.name.startswith('#')
+
+    def render(self, target: Target) -> str:
+        static = 'static ' if self.static else ''
+        if target == 'dts':
+            return f'    {static}{self.name}{"?" if self.optional else ""}: {self.type or self.declared}'
+        result = f'    {static}{self.name}'
+        if target == 'ts':
+            result += ('?' if self.optional else '') + (f': {self.type}' if self.type is not None else '')
+        if self.init is not None:
+            result += f' = {code(self.init, target)}'
+        return result
+
+
+class Method:
+
+    def __init__(self, name: str, params: list[Param], returns: str | None = None, body: list[Code] | None = None,
+                 modifiers: str = '', generics: str = '') -> None:
+        self.name = name
+        self.params = params
+        self.returns = returns
+        self.body = body or []
+        self.modifiers = modifiers
+        self.generics = generics
+
+    @property
+    def private(self) -> bool:
+        return self.name.startswith('#')
+
+    def render(self, target: Target) -> str:
+        returns = f': {self.returns}' if self.returns is not None and target != 'js' else ''
+        generics = self.generics if target != 'js' else ''
+        if target == 'dts':
+            modifiers = self.modifiers.replace('async ', '')
+            return f'    {modifiers}{self.name}{generics}({_params(self.params, target)}){returns}'
+        head = f'    {self.modifiers}{self.name}{generics}({_params(self.params, target)}){returns} {"{"}'
+        return '\n'.join([head, *_body(self.body, target), '    }'])
+
+
+class Class:
+
+    def __init__(self, name: str, fields: list[Field], methods: list[Method], generics: str = '',
+                 extends: Code | None = None, implements: str | None = None, exported: bool = False) -> None:
+        self.name = name
+        self.fields = fields
+        self.methods = methods
+        self.generics = generics
+        self.extends = extends
+        self.implements = implements
+        self.exported = exported
+
+    def render(self, target: Target) -> str:
+        type_target: Target = 'js' if target == 'js' else 'ts'
+        extends = f' extends {code(self.extends, type_target)}' if self.extends is not None else ''
+        if target == 'js':
+            head = f'{_export(self.exported)}class {self.name}{extends} {"{"}'
+            members = [m.render(target) for m in [*self.fields, *self.methods]]
+            return '\n'.join([head, *members, '}'])
+        implements = f' implements {self.implements}' if self.implements is not None else ''
+        declare = 'declare ' if target == 'dts' else ''
+        head = f'{_export(self.exported)}{declare}class {self.name}{self.generics}{extends}{implements} {"{"}'
+        if target == 'dts':
+            members = [m for m in [*self.fields, *self.methods] if not m.private]
+            private = ['    #private'] if len(members) < len(self.fields) + len(self.methods) else []
+            return '\n'.join([head, *private, *[m.render(target) for m in members], '}'])
+        groups: list[str] = []
+        if len(self.fields) > 0:
+            groups.append('\n'.join(f.render(target) for f in self.fields))
+        groups.extend(m.render(target) for m in self.methods)
+        return '\n\n'.join([head, *groups]) + '\n}'
+
+
+class Function:
+
+    def __init__(self, name: str, params: list[Param], returns: str | None, body: list[Code],
+                 exported: bool = False) -> None:
+        self.name = name
+        self.params = params
+        self.returns = returns
+        self.body = body
+        self.exported = exported
+
+    def render(self, target: Target) -> str:
+        returns = f': {self.returns}' if self.returns is not None and target != 'js' else ''
+        head = f'function {self.name}({_params(self.params, target)}){returns}'
+        if target == 'dts':
+            return f'{_export(self.exported)}declare {head}' if self.exported else ''
+        return '\n'.join([f'{_export(self.exported)}{head} {"{"}', *_body(self.body, target), '}'])
+
+
+class Const:
+
+    def __init__(self, name: str, value: Code, type: str | None = None, declared: str | None = None,
+                 exported: bool = False) -> None:
+        self.name = name
+        self.value = value
+        self.type = type
+        self.declared = declared
+        self.exported = exported
+
+    def render(self, target: Target) -> str:
+        if target == 'dts':
+            return f'export declare const {self.name}: {self.type or self.declared}' if self.exported else ''
+        type = f': {self.type}' if self.type is not None and target == 'ts' else ''
+        return f'{_export(self.exported)}const {self.name}{type} = {code(self.value, target)}'
+
+
+class Enum:
+
+    def __init__(self, name: str, items: list[tuple[str, str]], exported: bool = False) -> None:
+        self.name = name
+        self.items = items
+        self.exported = exported
+
+    def render(self, target: Target) -> str:
+        if target == 'js':
+            items = [f"    {name}: '{value}'," for (name, value) in self.items]
+            return '\n'.join([f'{_export(self.exported)}const {self.name} = Object.freeze({"{"}', *items, '})'])
+        items = [f"    {name} = '{value}'," for (name, value) in self.items]
+        declare = 'declare ' if target == 'dts' else ''
+        return '\n'.join([f'{_export(self.exported)}{declare}enum {self.name} {"{"}', *items, '}'])
+
+
+class Types:
+
+    def __init__(self, text: str) -> None:
+        self.text = text.strip()
+
+    def render(self, target: Target) -> str:
+        return '' if target == 'js' else self.text
+
+
+class Import:
+
+    def __init__(self, text: str) -> None:
+        self.text = text.strip('\n')
+
+    def render(self, target: Target) -> str:
+        return '' if target == 'dts' else self.text
+
+
+Declaration = Union[Class, Function, Const, Enum, Types, Import]
+
+
+def render(groups: Sequence[Sequence[Declaration]], target: Target) -> str:
+    separator = '\n\n\n' if target == 'ts' else '\n\n'
+    items: list[str] = []
+    for group in groups:
+        rendered = [d.render(target) for d in group]
+        content = '\n\n'.join(r for r in rendered if r != '')
+        if content != '':
+            items.append(content)
+    return separator.join(items) + '\n'
@@ -0,0 +1,6 @@
+from typing import Sequence
+from .declarations import Declaration, render
+
+
+def dts_content(program: Sequence[Sequence[Declaration]]) -> str:
+    return render(program, 'dts')
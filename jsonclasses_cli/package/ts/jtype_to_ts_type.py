@@ -28,15 +28,11 @@ def jtype_to_ts_type(fdef: FDef, mode: Literal['C', 'U', 'R', 'Q'], is_link: boo
         case FType.DATE:
             if mode == 'Q':
                 return 'DateQuery'
-            elif mode == 'R':
-                return 'string'
             else:
                 return 'Date'
         case FType.DATETIME:
             if mode == 'Q':
                 return 'DateQuery'
-            elif mode == 'R':
-                return 'string'
             else:
                 return 'Date'
         case FType.ENUM:
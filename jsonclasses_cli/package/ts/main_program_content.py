@@ -1,7 +1,9 @@
+from typing import Sequence
+from jsonclasses.cdef import CDef
 from jsonclasses.cgraph import CGraph
 from jsonclasses.uconf import uconf
 from .id_query import id_query
-from .class_api import class_api
+from .class_api import class_api, export_api
 from .data_requests_and_client import data_requests_and_clients
 from .links_interface import links_interface
 from .request_manager import request_manager
@@ -10,37 +12,66 @@ from .session_input import session_input
 from .session import session
 from .session_items import session_items
 from .data_interface import data_interface
+from .data_decoder import data_decoder, session_decoder
+from .data_validator import data_validator, validation_helpers
 from .string_query import string_query
 from .number_query import number_query
 from .boolean_query import boolean_query
 from .date_query import date_query
 from .data_enum import data_enum
-from ...utils.join_lines import join_lines
+from .declarations import Declaration, Import, Types, render
 from ...utils.package_utils import session_input_cdefs
 
 
-def main_program_content(cgraph: CGraph) -> str:
+Fragments = dict[str, dict[str, Sequence[Declaration]]]
+
+
+def main_program_content(cgraph: CGraph,
+                         validate: bool = False,
+                         fragments: Fragments | None = None) -> str:
+    return render(program(cgraph, validate, fragments), 'ts')
+
+
+def program(cgraph: CGraph,
+            validate: bool = False,
+            fragments: Fragments | None = None) -> list[Sequence[Declaration]]:
+    if fragments is None:
+        fragments = {c.name: model_fragments(c, validate) for c in cgraph._map.values()}
     session_classes = session_items(cgraph)
     use_session = len(session_classes) > 0
     request_url = uconf()['package.ts.url']
-    return join_lines([
-        _import_lines(),
-        *map(lambda e: data_enum(e), cgraph._enum_map.values()),
-        string_query(),
-        number_query(),
-        boolean_query(),
-        date_query(),
-        id_query(),
-        links_interface(),
-        *map(lambda c: data_interface(c), cgraph._map.values()),
-        *map(lambda c: session_input(c), session_input_cdefs(cgraph)),
-        session(session_classes),
-        session_manager(session_classes) if use_session else '',
-        request_manager(request_url,use_session),
-        *map(lambda c: data_requests_and_clients(c), cgraph._map.values()),
-        class_api(cgraph,use_session),
-        _export_api()
-    ], 3)
+    session_decoder_content = session_decoder(session_classes, cgraph)
+    return [
+        [Import(_import_lines())],
+        *map(lambda e: [data_enum(e)], cgraph._enum_map.values()),
+        [Types(string_query())],
+        [Types(number_query())],
+        [Types(boolean_query())],
+        [Types(date_query())],
+        [Types(id_query())],
+        [Types(links_interface())],
+        *map(lambda c: fragments[c.name]['interface'], cgraph._map.values()),
+        *map(lambda c: [Types(session_input(c))], session_input_cdefs(cgraph)),
+        [Types(session(session_classes))],
+        *map(lambda c: fragments[c.name]['decoder'], cgraph._map.values()),
+        session_decoder_content,
+        session_manager(session_classes, len(session_decoder_content) > 0) if use_session else [],
+        validation_helpers(cgraph) if validate else [],
+        *map(lambda c: fragments[c.name]['validator'], cgraph._map.values()),
+        request_manager(request_url, use_session),
+        *map(lambda c: fragments[c.name]['requests'], cgraph._map.values()),
+        [class_api(cgraph, use_session)],
+        [export_api()]
+    ]
+
+
+def model_fragments(cdef: CDef, validate: bool = False) -> dict[str, Sequence[Declaration]]:
+    return {
+        'interface': [Types(data_interface(cdef))],
+        'decoder': data_decoder(cdef),
+        'validator': data_validator(cdef) if validate else [],
+        'requests': data_requests_and_clients(cdef, validate),
+    }
 
 
 def _import_lines() -> str:
@@ -48,6 +79,3 @@ def _import_lines() -> str:
 import axios from 'axios'
 import { stringify } from 'qsparser-js'
     """.strip()
-
-def _export_api() -> str:
-    return "export const api = new API()"
@@ -2,8 +2,10 @@ from pathlib import Path
 from inflection import underscore, dasherize
 
 
-def package_json_content(dest: Path):
+def package_json_content(dest: Path, js: bool = False):
     pkg_name = dasherize(underscore(dest.name))
+    if js:
+        return _js_package_json_content(pkg_name)
     return f"""
 {'{'}
     "name": "{pkg_name}",
@@ -22,3 +24,22 @@ def package_json_content(dest: Path):
     {'}'}
 {'}'}
     """.strip() + '\n'
+
+
+def _js_package_json_content(pkg_name: str):
+    return f"""
+{'{'}
+    "name": "{pkg_name}",
+    "version": "0.1.0",
+    "private": true,
+    "description": "This API client package is generated by JSONClasses CLI.",
+    "type": "module",
+    "main": "lib/index.js",
+    "types": "lib/index.d.ts",
+    "author": "",
+    "dependencies": {'{'}
+        "axios": "^0.24.0",
+        "qsparser-js": "^1.0.1"
+    {'}'}
+{'}'}
+    """.strip() + '\n'
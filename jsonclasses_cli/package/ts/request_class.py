@@ -0,0 +1,57 @@
+from jsonclasses.cdef import CDef
+from .declarations import Class, Code, Field, Method, Param, TS
+from .shared_utils import interface_required_include
+from ...utils.package_utils import to_include, to_result_picks
+
+
+Member = tuple[Field, Param]
+
+
+def request_class(result: str, name: str, members: list[Member], methods: list[Method],
+                  extends: str = 'T') -> Class:
+    return Class(name, [Field('#manager', 'RequestManager'), *[f for (f, _) in members]], [
+        Method('constructor', [Param('manager', 'RequestManager'), *[p for (_, p) in members]], body=[
+            '        super(() => {})',
+            '        this.#manager = manager',
+            *[f'        this.{f.name} = {p.name}' for (f, p) in members]
+        ]),
+        *methods
+    ], f'<T extends Partial<{result}>>' if extends != 'void' else '', ['Promise', TS(f'<{extends}>')])
+
+
+def query_methods(cdef: CDef, request: str, narrow: bool = True) -> list[Method]:
+    picks = f'{to_result_picks(cdef)}[]'
+    methods = [
+        Method('pick', [Param('picks', picks)],
+               f'{request}<Pick<T, typeof picks[number]>>' if narrow else f'{request}<T>', [
+            '        this.#query = {...this.#query, _pick: picks}',
+            '        return this'
+        ]),
+        Method('omit', [Param('omits', picks)],
+               f'{request}<Omit<T, typeof omits[number]>>' if narrow else f'{request}<T>', [
+            '        this.#query = {...this.#query, _omit: omits}',
+            '        return this'
+        ])
+    ]
+    if interface_required_include(cdef):
+        methods.append(Method('include', [Param('includes', f'{to_include(cdef)}[]')], f'{request}<T>', [
+            '        this.#query = {...this.#query, _includes: includes}',
+            '        return this'
+        ]))
+    return methods
+
+
+def exec_method(returns: str, result: list[str], validation: list[Code] | None = None) -> Method:
+    return Method('exec', [], returns, [*(validation or []), ['        return ', *result]], 'async ')
+
+
+def input_member(type: str) -> Member:
+    return (Field('#input', type), Param('input', type))
+
+
+def query_member(type: str) -> Member:
+    return (Field('#query', type, optional=True), Param('query', type, optional=True))
+
+
+def id_member() -> Member:
+    return (Field('#id', 'string'), Param('id', 'string'))
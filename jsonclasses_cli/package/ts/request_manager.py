@@ -1,49 +1,51 @@
-def request_manager(base_url: str,use_session:bool) -> str:
-    return f"""
-class RequestManager {"{"}
-
-    static share = new RequestManager()
-
-    #baseURL: string = "{base_url}"
-
-
-    get headers() {"{"}
-        const token = {'SessionManager.share.hasSession() ? SessionManager.share.getToken() : ' if use_session else ''} undefined 
-        return token ? {"{"}
-            headers: {"{"}
-                'Authorization': `Bearer ${"{"}token{"}"}`
-            {"}"}
-        {"}"} : undefined
-    {"}"}
-
-    qs(val: any): string {"{"}
-        if (!val) {"{"}
-            return ''
-        {"}"}
-        if (Object.keys(val).length === 0) {"{"}
-            return ''
-        {"}"}
-        return '?' + stringify(val)
-    {"}"}
-
-    async post<T, U, V>(url: string, input: T, query: V | undefined = undefined): Promise<U> {"{"}
-        const response = await axios.post(this.#baseURL + url + this.qs(query), input, this.headers)
-        return response.data.data
-    {"}"}
-
-    async patch<T, U, V>(url: string, input: T, query: V | undefined = undefined): Promise<U> {"{"}
-        const response = await axios.patch(this.#baseURL + url + this.qs(query), input, this.headers)
-        return response.data.data
-    {"}"}
-
-    async delete<V>(url: string, query: V | undefined = undefined): Promise<void> {"{"}
-        await axios.delete(this.#baseURL + url + this.qs(query), this.headers)
-        return
-    {"}"}
-
-    async get<U, V>(url: string, query: V | undefined = undefined): Promise<U> {"{"}
-        const response = await axios.get(this.#baseURL + url + this.qs(query), this.headers)
-        return response.data.data
-    {"}"}
-{"}"}
-    """.strip() + '\n'
+from .declarations import Class, Declaration, Field, Method, Param, Types
+
+
+HEADERS = '{ headers: { Authorization: string } } | undefined'
+
+
+def request_manager(base_url: str, use_session: bool) -> list[Declaration]:
+    return [
+        Types("""
+export interface APIConfig {
+    baseURL?: string
+}
+        """.strip()),
+        Class('RequestManager', [Field('#baseURL', 'string')], [
+            Method('constructor', [Param('config', 'APIConfig', '{}')], body=[
+                f'        this.#baseURL = config.baseURL ?? "{base_url}"'
+            ]),
+            Method('headers', [], HEADERS, [
+                f"        return {'SessionManager.share.headers' if use_session else 'undefined'}"
+            ], 'get '),
+            Method('qs', [Param('val', 'any')], 'string', [
+                '        if (!val) {',
+                "            return ''",
+                '        }',
+                '        if (Object.keys(val).length === 0) {',
+                "            return ''",
+                '        }',
+                "        return '?' + stringify(val)"
+            ]),
+            *[_send(method) for method in ['post', 'patch']],
+            Method('delete', [Param('url', 'string'), _query()], 'Promise<void>', [
+                '        await axios.delete(this.#baseURL + url + this.qs(query), this.headers)',
+                '        return'
+            ], 'async ', '<V>'),
+            Method('get', [Param('url', 'string'), _query()], 'Promise<U>', [
+                '        const response = await axios.get(this.#baseURL + url + this.qs(query), this.headers)',
+                '        return response.data.data'
+            ], 'async ', '<U, V>')
+        ])
+    ]
+
+
+def _query() -> Param:
+    return Param('query', 'V | undefined', 'undefined')
+
+
+def _send(method: str) -> Method:
+    return Method(method, [Param('url', 'string'), Param('input', 'T'), _query()], 'Promise<U>', [
+        f'        const response = await axios.{method}(this.#baseURL + url + this.qs(query), input, this.headers)',
+        '        return response.data.data'
+    ], 'async ', '<T, U, V>')
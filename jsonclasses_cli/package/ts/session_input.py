@@ -1,8 +1,10 @@
 from jsonclasses.cdef import CDef
 from .interface import InterfaceItem, interface, interface_item
 from .jtype_to_ts_type import jtype_to_ts_type
+from ...utils.profile import traced
 
 
+@traced
 def session_input(cdef: CDef) -> str:
     items: list[InterfaceItem] = []
     (identities, bys) = _session_input_items(cdef)
@@ -1,52 +1,107 @@
+from .declarations import Class, Declaration, Field, Method, Param, TS, Types
+from .request_manager import HEADERS
 
 
-def session_manager(items: dict[str, str]) -> str:
+def session_manager(items: dict[str, str], decode: bool = False) -> list[Declaration]:
     session_items: list[str] = []
     for (_, c) in items.items():
         session_items.append(c + 'Session')
     sessions = ' | '.join(session_items)
-    return f"""
-class SessionManager {'{'}
-
-    #sessionKey = '_jsonclasses_session'
-    #session: {sessions} | undefined
-
-    static share = new SessionManager()
-
-    constructor() {'{'}
-        const item = localStorage.getItem(this.#sessionKey)
-        if (item && item !== null && item !== '') {'{'}
-            this.#session = JSON.parse(item)
-        {'}'} else {'{'}
-            this.#session = undefined
-        {'}'}
-    {'}'}
-
-    setSession(session: {sessions} | undefined | null) {'{'}
-        if (session) {'{'}
-            this.#session = session
-            localStorage.setItem(this.#sessionKey, JSON.stringify(session))
-        {'}'} else {'{'}
-            this.#session = undefined
-            localStorage.removeItem(this.#sessionKey)
-        {'}'}
-    {'}'}
-
-    hasSession(): boolean {'{'}
-        return this.#session !== undefined
-    {'}'}
-
-    getToken(): string | undefined {'{'}
-        return this.#session?.token
-    {'}'}
-
-    getSession(): {sessions} | undefined {'{'}
-        return this.#session
-    {'}'}
-
-    clearSession() {'{'}
-        this.#session = undefined
-        localStorage.removeItem(this.#sessionKey)
-    {'}'}
-{'}'}
-    """.strip() + "\n"
+    return [
+        _session_storage(),
+        _memory_storage(),
+        _session_manager(sessions, decode)
+    ]
+
+
+def _session_storage() -> Types:
+    return Types("""
+export interface SessionStorage {
+    getItem(key: string): string | null
+    setItem(key: string, value: string): void
+    removeItem(key: string): void
+}
+    """)
+
+
+def _memory_storage() -> Class:
+    return Class('MemoryStorage', [
+        Field('#items', init=['new Map', TS('<string, string>'), '()'])
+    ], [
+        Method('getItem', [Param('key', 'string')], 'string | null', [
+            '        return this.#items.get(key) ?? null'
+        ]),
+        Method('setItem', [Param('key', 'string'), Param('value', 'string')], 'void', [
+            '        this.#items.set(key, value)'
+        ]),
+        Method('removeItem', [Param('key', 'string')], 'void', [
+            '        this.#items.delete(key)'
+        ])
+    ], implements='SessionStorage', exported=True)
+
+
+def _session_manager(sessions: str, decode: bool) -> Class:
+    return Class('SessionManager', [
+        Field('#sessionKey', init="'_jsonclasses_session'"),
+        Field('#storage', 'SessionStorage | undefined'),
+        Field('#loaded', init='false'),
+        Field('#session', f'{sessions} | undefined'),
+        Field('#headers', HEADERS),
+        Field('share', init='new SessionManager()', static=True, declared='SessionManager')
+    ], [
+        Method('storage', [], 'SessionStorage', [
+            '        if (this.#storage === undefined) {',
+            "            this.#storage = typeof localStorage !== 'undefined' ? localStorage : new MemoryStorage()",
+            '        }',
+            '        return this.#storage'
+        ], 'get '),
+        Method('useStorage', [Param('storage', 'SessionStorage')], 'void', [
+            '        this.#storage = storage',
+            '        this.#loaded = false'
+        ]),
+        Method('#load', [], body=[
+            '        if (this.#loaded) {',
+            '            return',
+            '        }',
+            '        this.#loaded = true',
+            '        const item = this.storage.getItem(this.#sessionKey)',
+            "        if (item && item !== null && item !== '') {",
+            f"            this.#cache({'decodeSession(JSON.parse(item))' if decode else 'JSON.parse(item)'})",
+            '        } else {',
+            '            this.#cache(undefined)',
+            '        }'
+        ]),
+        Method('#cache', [Param('session', f'{sessions} | undefined')], body=[
+            '        this.#session = session',
+            '        this.#headers = session ? { headers: { Authorization: `Bearer ${session.token}` } } : undefined'
+        ]),
+        Method('setSession', [Param('session', f'{sessions} | undefined | null')], 'void', [
+            '        this.#loaded = true',
+            '        if (session) {',
+            '            this.#cache(session)',
+            '            this.storage.setItem(this.#sessionKey, JSON.stringify(session))',
+            '        } else {',
+            '            this.#cache(undefined)',
+            '            this.storage.removeItem(this.#sessionKey)',
+            '        }'
+        ]),
+        Method('hasSession', [], 'boolean', [
+            '        this.#load()',
+            '        return this.#session !== undefined'
+        ]),
+        Method('getToken', [], 'string | undefined', [
+            '        this.#load()',
+            '        return this.#session?.token'
+        ]),
+        Method('getSession', [], f'{sessions} | undefined', [
+            '        this.#load()',
+            '        return this.#session'
+        ]),
+        Method('headers', [], HEADERS, [
+            '        this.#load()',
+            '        return this.#headers'
+        ], 'get '),
+        Method('clearSession', [], 'void', [
+            '        this.setSession(undefined)'
+        ])
+    ])
@@ -1,55 +1,35 @@
 from typing import cast
 from jsonclasses.cdef import CDef
 from jsonclasses_server.aconf import AConf
-from ...utils.package_utils import (class_needs_session, to_include, to_result_picks,
-                                    to_session_input, to_sign_in_request, to_session, to_single_query)
-from .shared_utils import interface_required_include
+from jsonclasses_server.auth_conf import AuthConf
+from ...utils.package_utils import (class_needs_session, to_session_input, to_sign_in_request, to_session,
+                                    to_single_query, to_decoder)
+from .data_decoder import class_needs_decoder
+from .declarations import Class, Code, Method, TS
+from .request_class import request_class, query_methods, input_member, query_member
 
-def sign_in_request(cdef: CDef) -> str:
+
+def sign_in_request(cdef: CDef) -> Class | None:
     if not class_needs_session(cdef):
-        return ''
+        return None
     name = cast(AConf, cdef.cls.aconf).name
-    return f"""
-class {to_sign_in_request(cdef)}<T extends Partial<{to_session(cdef)}>> extends Promise<T> {'{'}
-
-    #input: {to_session_input(cdef)}
-    #query?: {to_single_query(cdef)}
-
-    constructor(input: {to_session_input(cdef)}, query?:{to_single_query(cdef)}){'{'}
-        super(() => {'{'}{'}'})
-        this.#input = input
-        this.#query = query
-    {'}'}
-
-    {_data_query_request_common(cdef, to_sign_in_request(cdef))}
-    {_data_query_request_includes(cdef, to_sign_in_request(cdef)) if interface_required_include(cdef) else ''}
-    async exec(): Promise<{to_session(cdef)}> {'{'}
-        const session = await RequestManager.share.post('/{name}/session', this.#input, this.#query) as {to_session(cdef)}
-        SessionManager.share.setSession(session)
-        return session
-    {'}'}
-{'}'}
-    """.strip() + "\n"
-
-
-def _data_query_request_includes(cdef: CDef, request: str) -> str:
-    return f"""
-    include(includes: {to_include(cdef)}[]): {request}<T> {'{'}
-        this.#query = {'{'}...this.#query, _includes: includes {'}'}
-        return this
-    {'}'}
-        """.strip() + "\n"
-
-
-def _data_query_request_common(cdef: CDef, request: str) -> str:
-    return f"""
-    pick(picks: {to_result_picks(cdef)}[]): {request}<T> {'{'}
-        this.#query = {'{'}...this.#query, _pick: picks{'}'}
-        return this
-    {'}'}
-
-    omit(omits: {to_result_picks(cdef)}[]): {request}<T> {'{'}
-        this.#query = {'{'}...this.#query, _omit: omits{'}'}
-        return this
-    {'}'}
-    """.strip() + "\n"
+    request = to_sign_in_request(cdef)
+    return request_class(to_session(cdef), request, [
+        input_member(to_session_input(cdef)), query_member(to_single_query(cdef))
+    ], [
+        *query_methods(cdef, request, False),
+        Method('exec', [], f'Promise<{to_session(cdef)}>', [
+            [f"        const session = await this.#manager.post('/{name}/session', this.#input, this.#query)",
+             TS(f' as {to_session(cdef)}')],
+            *_session_decode(cdef),
+            '        SessionManager.share.setSession(session)',
+            '        return session'
+        ], 'async ')
+    ])
+
+
+def _session_decode(cdef: CDef) -> list[Code]:
+    if not class_needs_decoder(cdef):
+        return []
+    srname = cast(AuthConf, cdef.cls.auth_conf).info.srname
+    return [f"        session.{srname} = {to_decoder(cdef)}(session.{srname})"]
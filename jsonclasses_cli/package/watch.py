@@ -0,0 +1,58 @@
+from typing import Literal
+from pathlib import Path
+from time import sleep, perf_counter
+from threading import Event
+from traceback import print_exc
+from rich import print
+from jsonclasses.cgraph import CGraph
+from . import generate
+from ..utils.import_app import reload_app, app_files, file_mtimes
+
+
+def watch(dest: Path,
+          app_file: Path,
+          lang: Literal['ts', 'js', 'swift', 'kotlin', 'python'],
+          cgraph_name: str = 'default',
+          validate: bool = False,
+          interval: float = 0.2,
+          debounce: float = 0.1,
+          silent: bool = False,
+          stopped: Event | None = None):
+    stopped = stopped or Event()
+    current = file_mtimes({app_file.resolve()})
+    _rebuild(dest, app_file, lang, cgraph_name, validate, silent)
+    mtimes = {**file_mtimes(app_files(app_file)), **current}
+    if not silent:
+        print(f"[bold green]WATCH[/bold green] {app_file.parent.resolve()}")
+    while not stopped.wait(interval):
+        current = file_mtimes(mtimes.keys() | app_files(app_file))
+        if current == mtimes:
+            continue
+        while True:
+            sleep(debounce)
+            latest = file_mtimes(current.keys())
+            if latest == current:
+                break
+            current = latest
+        _rebuild(dest, app_file, lang, cgraph_name, validate, silent)
+        mtimes = {**file_mtimes(app_files(app_file)), **current}
+
+
+def _rebuild(dest: Path,
+             app_file: Path,
+             lang: Literal['ts', 'js', 'swift', 'kotlin', 'python'],
+             cgraph_name: str,
+             validate: bool,
+             silent: bool = False) -> bool:
+    start = perf_counter()
+    try:
+        reload_app(app_file, cgraph_name)
+        generate(dest, CGraph(cgraph_name), lang, silent, validate)
+    except Exception:
+        print_exc()
+        if not silent:
+            print("[bold red]FAILED[/bold red] waiting for changes")
+        return False
+    if not silent:
+        print(f"[bold green]GENERATE[/bold green] {lang} in {(perf_counter() - start) * 1000:.0f}ms")
+    return True
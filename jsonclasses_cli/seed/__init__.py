@@ -0,0 +1,94 @@
+from pathlib import Path
+from time import perf_counter
+from multiprocessing import get_context, get_all_start_methods
+from rich import print
+from rich.table import Table
+from jsonclasses.cdef import CDef
+from jsonclasses.cgraph import CGraph
+from .worker import Task, Result, init_worker, insert_batch
+from ..utils.fake_utils import ordered_cdefs, is_field_local_key
+from ..utils.import_app import import_app
+from ..utils.resolve_cgraph import resolve_cgraph
+
+
+ID_SAMPLE = 10000
+
+
+def seed(app_file: Path,
+         count: int = 100,
+         counts: dict[str, int] | None = None,
+         batch_size: int = 1000,
+         jobs: int = 1,
+         dry_run: bool = False,
+         random_seed: int = 0,
+         cgraph_name: str = 'default',
+         silent: bool = False) -> dict[str, tuple[int, int, float]]:
+    import_app(app_file)
+    cgraph = CGraph(cgraph_name)
+    resolve_cgraph(cgraph)
+    cdefs = ordered_cdefs(list(cgraph._map.values()), lambda c: hasattr(c.cls, 'pconf'))
+    counts = counts or {}
+    unknown = set(counts.keys()) - {c.name for c in cdefs}
+    if len(unknown) > 0:
+        raise ValueError(f'unknown models: {", ".join(sorted(unknown))}')
+    ids: dict[str, list[str]] = {}
+    stats: dict[str, tuple[int, int, float]] = {}
+    pool = None
+    if jobs > 1:
+        method = 'fork' if 'fork' in get_all_start_methods() else None
+        pool = get_context(method).Pool(jobs, init_worker, (app_file, cgraph_name, dry_run))
+    else:
+        init_worker(app_file, cgraph_name, dry_run)
+    try:
+        for (index, cdef) in enumerate(cdefs):
+            total = counts.get(cdef.name, count)
+            refs = {n: ids.get(n, []) for n in _ref_names(cdef)}
+            tasks: list[Task] = []
+            for (batch, start) in enumerate(range(0, total, batch_size)):
+                size = min(batch_size, total - start)
+                tasks.append((cdef.name, size, random_seed * 1000003 + index * 10007 + batch, refs))
+            start_time = perf_counter()
+            results: list[Result] = list(map(insert_batch, tasks)) if pool is None \
+                else pool.imap_unordered(insert_batch, tasks)
+            (inserted, rejected, sample) = (0, 0, [])
+            for (_, batch_inserted, batch_rejected, batch_ids) in results:
+                inserted += batch_inserted
+                rejected += batch_rejected
+                sample.extend(batch_ids[:ID_SAMPLE - len(sample)])
+            stats[cdef.name] = (inserted, rejected, perf_counter() - start_time)
+            ids[cdef.name] = sample
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    if not silent:
+        _print_summary(stats, dry_run)
+    return stats
+
+
+def _ref_names(cdef: CDef) -> list[str]:
+    return [f.foreign_cdef.name for f in cdef.fields if is_field_local_key(f)]
+
+
+def _print_summary(stats: dict[str, tuple[int, int, float]], dry_run: bool):
+    table = Table(title='Seed (dry run)' if dry_run else 'Seed')
+    table.add_column('Model')
+    table.add_column('Rows', justify='right')
+    table.add_column('Rejected', justify='right')
+    table.add_column('Time', justify='right')
+    table.add_column('Rows/s', justify='right')
+    for (name, (rows, rejected, seconds)) in stats.items():
+        table.add_row(name, str(rows), str(rejected), _s(seconds), _rate(rows, seconds))
+    rows = sum(s[0] for s in stats.values())
+    seconds = sum(s[2] for s in stats.values())
+    table.add_row('total', str(rows), str(sum(s[1] for s in stats.values())), _s(seconds), _rate(rows, seconds),
+                  style='bold')
+    print(table)
+
+
+def _s(seconds: float) -> str:
+    return f'{seconds:.2f}s'
+
+
+def _rate(rows: int, seconds: float) -> str:
+    return f'{rows / seconds:,.0f}' if seconds > 0 else '-'
@@ -0,0 +1,48 @@
+from typing import Any
+from datetime import datetime, timezone
+from jsonclasses.fdef import FStore, FType
+from jsonclasses.types import Types
+from jsonclasses_pymongo.pobject import PObject
+from jsonclasses_pymongo.utils import idval, ref_db_field_key, ref_db_field_keys
+
+
+def document(obj: PObject) -> dict[str, Any]:
+    cls = obj.__class__
+    result: dict[str, Any] = {}
+    for field in cls.cdef.fields:
+        if field.fdef.fstore in (FStore.TEMP, FStore.CALCULATED):
+            continue
+        if field.is_primary:
+            result['_id'] = idval(field, getattr(obj, field.name))
+        elif field.is_foreign_one_ref or field.is_foreign_many_ref:
+            continue
+        elif field.is_local_one_ref:
+            id = getattr(obj, field.ref_name)
+            if id is not None:
+                result[ref_db_field_key(field.name, cls)] = idval(field.foreign_cdef.primary_field, id)
+        elif field.is_local_many_ref:
+            ids = getattr(obj, cls.cdef.jconf.ref_name_strategy(field))
+            primary = field.foreign_cdef.primary_field
+            result[ref_db_field_keys(field.name, cls)] = [idval(primary, i) for i in ids or []]
+        else:
+            value = encode_value(getattr(obj, field.name), field.types)
+            if value is not None:
+                result[cls.pconf.to_db_key(field.name)] = value
+    return result
+
+
+def encode_value(value: Any, types: Types) -> Any:
+    if value is None:
+        return None
+    match types.fdef.ftype:
+        case FType.LIST:
+            return [encode_value(v, types.fdef.item_types) for v in value]
+        case FType.DICT:
+            return {k: encode_value(v, types.fdef.item_types) for (k, v) in value.items()}
+        case FType.INSTANCE:
+            return document(value)
+        case FType.DATE:
+            return datetime.fromisoformat(value.isoformat()).replace(tzinfo=timezone.utc)
+        case FType.ENUM:
+            return value.value
+    return value
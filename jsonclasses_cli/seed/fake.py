@@ -0,0 +1,92 @@
+from random import Random
+from string import ascii_letters, ascii_lowercase, digits
+from datetime import date, datetime, timedelta, timezone
+from jsonclasses.cdef import CDef
+from jsonclasses.fdef import FDef, FType
+from jsonclasses.types import Types
+from ..utils.fake_utils import (
+    field_can_create, is_field_local_key, is_field_ref,
+    is_field_required_for_create, number_bounds, str_spec
+)
+
+
+EPOCH = datetime(2000, 1, 1, tzinfo=timezone.utc)
+
+
+class Skip:
+    pass
+
+
+SKIP = Skip()
+
+
+def fake_input(cdef: CDef, rng: Random, ids: dict[str, list[str]]) -> dict[str, object]:
+    result: dict[str, object] = {}
+    for field in cdef.fields:
+        if not field_can_create(field) or field.fdef.primary:
+            continue
+        required = is_field_required_for_create(field)
+        if is_field_local_key(field):
+            choices = ids.get(field.foreign_cdef.name)
+            if choices and (required or rng.random() < 0.5):
+                result[field.ref_name] = rng.choice(choices)
+            continue
+        if is_field_ref(field):
+            continue
+        if not required and rng.random() < 0.5:
+            continue
+        value = fake_value(field.fdef, field.types, rng)
+        if value is not SKIP:
+            result[field.name] = value
+    return result
+
+
+def fake_value(fdef: FDef, types: Types, rng: Random) -> object:
+    match fdef.ftype:
+        case FType.STR:
+            spec = str_spec(types)
+            if spec is None:
+                return SKIP
+            (kind, minlength, maxlength) = spec
+            match kind:
+                case 'email':
+                    return f'{_chars(rng, ascii_lowercase + digits, 8, 12)}@example.com'
+                case 'url':
+                    return f'https://example.com/{_chars(rng, ascii_lowercase + digits, 6, 10)}'
+                case 'alnum':
+                    return _chars(rng, ascii_letters + digits, minlength, maxlength)
+                case 'digits':
+                    return _chars(rng, digits, minlength, maxlength)
+                case _:
+                    return _chars(rng, ascii_letters + ' ', minlength, maxlength)
+        case FType.INT:
+            (minimum, maximum) = number_bounds(types)
+            return rng.randint(int(minimum), int(maximum))
+        case FType.FLOAT:
+            (minimum, maximum) = number_bounds(types)
+            return round(rng.uniform(minimum, maximum), 2)
+        case FType.BOOL:
+            return rng.random() < 0.5
+        case FType.DATE:
+            return EPOCH.date() + timedelta(days=rng.randint(0, 9000))
+        case FType.DATETIME:
+            return EPOCH + timedelta(seconds=rng.randint(0, 9000 * 86400))
+        case FType.ENUM:
+            return rng.choice(list(fdef.enum_class))
+        case FType.LIST:
+            items = [fake_value(fdef.item_types.fdef, fdef.item_types, rng) for _ in range(rng.randint(1, 3))]
+            return SKIP if SKIP in items else items
+        case _:
+            return SKIP
+
+
+def _chars(rng: Random, alphabet: str, minlength: int, maxlength: int) -> str:
+    length = rng.randint(int(minlength), int(maxlength))
+    if length == 0:
+        return ''
+    result = rng.choices(alphabet, k=length)
+    if result[0] == ' ':
+        result[0] = alphabet[0]
+    if result[-1] == ' ':
+        result[-1] = alphabet[0]
+    return ''.join(result)
@@ -0,0 +1,46 @@
+from pathlib import Path
+from random import Random
+from jsonclasses.cgraph import CGraph
+from .fake import fake_input
+from .document import document
+from ..utils.import_app import import_app
+
+
+Task = tuple[str, int, int, dict[str, list[str]]]
+Result = tuple[str, int, int, list[str]]
+
+
+_cgraph_name = 'default'
+_dry_run = False
+
+
+def init_worker(app_file: Path, cgraph_name: str, dry_run: bool):
+    global _cgraph_name, _dry_run
+    _cgraph_name = cgraph_name
+    _dry_run = dry_run
+    import_app(app_file)
+
+
+def insert_batch(task: Task) -> Result:
+    (name, size, seed, ids) = task
+    cdef = CGraph(_cgraph_name).fetch(name)
+    rng = Random(seed)
+    objects = []
+    for _ in range(size):
+        obj = cdef.cls(**fake_input(cdef, rng, ids))
+        if obj.is_valid:
+            objects.append(obj)
+    docs = [document(obj) for obj in objects]
+    failed = set() if _dry_run or len(docs) == 0 else _insert(cdef.cls, docs)
+    inserted = [str(obj._id) for (i, obj) in enumerate(objects) if i not in failed]
+    return (name, len(inserted), size - len(inserted), inserted)
+
+
+def _insert(cls: type, docs: list[dict]) -> set[int]:
+    from pymongo.errors import BulkWriteError
+    from jsonclasses_pymongo.connection import Connection
+    try:
+        Connection.get_collection(cls).insert_many(docs, ordered=False)
+    except BulkWriteError as error:
+        return {e['index'] for e in error.details['writeErrors']}
+    return set()
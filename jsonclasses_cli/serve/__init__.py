@@ -0,0 +1,51 @@
+from __future__ import annotations
+from typing import Any
+import os
+from pathlib import Path
+from jsonclasses.uconf import uconf, UserConf
+
+
+DEFAULTS: dict[str, Any] = {
+    'host': '127.0.0.1',
+    'port': 8000,
+    'workers': 1,
+    'loop': 'auto',
+    'http': 'auto',
+    'backlog': 2048,
+    'keep_alive': 5,
+    'graceful_timeout': 30,
+    'max_requests': 0,
+    'max_memory': 0,
+    'stats_interval': 10,
+    'stats_port': 0
+}
+
+
+def cpu_cores() -> int:
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def serve_conf(conf: UserConf | None = None, **overrides: Any) -> dict[str, Any]:
+    conf = conf if conf is not None else uconf()
+    result: dict[str, Any] = {}
+    for (key, default) in DEFAULTS.items():
+        value = overrides.get(key)
+        if value is None:
+            value = conf[f'serve.{key}']
+        result[key] = default if value is None else value
+    if result['workers'] == 'auto':
+        result['workers'] = cpu_cores()
+    result['workers'] = max(1, int(result['workers']))
+    return result
+
+
+def serve(dest: Path,
+          app_file: Path,
+          host: str | None = None,
+          port: int | None = None,
+          workers: int | None = None):
+    from .supervisor import Supervisor
+    conf = serve_conf(host=host, port=port, workers=workers)
+    Supervisor(dest, app_file, conf).run()
@@ -0,0 +1,118 @@
+from __future__ import annotations
+from typing import Any
+from random import random
+from resource import getrusage, RUSAGE_SELF
+from sys import platform
+from os import sysconf
+from time import perf_counter
+from ..console.helpers import format_size
+
+
+SAMPLE_SIZE = 1000
+
+
+def rss() -> int:
+    try:
+        with open('/proc/self/statm') as file:
+            return int(file.read().split()[1]) * sysconf('SC_PAGE_SIZE')
+    except OSError:
+        peak = getrusage(RUSAGE_SELF).ru_maxrss
+        return peak if platform == 'darwin' else peak * 1024
+
+
+def percentile(ordered: list[float], p: float) -> float:
+    if len(ordered) == 0:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(p / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+class Recorder:
+
+    def __init__(self) -> None:
+        self.total = 0
+        self.count = 0
+        self.latencies: list[float] = []
+
+    def record(self, seconds: float) -> None:
+        self.total += 1
+        self.count += 1
+        if len(self.latencies) < SAMPLE_SIZE:
+            self.latencies.append(seconds)
+        elif random() < SAMPLE_SIZE / self.count:
+            self.latencies[int(random() * SAMPLE_SIZE)] = seconds
+
+    def take(self) -> tuple[int, list[float]]:
+        (count, latencies) = (self.count, self.latencies)
+        self.count = 0
+        self.latencies = []
+        return (count, latencies)
+
+
+class StatsMiddleware:
+
+    def __init__(self, app: Any, recorder: Recorder) -> None:
+        self.app = app
+        self.recorder = recorder
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope['type'] != 'http':
+            return await self.app(scope, receive, send)
+        start = perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.recorder.record(perf_counter() - start)
+
+
+class Window:
+
+    def __init__(self) -> None:
+        self.start = perf_counter()
+        self.count = 0
+        self.latencies: list[float] = []
+        self.memory: dict[int, int] = {}
+        self.requests: dict[int, int] = {}
+        self.recycled = 0
+
+    def add(self, pid: int, count: int, latencies: list[float], memory: int, total: int) -> None:
+        self.count += count
+        self.latencies.extend(latencies)
+        self.memory[pid] = memory
+        self.requests[pid] = total
+
+    def remove(self, pid: int) -> None:
+        self.memory.pop(pid, None)
+        self.requests.pop(pid, None)
+
+    def summary(self, workers: int) -> dict[str, Any]:
+        seconds = max(perf_counter() - self.start, 1e-9)
+        ordered = sorted(self.latencies)
+        memory = list(self.memory.values()) or [0]
+        return {
+            'workers': workers,
+            'requests': self.count,
+            'rps': self.count / seconds,
+            'p50': percentile(ordered, 50),
+            'p90': percentile(ordered, 90),
+            'p99': percentile(ordered, 99),
+            'max': ordered[-1] if ordered else 0.0,
+            'rss': sum(memory) / len(memory),
+            'rss_max': max(memory),
+            'recycled': self.recycled,
+            'processes': [{'pid': pid, 'rss': self.memory[pid], 'requests': self.requests[pid]}
+                          for pid in sorted(self.memory)]
+        }
+
+    def reset(self) -> None:
+        self.start = perf_counter()
+        self.count = 0
+        self.latencies = []
+        self.recycled = 0
+
+
+def format_summary(summary: dict[str, Any]) -> str:
+    latencies = '  '.join(f'{k} {summary[k] * 1000:.2f}ms' for k in ('p50', 'p90', 'p99', 'max'))
+    return (f"{summary['workers']} workers  {summary['rps']:.1f} req/s  {latencies}  "
+            f"rss {format_size(summary['rss'])} avg {format_size(summary['rss_max'])} max  "
+            f"recycled {summary['recycled']}")
@@ -0,0 +1,175 @@
+from __future__ import annotations
+from typing import Any, cast
+from pathlib import Path
+from json import dumps
+from queue import Empty
+from signal import signal, SIGINT, SIGTERM, SIGHUP
+from time import monotonic
+from threading import Thread
+from socket import socket
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from logging import getLogger
+from multiprocessing import get_context, get_all_start_methods
+from .stats import Window, format_summary
+from .worker import run_worker
+
+
+logger = getLogger('uvicorn.error')
+
+
+class Supervisor:
+
+    def __init__(self, dest: Path, app_file: Path, conf: dict[str, Any]) -> None:
+        from uvicorn import Config
+        self.dest = dest
+        self.app_file = app_file
+        self.conf = conf
+        self.config = Config(f'{app_file.stem}:app', host=conf['host'], port=conf['port'],
+                             backlog=conf['backlog'])
+        self.context = get_context('fork' if 'fork' in get_all_start_methods() else None)
+        self.queue = self.context.Queue()
+        self.processes: dict[int, Any] = {}
+        self.replacing: dict[int, int] = {}
+        self.retiring: dict[int, float] = {}
+        self.ready: set[int] = set()
+        self.window = Window()
+        self.summary = self.window.summary(0)
+        self.should_exit = False
+        self.sock: socket | None = None
+        self.stats_server: ThreadingHTTPServer | None = None
+
+    def run(self) -> None:
+        self.sock = self.config.bind_socket()
+        for sig in (SIGINT, SIGTERM):
+            signal(sig, self.handle_exit)
+        signal(SIGHUP, self.handle_reload)
+        if self.conf['stats_port']:
+            self.start_stats_server()
+        for _ in range(self.conf['workers']):
+            self.spawn()
+        next_log = monotonic() + self.conf['stats_interval']
+        while not self.should_exit:
+            self.receive(0.5)
+            self.reap()
+            if monotonic() >= next_log:
+                self.log_stats()
+                next_log = monotonic() + self.conf['stats_interval']
+        self.shutdown()
+
+    def handle_exit(self, sig, frame) -> None:
+        self.should_exit = True
+
+    def handle_reload(self, sig, frame) -> None:
+        for pid in list(self.processes):
+            self.recycle(pid, 'reload')
+
+    def spawn(self) -> int:
+        process = self.context.Process(target=run_worker,
+                                       args=(self.app_file, self.conf, self.sock, self.queue))
+        process.start()
+        pid = cast(int, process.pid)
+        self.processes[pid] = process
+        return pid
+
+    def recycle(self, pid: int, reason: str) -> None:
+        if pid not in self.processes or pid in self.retiring or pid in self.replacing.values():
+            return
+        logger.info('Recycling worker [%d], %s', pid, reason)
+        self.replacing[self.spawn()] = pid
+
+    def retire(self, pid: int) -> None:
+        process = self.processes.get(pid)
+        if process is None or pid in self.retiring:
+            return
+        self.retiring[pid] = monotonic() + self.conf['graceful_timeout']
+        self.window.recycled += 1
+        process.terminate()
+
+    def receive(self, timeout: float) -> None:
+        try:
+            message = self.queue.get(timeout=timeout)
+        except Empty:
+            return
+        while True:
+            self.handle(message)
+            try:
+                message = self.queue.get_nowait()
+            except Empty:
+                return
+
+    def handle(self, message: tuple) -> None:
+        match message:
+            case ('ready', pid):
+                self.ready.add(pid)
+                if pid in self.replacing:
+                    self.retire(self.replacing.pop(pid))
+            case ('stats', pid, count, latencies, memory, total):
+                if pid in self.processes:
+                    self.window.add(pid, count, latencies, memory, total)
+            case ('recycle', pid, reason):
+                self.recycle(pid, reason)
+
+    def reap(self) -> None:
+        for (pid, process) in list(self.processes.items()):
+            if process.is_alive():
+                if pid in self.retiring and monotonic() > self.retiring[pid]:
+                    logger.warning('Worker [%d] did not exit in time, killing it', pid)
+                    process.kill()
+                continue
+            process.join()
+            del self.processes[pid]
+            self.window.remove(pid)
+            started = pid in self.ready
+            self.ready.discard(pid)
+            if self.retiring.pop(pid, None) is not None or self.should_exit:
+                continue
+            if not started and pid in self.replacing:
+                old = self.replacing.pop(pid)
+                if old in self.processes:
+                    logger.error('Worker [%d] failed to start, keeping [%d]', pid, old)
+                else:
+                    logger.error('Worker [%d] failed to start, [%d] is gone, respawning', pid, old)
+                    self.spawn()
+            elif not started:
+                logger.error('Worker [%d] failed to start, stopping', pid)
+                self.should_exit = True
+            else:
+                logger.warning('Worker [%d] exited with code %s', pid, process.exitcode)
+                if pid not in self.replacing.values():
+                    self.spawn()
+
+    def shutdown(self) -> None:
+        for (pid, process) in self.processes.items():
+            self.retiring.setdefault(pid, monotonic() + self.conf['graceful_timeout'])
+            process.terminate()
+        while len(self.processes) > 0:
+            self.receive(0.1)
+            self.reap()
+        if self.stats_server is not None:
+            self.stats_server.shutdown()
+        if self.sock is not None:
+            self.sock.close()
+
+    def log_stats(self) -> None:
+        self.summary = self.window.summary(len(self.processes) - len(self.retiring) - len(self.replacing))
+        self.window.reset()
+        logger.info('Stats: %s', format_summary(self.summary))
+
+    def start_stats_server(self) -> None:
+        supervisor = self
+
+        class Handler(BaseHTTPRequestHandler):
+
+            def do_GET(self) -> None:
+                content = dumps(supervisor.summary).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        self.stats_server = ThreadingHTTPServer(('127.0.0.1', self.conf['stats_port']), Handler)
+        Thread(target=self.stats_server.serve_forever, daemon=True).start()
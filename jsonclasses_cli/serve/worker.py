@@ -0,0 +1,75 @@
+from __future__ import annotations
+from typing import Any
+from pathlib import Path
+from socket import socket
+from signal import signal, SIGHUP, SIGINT, SIGTERM, SIG_IGN, SIG_DFL
+from os import getpid
+from time import monotonic
+from threading import Thread, Event
+from random import randint
+from multiprocessing.queues import Queue
+from .stats import Recorder, StatsMiddleware, rss
+from ..utils.import_app import import_app
+
+
+TICK = 1.0
+RETRY = 30.0
+
+
+def run_worker(app_file: Path, conf: dict[str, Any], sock: socket, queue: Queue) -> None:
+    from uvicorn import Config, Server
+    signal(SIGHUP, SIG_IGN)
+    signal(SIGINT, SIG_DFL)
+    signal(SIGTERM, SIG_DFL)
+    recorder = Recorder()
+    config = Config(StatsMiddleware(import_app(app_file).app, recorder),
+                    loop=conf['loop'],
+                    http=conf['http'],
+                    backlog=conf['backlog'],
+                    timeout_keep_alive=conf['keep_alive'])
+    server = Server(config)
+    reporter = Reporter(server, recorder, queue, conf)
+    reporter.start()
+    try:
+        server.run(sockets=[sock])
+    finally:
+        reporter.stop()
+
+
+class Reporter(Thread):
+
+    def __init__(self, server: Any, recorder: Recorder, queue: Queue, conf: dict[str, Any]) -> None:
+        super().__init__(daemon=True)
+        self.server = server
+        self.recorder = recorder
+        self.queue = queue
+        self.max_requests = conf['max_requests']
+        if self.max_requests > 0:
+            self.max_requests += randint(0, self.max_requests // 10)
+        self.max_memory = conf['max_memory'] * 1024 * 1024
+        self.stopped = Event()
+        self.recycling: float | None = None
+
+    def stop(self) -> None:
+        self.stopped.set()
+
+    def run(self) -> None:
+        pid = getpid()
+        while not self.server.started:
+            if self.stopped.wait(0.05):
+                return
+        self.queue.put(('ready', pid))
+        while not self.stopped.wait(TICK):
+            (count, latencies) = self.recorder.take()
+            memory = rss()
+            self.queue.put(('stats', pid, count, latencies, memory, self.recorder.total))
+            if self.server.should_exit:
+                continue
+            if self.recycling is not None and monotonic() - self.recycling < RETRY:
+                continue
+            if self.max_requests > 0 and self.recorder.total >= self.max_requests:
+                self.recycling = monotonic()
+                self.queue.put(('recycle', pid, f'served {self.recorder.total} requests'))
+            elif self.max_memory > 0 and memory >= self.max_memory:
+                self.recycling = monotonic()
+                self.queue.put(('recycle', pid, f'uses {memory // 1024 // 1024}MB'))
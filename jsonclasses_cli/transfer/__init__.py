@@ -0,0 +1,134 @@
+from pathlib import Path
+from time import perf_counter
+from multiprocessing import get_context, get_all_start_methods
+from rich import print
+from rich.table import Table
+from jsonclasses.cgraph import CGraph
+from jsonclasses.fdef import FType
+from ..indexes.plan import is_class_pymongo, join_table_name
+from ..utils.fake_utils import ordered_cdefs
+from ..utils.import_app import import_app
+from ..utils.resolve_cgraph import resolve_cgraph
+
+
+Stats = dict[str, tuple[int, int, int, float]]
+
+
+def export_models(dest: Path,
+                  app_file: Path,
+                  names: list[str],
+                  url: str | None = None,
+                  compress: bool = False,
+                  batch_size: int = 1000,
+                  jobs: int = 1,
+                  cgraph_name: str = 'default',
+                  silent: bool = False) -> Stats:
+    (collections, url) = _collections(app_file, names, url, cgraph_name)
+    dest.mkdir(parents=True, exist_ok=True)
+    suffix = '.ndjson.gz' if compress else '.ndjson'
+    tasks = [(url, name, dest / (name + suffix), batch_size) for name in collections]
+    if jobs < 2 or len(tasks) < 2:
+        results = list(map(_export_collection, tasks))
+    else:
+        method = 'fork' if 'fork' in get_all_start_methods() else None
+        with get_context(method).Pool(min(jobs, len(tasks))) as pool:
+            results = pool.map(_export_collection, tasks)
+    stats = dict(results)
+    if not silent:
+        _print_summary('Export', stats)
+    return stats
+
+
+def import_models(dest: Path,
+                  app_file: Path,
+                  names: list[str],
+                  url: str | None = None,
+                  batch_size: int = 1000,
+                  jobs: int = 4,
+                  cgraph_name: str = 'default',
+                  silent: bool = False) -> Stats:
+    from pymongo import MongoClient
+    from .ndjson import restore_collection
+    (collections, url) = _collections(app_file, names, url, cgraph_name)
+    files: dict[str, Path] = {}
+    for (name, required) in collections.items():
+        path = next((p for p in (dest / f'{name}.ndjson.gz', dest / f'{name}.ndjson') if p.is_file()), None)
+        if path is not None:
+            files[name] = path
+        elif required:
+            raise ValueError(f'no export file for collection \'{name}\' in {dest}')
+    stats: Stats = {}
+    client = MongoClient(url)
+    try:
+        database = client.get_database()
+        for (name, path) in files.items():
+            start = perf_counter()
+            (rows, rejected) = restore_collection(database[name], path, batch_size, jobs)
+            stats[name] = (rows, rejected, path.stat().st_size, perf_counter() - start)
+    finally:
+        client.close()
+    if not silent:
+        _print_summary('Import', stats)
+    return stats
+
+
+def _collections(app_file: Path,
+                 names: list[str],
+                 url: str | None,
+                 cgraph_name: str) -> tuple[dict[str, bool], str]:
+    from jsonclasses_pymongo.connection import Connection
+    import_app(app_file)
+    cgraph = CGraph(cgraph_name)
+    resolve_cgraph(cgraph)
+    cdefs = ordered_cdefs(list(cgraph._map.values()), is_class_pymongo)
+    unknown = set(names) - {c.name for c in cdefs}
+    if len(unknown) > 0:
+        raise ValueError(f'unknown models: {", ".join(sorted(unknown))}')
+    if len(names) > 0:
+        cdefs = [c for c in cdefs if c.name in names]
+    collections: dict[str, bool] = {c.cls.pconf.collection_name: True for c in cdefs}
+    for cdef in cdefs:
+        for field in cdef.fields:
+            if field.fdef.ftype == FType.LIST and field.fdef.use_join_table:
+                collections.setdefault(join_table_name(field), False)
+    return (collections, url or Connection(cgraph_name).url)
+
+
+def _export_collection(task: tuple[str, str, Path, int]) -> tuple[str, tuple[int, int, int, float]]:
+    from pymongo import MongoClient
+    from .ndjson import dump_collection
+    (url, name, path, batch_size) = task
+    start = perf_counter()
+    client = MongoClient(url)
+    try:
+        rows = dump_collection(client.get_database()[name], path, batch_size)
+    finally:
+        client.close()
+    return (name, (rows, 0, path.stat().st_size, perf_counter() - start))
+
+
+def _print_summary(title: str, stats: Stats):
+    table = Table(title=title)
+    table.add_column('Collection')
+    table.add_column('Rows', justify='right')
+    table.add_column('Rejected', justify='right')
+    table.add_column('Size', justify='right')
+    table.add_column('Time', justify='right')
+    table.add_column('Rows/s', justify='right')
+    table.add_column('MB/s', justify='right')
+    for (name, (rows, rejected, size, seconds)) in stats.items():
+        table.add_row(name, str(rows), str(rejected), _mb(size), f'{seconds:.2f}s',
+                      _rate(rows, seconds), _mb_rate(size, seconds))
+    print(table)
+
+
+def _mb(size: int) -> str:
+    return f'{size / 1e6:.1f}MB'
+
+
+def _rate(rows: int, seconds: float) -> str:
+    return f'{rows / seconds:,.0f}' if seconds > 0 else '-'
+
+
+def _mb_rate(size: int, seconds: float) -> str:
+    return f'{size / 1e6 / seconds:.1f}' if seconds > 0 else '-'
@@ -0,0 +1,95 @@
+from __future__ import annotations
+from typing import IO, Any
+from gzip import open as gzip_open
+from pathlib import Path
+from threading import Lock, Thread
+from queue import Queue
+from bson.json_util import dumps, loads, RELAXED_JSON_OPTIONS
+from pymongo.collection import Collection
+from pymongo.errors import BulkWriteError
+
+
+GZIP_LEVEL = 6
+BUFFER_SIZE = 1 << 20
+LOAD_OPTIONS = RELAXED_JSON_OPTIONS.with_options(tz_aware=True)
+
+
+def open_ndjson(path: Path, mode: str) -> IO[str]:
+    if path.suffix == '.gz':
+        return gzip_open(path, mode + 't', compresslevel=GZIP_LEVEL, encoding='utf-8')
+    return open(path, mode, buffering=BUFFER_SIZE, encoding='utf-8')
+
+
+def dump_collection(collection: Collection, path: Path, batch_size: int = 1000) -> int:
+    rows = 0
+    with open_ndjson(path, 'w') as file:
+        cursor = collection.find({}, batch_size=batch_size, sort=[('_id', 1)])
+        lines: list[str] = []
+        for document in cursor:
+            lines.append(dumps(document, json_options=RELAXED_JSON_OPTIONS))
+            if len(lines) == batch_size:
+                file.write('\n'.join(lines) + '\n')
+                rows += len(lines)
+                lines = []
+        if len(lines) > 0:
+            file.write('\n'.join(lines) + '\n')
+            rows += len(lines)
+    return rows
+
+
+def restore_collection(collection: Collection,
+                       path: Path,
+                       batch_size: int = 1000,
+                       jobs: int = 4) -> tuple[int, int]:
+    batches: Queue[list[dict[str, Any]] | None] = Queue(maxsize=jobs * 2)
+    counts = [0, 0]
+    errors: list[Exception] = []
+    lock = Lock()
+
+    def write():
+        while (batch := batches.get()) is not None:
+            if len(errors) > 0:
+                continue
+            try:
+                (inserted, rejected) = _insert(collection, batch)
+            except Exception as error:
+                errors.append(error)
+                continue
+            with lock:
+                counts[0] += inserted
+                counts[1] += rejected
+
+    writers = [Thread(target=write, daemon=True) for _ in range(max(1, jobs))]
+    for writer in writers:
+        writer.start()
+    try:
+        with open_ndjson(path, 'r') as file:
+            batch: list[dict[str, Any]] = []
+            for line in file:
+                if line.strip() == '':
+                    continue
+                batch.append(loads(line, json_options=LOAD_OPTIONS))
+                if len(batch) == batch_size:
+                    batches.put(batch)
+                    batch = []
+                if len(errors) > 0:
+                    break
+            if len(batch) > 0:
+                batches.put(batch)
+    finally:
+        for _ in writers:
+            batches.put(None)
+        for writer in writers:
+            writer.join()
+    if len(errors) > 0:
+        raise errors[0]
+    return (counts[0], counts[1])
+
+
+def _insert(collection: Collection, batch: list[dict[str, Any]]) -> tuple[int, int]:
+    try:
+        collection.insert_many(batch, ordered=False)
+    except BulkWriteError as error:
+        inserted = error.details['nInserted']
+        return (inserted, len(batch) - inserted)
+    return (len(batch), 0)
@@ -0,0 +1,35 @@
+from typing import Any
+from jsonclasses.cgraph import CGraph
+from jsonclasses.cdef import CDef
+from jsonclasses.fdef import FDef, FType
+
+
+def cgraph_schema(cgraph: CGraph) -> dict[str, Any]:
+    return {
+        'models': {cdef.name: _model_schema(cdef) for cdef in cgraph._map.values()},
+        'enums': {name: [m.name for m in enum] for (name, enum) in cgraph._enum_map.items()},
+    }
+
+
+def _model_schema(cdef: CDef) -> dict[str, Any]:
+    return {
+        'fields': {field.name: _field_schema(field.fdef) for field in cdef.fields},
+    }
+
+
+def _field_schema(fdef: FDef) -> dict[str, Any]:
+    result: dict[str, Any] = {
+        'type': fdef.ftype.value,
+        'store': fdef.fstore.value,
+        'required': fdef.required,
+    }
+    if fdef.primary:
+        result['primary'] = True
+    match fdef.ftype:
+        case FType.ENUM:
+            result['enum'] = fdef.enum_class.__name__
+        case FType.INSTANCE:
+            result['ref'] = fdef.inst_cls.cdef.name
+        case FType.LIST | FType.DICT:
+            result['item'] = _field_schema(fdef.item_types.fdef)
+    return result
@@ -0,0 +1,116 @@
+from typing import Callable
+from jsonclasses.cdef import CDef
+from jsonclasses.jfield import JField
+from jsonclasses.fdef import FStore, FType, WriteRule
+from jsonclasses.types import Types
+from jsonclasses.modifiers.required_modifier import RequiredModifier
+from jsonclasses.modifiers.default_modifier import DefaultModifier
+from jsonclasses.modifiers.length_modifier import LengthModifier
+from jsonclasses.modifiers.minlength_modifier import MinlengthModifier
+from jsonclasses.modifiers.maxlength_modifier import MaxlengthModifier
+from jsonclasses.modifiers.min_modifier import MinModifier
+from jsonclasses.modifiers.max_modifier import MaxModifier
+from jsonclasses.modifiers.range_modifier import RangeModifier
+from jsonclasses.modifiers.email_modifier import EmailModifier
+from jsonclasses.modifiers.match_modifier import MatchModifier
+from jsonclasses.modifiers.alnum_modifier import AlnumModifier
+from jsonclasses.modifiers.digit_modifier import DigitModifier
+from jsonclasses.modifiers.url_modifier import UrlModifier
+
+
+StrSpec = tuple[str, int, int]
+
+
+def ordered_cdefs(cdefs: list[CDef], include: Callable[[CDef], bool]) -> list[CDef]:
+    items = [c for c in cdefs if include(c)]
+    result: list[CDef] = []
+    visiting: set[str] = set()
+
+    def visit(cdef: CDef):
+        if cdef in result or cdef.name in visiting:
+            return
+        visiting.add(cdef.name)
+        for field in cdef.fields:
+            if is_field_local_key(field) and field.foreign_cdef in items:
+                visit(field.foreign_cdef)
+        result.append(cdef)
+
+    for cdef in items:
+        visit(cdef)
+    return result
+
+
+def str_spec(types: Types) -> StrSpec | None:
+    (minlength, maxlength) = (4, 16)
+    kind = 'text'
+    for modifier in types.modifier.vs:
+        match modifier:
+            case LengthModifier(minlength=lower, maxlength=upper):
+                if _is_number(lower) and _is_number(upper):
+                    (minlength, maxlength) = (lower, upper)
+            case MinlengthModifier(minlength=lower):
+                if _is_number(lower):
+                    minlength = lower
+                    maxlength = max(maxlength, lower)
+            case MaxlengthModifier(maxlength=upper):
+                if _is_number(upper):
+                    maxlength = upper
+                    minlength = min(minlength, upper)
+            case EmailModifier():
+                kind = 'email'
+            case UrlModifier():
+                kind = 'url'
+            case AlnumModifier():
+                kind = 'alnum'
+            case DigitModifier():
+                kind = 'digits'
+            case MatchModifier():
+                return None
+    return (kind, minlength, maxlength)
+
+
+def number_bounds(types: Types, minimum: float = 0, maximum: float = 1000) -> tuple[float, float]:
+    for modifier in types.modifier.vs:
+        match modifier:
+            case MinModifier(min_value=lower):
+                if _is_number(lower):
+                    minimum = lower
+            case MaxModifier(max_value=upper):
+                if _is_number(upper):
+                    maximum = upper
+            case RangeModifier(min=lower, max=upper):
+                if _is_number(lower):
+                    minimum = lower
+                if _is_number(upper):
+                    maximum = upper
+    if maximum < minimum:
+        maximum = minimum + 1000
+    return (minimum, maximum)
+
+
+def is_field_local_key(field: JField) -> bool:
+    return field.fdef.fstore == FStore.LOCAL_KEY and field.fdef.ftype == FType.INSTANCE
+
+
+def is_field_ref(field: JField) -> bool:
+    return field.fdef.fstore in (FStore.LOCAL_KEY, FStore.FOREIGN_KEY)
+
+
+def is_field_required_for_create(field: JField) -> bool:
+    if next((True for v in field.types.modifier.vs if isinstance(v, DefaultModifier)), False):
+        return False
+    return next((True for v in field.types.modifier.vs if isinstance(v, RequiredModifier)), False)
+
+
+def field_can_create(field: JField) -> bool:
+    return field.fdef.write_rule != WriteRule.NO_WRITE
+
+
+def field_can_update(field: JField) -> bool:
+    if field.fdef.write_rule == WriteRule.NO_WRITE:
+        return False
+    return field.fdef.write_rule != WriteRule.WRITE_ONCE
+
+
+def _is_number(value: object) -> bool:
+    return type(value) is int or type(value) is float
@@ -0,0 +1,55 @@
+from pathlib import Path
+from types import ModuleType
+from sys import path, modules
+from importlib import import_module
+from os.path import splitext
+from jsonclasses.cgraph import CGraph
+
+
+def import_app(app_file: Path) -> ModuleType:
+    app_dir = str(app_file.parent)
+    if app_dir not in path:
+        path.append(app_dir)
+    return import_module(splitext(app_file.name)[0], app_dir)
+
+
+def reload_app(app_file: Path, cgraph_name: str = 'default') -> ModuleType:
+    for name in app_modules(app_file.parent.resolve()):
+        del modules[name]
+    CGraph._graph_map.pop(cgraph_name, None)
+    CGraph._initialized_map.pop(cgraph_name, None)
+    return import_app(app_file)
+
+
+def app_modules(root: Path) -> list[str]:
+    names: list[str] = []
+    for (name, module) in list(modules.items()):
+        if name == '__main__' or name.startswith('jsonclasses_cli'):
+            continue
+        file = getattr(module, '__file__', None)
+        if file is None:
+            continue
+        file_path = Path(file).resolve()
+        if not file_path.is_relative_to(root):
+            continue
+        if 'site-packages' in file_path.parts:
+            continue
+        names.append(name)
+    return names
+
+
+def app_files(app_file: Path) -> set[Path]:
+    files = {app_file.resolve()}
+    for name in app_modules(app_file.parent.resolve()):
+        files.add(Path(modules[name].__file__).resolve())
+    return files
+
+
+def file_mtimes(files: set[Path]) -> dict[Path, float]:
+    result: dict[Path, float] = {}
+    for file in files:
+        try:
+            result[file] = file.stat().st_mtime
+        except FileNotFoundError:
+            continue
+    return result
@@ -123,3 +123,15 @@ def to_sign_in_request(cdef: CDef) -> str:
 
 def is_field_link(fdef: FDef) -> bool:
     return fdef.fstore == FStore.LOCAL_KEY or fdef.use_join_table
+
+
+def to_decoder(cdef: CDef) -> str:
+    return 'decode' + cdef.name
+
+
+def to_create_input_validator(cdef: CDef) -> str:
+    return 'validate' + to_create_input(cdef)
+
+
+def to_update_input_validator(cdef: CDef) -> str:
+    return 'validate' + to_update_input(cdef)
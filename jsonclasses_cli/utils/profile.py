@@ -0,0 +1,106 @@
+from __future__ import annotations
+from typing import Any, Callable, Iterator, TypeVar
+from contextlib import contextmanager
+from functools import wraps
+from os import getpid
+from threading import get_ident
+from time import perf_counter
+
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+
+class Span:
+
+    def __init__(self, name: str, cat: str, start: float, end: float, args: dict[str, Any]) -> None:
+        self.name = name
+        self.cat = cat
+        self.start = start
+        self.end = end
+        self.args = args
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+class Profile:
+
+    def __init__(self) -> None:
+        self.origin = perf_counter()
+        self.spans: list[Span] = []
+
+    def phases(self) -> dict[str, float]:
+        result: dict[str, float] = {}
+        for span in self.spans:
+            if span.cat == 'phase':
+                result[span.name] = result.get(span.name, 0) + span.duration
+        return result
+
+    def models(self) -> dict[str, dict[str, float]]:
+        result: dict[str, dict[str, float]] = {}
+        for span in self.spans:
+            if span.cat != 'model':
+                continue
+            fragments = result.setdefault(span.args['model'], {})
+            fragments[span.name] = fragments.get(span.name, 0) + span.duration
+        return result
+
+    def trace_events(self) -> dict[str, Any]:
+        pid = getpid()
+        tid = get_ident()
+        return {
+            'traceEvents': [{
+                'name': span.name,
+                'cat': span.cat,
+                'ph': 'X',
+                'ts': (span.start - self.origin) * 1_000_000,
+                'dur': span.duration * 1_000_000,
+                'pid': pid,
+                'tid': tid,
+                'args': span.args,
+            } for span in self.spans],
+            'displayTimeUnit': 'ms',
+        }
+
+
+_profile: Profile | None = None
+
+
+def start_profile() -> Profile:
+    global _profile
+    _profile = Profile()
+    return _profile
+
+
+def stop_profile() -> Profile | None:
+    global _profile
+    (profile, _profile) = (_profile, None)
+    return profile
+
+
+@contextmanager
+def span(name: str, cat: str = 'phase', **args: Any) -> Iterator[None]:
+    if _profile is None:
+        yield
+        return
+    profile = _profile
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        profile.spans.append(Span(name, cat, start, perf_counter(), args))
+
+
+def traced(func: F) -> F:
+    name = func.__module__.removeprefix('jsonclasses_cli.package.') + '.' + func.__name__
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if _profile is None:
+            return func(*args, **kwargs)
+        target = args[0]
+        model = getattr(target, 'name', None) or getattr(target, '__name__', None)
+        with span(name, 'model', model=model):
+            return func(*args, **kwargs)
+    return wrapper
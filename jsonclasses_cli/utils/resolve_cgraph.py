@@ -0,0 +1,19 @@
+from jsonclasses.cgraph import CGraph
+from jsonclasses.fdef import FType
+
+
+def resolve_cgraph(cgraph: CGraph) -> None:
+    for cdef in cgraph._map.values():
+        for field in cdef.fields:
+            fdef = field.fdef
+            match fdef.ftype:
+                case FType.INSTANCE:
+                    fdef.inst_cls
+                    fdef.foreign_key
+                case FType.LIST:
+                    item = fdef.item_types.fdef
+                    if item.ftype == FType.INSTANCE:
+                        item.inst_cls
+                    fdef.use_join_table
+                case FType.ENUM:
+                    fdef.enum_class
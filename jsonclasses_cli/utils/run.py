@@ -1,8 +1,25 @@
+from __future__ import annotations
+from pathlib import Path
+from subprocess import run as subprocess_run
+from time import perf_counter
 from rich import print
-from os import system
+from rich.markup import escape
 
 
-def run(cmd: str, silent: bool = False) -> None:
-    if not silent:
-        print(f"[bold green]RUN[/bold green] {cmd}")
-        system(cmd)
+def run(cmd: list[str], silent: bool = False, cwd: Path | None = None) -> bool:
+    if silent:
+        return True
+    line = ' '.join(str(arg) for arg in cmd)
+    start = perf_counter()
+    try:
+        result = subprocess_run(cmd, cwd=cwd, capture_output=True, text=True)
+    except OSError as error:
+        print(f"[bold red]FAIL[/bold red] {escape(line)}\n{escape(str(error))}")
+        return False
+    seconds = perf_counter() - start
+    if result.returncode != 0:
+        output = (result.stderr or result.stdout).strip().split('\n')[-20:]
+        print(f"[bold red]FAIL[/bold red] {escape(line)} ({seconds:.1f}s)\n" + escape('\n'.join(output)))
+        return False
+    print(f"[bold green]RUN[/bold green] {escape(line)} ({seconds:.1f}s)")
+    return True
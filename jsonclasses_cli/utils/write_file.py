@@ -2,10 +2,15 @@ from os import getcwd
 from pathlib import Path
 from rich import print
 
-def write_file(path: Path, content: str, silent: bool = False) -> None:
+def write_file(path: Path, content: str, silent: bool = False) -> bool:
     if not path.parent.exists():
         path.parent.mkdir(parents=True)
+    if path.is_file() and path.read_text() == content:
+        if not silent:
+            print(f"[bold blue]IDENTICAL[/bold blue] {path.relative_to(getcwd())}")
+        return False
     with open(path, 'w') as file:
         if not silent:
             print(f"[bold green]CREATE[/bold green] {path.relative_to(getcwd())}")
         file.write(content)
+    return True
@@ -0,0 +1,37 @@
+from __future__ import annotations
+from datetime import datetime
+from typing import Annotated
+from jsonclasses import jsonclass, types, linkto, linkedby, linkedthru
+from jsonclasses_pymongo import pymongo
+
+
+@pymongo
+@jsonclass(class_graph='indexes')
+class User:
+    id: str = types.readonly.str.primary.mongoid.required
+    email: str = types.str.email.unique.required
+    name: str = types.str.index.required
+    first_name: str | None = types.str.cindex('full_name')
+    last_name: str | None = types.str.cindex('full_name')
+    password: str = types.str.writeonly.unqueryable.required
+    admin: bool = types.bool.default(False).required
+    posts: Annotated[list[Post], linkedby('author')]
+    created_at: datetime = types.readonly.datetime.tscreated.required
+
+
+@pymongo
+@jsonclass(class_graph='indexes')
+class Post:
+    id: str = types.readonly.str.primary.mongoid.required
+    title: str = types.str.required
+    views: int = types.int.default(0).required
+    author: User = types.objof('User').linkto.required
+    tags: Annotated[list[Tag], linkedthru('posts')]
+
+
+@pymongo
+@jsonclass(class_graph='indexes')
+class Tag:
+    id: str = types.readonly.str.primary.mongoid.required
+    name: str = types.str.unique.required
+    posts: Annotated[list[Post], linkedthru('tags')]
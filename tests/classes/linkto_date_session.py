@@ -0,0 +1,25 @@
+from __future__ import annotations
+from datetime import date, datetime
+from typing import Annotated
+from jsonclasses import jsonclass, types, linkto, linkedby
+from jsonclasses_server import api, authorized
+
+
+@authorized
+@api
+@jsonclass(class_graph='linkto_date_session')
+class User:
+    id: str = types.readonly.str.primary.mongoid.required
+    username: str = types.str.authidentity.writenonnull.required
+    password: str = types.str.writeonly.writenonnull.salt.authbycheckpw.unqueryable.required
+    birthday: date | None
+    articles: Annotated[list[Article], linkedby('author')]
+    created_at: datetime = types.readonly.datetime.tscreated.required
+
+@api
+@jsonclass(class_graph='linkto_date_session')
+class Article:
+    id: str = types.readonly.str.primary.mongoid.required
+    title: str = types.str.required
+    published_at: list[datetime]
+    author: Annotated[User, linkto]
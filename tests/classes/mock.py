@@ -0,0 +1,33 @@
+from __future__ import annotations
+from datetime import datetime
+from enum import Enum
+from typing import Annotated
+from jsonclasses import jsonclass, jsonenum, types, linkto, linkedby
+from jsonclasses_server import api, authorized
+
+
+@jsonenum(class_graph='mock')
+class Role(Enum):
+    READER = 'reader'
+    WRITER = 'writer'
+
+
+@authorized
+@api
+@jsonclass(class_graph='mock')
+class Author:
+    id: str = types.readonly.str.primary.mongoid.required
+    email: str = types.str.email.authidentity.required
+    password: str = types.str.writeonly.writenonnull.salt.authbycheckpw.unqueryable.required
+    role: Role = types.enum(Role).required
+    posts: Annotated[list[Post], linkedby('author')]
+    created_at: datetime = types.readonly.datetime.tscreated.required
+
+
+@api(disable='D')
+@jsonclass(class_graph='mock')
+class Post:
+    id: str = types.readonly.str.primary.mongoid.required
+    title: str = types.str.maxlength(40).required
+    rating: float | None = types.float.range(0, 5)
+    author: Annotated[Author, linkto]
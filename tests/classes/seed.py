@@ -0,0 +1,34 @@
+from __future__ import annotations
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated
+from jsonclasses import jsonclass, jsonenum, types, linkto, linkedby
+from jsonclasses_pymongo import pymongo
+
+
+@jsonenum(class_graph='seed')
+class Role(Enum):
+    READER = 'reader'
+    WRITER = 'writer'
+
+
+@pymongo
+@jsonclass(class_graph='seed')
+class Post:
+    id: str = types.readonly.str.primary.mongoid.required
+    title: str = types.str.maxlength(40).required
+    rating: float | None = types.float.range(0, 5)
+    tags: list[str] | None
+    author: Author = types.objof('Author').linkto.required
+
+
+@pymongo
+@jsonclass(class_graph='seed')
+class Author:
+    id: str = types.readonly.str.primary.mongoid.required
+    name: str = types.str.length(2, 20).required
+    email: str = types.str.email.unique.required
+    role: Role = types.enum(Role).required
+    birthday: date | None
+    posts: Annotated[list[Post], linkedby('author')]
+    created_at: datetime = types.readonly.datetime.tscreated.required
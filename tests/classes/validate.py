@@ -0,0 +1,25 @@
+from __future__ import annotations
+from enum import Enum
+from jsonclasses import jsonclass, jsonenum, types
+from jsonclasses_server import api
+
+
+@jsonenum(class_graph='validate')
+class Gender(Enum):
+    MALE = 'male'
+    FEMALE = 'female'
+
+
+@api
+@jsonclass(class_graph='validate')
+class Singer:
+    id: str = types.readonly.str.primary.mongoid.required
+    email: str = types.str.email.required
+    name: str = types.str.length(2, 20).required
+    nickname: str | None = types.str.trim.maxlength(10)
+    code: str | None = types.str.match('^[A-Z]{3}$')
+    phone_num: str | None = types.str.alnum
+    gender: Gender | None = types.enum(Gender)
+    age: int | None = types.int.range(0, 150)
+    rating: float | None = types.float.min(0).max(5)
+    verified: bool = types.bool.default(False).required
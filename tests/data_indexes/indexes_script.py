@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Create the recommended MongoDB indexes.
+
+Generated by `jsonclasses indexes`. Running it again only creates the
+indexes which are missing.
+
+jsonclasses-pymongo drops indexes which are not declared with `unique`,
+`index`, `cindex` or `cunique` when the app connects. Declare indexes
+on fields to keep them, or run this script after the app started.
+"""
+from argparse import ArgumentParser
+from pymongo import ASCENDING, MongoClient
+
+
+INDEXES = [
+    ('users', [('email', ASCENDING)], {'name': 'email_1', 'unique': True}),
+    ('users', [('name', ASCENDING)], {'name': 'name_1'}),
+    ('users', [('firstName', ASCENDING), ('lastName', ASCENDING)], {'name': 'full_name', 'sparse': True}),
+    ('users', [('lastName', ASCENDING)], {'name': 'lastName_1', 'sparse': True}),
+    ('users', [('createdAt', ASCENDING)], {'name': 'createdAt_1'}),
+    ('posts', [('title', ASCENDING)], {'name': 'title_1'}),
+    ('posts', [('views', ASCENDING)], {'name': 'views_1'}),
+    ('posts', [('authorId', ASCENDING)], {'name': 'authorId_1'}),
+    ('tags', [('name', ASCENDING)], {'name': 'name_1', 'unique': True}),
+    ('poststagstagsposts', [('postId', ASCENDING), ('tagId', ASCENDING)], {'name': 'ref', 'unique': True}),
+    ('poststagstagsposts', [('tagId', ASCENDING)], {'name': 'tagId_1'})
+]
+
+
+def create_indexes(url: str, dry_run: bool = False) -> list[str]:
+    client = MongoClient(url)
+    database = client.get_database()
+    created: list[str] = []
+    try:
+        for (collection, keys, options) in INDEXES:
+            name = f'{collection}.{options["name"]}'
+            existing = database[collection].index_information()
+            names = [k for (k, _) in keys]
+            if options['name'] in existing or any([k for (k, _) in i['key']] == names for i in existing.values()):
+                print(f'exists  {name}')
+                continue
+            if not dry_run:
+                database[collection].create_index(keys, **options)
+            created.append(name)
+            print(f'missing {name}' if dry_run else f'created {name}')
+    finally:
+        client.close()
+    return created
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Create the recommended MongoDB indexes.')
+    parser.add_argument('--url', default='mongodb://localhost:27017/app', help='MongoDB connection string.')
+    parser.add_argument('--dry-run', action='store_true', help='Only print missing indexes.')
+    args = parser.parse_args()
+    create_indexes(args.url, args.dry_run)
+
+
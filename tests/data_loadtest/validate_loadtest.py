@@ -0,0 +1,266 @@
+#!/usr/bin/env python
+from __future__ import annotations
+from argparse import ArgumentParser
+from asyncio import gather, run
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from random import Random
+from string import ascii_letters, ascii_lowercase, digits
+from time import perf_counter
+from typing import Any, Callable
+from httpx import AsyncBaseTransport, AsyncClient, HTTPError, Limits
+
+
+EPOCH = datetime(2000, 1, 1, tzinfo=timezone.utc)
+
+
+def _text(rng: Random, minlength: int, maxlength: int) -> str:
+    return ''.join(rng.choices(ascii_letters, k=rng.randint(minlength, maxlength)))
+
+
+def _alnum(rng: Random, minlength: int, maxlength: int) -> str:
+    return ''.join(rng.choices(ascii_letters + digits, k=rng.randint(minlength, maxlength)))
+
+
+def _digits(rng: Random, minlength: int, maxlength: int) -> str:
+    return ''.join(rng.choices(digits, k=rng.randint(minlength, maxlength)))
+
+
+def _email(rng: Random) -> str:
+    return ''.join(rng.choices(ascii_lowercase + digits, k=12)) + '@example.com'
+
+
+def _url(rng: Random) -> str:
+    return 'https://example.com/' + ''.join(rng.choices(ascii_lowercase + digits, k=12))
+
+
+def _date(rng: Random) -> str:
+    return (EPOCH + timedelta(days=rng.randint(0, 9000))).strftime('%Y-%m-%dT00:00:00.000Z')
+
+
+def _datetime(rng: Random) -> str:
+    return (EPOCH + timedelta(seconds=rng.randint(0, 9000 * 86400))).strftime('%Y-%m-%dT%H:%M:%S.000Z')
+
+
+def _create_singer(rng: Random, ids: dict[str, list[str]]) -> dict[str, Any]:
+    data: dict[str, Any] = {}
+    data['email'] = _email(rng)
+    data['name'] = _text(rng, 2, 20)
+    if rng.random() < 0.5:
+        data['nickname'] = _text(rng, 4, 10)
+    if rng.random() < 0.5:
+        data['phoneNum'] = _alnum(rng, 4, 16)
+    if rng.random() < 0.5:
+        data['gender'] = rng.choice(['MALE', 'FEMALE'])
+    if rng.random() < 0.5:
+        data['age'] = rng.randint(0, 150)
+    if rng.random() < 0.5:
+        data['rating'] = round(rng.uniform(0, 5), 2)
+    if rng.random() < 0.5:
+        data['verified'] = rng.random() < 0.5
+    return data
+
+
+def _update_singer(rng: Random, ids: dict[str, list[str]]) -> dict[str, Any]:
+    data: dict[str, Any] = {}
+    if rng.random() < 0.5:
+        data['email'] = _email(rng)
+    if rng.random() < 0.5:
+        data['name'] = _text(rng, 2, 20)
+    if rng.random() < 0.5:
+        data['nickname'] = _text(rng, 4, 10)
+    if rng.random() < 0.5:
+        data['phoneNum'] = _alnum(rng, 4, 16)
+    if rng.random() < 0.5:
+        data['gender'] = rng.choice(['MALE', 'FEMALE'])
+    if rng.random() < 0.5:
+        data['age'] = rng.randint(0, 150)
+    if rng.random() < 0.5:
+        data['rating'] = round(rng.uniform(0, 5), 2)
+    if rng.random() < 0.5:
+        data['verified'] = rng.random() < 0.5
+    return data
+
+
+Payload = Callable[[Random, dict[str, list[str]]], dict[str, Any]]
+
+
+@dataclass
+class Model:
+    name: str
+    actions: str
+    primary: str
+    create: Payload
+    update: Payload
+    sign_in: tuple[str, ...] = ()
+    credentials: dict[str, Any] | None = None
+
+
+MODELS = [
+    Model('singers', 'CRUDL', 'id', _create_singer, _update_singer, ()),
+]
+
+
+@dataclass
+class Stats:
+    latencies: dict[str, list[float]] = field(default_factory=dict)
+    errors: dict[str, int] = field(default_factory=dict)
+    elapsed: float = 0
+
+    def record(self, route: str, seconds: float, ok: bool) -> None:
+        self.latencies.setdefault(route, []).append(seconds)
+        self.errors.setdefault(route, 0)
+        if not ok:
+            self.errors[route] += 1
+
+    def report(self) -> str:
+        lines = [f"{'route':<32}{'count':>8}{'errors':>8}{'rps':>10}{'p50':>10}{'p90':>10}{'p99':>10}{'max':>10}"]
+        for (route, values) in sorted(self.latencies.items()):
+            ordered = sorted(values)
+            lines.append(f'{route:<32}{len(values):>8}{self.errors[route]:>8}'
+                         f'{len(values) / max(self.elapsed, 1e-9):>10.1f}'
+                         f'{_ms(percentile(ordered, 50)):>10}{_ms(percentile(ordered, 90)):>10}'
+                         f'{_ms(percentile(ordered, 99)):>10}{_ms(ordered[-1]):>10}')
+        return '\n'.join(lines)
+
+
+def percentile(ordered: list[float], p: float) -> float:
+    return ordered[min(len(ordered) - 1, round(p / 100 * (len(ordered) - 1)))]
+
+
+def _ms(seconds: float) -> str:
+    return f'{seconds * 1000:.1f}ms'
+
+
+class Runner:
+
+    def __init__(self, client: AsyncClient, models: list[Model], mix: dict[str, float], seed: int) -> None:
+        self.client = client
+        self.models = [m for m in models if any(mix.get(a, 0) > 0 for a in m.actions)]
+        if len(self.models) == 0:
+            raise ValueError('no model supports an action in the mix')
+        self.mix = mix
+        self.rng = Random(seed)
+        self.ids: dict[str, list[str]] = {m.name: [] for m in models}
+        self.stats = Stats()
+
+    async def request(self, route: str, method: str, url: str, **kwargs: Any) -> Any:
+        start = perf_counter()
+        try:
+            response = await self.client.request(method, url, **kwargs)
+        except HTTPError:
+            self.stats.record(route, perf_counter() - start, False)
+            return None
+        ok = response.status_code < 400
+        self.stats.record(route, perf_counter() - start, ok)
+        if not ok or len(response.content) == 0:
+            return None
+        return response.json().get('data')
+
+    async def create(self, model: Model) -> None:
+        payload = model.create(self.rng, self.ids)
+        data = await self.request(f'POST /{model.name}', 'POST', f'/{model.name}', json=payload)
+        if data is None:
+            return
+        self.ids[model.name].append(data[model.primary])
+        if model.sign_in and model.credentials is None:
+            model.credentials = {k: payload[k] for k in model.sign_in if k in payload}
+
+    async def read(self, model: Model) -> None:
+        if len(self.ids[model.name]) == 0:
+            return await self.list(model)
+        id = self.rng.choice(self.ids[model.name])
+        await self.request(f'GET /{model.name}/:id', 'GET', f'/{model.name}/{id}')
+
+    async def update(self, model: Model) -> None:
+        if len(self.ids[model.name]) == 0:
+            return await self.list(model)
+        id = self.rng.choice(self.ids[model.name])
+        payload = model.update(self.rng, self.ids)
+        await self.request(f'PATCH /{model.name}/:id', 'PATCH', f'/{model.name}/{id}', json=payload)
+
+    async def delete(self, model: Model) -> None:
+        ids = self.ids[model.name]
+        if len(ids) == 0:
+            return await self.list(model)
+        id = ids.pop(self.rng.randrange(len(ids)))
+        await self.request(f'DELETE /{model.name}/:id', 'DELETE', f'/{model.name}/{id}')
+
+    async def list(self, model: Model) -> None:
+        await self.request(f'GET /{model.name}', 'GET', f'/{model.name}?_limit=20')
+
+    async def sign_in(self, models: list[Model]) -> None:
+        for model in models:
+            if model.credentials is None:
+                continue
+            data = await self.request(f'POST /{model.name}/session', 'POST',
+                                      f'/{model.name}/session', json=model.credentials)
+            if data is not None:
+                self.client.headers['Authorization'] = 'Bearer ' + data['token']
+            return
+
+    async def step(self) -> None:
+        model = self.rng.choice(self.models)
+        actions = [a for a in model.actions if self.mix.get(a, 0) > 0]
+        action = self.rng.choices(actions, [self.mix[a] for a in actions])[0]
+        match action:
+            case 'C':
+                await self.create(model)
+            case 'R':
+                await self.read(model)
+            case 'U':
+                await self.update(model)
+            case 'D':
+                await self.delete(model)
+            case 'L':
+                await self.list(model)
+
+    async def worker(self, deadline: float) -> None:
+        while perf_counter() < deadline:
+            await self.step()
+
+
+async def load(url: str,
+               mix: dict[str, float],
+               concurrency: int = 10,
+               duration: float = 10,
+               seed_count: int = 10,
+               seed: int = 0,
+               transport: AsyncBaseTransport | None = None) -> Stats:
+    limits = Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with AsyncClient(base_url=url, limits=limits, transport=transport, timeout=30) as client:
+        models = [Model(m.name, m.actions, m.primary, m.create, m.update, m.sign_in) for m in MODELS]
+        runner = Runner(client, models, mix, seed)
+        for model in models:
+            if 'C' in model.actions:
+                for _ in range(seed_count):
+                    await runner.create(model)
+        await runner.sign_in(models)
+        runner.stats = Stats()
+        start = perf_counter()
+        await gather(*[runner.worker(start + duration) for _ in range(concurrency)])
+        runner.stats.elapsed = perf_counter() - start
+        return runner.stats
+
+
+def parse_mix(value: str) -> dict[str, float]:
+    mix: dict[str, float] = {}
+    for item in value.split(','):
+        (action, weight) = item.split('=')
+        mix[action.strip().upper()] = float(weight)
+    return mix
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Load test the API of this app.')
+    parser.add_argument('--url', default='http://127.0.0.1:8000', help='base url of a running server')
+    parser.add_argument('--mix', type=parse_mix, default='C=1,R=4,U=1,D=1,L=2', help='action weights')
+    parser.add_argument('--concurrency', type=int, default=10, help='number of concurrent workers')
+    parser.add_argument('--duration', type=float, default=10, help='seconds to run')
+    parser.add_argument('--seed-count', type=int, default=10, help='records created per model before running')
+    parser.add_argument('--seed', type=int, default=0, help='random seed')
+    args = parser.parse_args()
+    stats = run(load(args.url, args.mix, args.concurrency, args.duration, args.seed_count, args.seed))
+    print(stats.report())
+
+
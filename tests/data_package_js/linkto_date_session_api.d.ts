@@ -0,0 +1,539 @@
+type Mode = 'default' | 'insensitive'
+
+interface StringContainsQuery {
+    _contains: string
+    _mode?: Mode
+}
+
+interface StringPrefixQuery {
+    _prefix: string
+    _mode?: Mode
+}
+
+interface StringSuffixQuery {
+    _suffix: string
+    _mode?: Mode
+}
+
+interface StringMatchQuery {
+    _match: string
+    _mode?: Mode
+}
+
+interface StringEqQuery {
+    _eq: string
+}
+
+interface StringNeqQuery {
+    _neq: string
+}
+
+interface StringNullQuery {
+    _null: boolean
+}
+
+interface StringCompareQuery {
+    _gt?: string
+    _gte?: string
+    _lt?: string
+    _lte?: string
+}
+
+interface StringOrQuery {
+    _or: StringQuery[]
+}
+
+interface StringAndQuery {
+    _and: StringQuery[]
+}
+
+export type StringQuery = string | StringContainsQuery | StringPrefixQuery | StringSuffixQuery | StringMatchQuery |
+                          StringEqQuery | StringNeqQuery | StringNullQuery | StringCompareQuery | StringOrQuery | StringAndQuery
+
+interface NumberValueQuery {
+    _gt?: number
+    _gte?: number
+    _lt?: number
+    _lte?: number
+}
+
+interface NumberEqQuery {
+    _eq: number
+}
+
+interface NumberNeqQuery {
+    _neq: number
+}
+
+interface NumberNullQuery {
+    _null: boolean
+}
+
+interface NumberOrQuery {
+    _or: NumberQuery[]
+}
+
+interface NumberAndQuery {
+    _and: NumberQuery[]
+}
+
+export type NumberQuery = number | NumberEqQuery | NumberNeqQuery | NumberNullQuery | NumberValueQuery | NumberOrQuery | NumberAndQuery
+
+interface BooleanEqQuery {
+    _eq: boolean
+}
+
+interface BooleanNeqQuery {
+    _neq: boolean
+}
+
+interface BooleanNullQuery {
+    _null: boolean
+}
+
+interface BooleanOrQuery {
+    _or: BooleanQuery[]
+}
+
+interface BooleanAndQuery {
+    _and: BooleanQuery[]
+}
+
+export type BooleanQuery = boolean | BooleanEqQuery | BooleanNeqQuery | BooleanNullQuery | BooleanOrQuery | BooleanAndQuery
+
+interface DateValueQuery {
+    _gt?: Date
+    _gte?: Date
+    _lt?: Date
+    _lte?: Date
+    _on?: Date
+}
+
+interface DateEqQuery {
+    _eq: Date
+}
+
+interface DateNeqQuery {
+    _neq: Date
+}
+
+interface DateNullQuery {
+    _null: boolean
+}
+
+interface DateOrQuery {
+    _or: DateQuery[]
+}
+
+interface DateAndQuery {
+    _and: DateQuery[]
+}
+
+interface DateBeforeQuery {
+    _before: Date
+}
+
+interface DateAfterQuery {
+    _after: Date
+}
+
+export type DateQuery = Date | DateValueQuery | DateEqQuery | DateNeqQuery | DateNullQuery | DateOrQuery | DateAndQuery |
+                        DateBeforeQuery | DateAfterQuery
+
+interface IDQuery {
+    _eq: String
+    _neq: String
+    _null: boolean
+}
+
+interface Link {
+    _add: String
+}
+
+interface UnLink {
+    _del: String
+}
+
+export interface User {
+    id: string
+    username: string
+    birthday?: Date
+    articles: Article[]
+    createdAt: Date
+}
+
+export interface UserCreateInput {
+    username: string
+    password: string
+    birthday?: Date
+    articles: ArticleCreateInput[]
+}
+
+export interface UserUpdateInput {
+    username?: string
+    password?: string
+    birthday?: Date | null
+    articles?: ArticleUpdateInput[]
+}
+
+type UserSortOrder = 'username' | '-username' | 'birthday' | '-birthday' | 'createdAt' | '-createdAt'
+
+type UserResultPick = 'id' | 'username' | 'birthday' | 'articles' | 'createdAt'
+
+interface UserArticlesInclude {
+    articles?: ArticleListQuery
+}
+
+type UserInclude = UserArticlesInclude
+
+interface UserSingleQuery {
+    _pick?: UserResultPick[]
+    _omit?: UserResultPick[]
+    _includes?: UserInclude[]
+}
+
+interface UserListQuery {
+    id?: StringQuery
+    username?: StringQuery
+    birthday?: DateQuery
+    createdAt?: DateQuery
+    _order?: UserSortOrder | UserSortOrder[]
+    _limit?: number
+    _skip?: number
+    _pageNo?: number
+    _pageSize?: number
+    _pick?: UserResultPick[]
+    _omit?: UserResultPick[]
+    _includes?: UserInclude[]
+}
+
+interface UserSeekQuery {
+    id?: StringQuery
+    username?: StringQuery
+    birthday?: DateQuery
+    createdAt?: DateQuery
+}
+
+interface UserQueryData {
+    _query: UserSeekQuery
+    _data: UserUpdateInput
+}
+
+export interface Article {
+    id: string
+    title: string
+    publishedAt: Date[]
+    author: User
+    author_id: string
+}
+
+export interface ArticleCreateInput {
+    title: string
+    publishedAt: Date[]
+    author: (UserCreateInput | Link)
+    author_id: string
+}
+
+export interface ArticleUpdateInput {
+    title?: string
+    publishedAt?: Date[]
+    author?: (UserUpdateInput | Link | UnLink)
+    author_id?: string
+}
+
+type ArticleSortOrder = 'title' | '-title' | 'publishedAt' | '-publishedAt'
+
+type ArticleResultPick = 'id' | 'title' | 'publishedAt' | 'author' | 'author_id'
+
+interface ArticleAuthorInclude {
+    author?: UserSingleQuery
+}
+
+type ArticleInclude = ArticleAuthorInclude
+
+interface ArticleSingleQuery {
+    _pick?: ArticleResultPick[]
+    _omit?: ArticleResultPick[]
+    _includes?: ArticleInclude[]
+}
+
+interface ArticleListQuery {
+    id?: StringQuery
+    title?: StringQuery
+    publishedAt?: DateQuery[]
+    author_id?: IDQuery
+    _order?: ArticleSortOrder | ArticleSortOrder[]
+    _limit?: number
+    _skip?: number
+    _pageNo?: number
+    _pageSize?: number
+    _pick?: ArticleResultPick[]
+    _omit?: ArticleResultPick[]
+    _includes?: ArticleInclude[]
+}
+
+interface ArticleSeekQuery {
+    id?: StringQuery
+    title?: StringQuery
+    publishedAt?: DateQuery[]
+    author_id?: IDQuery
+}
+
+interface ArticleQueryData {
+    _query: ArticleSeekQuery
+    _data: ArticleUpdateInput
+}
+
+interface UserSessionInput {
+    username: string
+    password: string
+}
+
+interface UserSession {
+    token: string
+    user: User
+}
+
+export interface SessionStorage {
+    getItem(key: string): string | null
+    setItem(key: string, value: string): void
+    removeItem(key: string): void
+}
+
+export declare class MemoryStorage implements SessionStorage {
+    #private
+    getItem(key: string): string | null
+    setItem(key: string, value: string): void
+    removeItem(key: string): void
+}
+
+declare class SessionManager {
+    #private
+    static share: SessionManager
+    get storage(): SessionStorage
+    useStorage(storage: SessionStorage): void
+    setSession(session: UserSession | undefined | null): void
+    hasSession(): boolean
+    getToken(): string | undefined
+    getSession(): UserSession | undefined
+    get headers(): { headers: { Authorization: string } } | undefined
+    clearSession(): void
+}
+
+export interface APIConfig {
+    baseURL?: string
+}
+
+declare class RequestManager {
+    #private
+    constructor(config?: APIConfig)
+    get headers(): { headers: { Authorization: string } } | undefined
+    qs(val: any): string
+    post<T, U, V>(url: string, input: T, query?: V | undefined): Promise<U>
+    patch<T, U, V>(url: string, input: T, query?: V | undefined): Promise<U>
+    delete<V>(url: string, query?: V | undefined): Promise<void>
+    get<U, V>(url: string, query?: V | undefined): Promise<U>
+}
+
+declare class UserCreateRequest<T extends Partial<User>> extends Promise<T> {
+    #private
+    constructor(manager: RequestManager, input: UserCreateInput, query?: UserSingleQuery)
+    pick(picks: UserResultPick[]): UserCreateRequest<Pick<T, typeof picks[number]>>
+    omit(omits: UserResultPick[]): UserCreateRequest<Omit<T, typeof omits[number]>>
+    include(includes: UserInclude[]): UserCreateRequest<T>
+    exec(): Promise<T>
+}
+
+declare class UserUpdateRequest<T extends Partial<User>> extends Promise<T> {
+    #private
+    constructor(manager: RequestManager, id: string, input: UserUpdateInput, query?: UserSingleQuery)
+    pick(picks: UserResultPick[]): UserUpdateRequest<Pick<T, typeof picks[number]>>
+    omit(omits: UserResultPick[]): UserUpdateRequest<Omit<T, typeof omits[number]>>
+    include(includes: UserInclude[]): UserUpdateRequest<T>
+    exec(): Promise<User>
+}
+
+declare class UserDeleteRequest extends Promise<void> {
+    #private
+    constructor(manager: RequestManager, id: string)
+    exec(): Promise<void>
+}
+
+declare class UserIDRequest<T extends Partial<User>> extends Promise<T> {
+    #private
+    constructor(manager: RequestManager, id: string, query?: UserSingleQuery)
+    pick(picks: UserResultPick[]): UserIDRequest<Pick<T, typeof picks[number]>>
+    omit(omits: UserResultPick[]): UserIDRequest<Omit<T, typeof omits[number]>>
+    include(includes: UserInclude[]): UserIDRequest<T>
+    exec(): Promise<User>
+}
+
+declare class UserUpsertRequest<T extends Partial<User>> extends Promise<T> {
+    #private
+    constructor(manager: RequestManager, input: UserQueryData)
+    exec(): Promise<T>
+}
+
+declare class UserCreateManyRequest<T extends Partial<User>> extends Promise<T> {
+    #private
+    constructor(manager: RequestManager, input: UserCreateInput[], query?: UserSingleQuery)
+    pick(picks: UserResultPick[]): UserCreateManyRequest<Pick<T, typeof picks[number]>>
+    omit(omits: UserResultPick[]): UserCreateManyRequest<Omit<T, typeof omits[number]>>
+    include(includes: UserInclude[]): UserCreateManyRequest<T>
+    exec(): Promise<T[]>
+}
+
+declare class UserUpdateManyRequest<T extends Partial<User>> extends Promise<T> {
+    #private
+    constructor(manager: RequestManager, input: UserQueryData, query?: UserSingleQuery)
+    pick(picks: UserResultPick[]): UserUpdateManyRequest<Pick<T, typeof picks[number]>>
+    omit(omits: UserResultPick[]): UserUpdateManyRequest<Omit<T, typeof omits[number]>>
+    include(includes: UserInclude[]): UserUpdateManyRequest<T>
+    exec(): Promise<User>
+}
+
+declare class UserDeleteManyRequest extends Promise<void> {
+    #private
+    constructor(manager: RequestManager, query?: UserSeekQuery)
+    exec(): Promise<void>
+}
+
+declare class UserListRequest<T extends Partial<User>> extends Promise<T[]> {
+    #private
+    constructor(manager: RequestManager, query?: UserListQuery)
+    order(order: UserSortOrder | UserSortOrder[]): UserListRequest<T>
+    skip(skip: number): UserListRequest<T>
+    limt(limit: number): UserListRequest<T>
+    pageSize(pageSize: number): UserListRequest<T>
+    pageNo(pageNo: number): UserListRequest<T>
+    pick(picks: UserResultPick[]): UserListRequest<Pick<T, typeof picks[number]>>
+    omit(omits: UserResultPick[]): UserListRequest<Omit<T, typeof omits[number]>>
+    include(includes: UserInclude[]): UserListRequest<T>
+    exec(): Promise<User[]>
+}
+
+declare class UserSignInRequest<T extends Partial<UserSession>> extends Promise<T> {
+    #private
+    constructor(manager: RequestManager, input: UserSessionInput, query?: UserSingleQuery)
+    pick(picks: UserResultPick[]): UserSignInRequest<T>
+    omit(omits: UserResultPick[]): UserSignInRequest<T>
+    include(includes: UserInclude[]): UserSignInRequest<T>
+    exec(): Promise<UserSession>
+}
+
+declare class UserClient {
+    #private
+    constructor(manager: RequestManager)
+    create(input: UserCreateInput, query?: UserSingleQuery): UserCreateRequest<User>
+    createMany(input: UserCreateInput[]): UserCreateManyRequest<User>
+    id(id: string, query?: UserSingleQuery): UserIDRequest<User>
+    update(id: string, input: UserUpdateInput, query?: UserSingleQuery): UserUpdateRequest<User>
+    updateMany(input: UserQueryData): UserUpdateManyRequest<User>
+    upsert(input: UserQueryData): UserUpsertRequest<User>
+    find(query?: UserListQuery): UserListRequest<User>
+    delete(id: string): UserDeleteRequest
+    deleteMany(query?: UserSeekQuery): UserDeleteManyRequest
+    signIn(input: UserSessionInput, query?: UserSingleQuery): UserSignInRequest<UserSession>
+}
+
+declare class ArticleCreateRequest<T extends Partial<Article>> extends Promise<T> {
+    #private
+    constructor(manager: RequestManager, input: ArticleCreateInput, query?: ArticleSingleQuery)
+    pick(picks: ArticleResultPick[]): ArticleCreateRequest<Pick<T, typeof picks[number]>>
+    omit(omits: ArticleResultPick[]): ArticleCreateRequest<Omit<T, typeof omits[number]>>
+    include(includes: ArticleInclude[]): ArticleCreateRequest<T>
+    exec(): Promise<T>
+}
+
+declare class ArticleUpdateRequest<T extends Partial<Article>> extends Promise<T> {
+    #private
+    constructor(manager: RequestManager, id: string, input: ArticleUpdateInput, query?: ArticleSingleQuery)
+    pick(picks: ArticleResultPick[]): ArticleUpdateRequest<Pick<T, typeof picks[number]>>
+    omit(omits: ArticleResultPick[]): ArticleUpdateRequest<Omit<T, typeof omits[number]>>
+    include(includes: ArticleInclude[]): ArticleUpdateRequest<T>
+    exec(): Promise<Article>
+}
+
+declare class ArticleDeleteRequest extends Promise<void> {
+    #private
+    constructor(manager: RequestManager, id: string)
+    exec(): Promise<void>
+}
+
+declare class ArticleIDRequest<T extends Partial<Article>> extends Promise<T> {
+    #private
+    constructor(manager: RequestManager, id: string, query?: ArticleSingleQuery)
+    pick(picks: ArticleResultPick[]): ArticleIDRequest<Pick<T, typeof picks[number]>>
+    omit(omits: ArticleResultPick[]): ArticleIDRequest<Omit<T, typeof omits[number]>>
+    include(includes: ArticleInclude[]): ArticleIDRequest<T>
+    exec(): Promise<Article>
+}
+
+declare class ArticleUpsertRequest<T extends Partial<Article>> extends Promise<T> {
+    #private
+    constructor(manager: RequestManager, input: ArticleQueryData)
+    exec(): Promise<T>
+}
+
+declare class ArticleCreateManyRequest<T extends Partial<Article>> extends Promise<T> {
+    #private
+    constructor(manager: RequestManager, input: ArticleCreateInput[], query?: ArticleSingleQuery)
+    pick(picks: ArticleResultPick[]): ArticleCreateManyRequest<Pick<T, typeof picks[number]>>
+    omit(omits: ArticleResultPick[]): ArticleCreateManyRequest<Omit<T, typeof omits[number]>>
+    include(includes: ArticleInclude[]): ArticleCreateManyRequest<T>
+    exec(): Promise<T[]>
+}
+
+declare class ArticleUpdateManyRequest<T extends Partial<Article>> extends Promise<T> {
+    #private
+    constructor(manager: RequestManager, input: ArticleQueryData, query?: ArticleSingleQuery)
+    pick(picks: ArticleResultPick[]): ArticleUpdateManyRequest<Pick<T, typeof picks[number]>>
+    omit(omits: ArticleResultPick[]): ArticleUpdateManyRequest<Omit<T, typeof omits[number]>>
+    include(includes: ArticleInclude[]): ArticleUpdateManyRequest<T>
+    exec(): Promise<Article>
+}
+
+declare class ArticleDeleteManyRequest extends Promise<void> {
+    #private
+    constructor(manager: RequestManager, query?: ArticleSeekQuery)
+    exec(): Promise<void>
+}
+
+declare class ArticleListRequest<T extends Partial<Article>> extends Promise<T[]> {
+    #private
+    constructor(manager: RequestManager, query?: ArticleListQuery)
+    order(order: ArticleSortOrder | ArticleSortOrder[]): ArticleListRequest<T>
+    skip(skip: number): ArticleListRequest<T>
+    limt(limit: number): ArticleListRequest<T>
+    pageSize(pageSize: number): ArticleListRequest<T>
+    pageNo(pageNo: number): ArticleListRequest<T>
+    pick(picks: ArticleResultPick[]): ArticleListRequest<Pick<T, typeof picks[number]>>
+    omit(omits: ArticleResultPick[]): ArticleListRequest<Omit<T, typeof omits[number]>>
+    include(includes: ArticleInclude[]): ArticleListRequest<T>
+    exec(): Promise<Article[]>
+}
+
+declare class ArticleClient {
+    #private
+    constructor(manager: RequestManager)
+    create(input: ArticleCreateInput, query?: ArticleSingleQuery): ArticleCreateRequest<Article>
+    createMany(input: ArticleCreateInput[]): ArticleCreateManyRequest<Article>
+    id(id: string, query?: ArticleSingleQuery): ArticleIDRequest<Article>
+    update(id: string, input: ArticleUpdateInput, query?: ArticleSingleQuery): ArticleUpdateRequest<Article>
+    updateMany(input: ArticleQueryData): ArticleUpdateManyRequest<Article>
+    upsert(input: ArticleQueryData): ArticleUpsertRequest<Article>
+    find(query?: ArticleListQuery): ArticleListRequest<Article>
+    delete(id: string): ArticleDeleteRequest
+    deleteMany(query?: ArticleSeekQuery): ArticleDeleteManyRequest
+}
+
+export declare class API {
+    #private
+    constructor(config?: APIConfig)
+    get users(): UserClient
+    get articles(): ArticleClient
+    get session(): SessionManager
+    signOut(): void
+}
+
+export declare const api: API
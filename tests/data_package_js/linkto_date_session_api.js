@@ -0,0 +1,714 @@
+import axios from 'axios'
+import { stringify } from 'qsparser-js'
+
+function decodeUser(data) {
+    if (data == null) {
+        return data
+    }
+    if (data.birthday != null) {
+        data.birthday = new Date(data.birthday)
+    }
+    if (data.articles != null) {
+        data.articles = data.articles.map(decodeArticle)
+    }
+    if (data.createdAt != null) {
+        data.createdAt = new Date(data.createdAt)
+    }
+    return data
+}
+
+function decodeArticle(data) {
+    if (data == null) {
+        return data
+    }
+    if (data.publishedAt != null) {
+        data.publishedAt = data.publishedAt.map((v) => new Date(v))
+    }
+    if (data.author != null) {
+        data.author = decodeUser(data.author)
+    }
+    return data
+}
+
+function decodeSession(data) {
+    data.user = decodeUser(data.user)
+    return data
+}
+
+export class MemoryStorage {
+    #items = new Map()
+    getItem(key) {
+        return this.#items.get(key) ?? null
+    }
+    setItem(key, value) {
+        this.#items.set(key, value)
+    }
+    removeItem(key) {
+        this.#items.delete(key)
+    }
+}
+
+class SessionManager {
+    #sessionKey = '_jsonclasses_session'
+    #storage
+    #loaded = false
+    #session
+    #headers
+    static share = new SessionManager()
+    get storage() {
+        if (this.#storage === undefined) {
+            this.#storage = typeof localStorage !== 'undefined' ? localStorage : new MemoryStorage()
+        }
+        return this.#storage
+    }
+    useStorage(storage) {
+        this.#storage = storage
+        this.#loaded = false
+    }
+    #load() {
+        if (this.#loaded) {
+            return
+        }
+        this.#loaded = true
+        const item = this.storage.getItem(this.#sessionKey)
+        if (item && item !== null && item !== '') {
+            this.#cache(decodeSession(JSON.parse(item)))
+        } else {
+            this.#cache(undefined)
+        }
+    }
+    #cache(session) {
+        this.#session = session
+        this.#headers = session ? { headers: { Authorization: `Bearer ${session.token}` } } : undefined
+    }
+    setSession(session) {
+        this.#loaded = true
+        if (session) {
+            this.#cache(session)
+            this.storage.setItem(this.#sessionKey, JSON.stringify(session))
+        } else {
+            this.#cache(undefined)
+            this.storage.removeItem(this.#sessionKey)
+        }
+    }
+    hasSession() {
+        this.#load()
+        return this.#session !== undefined
+    }
+    getToken() {
+        this.#load()
+        return this.#session?.token
+    }
+    getSession() {
+        this.#load()
+        return this.#session
+    }
+    get headers() {
+        this.#load()
+        return this.#headers
+    }
+    clearSession() {
+        this.setSession(undefined)
+    }
+}
+
+class RequestManager {
+    #baseURL
+    constructor(config = {}) {
+        this.#baseURL = config.baseURL ?? "None"
+    }
+    get headers() {
+        return SessionManager.share.headers
+    }
+    qs(val) {
+        if (!val) {
+            return ''
+        }
+        if (Object.keys(val).length === 0) {
+            return ''
+        }
+        return '?' + stringify(val)
+    }
+    async post(url, input, query = undefined) {
+        const response = await axios.post(this.#baseURL + url + this.qs(query), input, this.headers)
+        return response.data.data
+    }
+    async patch(url, input, query = undefined) {
+        const response = await axios.patch(this.#baseURL + url + this.qs(query), input, this.headers)
+        return response.data.data
+    }
+    async delete(url, query = undefined) {
+        await axios.delete(this.#baseURL + url + this.qs(query), this.headers)
+        return
+    }
+    async get(url, query = undefined) {
+        const response = await axios.get(this.#baseURL + url + this.qs(query), this.headers)
+        return response.data.data
+    }
+}
+
+class UserCreateRequest extends Promise {
+    #manager
+    #input
+    #query
+    constructor(manager, input, query) {
+        super(() => {})
+        this.#manager = manager
+        this.#input = input
+        this.#query = query
+    }
+    pick(picks) {
+        this.#query = {...this.#query, _pick: picks}
+        return this
+    }
+    omit(omits) {
+        this.#query = {...this.#query, _omit: omits}
+        return this
+    }
+    include(includes) {
+        this.#query = {...this.#query, _includes: includes}
+        return this
+    }
+    async exec() {
+        return decodeUser(await this.#manager.post('/users', this.#input, this.#query))
+    }
+}
+
+class UserUpdateRequest extends Promise {
+    #manager
+    #id
+    #input
+    #query
+    constructor(manager, id, input, query) {
+        super(() => {})
+        this.#manager = manager
+        this.#id = id
+        this.#input = input
+        this.#query = query
+    }
+    pick(picks) {
+        this.#query = {...this.#query, _pick: picks}
+        return this
+    }
+    omit(omits) {
+        this.#query = {...this.#query, _omit: omits}
+        return this
+    }
+    include(includes) {
+        this.#query = {...this.#query, _includes: includes}
+        return this
+    }
+    async exec() {
+        return decodeUser(await this.#manager.patch(`/users/${this.#id}`, this.#input, this.#query))
+    }
+}
+
+class UserDeleteRequest extends Promise {
+    #manager
+    #id
+    constructor(manager, id) {
+        super(() => {})
+        this.#manager = manager
+        this.#id = id
+    }
+    async exec() {
+        return await this.#manager.delete(`/users/${this.#id}`)
+    }
+}
+
+class UserIDRequest extends Promise {
+    #manager
+    #id
+    #query
+    constructor(manager, id, query) {
+        super(() => {})
+        this.#manager = manager
+        this.#id = id
+        this.#query = query
+    }
+    pick(picks) {
+        this.#query = {...this.#query, _pick: picks}
+        return this
+    }
+    omit(omits) {
+        this.#query = {...this.#query, _omit: omits}
+        return this
+    }
+    include(includes) {
+        this.#query = {...this.#query, _includes: includes}
+        return this
+    }
+    async exec() {
+        return decodeUser(await this.#manager.get(`/users/${this.#id}`, this.#query))
+    }
+}
+
+class UserUpsertRequest extends Promise {
+    #manager
+    #input
+    constructor(manager, input) {
+        super(() => {})
+        this.#manager = manager
+        this.#input = input
+    }
+    async exec() {
+        return decodeUser(await this.#manager.post('/users', { '_upsert': this.#input }))
+    }
+}
+
+class UserCreateManyRequest extends Promise {
+    #manager
+    #input
+    #query
+    constructor(manager, input, query) {
+        super(() => {})
+        this.#manager = manager
+        this.#input = input
+        this.#query = query
+    }
+    pick(picks) {
+        this.#query = {...this.#query, _pick: picks}
+        return this
+    }
+    omit(omits) {
+        this.#query = {...this.#query, _omit: omits}
+        return this
+    }
+    include(includes) {
+        this.#query = {...this.#query, _includes: includes}
+        return this
+    }
+    async exec() {
+        return (await this.#manager.post('/users', { '_create': this.#input })).map(decodeUser)
+    }
+}
+
+class UserUpdateManyRequest extends Promise {
+    #manager
+    #input
+    #query
+    constructor(manager, input, query) {
+        super(() => {})
+        this.#manager = manager
+        this.#input = input
+        this.#query = query
+    }
+    pick(picks) {
+        this.#query = {...this.#query, _pick: picks}
+        return this
+    }
+    omit(omits) {
+        this.#query = {...this.#query, _omit: omits}
+        return this
+    }
+    include(includes) {
+        this.#query = {...this.#query, _includes: includes}
+        return this
+    }
+    async exec() {
+        return (await this.#manager.patch('/users', { '_update': this.#input })).map(decodeUser)
+    }
+}
+
+class UserDeleteManyRequest extends Promise {
+    #manager
+    #query
+    constructor(manager, query) {
+        super(() => {})
+        this.#manager = manager
+        this.#query = query
+    }
+    async exec() {
+        return await this.#manager.delete('/users', this.#query)
+    }
+}
+
+class UserListRequest extends Promise {
+    #manager
+    #query
+    constructor(manager, query) {
+        super(() => {})
+        this.#manager = manager
+        this.#query = query
+    }
+    order(order) {
+        this.#query = {...this.#query, _order: order}
+        return this
+    }
+    skip(skip) {
+        this.#query = {...this.#query, _skip: skip}
+        return this
+    }
+    limt(limit) {
+        this.#query = {...this.#query, _limit: limit}
+        return this
+    }
+    pageSize(pageSize) {
+        this.#query = {...this.#query, _pageSize: pageSize}
+        return this
+    }
+    pageNo(pageNo) {
+        this.#query = {...this.#query, _pageNo: pageNo}
+        return this
+    }
+    pick(picks) {
+        this.#query = {...this.#query, _pick: picks}
+        return this
+    }
+    omit(omits) {
+        this.#query = {...this.#query, _omit: omits}
+        return this
+    }
+    include(includes) {
+        this.#query = {...this.#query, _includes: includes}
+        return this
+    }
+    async exec() {
+        return (await this.#manager.get('/users', this.#query)).map(decodeUser)
+    }
+}
+
+class UserSignInRequest extends Promise {
+    #manager
+    #input
+    #query
+    constructor(manager, input, query) {
+        super(() => {})
+        this.#manager = manager
+        this.#input = input
+        this.#query = query
+    }
+    pick(picks) {
+        this.#query = {...this.#query, _pick: picks}
+        return this
+    }
+    omit(omits) {
+        this.#query = {...this.#query, _omit: omits}
+        return this
+    }
+    include(includes) {
+        this.#query = {...this.#query, _includes: includes}
+        return this
+    }
+    async exec() {
+        const session = await this.#manager.post('/users/session', this.#input, this.#query)
+        session.user = decodeUser(session.user)
+        SessionManager.share.setSession(session)
+        return session
+    }
+}
+
+class UserClient {
+    #manager
+    constructor(manager) {
+        this.#manager = manager
+    }
+    create(input, query) {
+        return new UserCreateRequest(this.#manager, input, query)
+    }
+    createMany(input) {
+        return new UserCreateManyRequest(this.#manager, input)
+    }
+    id(id, query) {
+        return new UserIDRequest(this.#manager, id, query)
+    }
+    update(id, input, query) {
+        return new UserUpdateRequest(this.#manager, id, input, query)
+    }
+    updateMany(input) {
+        return new UserUpdateManyRequest(this.#manager, input)
+    }
+    upsert(input) {
+        return new UserUpsertRequest(this.#manager, input)
+    }
+    find(query) {
+        return new UserListRequest(this.#manager, query)
+    }
+    delete(id) {
+        return new UserDeleteRequest(this.#manager, id)
+    }
+    deleteMany(query) {
+        return new UserDeleteManyRequest(this.#manager, query)
+    }
+    signIn(input, query) {
+        return new UserSignInRequest(this.#manager, input, query)
+    }
+}
+
+class ArticleCreateRequest extends Promise {
+    #manager
+    #input
+    #query
+    constructor(manager, input, query) {
+        super(() => {})
+        this.#manager = manager
+        this.#input = input
+        this.#query = query
+    }
+    pick(picks) {
+        this.#query = {...this.#query, _pick: picks}
+        return this
+    }
+    omit(omits) {
+        this.#query = {...this.#query, _omit: omits}
+        return this
+    }
+    include(includes) {
+        this.#query = {...this.#query, _includes: includes}
+        return this
+    }
+    async exec() {
+        return decodeArticle(await this.#manager.post('/articles', this.#input, this.#query))
+    }
+}
+
+class ArticleUpdateRequest extends Promise {
+    #manager
+    #id
+    #input
+    #query
+    constructor(manager, id, input, query) {
+        super(() => {})
+        this.#manager = manager
+        this.#id = id
+        this.#input = input
+        this.#query = query
+    }
+    pick(picks) {
+        this.#query = {...this.#query, _pick: picks}
+        return this
+    }
+    omit(omits) {
+        this.#query = {...this.#query, _omit: omits}
+        return this
+    }
+    include(includes) {
+        this.#query = {...this.#query, _includes: includes}
+        return this
+    }
+    async exec() {
+        return decodeArticle(await this.#manager.patch(`/articles/${this.#id}`, this.#input, this.#query))
+    }
+}
+
+class ArticleDeleteRequest extends Promise {
+    #manager
+    #id
+    constructor(manager, id) {
+        super(() => {})
+        this.#manager = manager
+        this.#id = id
+    }
+    async exec() {
+        return await this.#manager.delete(`/articles/${this.#id}`)
+    }
+}
+
+class ArticleIDRequest extends Promise {
+    #manager
+    #id
+    #query
+    constructor(manager, id, query) {
+        super(() => {})
+        this.#manager = manager
+        this.#id = id
+        this.#query = query
+    }
+    pick(picks) {
+        this.#query = {...this.#query, _pick: picks}
+        return this
+    }
+    omit(omits) {
+        this.#query = {...this.#query, _omit: omits}
+        return this
+    }
+    include(includes) {
+        this.#query = {...this.#query, _includes: includes}
+        return this
+    }
+    async exec() {
+        return decodeArticle(await this.#manager.get(`/articles/${this.#id}`, this.#query))
+    }
+}
+
+class ArticleUpsertRequest extends Promise {
+    #manager
+    #input
+    constructor(manager, input) {
+        super(() => {})
+        this.#manager = manager
+        this.#input = input
+    }
+    async exec() {
+        return decodeArticle(await this.#manager.post('/articles', { '_upsert': this.#input }))
+    }
+}
+
+class ArticleCreateManyRequest extends Promise {
+    #manager
+    #input
+    #query
+    constructor(manager, input, query) {
+        super(() => {})
+        this.#manager = manager
+        this.#input = input
+        this.#query = query
+    }
+    pick(picks) {
+        this.#query = {...this.#query, _pick: picks}
+        return this
+    }
+    omit(omits) {
+        this.#query = {...this.#query, _omit: omits}
+        return this
+    }
+    include(includes) {
+        this.#query = {...this.#query, _includes: includes}
+        return this
+    }
+    async exec() {
+        return (await this.#manager.post('/articles', { '_create': this.#input })).map(decodeArticle)
+    }
+}
+
+class ArticleUpdateManyRequest extends Promise {
+    #manager
+    #input
+    #query
+    constructor(manager, input, query) {
+        super(() => {})
+        this.#manager = manager
+        this.#input = input
+        this.#query = query
+    }
+    pick(picks) {
+        this.#query = {...this.#query, _pick: picks}
+        return this
+    }
+    omit(omits) {
+        this.#query = {...this.#query, _omit: omits}
+        return this
+    }
+    include(includes) {
+        this.#query = {...this.#query, _includes: includes}
+        return this
+    }
+    async exec() {
+        return (await this.#manager.patch('/articles', { '_update': this.#input })).map(decodeArticle)
+    }
+}
+
+class ArticleDeleteManyRequest extends Promise {
+    #manager
+    #query
+    constructor(manager, query) {
+        super(() => {})
+        this.#manager = manager
+        this.#query = query
+    }
+    async exec() {
+        return await this.#manager.delete('/articles', this.#query)
+    }
+}
+
+class ArticleListRequest extends Promise {
+    #manager
+    #query
+    constructor(manager, query) {
+        super(() => {})
+        this.#manager = manager
+        this.#query = query
+    }
+    order(order) {
+        this.#query = {...this.#query, _order: order}
+        return this
+    }
+    skip(skip) {
+        this.#query = {...this.#query, _skip: skip}
+        return this
+    }
+    limt(limit) {
+        this.#query = {...this.#query, _limit: limit}
+        return this
+    }
+    pageSize(pageSize) {
+        this.#query = {...this.#query, _pageSize: pageSize}
+        return this
+    }
+    pageNo(pageNo) {
+        this.#query = {...this.#query, _pageNo: pageNo}
+        return this
+    }
+    pick(picks) {
+        this.#query = {...this.#query, _pick: picks}
+        return this
+    }
+    omit(omits) {
+        this.#query = {...this.#query, _omit: omits}
+        return this
+    }
+    include(includes) {
+        this.#query = {...this.#query, _includes: includes}
+        return this
+    }
+    async exec() {
+        return (await this.#manager.get('/articles', this.#query)).map(decodeArticle)
+    }
+}
+
+class ArticleClient {
+    #manager
+    constructor(manager) {
+        this.#manager = manager
+    }
+    create(input, query) {
+        return new ArticleCreateRequest(this.#manager, input, query)
+    }
+    createMany(input) {
+        return new ArticleCreateManyRequest(this.#manager, input)
+    }
+    id(id, query) {
+        return new ArticleIDRequest(this.#manager, id, query)
+    }
+    update(id, input, query) {
+        return new ArticleUpdateRequest(this.#manager, id, input, query)
+    }
+    updateMany(input) {
+        return new ArticleUpdateManyRequest(this.#manager, input)
+    }
+    upsert(input) {
+        return new ArticleUpsertRequest(this.#manager, input)
+    }
+    find(query) {
+        return new ArticleListRequest(this.#manager, query)
+    }
+    delete(id) {
+        return new ArticleDeleteRequest(this.#manager, id)
+    }
+    deleteMany(query) {
+        return new ArticleDeleteManyRequest(this.#manager, query)
+    }
+}
+
+export class API {
+    #manager
+    #users
+    #articles
+    constructor(config = {}) {
+        this.#manager = new RequestManager(config)
+    }
+    get users() {
+        return this.#users ??= new UserClient(this.#manager)
+    }
+    get articles() {
+        return this.#articles ??= new ArticleClient(this.#manager)
+    }
+    get session() {
+        return SessionManager.share
+    }
+    signOut() {
+        SessionManager.share.clearSession()
+    }
+}
+
+export const api = new API()
@@ -0,0 +1,363 @@
+declare enum Gender {
+    male = 'MALE',
+    female = 'FEMALE',
+}
+
+type Mode = 'default' | 'insensitive'
+
+interface StringContainsQuery {
+    _contains: string
+    _mode?: Mode
+}
+
+interface StringPrefixQuery {
+    _prefix: string
+    _mode?: Mode
+}
+
+interface StringSuffixQuery {
+    _suffix: string
+    _mode?: Mode
+}
+
+interface StringMatchQuery {
+    _match: string
+    _mode?: Mode
+}
+
+interface StringEqQuery {
+    _eq: string
+}
+
+interface StringNeqQuery {
+    _neq: string
+}
+
+interface StringNullQuery {
+    _null: boolean
+}
+
+interface StringCompareQuery {
+    _gt?: string
+    _gte?: string
+    _lt?: string
+    _lte?: string
+}
+
+interface StringOrQuery {
+    _or: StringQuery[]
+}
+
+interface StringAndQuery {
+    _and: StringQuery[]
+}
+
+export type StringQuery = string | StringContainsQuery | StringPrefixQuery | StringSuffixQuery | StringMatchQuery |
+                          StringEqQuery | StringNeqQuery | StringNullQuery | StringCompareQuery | StringOrQuery | StringAndQuery
+
+interface NumberValueQuery {
+    _gt?: number
+    _gte?: number
+    _lt?: number
+    _lte?: number
+}
+
+interface NumberEqQuery {
+    _eq: number
+}
+
+interface NumberNeqQuery {
+    _neq: number
+}
+
+interface NumberNullQuery {
+    _null: boolean
+}
+
+interface NumberOrQuery {
+    _or: NumberQuery[]
+}
+
+interface NumberAndQuery {
+    _and: NumberQuery[]
+}
+
+export type NumberQuery = number | NumberEqQuery | NumberNeqQuery | NumberNullQuery | NumberValueQuery | NumberOrQuery | NumberAndQuery
+
+interface BooleanEqQuery {
+    _eq: boolean
+}
+
+interface BooleanNeqQuery {
+    _neq: boolean
+}
+
+interface BooleanNullQuery {
+    _null: boolean
+}
+
+interface BooleanOrQuery {
+    _or: BooleanQuery[]
+}
+
+interface BooleanAndQuery {
+    _and: BooleanQuery[]
+}
+
+export type BooleanQuery = boolean | BooleanEqQuery | BooleanNeqQuery | BooleanNullQuery | BooleanOrQuery | BooleanAndQuery
+
+interface DateValueQuery {
+    _gt?: Date
+    _gte?: Date
+    _lt?: Date
+    _lte?: Date
+    _on?: Date
+}
+
+interface DateEqQuery {
+    _eq: Date
+}
+
+interface DateNeqQuery {
+    _neq: Date
+}
+
+interface DateNullQuery {
+    _null: boolean
+}
+
+interface DateOrQuery {
+    _or: DateQuery[]
+}
+
+interface DateAndQuery {
+    _and: DateQuery[]
+}
+
+interface DateBeforeQuery {
+    _before: Date
+}
+
+interface DateAfterQuery {
+    _after: Date
+}
+
+export type DateQuery = Date | DateValueQuery | DateEqQuery | DateNeqQuery | DateNullQuery | DateOrQuery | DateAndQuery |
+                        DateBeforeQuery | DateAfterQuery
+
+interface IDQuery {
+    _eq: String
+    _neq: String
+    _null: boolean
+}
+
+interface Link {
+    _add: String
+}
+
+interface UnLink {
+    _del: String
+}
+
+export interface Singer {
+    id: string
+    email: string
+    name: string
+    nickname?: string
+    code?: string
+    phoneNum?: string
+    gender?: Gender
+    age?: number
+    rating?: number
+    verified: boolean
+}
+
+export interface SingerCreateInput {
+    email: string
+    name: string
+    nickname?: string
+    code?: string
+    phoneNum?: string
+    gender?: Gender
+    age?: number
+    rating?: number
+    verified: boolean
+}
+
+export interface SingerUpdateInput {
+    email?: string
+    name?: string
+    nickname?: string | null
+    code?: string | null
+    phoneNum?: string | null
+    gender?: Gender | null
+    age?: number | null
+    rating?: number | null
+    verified?: boolean
+}
+
+type SingerSortOrder = 'email' | '-email' | 'name' | '-name' | 'nickname' | '-nickname' | 'code' | '-code' | 'phoneNum' | '-phoneNum' | 'gender' | '-gender' | 'age' | '-age' | 'rating' | '-rating' | 'verified' | '-verified'
+
+type SingerResultPick = 'id' | 'email' | 'name' | 'nickname' | 'code' | 'phoneNum' | 'gender' | 'age' | 'rating' | 'verified'
+
+interface SingerSingleQuery {
+    _pick?: SingerResultPick[]
+    _omit?: SingerResultPick[]
+}
+
+interface SingerListQuery {
+    id?: StringQuery
+    email?: StringQuery
+    name?: StringQuery
+    nickname?: StringQuery
+    code?: StringQuery
+    phoneNum?: StringQuery
+    gender?: Gender
+    age?: NumberQuery
+    rating?: NumberQuery
+    verified?: BooleanQuery
+    _order?: SingerSortOrder | SingerSortOrder[]
+    _limit?: number
+    _skip?: number
+    _pageNo?: number
+    _pageSize?: number
+    _pick?: SingerResultPick[]
+    _omit?: SingerResultPick[]
+}
+
+interface SingerSeekQuery {
+    id?: StringQuery
+    email?: StringQuery
+    name?: StringQuery
+    nickname?: StringQuery
+    code?: StringQuery
+    phoneNum?: StringQuery
+    gender?: Gender
+    age?: NumberQuery
+    rating?: NumberQuery
+    verified?: BooleanQuery
+}
+
+interface SingerQueryData {
+    _query: SingerSeekQuery
+    _data: SingerUpdateInput
+}
+
+export type ValidationErrors = {[key: string]: string}
+
+export declare class ValidationError extends Error {
+    keypathMessages: ValidationErrors
+    constructor(keypathMessages: ValidationErrors)
+}
+
+export declare function validateSingerCreateInput(input: SingerCreateInput): ValidationErrors | undefined
+
+export declare function validateSingerUpdateInput(input: SingerUpdateInput): ValidationErrors | undefined
+
+export interface APIConfig {
+    baseURL?: string
+}
+
+declare class RequestManager {
+    #private
+    constructor(config?: APIConfig)
+    get headers(): { headers: { Authorization: string } } | undefined
+    qs(val: any): string
+    post<T, U, V>(url: string, input: T, query?: V | undefined): Promise<U>
+    patch<T, U, V>(url: string, input: T, query?: V | undefined): Promise<U>
+    delete<V>(url: string, query?: V | undefined): Promise<void>
+    get<U, V>(url: string, query?: V | undefined): Promise<U>
+}
+
+declare class SingerCreateRequest<T extends Partial<Singer>> extends Promise<T> {
+    #private
+    constructor(manager: RequestManager, input: SingerCreateInput, query?: SingerSingleQuery)
+    pick(picks: SingerResultPick[]): SingerCreateRequest<Pick<T, typeof picks[number]>>
+    omit(omits: SingerResultPick[]): SingerCreateRequest<Omit<T, typeof omits[number]>>
+    exec(): Promise<T>
+}
+
+declare class SingerUpdateRequest<T extends Partial<Singer>> extends Promise<T> {
+    #private
+    constructor(manager: RequestManager, id: string, input: SingerUpdateInput, query?: SingerSingleQuery)
+    pick(picks: SingerResultPick[]): SingerUpdateRequest<Pick<T, typeof picks[number]>>
+    omit(omits: SingerResultPick[]): SingerUpdateRequest<Omit<T, typeof omits[number]>>
+    exec(): Promise<Singer>
+}
+
+declare class SingerDeleteRequest extends Promise<void> {
+    #private
+    constructor(manager: RequestManager, id: string)
+    exec(): Promise<void>
+}
+
+declare class SingerIDRequest<T extends Partial<Singer>> extends Promise<T> {
+    #private
+    constructor(manager: RequestManager, id: string, query?: SingerSingleQuery)
+    pick(picks: SingerResultPick[]): SingerIDRequest<Pick<T, typeof picks[number]>>
+    omit(omits: SingerResultPick[]): SingerIDRequest<Omit<T, typeof omits[number]>>
+    exec(): Promise<Singer>
+}
+
+declare class SingerUpsertRequest<T extends Partial<Singer>> extends Promise<T> {
+    #private
+    constructor(manager: RequestManager, input: SingerQueryData)
+    exec(): Promise<T>
+}
+
+declare class SingerCreateManyRequest<T extends Partial<Singer>> extends Promise<T> {
+    #private
+    constructor(manager: RequestManager, input: SingerCreateInput[], query?: SingerSingleQuery)
+    pick(picks: SingerResultPick[]): SingerCreateManyRequest<Pick<T, typeof picks[number]>>
+    omit(omits: SingerResultPick[]): SingerCreateManyRequest<Omit<T, typeof omits[number]>>
+    exec(): Promise<T[]>
+}
+
+declare class SingerUpdateManyRequest<T extends Partial<Singer>> extends Promise<T> {
+    #private
+    constructor(manager: RequestManager, input: SingerQueryData, query?: SingerSingleQuery)
+    pick(picks: SingerResultPick[]): SingerUpdateManyRequest<Pick<T, typeof picks[number]>>
+    omit(omits: SingerResultPick[]): SingerUpdateManyRequest<Omit<T, typeof omits[number]>>
+    exec(): Promise<Singer>
+}
+
+declare class SingerDeleteManyRequest extends Promise<void> {
+    #private
+    constructor(manager: RequestManager, query?: SingerSeekQuery)
+    exec(): Promise<void>
+}
+
+declare class SingerListRequest<T extends Partial<Singer>> extends Promise<T[]> {
+    #private
+    constructor(manager: RequestManager, query?: SingerListQuery)
+    order(order: SingerSortOrder | SingerSortOrder[]): SingerListRequest<T>
+    skip(skip: number): SingerListRequest<T>
+    limt(limit: number): SingerListRequest<T>
+    pageSize(pageSize: number): SingerListRequest<T>
+    pageNo(pageNo: number): SingerListRequest<T>
+    pick(picks: SingerResultPick[]): SingerListRequest<Pick<T, typeof picks[number]>>
+    omit(omits: SingerResultPick[]): SingerListRequest<Omit<T, typeof omits[number]>>
+    exec(): Promise<Singer[]>
+}
+
+declare class SingerClient {
+    #private
+    constructor(manager: RequestManager)
+    create(input: SingerCreateInput, query?: SingerSingleQuery): SingerCreateRequest<Singer>
+    createMany(input: SingerCreateInput[]): SingerCreateManyRequest<Singer>
+    id(id: string, query?: SingerSingleQuery): SingerIDRequest<Singer>
+    update(id: string, input: SingerUpdateInput, query?: SingerSingleQuery): SingerUpdateRequest<Singer>
+    updateMany(input: SingerQueryData): SingerUpdateManyRequest<Singer>
+    upsert(input: SingerQueryData): SingerUpsertRequest<Singer>
+    find(query?: SingerListQuery): SingerListRequest<Singer>
+    delete(id: string): SingerDeleteRequest
+    deleteMany(query?: SingerSeekQuery): SingerDeleteManyRequest
+}
+
+export declare class API {
+    #private
+    constructor(config?: APIConfig)
+    get singers(): SingerClient
+}
+
+export declare const api: API
@@ -0,0 +1,466 @@
+import axios from 'axios'
+import { stringify } from 'qsparser-js'
+
+const Gender = Object.freeze({
+    male: 'MALE',
+    female: 'FEMALE',
+})
+
+export class ValidationError extends Error {
+    keypathMessages
+    constructor(keypathMessages) {
+        super('Client side validation failed.')
+        this.keypathMessages = keypathMessages
+    }
+}
+
+const emailPattern = /^\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b/
+
+const alnumPattern = new RegExp('^[\\p{L}\\p{N}]+$', 'u')
+
+const genderValues = new Set(Object.values(Gender))
+
+const singerCodePattern = new RegExp("^[A-Z]{3}$")
+
+export function validateSingerCreateInput(input) {
+    let errors
+    if (input.email == null) {
+        (errors ??= {})['email'] = 'value required'
+    } else {
+        if (typeof input.email !== 'string') {
+            (errors ??= {})['email'] = 'value is not str'
+        } else if (!emailPattern.test(input.email)) {
+            (errors ??= {})['email'] = 'value is not email string'
+        }
+    }
+    if (input.name == null) {
+        (errors ??= {})['name'] = 'value required'
+    } else {
+        if (typeof input.name !== 'string') {
+            (errors ??= {})['name'] = 'value is not str'
+        } else if (input.name.length < 2 || input.name.length > 20) {
+            (errors ??= {})['name'] = 'length of value is not between 2 and 20'
+        }
+    }
+    if (input.nickname != null) {
+        if (typeof input.nickname !== 'string') {
+            (errors ??= {})['nickname'] = 'value is not str'
+        }
+    }
+    if (input.code != null) {
+        if (typeof input.code !== 'string') {
+            (errors ??= {})['code'] = 'value is not str'
+        } else if (!singerCodePattern.test(input.code)) {
+            (errors ??= {})['code'] = 'value does not match pattern'
+        }
+    }
+    if (input.phoneNum != null) {
+        if (typeof input.phoneNum !== 'string') {
+            (errors ??= {})['phoneNum'] = 'value is not str'
+        } else if (!alnumPattern.test(input.phoneNum)) {
+            (errors ??= {})['phoneNum'] = 'value is not alnum str'
+        }
+    }
+    if (input.gender != null) {
+        if (!genderValues.has(input.gender)) {
+            (errors ??= {})['gender'] = 'unknown enum value'
+        }
+    }
+    if (input.age != null) {
+        if (!Number.isInteger(input.age)) {
+            (errors ??= {})['age'] = 'value is not int'
+        } else if (input.age < 0) {
+            (errors ??= {})['age'] = 'value is not greater than or equal 0'
+        } else if (input.age > 150) {
+            (errors ??= {})['age'] = 'value is not less than or equal 150'
+        }
+    }
+    if (input.rating != null) {
+        if (typeof input.rating !== 'number') {
+            (errors ??= {})['rating'] = 'value is not float'
+        } else if (input.rating < 0) {
+            (errors ??= {})['rating'] = 'value is not greater than or equal 0'
+        } else if (input.rating > 5) {
+            (errors ??= {})['rating'] = 'value is not less than or equal 5'
+        }
+    }
+    if (input.verified != null) {
+        if (typeof input.verified !== 'boolean') {
+            (errors ??= {})['verified'] = 'value is not bool'
+        }
+    }
+    return errors
+}
+
+export function validateSingerUpdateInput(input) {
+    let errors
+    if (input.email === null) {
+        (errors ??= {})['email'] = 'value required'
+    } else if (input.email !== undefined) {
+        if (typeof input.email !== 'string') {
+            (errors ??= {})['email'] = 'value is not str'
+        } else if (!emailPattern.test(input.email)) {
+            (errors ??= {})['email'] = 'value is not email string'
+        }
+    }
+    if (input.name === null) {
+        (errors ??= {})['name'] = 'value required'
+    } else if (input.name !== undefined) {
+        if (typeof input.name !== 'string') {
+            (errors ??= {})['name'] = 'value is not str'
+        } else if (input.name.length < 2 || input.name.length > 20) {
+            (errors ??= {})['name'] = 'length of value is not between 2 and 20'
+        }
+    }
+    if (input.nickname != null) {
+        if (typeof input.nickname !== 'string') {
+            (errors ??= {})['nickname'] = 'value is not str'
+        }
+    }
+    if (input.code != null) {
+        if (typeof input.code !== 'string') {
+            (errors ??= {})['code'] = 'value is not str'
+        } else if (!singerCodePattern.test(input.code)) {
+            (errors ??= {})['code'] = 'value does not match pattern'
+        }
+    }
+    if (input.phoneNum != null) {
+        if (typeof input.phoneNum !== 'string') {
+            (errors ??= {})['phoneNum'] = 'value is not str'
+        } else if (!alnumPattern.test(input.phoneNum)) {
+            (errors ??= {})['phoneNum'] = 'value is not alnum str'
+        }
+    }
+    if (input.gender != null) {
+        if (!genderValues.has(input.gender)) {
+            (errors ??= {})['gender'] = 'unknown enum value'
+        }
+    }
+    if (input.age != null) {
+        if (!Number.isInteger(input.age)) {
+            (errors ??= {})['age'] = 'value is not int'
+        } else if (input.age < 0) {
+            (errors ??= {})['age'] = 'value is not greater than or equal 0'
+        } else if (input.age > 150) {
+            (errors ??= {})['age'] = 'value is not less than or equal 150'
+        }
+    }
+    if (input.rating != null) {
+        if (typeof input.rating !== 'number') {
+            (errors ??= {})['rating'] = 'value is not float'
+        } else if (input.rating < 0) {
+            (errors ??= {})['rating'] = 'value is not greater than or equal 0'
+        } else if (input.rating > 5) {
+            (errors ??= {})['rating'] = 'value is not less than or equal 5'
+        }
+    }
+    if (input.verified === null) {
+        (errors ??= {})['verified'] = 'value required'
+    } else if (input.verified !== undefined) {
+        if (typeof input.verified !== 'boolean') {
+            (errors ??= {})['verified'] = 'value is not bool'
+        }
+    }
+    return errors
+}
+
+class RequestManager {
+    #baseURL
+    constructor(config = {}) {
+        this.#baseURL = config.baseURL ?? "None"
+    }
+    get headers() {
+        return undefined
+    }
+    qs(val) {
+        if (!val) {
+            return ''
+        }
+        if (Object.keys(val).length === 0) {
+            return ''
+        }
+        return '?' + stringify(val)
+    }
+    async post(url, input, query = undefined) {
+        const response = await axios.post(this.#baseURL + url + this.qs(query), input, this.headers)
+        return response.data.data
+    }
+    async patch(url, input, query = undefined) {
+        const response = await axios.patch(this.#baseURL + url + this.qs(query), input, this.headers)
+        return response.data.data
+    }
+    async delete(url, query = undefined) {
+        await axios.delete(this.#baseURL + url + this.qs(query), this.headers)
+        return
+    }
+    async get(url, query = undefined) {
+        const response = await axios.get(this.#baseURL + url + this.qs(query), this.headers)
+        return response.data.data
+    }
+}
+
+class SingerCreateRequest extends Promise {
+    #manager
+    #input
+    #query
+    constructor(manager, input, query) {
+        super(() => {})
+        this.#manager = manager
+        this.#input = input
+        this.#query = query
+    }
+    pick(picks) {
+        this.#query = {...this.#query, _pick: picks}
+        return this
+    }
+    omit(omits) {
+        this.#query = {...this.#query, _omit: omits}
+        return this
+    }
+    async exec() {
+        const errors = validateSingerCreateInput(this.#input)
+        if (errors) {
+            throw new ValidationError(errors)
+        }
+        return await this.#manager.post('/singers', this.#input, this.#query)
+    }
+}
+
+class SingerUpdateRequest extends Promise {
+    #manager
+    #id
+    #input
+    #query
+    constructor(manager, id, input, query) {
+        super(() => {})
+        this.#manager = manager
+        this.#id = id
+        this.#input = input
+        this.#query = query
+    }
+    pick(picks) {
+        this.#query = {...this.#query, _pick: picks}
+        return this
+    }
+    omit(omits) {
+        this.#query = {...this.#query, _omit: omits}
+        return this
+    }
+    async exec() {
+        const errors = validateSingerUpdateInput(this.#input)
+        if (errors) {
+            throw new ValidationError(errors)
+        }
+        return await this.#manager.patch(`/singers/${this.#id}`, this.#input, this.#query)
+    }
+}
+
+class SingerDeleteRequest extends Promise {
+    #manager
+    #id
+    constructor(manager, id) {
+        super(() => {})
+        this.#manager = manager
+        this.#id = id
+    }
+    async exec() {
+        return await this.#manager.delete(`/singers/${this.#id}`)
+    }
+}
+
+class SingerIDRequest extends Promise {
+    #manager
+    #id
+    #query
+    constructor(manager, id, query) {
+        super(() => {})
+        this.#manager = manager
+        this.#id = id
+        this.#query = query
+    }
+    pick(picks) {
+        this.#query = {...this.#query, _pick: picks}
+        return this
+    }
+    omit(omits) {
+        this.#query = {...this.#query, _omit: omits}
+        return this
+    }
+    async exec() {
+        return await this.#manager.get(`/singers/${this.#id}`, this.#query)
+    }
+}
+
+class SingerUpsertRequest extends Promise {
+    #manager
+    #input
+    constructor(manager, input) {
+        super(() => {})
+        this.#manager = manager
+        this.#input = input
+    }
+    async exec() {
+        const errors = validateSingerUpdateInput(this.#input._data)
+        if (errors) {
+            throw new ValidationError(errors)
+        }
+        return await this.#manager.post('/singers', { '_upsert': this.#input })
+    }
+}
+
+class SingerCreateManyRequest extends Promise {
+    #manager
+    #input
+    #query
+    constructor(manager, input, query) {
+        super(() => {})
+        this.#manager = manager
+        this.#input = input
+        this.#query = query
+    }
+    pick(picks) {
+        this.#query = {...this.#query, _pick: picks}
+        return this
+    }
+    omit(omits) {
+        this.#query = {...this.#query, _omit: omits}
+        return this
+    }
+    async exec() {
+        for (const input of this.#input) {
+            const errors = validateSingerCreateInput(input)
+            if (errors) {
+                throw new ValidationError(errors)
+            }
+        }
+        return await this.#manager.post('/singers', { '_create': this.#input })
+    }
+}
+
+class SingerUpdateManyRequest extends Promise {
+    #manager
+    #input
+    #query
+    constructor(manager, input, query) {
+        super(() => {})
+        this.#manager = manager
+        this.#input = input
+        this.#query = query
+    }
+    pick(picks) {
+        this.#query = {...this.#query, _pick: picks}
+        return this
+    }
+    omit(omits) {
+        this.#query = {...this.#query, _omit: omits}
+        return this
+    }
+    async exec() {
+        const errors = validateSingerUpdateInput(this.#input._data)
+        if (errors) {
+            throw new ValidationError(errors)
+        }
+        return await this.#manager.patch('/singers', { '_update': this.#input })
+    }
+}
+
+class SingerDeleteManyRequest extends Promise {
+    #manager
+    #query
+    constructor(manager, query) {
+        super(() => {})
+        this.#manager = manager
+        this.#query = query
+    }
+    async exec() {
+        return await this.#manager.delete('/singers', this.#query)
+    }
+}
+
+class SingerListRequest extends Promise {
+    #manager
+    #query
+    constructor(manager, query) {
+        super(() => {})
+        this.#manager = manager
+        this.#query = query
+    }
+    order(order) {
+        this.#query = {...this.#query, _order: order}
+        return this
+    }
+    skip(skip) {
+        this.#query = {...this.#query, _skip: skip}
+        return this
+    }
+    limt(limit) {
+        this.#query = {...this.#query, _limit: limit}
+        return this
+    }
+    pageSize(pageSize) {
+        this.#query = {...this.#query, _pageSize: pageSize}
+        return this
+    }
+    pageNo(pageNo) {
+        this.#query = {...this.#query, _pageNo: pageNo}
+        return this
+    }
+    pick(picks) {
+        this.#query = {...this.#query, _pick: picks}
+        return this
+    }
+    omit(omits) {
+        this.#query = {...this.#query, _omit: omits}
+        return this
+    }
+    async exec() {
+        return await this.#manager.get('/singers', this.#query)
+    }
+}
+
+class SingerClient {
+    #manager
+    constructor(manager) {
+        this.#manager = manager
+    }
+    create(input, query) {
+        return new SingerCreateRequest(this.#manager, input, query)
+    }
+    createMany(input) {
+        return new SingerCreateManyRequest(this.#manager, input)
+    }
+    id(id, query) {
+        return new SingerIDRequest(this.#manager, id, query)
+    }
+    update(id, input, query) {
+        return new SingerUpdateRequest(this.#manager, id, input, query)
+    }
+    updateMany(input) {
+        return new SingerUpdateManyRequest(this.#manager, input)
+    }
+    upsert(input) {
+        return new SingerUpsertRequest(this.#manager, input)
+    }
+    find(query) {
+        return new SingerListRequest(this.#manager, query)
+    }
+    delete(id) {
+        return new SingerDeleteRequest(this.#manager, id)
+    }
+    deleteMany(query) {
+        return new SingerDeleteManyRequest(this.#manager, query)
+    }
+}
+
+export class API {
+    #manager
+    #singers
+    constructor(config = {}) {
+        this.#manager = new RequestManager(config)
+    }
+    get singers() {
+        return this.#singers ??= new SingerClient(this.#manager)
+    }
+}
+
+export const api = new API()
@@ -0,0 +1,22 @@
+plugins {
+    kotlin("jvm") version "1.9.22"
+    kotlin("plugin.serialization") version "1.9.22"
+    `java-library`
+}
+
+group = "api"
+version = "1.0.0"
+
+repositories {
+    mavenCentral()
+}
+
+dependencies {
+    api("org.jetbrains.kotlinx:kotlinx-coroutines-core:1.8.0")
+    api("org.jetbrains.kotlinx:kotlinx-serialization-json:1.6.3")
+    api("com.squareup.okhttp3:okhttp:4.12.0")
+}
+
+kotlin {
+    jvmToolchain(17)
+}
@@ -0,0 +1,1042 @@
+@file:OptIn(ExperimentalSerializationApi::class)
+@file:UseSerializers(InstantSerializer::class)
+
+package api
+
+import java.io.File
+import java.io.IOException
+import java.net.URLEncoder
+import java.time.Instant
+import java.util.concurrent.TimeUnit
+import kotlin.coroutines.resume
+import kotlin.coroutines.resumeWithException
+import kotlinx.coroutines.flow.Flow
+import kotlinx.coroutines.flow.flow
+import kotlinx.coroutines.suspendCancellableCoroutine
+import kotlinx.serialization.ExperimentalSerializationApi
+import kotlinx.serialization.KSerializer
+import kotlinx.serialization.SerialName
+import kotlinx.serialization.Serializable
+import kotlinx.serialization.SerializationStrategy
+import kotlinx.serialization.UseSerializers
+import kotlinx.serialization.builtins.ListSerializer
+import kotlinx.serialization.descriptors.PrimitiveKind
+import kotlinx.serialization.descriptors.PrimitiveSerialDescriptor
+import kotlinx.serialization.descriptors.SerialDescriptor
+import kotlinx.serialization.encoding.Decoder
+import kotlinx.serialization.encoding.Encoder
+import kotlinx.serialization.json.Json
+import kotlinx.serialization.json.JsonArray
+import kotlinx.serialization.json.JsonElement
+import kotlinx.serialization.json.JsonObject
+import kotlinx.serialization.json.JsonPrimitive
+import kotlinx.serialization.json.buildJsonObject
+import okhttp3.Call
+import okhttp3.Callback
+import okhttp3.ConnectionPool
+import okhttp3.Dispatcher
+import okhttp3.HttpUrl.Companion.toHttpUrl
+import okhttp3.MediaType.Companion.toMediaType
+import okhttp3.OkHttpClient
+import okhttp3.Request
+import okhttp3.RequestBody.Companion.toRequestBody
+
+object InstantSerializer : KSerializer<Instant> {
+
+    override val descriptor: SerialDescriptor = PrimitiveSerialDescriptor("Instant", PrimitiveKind.STRING)
+
+    override fun serialize(encoder: Encoder, value: Instant) = encoder.encodeString(value.toString())
+
+    override fun deserialize(decoder: Decoder): Instant = Instant.parse(decoder.decodeString())
+}
+
+@Serializable
+enum class Mode {
+    @SerialName("default") DEFAULT,
+    @SerialName("insensitive") INSENSITIVE,
+}
+
+@Serializable
+data class StringQuery(
+    @SerialName("_eq") val eq: String? = null,
+    @SerialName("_neq") val neq: String? = null,
+    @SerialName("_null") val isNull: Boolean? = null,
+    @SerialName("_gt") val gt: String? = null,
+    @SerialName("_gte") val gte: String? = null,
+    @SerialName("_lt") val lt: String? = null,
+    @SerialName("_lte") val lte: String? = null,
+    @SerialName("_contains") val contains: String? = null,
+    @SerialName("_prefix") val prefix: String? = null,
+    @SerialName("_suffix") val suffix: String? = null,
+    @SerialName("_match") val match: String? = null,
+    @SerialName("_mode") val mode: Mode? = null,
+    @SerialName("_or") val or: List<StringQuery>? = null,
+    @SerialName("_and") val and: List<StringQuery>? = null,
+)
+
+@Serializable
+data class IntQuery(
+    @SerialName("_eq") val eq: Int? = null,
+    @SerialName("_neq") val neq: Int? = null,
+    @SerialName("_null") val isNull: Boolean? = null,
+    @SerialName("_gt") val gt: Int? = null,
+    @SerialName("_gte") val gte: Int? = null,
+    @SerialName("_lt") val lt: Int? = null,
+    @SerialName("_lte") val lte: Int? = null,
+    @SerialName("_or") val or: List<IntQuery>? = null,
+    @SerialName("_and") val and: List<IntQuery>? = null,
+)
+
+@Serializable
+data class FloatQuery(
+    @SerialName("_eq") val eq: Double? = null,
+    @SerialName("_neq") val neq: Double? = null,
+    @SerialName("_null") val isNull: Boolean? = null,
+    @SerialName("_gt") val gt: Double? = null,
+    @SerialName("_gte") val gte: Double? = null,
+    @SerialName("_lt") val lt: Double? = null,
+    @SerialName("_lte") val lte: Double? = null,
+    @SerialName("_or") val or: List<FloatQuery>? = null,
+    @SerialName("_and") val and: List<FloatQuery>? = null,
+)
+
+@Serializable
+data class BoolQuery(
+    @SerialName("_eq") val eq: Boolean? = null,
+    @SerialName("_neq") val neq: Boolean? = null,
+    @SerialName("_null") val isNull: Boolean? = null,
+    @SerialName("_or") val or: List<BoolQuery>? = null,
+    @SerialName("_and") val and: List<BoolQuery>? = null,
+)
+
+@Serializable
+data class DateQuery(
+    @SerialName("_eq") val eq: Instant? = null,
+    @SerialName("_neq") val neq: Instant? = null,
+    @SerialName("_null") val isNull: Boolean? = null,
+    @SerialName("_gt") val gt: Instant? = null,
+    @SerialName("_gte") val gte: Instant? = null,
+    @SerialName("_lt") val lt: Instant? = null,
+    @SerialName("_lte") val lte: Instant? = null,
+    @SerialName("_or") val or: List<DateQuery>? = null,
+    @SerialName("_and") val and: List<DateQuery>? = null,
+)
+
+@Serializable
+data class IDQuery(
+    @SerialName("_eq") val eq: String? = null,
+    @SerialName("_neq") val neq: String? = null,
+    @SerialName("_null") val isNull: Boolean? = null,
+)
+
+@Serializable
+data class LinkAction(
+    @SerialName("_add") val add: String? = null,
+    @SerialName("_del") val del: String? = null,
+)
+
+@Serializable(with = CreateOrLinkSerializer::class)
+sealed class CreateOrLink<out T> {
+    data class Create<T>(val input: T) : CreateOrLink<T>()
+    data class Link(val id: String) : CreateOrLink<Nothing>()
+}
+
+@Serializable(with = UpdateOrLinkSerializer::class)
+sealed class UpdateOrLink<out T> {
+    data class Update<T>(val input: T) : UpdateOrLink<T>()
+    data class Link(val id: String) : UpdateOrLink<Nothing>()
+    data class Unlink(val id: String) : UpdateOrLink<Nothing>()
+}
+
+class CreateOrLinkSerializer<T>(private val inputSerializer: KSerializer<T>) : KSerializer<CreateOrLink<T>> {
+
+    override val descriptor: SerialDescriptor = inputSerializer.descriptor
+
+    override fun serialize(encoder: Encoder, value: CreateOrLink<T>) = when (value) {
+        is CreateOrLink.Create -> encoder.encodeSerializableValue(inputSerializer, value.input)
+        is CreateOrLink.Link -> encoder.encodeSerializableValue(LinkAction.serializer(), LinkAction(add = value.id))
+    }
+
+    override fun deserialize(decoder: Decoder): CreateOrLink<T> =
+        CreateOrLink.Create(decoder.decodeSerializableValue(inputSerializer))
+}
+
+class UpdateOrLinkSerializer<T>(private val inputSerializer: KSerializer<T>) : KSerializer<UpdateOrLink<T>> {
+
+    override val descriptor: SerialDescriptor = inputSerializer.descriptor
+
+    override fun serialize(encoder: Encoder, value: UpdateOrLink<T>) = when (value) {
+        is UpdateOrLink.Update -> encoder.encodeSerializableValue(inputSerializer, value.input)
+        is UpdateOrLink.Link -> encoder.encodeSerializableValue(LinkAction.serializer(), LinkAction(add = value.id))
+        is UpdateOrLink.Unlink -> encoder.encodeSerializableValue(LinkAction.serializer(), LinkAction(del = value.id))
+    }
+
+    override fun deserialize(decoder: Decoder): UpdateOrLink<T> =
+        UpdateOrLink.Update(decoder.decodeSerializableValue(inputSerializer))
+}
+
+@Serializable
+class Response<T>(val data: T)
+
+class RequestException(val status: Int, val body: String) : IOException("request failed with status $status")
+
+internal fun <T> include(name: String, serializer: SerializationStrategy<T>, query: T?): JsonElement =
+    if (query == null) JsonPrimitive(name) else buildJsonObject { put(name, RequestManager.encode(serializer, query)) }
+
+@Serializable
+data class UserCreateInput(
+    val username: String,
+    val password: String,
+    val phoneNum: String? = null,
+    val articles: List<CreateOrLink<ArticleCreateInput>>? = null,
+)
+
+@Serializable
+data class UserUpdateInput(
+    val username: String? = null,
+    val password: String? = null,
+    val phoneNum: String? = null,
+    val articles: List<UpdateOrLink<ArticleUpdateInput>>? = null,
+)
+
+@Serializable
+enum class UserSortOrder {
+    @SerialName("username") USERNAME,
+    @SerialName("-username") USERNAME_DESC,
+    @SerialName("phoneNum") PHONE_NUM,
+    @SerialName("-phoneNum") PHONE_NUM_DESC;
+
+    operator fun unaryMinus(): UserSortOrder = when (this) {
+        USERNAME -> USERNAME_DESC
+        USERNAME_DESC -> USERNAME
+        PHONE_NUM -> PHONE_NUM_DESC
+        PHONE_NUM_DESC -> PHONE_NUM
+    }
+}
+
+@Serializable
+enum class UserResultPick {
+    @SerialName("id") ID,
+    @SerialName("username") USERNAME,
+    @SerialName("phoneNum") PHONE_NUM,
+    @SerialName("articles") ARTICLES,
+}
+
+@Serializable
+data class UserSingleQuery(
+    val _pick: List<UserResultPick>? = null,
+    val _omit: List<UserResultPick>? = null,
+    val _includes: List<JsonElement>? = null,
+) {
+    fun pick(vararg picks: UserResultPick): UserSingleQuery = copy(_pick = picks.toList())
+    fun omit(vararg omits: UserResultPick): UserSingleQuery = copy(_omit = omits.toList())
+    fun includeArticles(query: ArticleListQuery? = null): UserSingleQuery =
+        copy(_includes = _includes.orEmpty() + include("articles", ArticleListQuery.serializer(), query))
+}
+
+@Serializable
+data class UserSeekQuery(
+    val id: StringQuery? = null,
+    val username: StringQuery? = null,
+    val phoneNum: StringQuery? = null,
+)
+
+@Serializable
+data class UserQueryData(
+    val _query: UserSeekQuery,
+    val _data: UserUpdateInput,
+)
+
+@Serializable
+data class UserListQuery(
+    val id: StringQuery? = null,
+    val username: StringQuery? = null,
+    val phoneNum: StringQuery? = null,
+    val _order: List<UserSortOrder>? = null,
+    val _limit: Int? = null,
+    val _skip: Int? = null,
+    val _pageNo: Int? = null,
+    val _pageSize: Int? = null,
+    val _pick: List<UserResultPick>? = null,
+    val _omit: List<UserResultPick>? = null,
+    val _includes: List<JsonElement>? = null,
+) {
+    fun order(vararg orders: UserSortOrder): UserListQuery = copy(_order = _order.orEmpty() + orders)
+    fun limit(limit: Int): UserListQuery = copy(_limit = limit)
+    fun skip(skip: Int): UserListQuery = copy(_skip = skip)
+    fun pageNo(pageNo: Int): UserListQuery = copy(_pageNo = pageNo)
+    fun pageSize(pageSize: Int): UserListQuery = copy(_pageSize = pageSize)
+    fun pick(vararg picks: UserResultPick): UserListQuery = copy(_pick = picks.toList())
+    fun omit(vararg omits: UserResultPick): UserListQuery = copy(_omit = omits.toList())
+    fun includeArticles(query: ArticleListQuery? = null): UserListQuery =
+        copy(_includes = _includes.orEmpty() + include("articles", ArticleListQuery.serializer(), query))
+}
+
+@Serializable
+data class User(
+    val id: String? = null,
+    val username: String? = null,
+    val phoneNum: String? = null,
+    val articles: List<Article>? = null,
+)
+
+@Serializable
+data class ArticleCreateInput(
+    val title: String,
+    val content: String? = null,
+    val users: List<CreateOrLink<UserCreateInput>>? = null,
+)
+
+@Serializable
+data class ArticleUpdateInput(
+    val title: String? = null,
+    val content: String? = null,
+    val users: List<UpdateOrLink<UserUpdateInput>>? = null,
+)
+
+@Serializable
+enum class ArticleSortOrder {
+    @SerialName("title") TITLE,
+    @SerialName("-title") TITLE_DESC,
+    @SerialName("content") CONTENT,
+    @SerialName("-content") CONTENT_DESC;
+
+    operator fun unaryMinus(): ArticleSortOrder = when (this) {
+        TITLE -> TITLE_DESC
+        TITLE_DESC -> TITLE
+        CONTENT -> CONTENT_DESC
+        CONTENT_DESC -> CONTENT
+    }
+}
+
+@Serializable
+enum class ArticleResultPick {
+    @SerialName("id") ID,
+    @SerialName("title") TITLE,
+    @SerialName("content") CONTENT,
+    @SerialName("users") USERS,
+}
+
+@Serializable
+data class ArticleSingleQuery(
+    val _pick: List<ArticleResultPick>? = null,
+    val _omit: List<ArticleResultPick>? = null,
+    val _includes: List<JsonElement>? = null,
+) {
+    fun pick(vararg picks: ArticleResultPick): ArticleSingleQuery = copy(_pick = picks.toList())
+    fun omit(vararg omits: ArticleResultPick): ArticleSingleQuery = copy(_omit = omits.toList())
+    fun includeUsers(query: UserListQuery? = null): ArticleSingleQuery =
+        copy(_includes = _includes.orEmpty() + include("users", UserListQuery.serializer(), query))
+}
+
+@Serializable
+data class ArticleSeekQuery(
+    val id: StringQuery? = null,
+    val title: StringQuery? = null,
+    val content: StringQuery? = null,
+)
+
+@Serializable
+data class ArticleQueryData(
+    val _query: ArticleSeekQuery,
+    val _data: ArticleUpdateInput,
+)
+
+@Serializable
+data class ArticleListQuery(
+    val id: StringQuery? = null,
+    val title: StringQuery? = null,
+    val content: StringQuery? = null,
+    val _order: List<ArticleSortOrder>? = null,
+    val _limit: Int? = null,
+    val _skip: Int? = null,
+    val _pageNo: Int? = null,
+    val _pageSize: Int? = null,
+    val _pick: List<ArticleResultPick>? = null,
+    val _omit: List<ArticleResultPick>? = null,
+    val _includes: List<JsonElement>? = null,
+) {
+    fun order(vararg orders: ArticleSortOrder): ArticleListQuery = copy(_order = _order.orEmpty() + orders)
+    fun limit(limit: Int): ArticleListQuery = copy(_limit = limit)
+    fun skip(skip: Int): ArticleListQuery = copy(_skip = skip)
+    fun pageNo(pageNo: Int): ArticleListQuery = copy(_pageNo = pageNo)
+    fun pageSize(pageSize: Int): ArticleListQuery = copy(_pageSize = pageSize)
+    fun pick(vararg picks: ArticleResultPick): ArticleListQuery = copy(_pick = picks.toList())
+    fun omit(vararg omits: ArticleResultPick): ArticleListQuery = copy(_omit = omits.toList())
+    fun includeUsers(query: UserListQuery? = null): ArticleListQuery =
+        copy(_includes = _includes.orEmpty() + include("users", UserListQuery.serializer(), query))
+}
+
+@Serializable
+data class Article(
+    val id: String? = null,
+    val title: String? = null,
+    val content: String? = null,
+    val users: List<User>? = null,
+)
+
+@Serializable
+data class UserSessionInput(
+    val username: String,
+    val password: String,
+)
+
+@Serializable
+data class Session(
+    val token: String,
+    val user: User,
+)
+
+interface SessionStorage {
+    fun load(): String?
+    fun save(value: String?)
+}
+
+class MemorySessionStorage : SessionStorage {
+
+    @Volatile
+    private var value: String? = null
+
+    override fun load(): String? = value
+
+    override fun save(value: String?) {
+        this.value = value
+    }
+}
+
+class FileSessionStorage(private val file: File) : SessionStorage {
+
+    override fun load(): String? = if (file.exists()) file.readText() else null
+
+    override fun save(value: String?) {
+        if (value == null) {
+            file.delete()
+        } else {
+            file.writeText(value)
+        }
+    }
+}
+
+object SessionManager {
+
+    private var storage: SessionStorage = MemorySessionStorage()
+    private var loaded = false
+    private var cachedSession: Session? = null
+    private var cachedAuthorization: String? = null
+
+    var session: Session?
+        @Synchronized get() {
+            loadIfNeeded()
+            return cachedSession
+        }
+        @Synchronized internal set(value) {
+            loaded = true
+            cache(value)
+            storage.save(value?.let { RequestManager.json.encodeToString(Session.serializer(), it) })
+        }
+
+    internal val authorization: String?
+        @Synchronized get() {
+            loadIfNeeded()
+            return cachedAuthorization
+        }
+
+    @Synchronized
+    fun use(storage: SessionStorage) {
+        this.storage = storage
+        loaded = false
+    }
+
+    private fun loadIfNeeded() {
+        if (loaded) {
+            return
+        }
+        loaded = true
+        val content = storage.load()
+        cache(content?.let { runCatching { RequestManager.json.decodeFromString(Session.serializer(), it) }.getOrNull() })
+    }
+
+    private fun cache(session: Session?) {
+        cachedSession = session
+        cachedAuthorization = session?.let { "Bearer ${it.token}" }
+    }
+}
+
+fun signOut() {
+    SessionManager.session = null
+}
+
+object RequestManager {
+
+    var baseUrl: String = "None"
+
+    internal val json = Json {
+        ignoreUnknownKeys = true
+        explicitNulls = false
+    }
+
+    private val mediaType = "application/json; charset=utf-8".toMediaType()
+
+    private val client = OkHttpClient.Builder()
+        .connectionPool(ConnectionPool(8, 5, TimeUnit.MINUTES))
+        .dispatcher(Dispatcher().apply { maxRequestsPerHost = 8 })
+        .build()
+
+    internal fun <T> encode(serializer: SerializationStrategy<T>, value: T): JsonElement =
+        json.encodeToJsonElement(serializer, value)
+
+    internal suspend fun <T> get(url: String, query: JsonElement?, serializer: KSerializer<T>): T =
+        decode(send("GET", url, null, query), serializer)
+
+    internal suspend fun <T> post(url: String, input: JsonElement, query: JsonElement?, serializer: KSerializer<T>): T =
+        decode(send("POST", url, input, query), serializer)
+
+    internal suspend fun <T> patch(url: String, input: JsonElement, query: JsonElement?, serializer: KSerializer<T>): T =
+        decode(send("PATCH", url, input, query), serializer)
+
+    internal suspend fun delete(url: String, query: JsonElement? = null) {
+        send("DELETE", url, null, query)
+    }
+
+    private fun <T> decode(content: String, serializer: KSerializer<T>): T =
+        json.decodeFromString(Response.serializer(serializer), content).data
+
+    private suspend fun send(method: String, url: String, input: JsonElement?, query: JsonElement?): String {
+        val body = input?.let { json.encodeToString(JsonElement.serializer(), it).toRequestBody(mediaType) }
+        val builder = Request.Builder()
+            .url((baseUrl + url + qs(query)).toHttpUrl())
+            .method(method, body)
+        SessionManager.authorization?.let { builder.header("Authorization", it) }
+        return client.newCall(builder.build()).await().use { response ->
+            val content = response.body?.string() ?: ""
+            if (!response.isSuccessful) {
+                throw RequestException(response.code, content)
+            }
+            content
+        }
+    }
+
+    private fun qs(query: JsonElement?): String {
+        val items = mutableListOf<String>()
+        if (query is JsonObject) {
+            query.forEach { (key, value) -> flatten(key, value, items) }
+        }
+        return if (items.isEmpty()) "" else "?" + items.joinToString("&")
+    }
+
+    private fun flatten(key: String, value: JsonElement, items: MutableList<String>) {
+        when (value) {
+            is JsonObject -> value.forEach { (k, v) -> flatten("$key[$k]", v, items) }
+            is JsonArray -> value.forEachIndexed { index, v -> flatten("$key[$index]", v, items) }
+            is JsonPrimitive -> items.add(key + "=" + URLEncoder.encode(value.content, Charsets.UTF_8).replace("+", "%20"))
+        }
+    }
+}
+
+private suspend fun Call.await(): okhttp3.Response = suspendCancellableCoroutine { continuation ->
+    continuation.invokeOnCancellation { cancel() }
+    enqueue(object : Callback {
+        override fun onResponse(call: Call, response: okhttp3.Response) {
+            continuation.resume(response)
+        }
+
+        override fun onFailure(call: Call, e: IOException) {
+            continuation.resumeWithException(e)
+        }
+    })
+}
+
+class UserCreateRequest internal constructor(
+    private val input: UserCreateInput,
+    private var query: UserSingleQuery = UserSingleQuery(),
+) {
+    fun pick(vararg picks: UserResultPick): UserCreateRequest = apply { query = query.pick(*picks) }
+    fun omit(vararg omits: UserResultPick): UserCreateRequest = apply { query = query.omit(*omits) }
+    fun includeArticles(query: ArticleListQuery? = null): UserCreateRequest =
+        apply { this.query = this.query.includeArticles(query) }
+
+    suspend fun exec(): User = with(RequestManager) {
+        post(
+            "/users",
+            encode(UserCreateInput.serializer(), input),
+            encode(UserSingleQuery.serializer(), query),
+            User.serializer(),
+        )
+    }
+}
+
+class UserUpdateRequest internal constructor(
+    private val id: String,
+    private val input: UserUpdateInput,
+    private var query: UserSingleQuery = UserSingleQuery(),
+) {
+    fun pick(vararg picks: UserResultPick): UserUpdateRequest = apply { query = query.pick(*picks) }
+    fun omit(vararg omits: UserResultPick): UserUpdateRequest = apply { query = query.omit(*omits) }
+    fun includeArticles(query: ArticleListQuery? = null): UserUpdateRequest =
+        apply { this.query = this.query.includeArticles(query) }
+
+    suspend fun exec(): User = with(RequestManager) {
+        patch(
+            "/users/$id",
+            encode(UserUpdateInput.serializer(), input),
+            encode(UserSingleQuery.serializer(), query),
+            User.serializer(),
+        )
+    }
+}
+
+class UserDeleteRequest internal constructor(
+    private val id: String,
+) {
+    suspend fun exec() = with(RequestManager) {
+        delete(
+            "/users/$id",
+        )
+    }
+}
+
+class UserIDRequest internal constructor(
+    private val id: String,
+    private var query: UserSingleQuery = UserSingleQuery(),
+) {
+    fun pick(vararg picks: UserResultPick): UserIDRequest = apply { query = query.pick(*picks) }
+    fun omit(vararg omits: UserResultPick): UserIDRequest = apply { query = query.omit(*omits) }
+    fun includeArticles(query: ArticleListQuery? = null): UserIDRequest =
+        apply { this.query = this.query.includeArticles(query) }
+
+    suspend fun exec(): User = with(RequestManager) {
+        get(
+            "/users/$id",
+            encode(UserSingleQuery.serializer(), query),
+            User.serializer(),
+        )
+    }
+}
+
+class UserUpsertRequest internal constructor(
+    private val input: UserQueryData,
+    private var query: UserSingleQuery = UserSingleQuery(),
+) {
+    fun pick(vararg picks: UserResultPick): UserUpsertRequest = apply { query = query.pick(*picks) }
+    fun omit(vararg omits: UserResultPick): UserUpsertRequest = apply { query = query.omit(*omits) }
+    fun includeArticles(query: ArticleListQuery? = null): UserUpsertRequest =
+        apply { this.query = this.query.includeArticles(query) }
+
+    suspend fun exec(): User = with(RequestManager) {
+        post(
+            "/users",
+            buildJsonObject { put("_upsert", encode(UserQueryData.serializer(), input)) },
+            encode(UserSingleQuery.serializer(), query),
+            User.serializer(),
+        )
+    }
+}
+
+class UserCreateManyRequest internal constructor(
+    private val input: List<UserCreateInput>,
+    private var query: UserSingleQuery = UserSingleQuery(),
+) {
+    fun pick(vararg picks: UserResultPick): UserCreateManyRequest = apply { query = query.pick(*picks) }
+    fun omit(vararg omits: UserResultPick): UserCreateManyRequest = apply { query = query.omit(*omits) }
+    fun includeArticles(query: ArticleListQuery? = null): UserCreateManyRequest =
+        apply { this.query = this.query.includeArticles(query) }
+
+    suspend fun exec(): List<User> = with(RequestManager) {
+        post(
+            "/users",
+            buildJsonObject { put("_create", encode(ListSerializer(UserCreateInput.serializer()), input)) },
+            encode(UserSingleQuery.serializer(), query),
+            ListSerializer(User.serializer()),
+        )
+    }
+}
+
+class UserUpdateManyRequest internal constructor(
+    private val input: UserQueryData,
+    private var query: UserSingleQuery = UserSingleQuery(),
+) {
+    fun pick(vararg picks: UserResultPick): UserUpdateManyRequest = apply { query = query.pick(*picks) }
+    fun omit(vararg omits: UserResultPick): UserUpdateManyRequest = apply { query = query.omit(*omits) }
+    fun includeArticles(query: ArticleListQuery? = null): UserUpdateManyRequest =
+        apply { this.query = this.query.includeArticles(query) }
+
+    suspend fun exec(): List<User> = with(RequestManager) {
+        patch(
+            "/users",
+            buildJsonObject { put("_update", encode(UserQueryData.serializer(), input)) },
+            encode(UserSingleQuery.serializer(), query),
+            ListSerializer(User.serializer()),
+        )
+    }
+}
+
+class UserDeleteManyRequest internal constructor(
+    private val query: UserSeekQuery,
+) {
+    suspend fun exec() = with(RequestManager) {
+        delete(
+            "/users",
+            encode(UserSeekQuery.serializer(), query),
+        )
+    }
+}
+
+class UserListRequest internal constructor(
+    private var query: UserListQuery = UserListQuery(),
+) {
+    fun order(vararg orders: UserSortOrder): UserListRequest = apply { query = query.order(*orders) }
+    fun limit(limit: Int): UserListRequest = apply { query = query.limit(limit) }
+    fun skip(skip: Int): UserListRequest = apply { query = query.skip(skip) }
+    fun pageNo(pageNo: Int): UserListRequest = apply { query = query.pageNo(pageNo) }
+    fun pageSize(pageSize: Int): UserListRequest = apply { query = query.pageSize(pageSize) }
+    fun pick(vararg picks: UserResultPick): UserListRequest = apply { query = query.pick(*picks) }
+    fun omit(vararg omits: UserResultPick): UserListRequest = apply { query = query.omit(*omits) }
+    fun includeArticles(query: ArticleListQuery? = null): UserListRequest =
+        apply { this.query = this.query.includeArticles(query) }
+
+    suspend fun exec(): List<User> = with(RequestManager) {
+        get(
+            "/users",
+            encode(UserListQuery.serializer(), query),
+            ListSerializer(User.serializer()),
+        )
+    }
+
+    fun asFlow(pageSize: Int = 100): Flow<User> = flow {
+        var skip = query._skip ?: 0
+        var remaining = query._limit
+        while (remaining == null || remaining > 0) {
+            val limit = if (remaining == null) pageSize else minOf(pageSize, remaining)
+            val page = UserListRequest(query.copy(_skip = skip, _limit = limit, _pageNo = null, _pageSize = null)).exec()
+            page.forEach { emit(it) }
+            if (page.size < limit) {
+                break
+            }
+            skip += limit
+            remaining = remaining?.minus(limit)
+        }
+    }
+}
+
+class UserSignInRequest internal constructor(
+    private val input: UserSessionInput,
+    private var query: UserSingleQuery = UserSingleQuery(),
+) {
+    fun pick(vararg picks: UserResultPick): UserSignInRequest = apply { query = query.pick(*picks) }
+    fun omit(vararg omits: UserResultPick): UserSignInRequest = apply { query = query.omit(*omits) }
+    fun includeArticles(query: ArticleListQuery? = null): UserSignInRequest =
+        apply { this.query = this.query.includeArticles(query) }
+
+    suspend fun exec(): Session {
+        val session = RequestManager.post(
+            "/users/session",
+            RequestManager.encode(UserSessionInput.serializer(), input),
+            RequestManager.encode(UserSingleQuery.serializer(), query),
+            Session.serializer(),
+        )
+        SessionManager.session = session
+        return session
+    }
+}
+
+class UserClient internal constructor() {
+    fun create(input: UserCreateInput): UserCreateRequest = UserCreateRequest(input)
+
+    fun create(
+        username: String,
+        password: String,
+        phoneNum: String? = null,
+        articles: List<CreateOrLink<ArticleCreateInput>>? = null,
+    ): UserCreateRequest = create(
+        UserCreateInput(
+            username = username,
+            password = password,
+            phoneNum = phoneNum,
+            articles = articles,
+        )
+    )
+
+    fun update(id: String, input: UserUpdateInput): UserUpdateRequest = UserUpdateRequest(id, input)
+
+    fun update(
+        id: String,
+        username: String? = null,
+        password: String? = null,
+        phoneNum: String? = null,
+        articles: List<UpdateOrLink<ArticleUpdateInput>>? = null,
+    ): UserUpdateRequest = update(
+        id,
+        UserUpdateInput(
+            username = username,
+            password = password,
+            phoneNum = phoneNum,
+            articles = articles,
+        )
+    )
+
+    suspend fun delete(id: String): Unit = UserDeleteRequest(id).exec()
+
+    fun id(id: String): UserIDRequest = UserIDRequest(id)
+
+    fun find(query: UserListQuery): UserListRequest = UserListRequest(query)
+
+    fun find(
+        id: StringQuery? = null,
+        username: StringQuery? = null,
+        phoneNum: StringQuery? = null,
+    ): UserListRequest = find(
+        UserListQuery(
+            id = id,
+            username = username,
+            phoneNum = phoneNum,
+        )
+    )
+
+    fun upsert(query: UserSeekQuery, data: UserUpdateInput): UserUpsertRequest =
+        UserUpsertRequest(UserQueryData(query, data))
+
+    fun createMany(input: List<UserCreateInput>): UserCreateManyRequest = UserCreateManyRequest(input)
+
+    fun updateMany(query: UserSeekQuery, data: UserUpdateInput): UserUpdateManyRequest =
+        UserUpdateManyRequest(UserQueryData(query, data))
+
+    suspend fun deleteMany(query: UserSeekQuery = UserSeekQuery()): Unit = UserDeleteManyRequest(query).exec()
+
+    fun signIn(input: UserSessionInput): UserSignInRequest = UserSignInRequest(input)
+}
+
+class ArticleCreateRequest internal constructor(
+    private val input: ArticleCreateInput,
+    private var query: ArticleSingleQuery = ArticleSingleQuery(),
+) {
+    fun pick(vararg picks: ArticleResultPick): ArticleCreateRequest = apply { query = query.pick(*picks) }
+    fun omit(vararg omits: ArticleResultPick): ArticleCreateRequest = apply { query = query.omit(*omits) }
+    fun includeUsers(query: UserListQuery? = null): ArticleCreateRequest =
+        apply { this.query = this.query.includeUsers(query) }
+
+    suspend fun exec(): Article = with(RequestManager) {
+        post(
+            "/articles",
+            encode(ArticleCreateInput.serializer(), input),
+            encode(ArticleSingleQuery.serializer(), query),
+            Article.serializer(),
+        )
+    }
+}
+
+class ArticleUpdateRequest internal constructor(
+    private val id: String,
+    private val input: ArticleUpdateInput,
+    private var query: ArticleSingleQuery = ArticleSingleQuery(),
+) {
+    fun pick(vararg picks: ArticleResultPick): ArticleUpdateRequest = apply { query = query.pick(*picks) }
+    fun omit(vararg omits: ArticleResultPick): ArticleUpdateRequest = apply { query = query.omit(*omits) }
+    fun includeUsers(query: UserListQuery? = null): ArticleUpdateRequest =
+        apply { this.query = this.query.includeUsers(query) }
+
+    suspend fun exec(): Article = with(RequestManager) {
+        patch(
+            "/articles/$id",
+            encode(ArticleUpdateInput.serializer(), input),
+            encode(ArticleSingleQuery.serializer(), query),
+            Article.serializer(),
+        )
+    }
+}
+
+class ArticleDeleteRequest internal constructor(
+    private val id: String,
+) {
+    suspend fun exec() = with(RequestManager) {
+        delete(
+            "/articles/$id",
+        )
+    }
+}
+
+class ArticleIDRequest internal constructor(
+    private val id: String,
+    private var query: ArticleSingleQuery = ArticleSingleQuery(),
+) {
+    fun pick(vararg picks: ArticleResultPick): ArticleIDRequest = apply { query = query.pick(*picks) }
+    fun omit(vararg omits: ArticleResultPick): ArticleIDRequest = apply { query = query.omit(*omits) }
+    fun includeUsers(query: UserListQuery? = null): ArticleIDRequest =
+        apply { this.query = this.query.includeUsers(query) }
+
+    suspend fun exec(): Article = with(RequestManager) {
+        get(
+            "/articles/$id",
+            encode(ArticleSingleQuery.serializer(), query),
+            Article.serializer(),
+        )
+    }
+}
+
+class ArticleUpsertRequest internal constructor(
+    private val input: ArticleQueryData,
+    private var query: ArticleSingleQuery = ArticleSingleQuery(),
+) {
+    fun pick(vararg picks: ArticleResultPick): ArticleUpsertRequest = apply { query = query.pick(*picks) }
+    fun omit(vararg omits: ArticleResultPick): ArticleUpsertRequest = apply { query = query.omit(*omits) }
+    fun includeUsers(query: UserListQuery? = null): ArticleUpsertRequest =
+        apply { this.query = this.query.includeUsers(query) }
+
+    suspend fun exec(): Article = with(RequestManager) {
+        post(
+            "/articles",
+            buildJsonObject { put("_upsert", encode(ArticleQueryData.serializer(), input)) },
+            encode(ArticleSingleQuery.serializer(), query),
+            Article.serializer(),
+        )
+    }
+}
+
+class ArticleCreateManyRequest internal constructor(
+    private val input: List<ArticleCreateInput>,
+    private var query: ArticleSingleQuery = ArticleSingleQuery(),
+) {
+    fun pick(vararg picks: ArticleResultPick): ArticleCreateManyRequest = apply { query = query.pick(*picks) }
+    fun omit(vararg omits: ArticleResultPick): ArticleCreateManyRequest = apply { query = query.omit(*omits) }
+    fun includeUsers(query: UserListQuery? = null): ArticleCreateManyRequest =
+        apply { this.query = this.query.includeUsers(query) }
+
+    suspend fun exec(): List<Article> = with(RequestManager) {
+        post(
+            "/articles",
+            buildJsonObject { put("_create", encode(ListSerializer(ArticleCreateInput.serializer()), input)) },
+            encode(ArticleSingleQuery.serializer(), query),
+            ListSerializer(Article.serializer()),
+        )
+    }
+}
+
+class ArticleUpdateManyRequest internal constructor(
+    private val input: ArticleQueryData,
+    private var query: ArticleSingleQuery = ArticleSingleQuery(),
+) {
+    fun pick(vararg picks: ArticleResultPick): ArticleUpdateManyRequest = apply { query = query.pick(*picks) }
+    fun omit(vararg omits: ArticleResultPick): ArticleUpdateManyRequest = apply { query = query.omit(*omits) }
+    fun includeUsers(query: UserListQuery? = null): ArticleUpdateManyRequest =
+        apply { this.query = this.query.includeUsers(query) }
+
+    suspend fun exec(): List<Article> = with(RequestManager) {
+        patch(
+            "/articles",
+            buildJsonObject { put("_update", encode(ArticleQueryData.serializer(), input)) },
+            encode(ArticleSingleQuery.serializer(), query),
+            ListSerializer(Article.serializer()),
+        )
+    }
+}
+
+class ArticleDeleteManyRequest internal constructor(
+    private val query: ArticleSeekQuery,
+) {
+    suspend fun exec() = with(RequestManager) {
+        delete(
+            "/articles",
+            encode(ArticleSeekQuery.serializer(), query),
+        )
+    }
+}
+
+class ArticleListRequest internal constructor(
+    private var query: ArticleListQuery = ArticleListQuery(),
+) {
+    fun order(vararg orders: ArticleSortOrder): ArticleListRequest = apply { query = query.order(*orders) }
+    fun limit(limit: Int): ArticleListRequest = apply { query = query.limit(limit) }
+    fun skip(skip: Int): ArticleListRequest = apply { query = query.skip(skip) }
+    fun pageNo(pageNo: Int): ArticleListRequest = apply { query = query.pageNo(pageNo) }
+    fun pageSize(pageSize: Int): ArticleListRequest = apply { query = query.pageSize(pageSize) }
+    fun pick(vararg picks: ArticleResultPick): ArticleListRequest = apply { query = query.pick(*picks) }
+    fun omit(vararg omits: ArticleResultPick): ArticleListRequest = apply { query = query.omit(*omits) }
+    fun includeUsers(query: UserListQuery? = null): ArticleListRequest =
+        apply { this.query = this.query.includeUsers(query) }
+
+    suspend fun exec(): List<Article> = with(RequestManager) {
+        get(
+            "/articles",
+            encode(ArticleListQuery.serializer(), query),
+            ListSerializer(Article.serializer()),
+        )
+    }
+
+    fun asFlow(pageSize: Int = 100): Flow<Article> = flow {
+        var skip = query._skip ?: 0
+        var remaining = query._limit
+        while (remaining == null || remaining > 0) {
+            val limit = if (remaining == null) pageSize else minOf(pageSize, remaining)
+            val page = ArticleListRequest(query.copy(_skip = skip, _limit = limit, _pageNo = null, _pageSize = null)).exec()
+            page.forEach { emit(it) }
+            if (page.size < limit) {
+                break
+            }
+            skip += limit
+            remaining = remaining?.minus(limit)
+        }
+    }
+}
+
+class ArticleClient internal constructor() {
+    fun create(input: ArticleCreateInput): ArticleCreateRequest = ArticleCreateRequest(input)
+
+    fun create(
+        title: String,
+        content: String? = null,
+        users: List<CreateOrLink<UserCreateInput>>? = null,
+    ): ArticleCreateRequest = create(
+        ArticleCreateInput(
+            title = title,
+            content = content,
+            users = users,
+        )
+    )
+
+    fun update(id: String, input: ArticleUpdateInput): ArticleUpdateRequest = ArticleUpdateRequest(id, input)
+
+    fun update(
+        id: String,
+        title: String? = null,
+        content: String? = null,
+        users: List<UpdateOrLink<UserUpdateInput>>? = null,
+    ): ArticleUpdateRequest = update(
+        id,
+        ArticleUpdateInput(
+            title = title,
+            content = content,
+            users = users,
+        )
+    )
+
+    suspend fun delete(id: String): Unit = ArticleDeleteRequest(id).exec()
+
+    fun id(id: String): ArticleIDRequest = ArticleIDRequest(id)
+
+    fun find(query: ArticleListQuery): ArticleListRequest = ArticleListRequest(query)
+
+    fun find(
+        id: StringQuery? = null,
+        title: StringQuery? = null,
+        content: StringQuery? = null,
+    ): ArticleListRequest = find(
+        ArticleListQuery(
+            id = id,
+            title = title,
+            content = content,
+        )
+    )
+
+    fun upsert(query: ArticleSeekQuery, data: ArticleUpdateInput): ArticleUpsertRequest =
+        ArticleUpsertRequest(ArticleQueryData(query, data))
+
+    fun createMany(input: List<ArticleCreateInput>): ArticleCreateManyRequest = ArticleCreateManyRequest(input)
+
+    fun updateMany(query: ArticleSeekQuery, data: ArticleUpdateInput): ArticleUpdateManyRequest =
+        ArticleUpdateManyRequest(ArticleQueryData(query, data))
+
+    suspend fun deleteMany(query: ArticleSeekQuery = ArticleSeekQuery()): Unit = ArticleDeleteManyRequest(query).exec()
+}
+
+val users = UserClient()
+val articles = ArticleClient()
+
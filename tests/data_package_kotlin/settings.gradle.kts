@@ -0,0 +1 @@
+rootProject.name = "api"
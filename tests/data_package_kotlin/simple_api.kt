@@ -0,0 +1,568 @@
+@file:OptIn(ExperimentalSerializationApi::class)
+@file:UseSerializers(InstantSerializer::class)
+
+package api
+
+import java.io.IOException
+import java.net.URLEncoder
+import java.time.Instant
+import java.util.concurrent.TimeUnit
+import kotlin.coroutines.resume
+import kotlin.coroutines.resumeWithException
+import kotlinx.coroutines.flow.Flow
+import kotlinx.coroutines.flow.flow
+import kotlinx.coroutines.suspendCancellableCoroutine
+import kotlinx.serialization.ExperimentalSerializationApi
+import kotlinx.serialization.KSerializer
+import kotlinx.serialization.SerialName
+import kotlinx.serialization.Serializable
+import kotlinx.serialization.SerializationStrategy
+import kotlinx.serialization.UseSerializers
+import kotlinx.serialization.builtins.ListSerializer
+import kotlinx.serialization.descriptors.PrimitiveKind
+import kotlinx.serialization.descriptors.PrimitiveSerialDescriptor
+import kotlinx.serialization.descriptors.SerialDescriptor
+import kotlinx.serialization.encoding.Decoder
+import kotlinx.serialization.encoding.Encoder
+import kotlinx.serialization.json.Json
+import kotlinx.serialization.json.JsonArray
+import kotlinx.serialization.json.JsonElement
+import kotlinx.serialization.json.JsonObject
+import kotlinx.serialization.json.JsonPrimitive
+import kotlinx.serialization.json.buildJsonObject
+import okhttp3.Call
+import okhttp3.Callback
+import okhttp3.ConnectionPool
+import okhttp3.Dispatcher
+import okhttp3.HttpUrl.Companion.toHttpUrl
+import okhttp3.MediaType.Companion.toMediaType
+import okhttp3.OkHttpClient
+import okhttp3.Request
+import okhttp3.RequestBody.Companion.toRequestBody
+
+object InstantSerializer : KSerializer<Instant> {
+
+    override val descriptor: SerialDescriptor = PrimitiveSerialDescriptor("Instant", PrimitiveKind.STRING)
+
+    override fun serialize(encoder: Encoder, value: Instant) = encoder.encodeString(value.toString())
+
+    override fun deserialize(decoder: Decoder): Instant = Instant.parse(decoder.decodeString())
+}
+
+@Serializable
+enum class Mode {
+    @SerialName("default") DEFAULT,
+    @SerialName("insensitive") INSENSITIVE,
+}
+
+@Serializable
+data class StringQuery(
+    @SerialName("_eq") val eq: String? = null,
+    @SerialName("_neq") val neq: String? = null,
+    @SerialName("_null") val isNull: Boolean? = null,
+    @SerialName("_gt") val gt: String? = null,
+    @SerialName("_gte") val gte: String? = null,
+    @SerialName("_lt") val lt: String? = null,
+    @SerialName("_lte") val lte: String? = null,
+    @SerialName("_contains") val contains: String? = null,
+    @SerialName("_prefix") val prefix: String? = null,
+    @SerialName("_suffix") val suffix: String? = null,
+    @SerialName("_match") val match: String? = null,
+    @SerialName("_mode") val mode: Mode? = null,
+    @SerialName("_or") val or: List<StringQuery>? = null,
+    @SerialName("_and") val and: List<StringQuery>? = null,
+)
+
+@Serializable
+data class IntQuery(
+    @SerialName("_eq") val eq: Int? = null,
+    @SerialName("_neq") val neq: Int? = null,
+    @SerialName("_null") val isNull: Boolean? = null,
+    @SerialName("_gt") val gt: Int? = null,
+    @SerialName("_gte") val gte: Int? = null,
+    @SerialName("_lt") val lt: Int? = null,
+    @SerialName("_lte") val lte: Int? = null,
+    @SerialName("_or") val or: List<IntQuery>? = null,
+    @SerialName("_and") val and: List<IntQuery>? = null,
+)
+
+@Serializable
+data class FloatQuery(
+    @SerialName("_eq") val eq: Double? = null,
+    @SerialName("_neq") val neq: Double? = null,
+    @SerialName("_null") val isNull: Boolean? = null,
+    @SerialName("_gt") val gt: Double? = null,
+    @SerialName("_gte") val gte: Double? = null,
+    @SerialName("_lt") val lt: Double? = null,
+    @SerialName("_lte") val lte: Double? = null,
+    @SerialName("_or") val or: List<FloatQuery>? = null,
+    @SerialName("_and") val and: List<FloatQuery>? = null,
+)
+
+@Serializable
+data class BoolQuery(
+    @SerialName("_eq") val eq: Boolean? = null,
+    @SerialName("_neq") val neq: Boolean? = null,
+    @SerialName("_null") val isNull: Boolean? = null,
+    @SerialName("_or") val or: List<BoolQuery>? = null,
+    @SerialName("_and") val and: List<BoolQuery>? = null,
+)
+
+@Serializable
+data class DateQuery(
+    @SerialName("_eq") val eq: Instant? = null,
+    @SerialName("_neq") val neq: Instant? = null,
+    @SerialName("_null") val isNull: Boolean? = null,
+    @SerialName("_gt") val gt: Instant? = null,
+    @SerialName("_gte") val gte: Instant? = null,
+    @SerialName("_lt") val lt: Instant? = null,
+    @SerialName("_lte") val lte: Instant? = null,
+    @SerialName("_or") val or: List<DateQuery>? = null,
+    @SerialName("_and") val and: List<DateQuery>? = null,
+)
+
+@Serializable
+data class IDQuery(
+    @SerialName("_eq") val eq: String? = null,
+    @SerialName("_neq") val neq: String? = null,
+    @SerialName("_null") val isNull: Boolean? = null,
+)
+
+@Serializable
+data class LinkAction(
+    @SerialName("_add") val add: String? = null,
+    @SerialName("_del") val del: String? = null,
+)
+
+@Serializable(with = CreateOrLinkSerializer::class)
+sealed class CreateOrLink<out T> {
+    data class Create<T>(val input: T) : CreateOrLink<T>()
+    data class Link(val id: String) : CreateOrLink<Nothing>()
+}
+
+@Serializable(with = UpdateOrLinkSerializer::class)
+sealed class UpdateOrLink<out T> {
+    data class Update<T>(val input: T) : UpdateOrLink<T>()
+    data class Link(val id: String) : UpdateOrLink<Nothing>()
+    data class Unlink(val id: String) : UpdateOrLink<Nothing>()
+}
+
+class CreateOrLinkSerializer<T>(private val inputSerializer: KSerializer<T>) : KSerializer<CreateOrLink<T>> {
+
+    override val descriptor: SerialDescriptor = inputSerializer.descriptor
+
+    override fun serialize(encoder: Encoder, value: CreateOrLink<T>) = when (value) {
+        is CreateOrLink.Create -> encoder.encodeSerializableValue(inputSerializer, value.input)
+        is CreateOrLink.Link -> encoder.encodeSerializableValue(LinkAction.serializer(), LinkAction(add = value.id))
+    }
+
+    override fun deserialize(decoder: Decoder): CreateOrLink<T> =
+        CreateOrLink.Create(decoder.decodeSerializableValue(inputSerializer))
+}
+
+class UpdateOrLinkSerializer<T>(private val inputSerializer: KSerializer<T>) : KSerializer<UpdateOrLink<T>> {
+
+    override val descriptor: SerialDescriptor = inputSerializer.descriptor
+
+    override fun serialize(encoder: Encoder, value: UpdateOrLink<T>) = when (value) {
+        is UpdateOrLink.Update -> encoder.encodeSerializableValue(inputSerializer, value.input)
+        is UpdateOrLink.Link -> encoder.encodeSerializableValue(LinkAction.serializer(), LinkAction(add = value.id))
+        is UpdateOrLink.Unlink -> encoder.encodeSerializableValue(LinkAction.serializer(), LinkAction(del = value.id))
+    }
+
+    override fun deserialize(decoder: Decoder): UpdateOrLink<T> =
+        UpdateOrLink.Update(decoder.decodeSerializableValue(inputSerializer))
+}
+
+@Serializable
+class Response<T>(val data: T)
+
+class RequestException(val status: Int, val body: String) : IOException("request failed with status $status")
+
+internal fun <T> include(name: String, serializer: SerializationStrategy<T>, query: T?): JsonElement =
+    if (query == null) JsonPrimitive(name) else buildJsonObject { put(name, RequestManager.encode(serializer, query)) }
+
+@Serializable
+data class SimpleSongCreateInput(
+    val name: String,
+)
+
+@Serializable
+data class SimpleSongUpdateInput(
+    val name: String? = null,
+)
+
+@Serializable
+enum class SimpleSongSortOrder {
+    @SerialName("name") NAME,
+    @SerialName("-name") NAME_DESC,
+    @SerialName("createdAt") CREATED_AT,
+    @SerialName("-createdAt") CREATED_AT_DESC,
+    @SerialName("updatedAt") UPDATED_AT,
+    @SerialName("-updatedAt") UPDATED_AT_DESC;
+
+    operator fun unaryMinus(): SimpleSongSortOrder = when (this) {
+        NAME -> NAME_DESC
+        NAME_DESC -> NAME
+        CREATED_AT -> CREATED_AT_DESC
+        CREATED_AT_DESC -> CREATED_AT
+        UPDATED_AT -> UPDATED_AT_DESC
+        UPDATED_AT_DESC -> UPDATED_AT
+    }
+}
+
+@Serializable
+enum class SimpleSongResultPick {
+    @SerialName("id") ID,
+    @SerialName("name") NAME,
+    @SerialName("createdAt") CREATED_AT,
+    @SerialName("updatedAt") UPDATED_AT,
+}
+
+@Serializable
+data class SimpleSongSingleQuery(
+    val _pick: List<SimpleSongResultPick>? = null,
+    val _omit: List<SimpleSongResultPick>? = null,
+) {
+    fun pick(vararg picks: SimpleSongResultPick): SimpleSongSingleQuery = copy(_pick = picks.toList())
+    fun omit(vararg omits: SimpleSongResultPick): SimpleSongSingleQuery = copy(_omit = omits.toList())
+}
+
+@Serializable
+data class SimpleSongSeekQuery(
+    val id: StringQuery? = null,
+    val name: StringQuery? = null,
+    val createdAt: DateQuery? = null,
+    val updatedAt: DateQuery? = null,
+)
+
+@Serializable
+data class SimpleSongQueryData(
+    val _query: SimpleSongSeekQuery,
+    val _data: SimpleSongUpdateInput,
+)
+
+@Serializable
+data class SimpleSongListQuery(
+    val id: StringQuery? = null,
+    val name: StringQuery? = null,
+    val createdAt: DateQuery? = null,
+    val updatedAt: DateQuery? = null,
+    val _order: List<SimpleSongSortOrder>? = null,
+    val _limit: Int? = null,
+    val _skip: Int? = null,
+    val _pageNo: Int? = null,
+    val _pageSize: Int? = null,
+    val _pick: List<SimpleSongResultPick>? = null,
+    val _omit: List<SimpleSongResultPick>? = null,
+) {
+    fun order(vararg orders: SimpleSongSortOrder): SimpleSongListQuery = copy(_order = _order.orEmpty() + orders)
+    fun limit(limit: Int): SimpleSongListQuery = copy(_limit = limit)
+    fun skip(skip: Int): SimpleSongListQuery = copy(_skip = skip)
+    fun pageNo(pageNo: Int): SimpleSongListQuery = copy(_pageNo = pageNo)
+    fun pageSize(pageSize: Int): SimpleSongListQuery = copy(_pageSize = pageSize)
+    fun pick(vararg picks: SimpleSongResultPick): SimpleSongListQuery = copy(_pick = picks.toList())
+    fun omit(vararg omits: SimpleSongResultPick): SimpleSongListQuery = copy(_omit = omits.toList())
+}
+
+@Serializable
+data class SimpleSong(
+    val id: String? = null,
+    val name: String? = null,
+    val createdAt: Instant? = null,
+    val updatedAt: Instant? = null,
+)
+
+object RequestManager {
+
+    var baseUrl: String = "None"
+
+    internal val json = Json {
+        ignoreUnknownKeys = true
+        explicitNulls = false
+    }
+
+    private val mediaType = "application/json; charset=utf-8".toMediaType()
+
+    private val client = OkHttpClient.Builder()
+        .connectionPool(ConnectionPool(8, 5, TimeUnit.MINUTES))
+        .dispatcher(Dispatcher().apply { maxRequestsPerHost = 8 })
+        .build()
+
+    internal fun <T> encode(serializer: SerializationStrategy<T>, value: T): JsonElement =
+        json.encodeToJsonElement(serializer, value)
+
+    internal suspend fun <T> get(url: String, query: JsonElement?, serializer: KSerializer<T>): T =
+        decode(send("GET", url, null, query), serializer)
+
+    internal suspend fun <T> post(url: String, input: JsonElement, query: JsonElement?, serializer: KSerializer<T>): T =
+        decode(send("POST", url, input, query), serializer)
+
+    internal suspend fun <T> patch(url: String, input: JsonElement, query: JsonElement?, serializer: KSerializer<T>): T =
+        decode(send("PATCH", url, input, query), serializer)
+
+    internal suspend fun delete(url: String, query: JsonElement? = null) {
+        send("DELETE", url, null, query)
+    }
+
+    private fun <T> decode(content: String, serializer: KSerializer<T>): T =
+        json.decodeFromString(Response.serializer(serializer), content).data
+
+    private suspend fun send(method: String, url: String, input: JsonElement?, query: JsonElement?): String {
+        val body = input?.let { json.encodeToString(JsonElement.serializer(), it).toRequestBody(mediaType) }
+        val builder = Request.Builder()
+            .url((baseUrl + url + qs(query)).toHttpUrl())
+            .method(method, body)
+        return client.newCall(builder.build()).await().use { response ->
+            val content = response.body?.string() ?: ""
+            if (!response.isSuccessful) {
+                throw RequestException(response.code, content)
+            }
+            content
+        }
+    }
+
+    private fun qs(query: JsonElement?): String {
+        val items = mutableListOf<String>()
+        if (query is JsonObject) {
+            query.forEach { (key, value) -> flatten(key, value, items) }
+        }
+        return if (items.isEmpty()) "" else "?" + items.joinToString("&")
+    }
+
+    private fun flatten(key: String, value: JsonElement, items: MutableList<String>) {
+        when (value) {
+            is JsonObject -> value.forEach { (k, v) -> flatten("$key[$k]", v, items) }
+            is JsonArray -> value.forEachIndexed { index, v -> flatten("$key[$index]", v, items) }
+            is JsonPrimitive -> items.add(key + "=" + URLEncoder.encode(value.content, Charsets.UTF_8).replace("+", "%20"))
+        }
+    }
+}
+
+private suspend fun Call.await(): okhttp3.Response = suspendCancellableCoroutine { continuation ->
+    continuation.invokeOnCancellation { cancel() }
+    enqueue(object : Callback {
+        override fun onResponse(call: Call, response: okhttp3.Response) {
+            continuation.resume(response)
+        }
+
+        override fun onFailure(call: Call, e: IOException) {
+            continuation.resumeWithException(e)
+        }
+    })
+}
+
+class SimpleSongCreateRequest internal constructor(
+    private val input: SimpleSongCreateInput,
+    private var query: SimpleSongSingleQuery = SimpleSongSingleQuery(),
+) {
+    fun pick(vararg picks: SimpleSongResultPick): SimpleSongCreateRequest = apply { query = query.pick(*picks) }
+    fun omit(vararg omits: SimpleSongResultPick): SimpleSongCreateRequest = apply { query = query.omit(*omits) }
+
+    suspend fun exec(): SimpleSong = with(RequestManager) {
+        post(
+            "/simple-songs",
+            encode(SimpleSongCreateInput.serializer(), input),
+            encode(SimpleSongSingleQuery.serializer(), query),
+            SimpleSong.serializer(),
+        )
+    }
+}
+
+class SimpleSongUpdateRequest internal constructor(
+    private val id: String,
+    private val input: SimpleSongUpdateInput,
+    private var query: SimpleSongSingleQuery = SimpleSongSingleQuery(),
+) {
+    fun pick(vararg picks: SimpleSongResultPick): SimpleSongUpdateRequest = apply { query = query.pick(*picks) }
+    fun omit(vararg omits: SimpleSongResultPick): SimpleSongUpdateRequest = apply { query = query.omit(*omits) }
+
+    suspend fun exec(): SimpleSong = with(RequestManager) {
+        patch(
+            "/simple-songs/$id",
+            encode(SimpleSongUpdateInput.serializer(), input),
+            encode(SimpleSongSingleQuery.serializer(), query),
+            SimpleSong.serializer(),
+        )
+    }
+}
+
+class SimpleSongDeleteRequest internal constructor(
+    private val id: String,
+) {
+    suspend fun exec() = with(RequestManager) {
+        delete(
+            "/simple-songs/$id",
+        )
+    }
+}
+
+class SimpleSongIDRequest internal constructor(
+    private val id: String,
+    private var query: SimpleSongSingleQuery = SimpleSongSingleQuery(),
+) {
+    fun pick(vararg picks: SimpleSongResultPick): SimpleSongIDRequest = apply { query = query.pick(*picks) }
+    fun omit(vararg omits: SimpleSongResultPick): SimpleSongIDRequest = apply { query = query.omit(*omits) }
+
+    suspend fun exec(): SimpleSong = with(RequestManager) {
+        get(
+            "/simple-songs/$id",
+            encode(SimpleSongSingleQuery.serializer(), query),
+            SimpleSong.serializer(),
+        )
+    }
+}
+
+class SimpleSongUpsertRequest internal constructor(
+    private val input: SimpleSongQueryData,
+    private var query: SimpleSongSingleQuery = SimpleSongSingleQuery(),
+) {
+    fun pick(vararg picks: SimpleSongResultPick): SimpleSongUpsertRequest = apply { query = query.pick(*picks) }
+    fun omit(vararg omits: SimpleSongResultPick): SimpleSongUpsertRequest = apply { query = query.omit(*omits) }
+
+    suspend fun exec(): SimpleSong = with(RequestManager) {
+        post(
+            "/simple-songs",
+            buildJsonObject { put("_upsert", encode(SimpleSongQueryData.serializer(), input)) },
+            encode(SimpleSongSingleQuery.serializer(), query),
+            SimpleSong.serializer(),
+        )
+    }
+}
+
+class SimpleSongCreateManyRequest internal constructor(
+    private val input: List<SimpleSongCreateInput>,
+    private var query: SimpleSongSingleQuery = SimpleSongSingleQuery(),
+) {
+    fun pick(vararg picks: SimpleSongResultPick): SimpleSongCreateManyRequest = apply { query = query.pick(*picks) }
+    fun omit(vararg omits: SimpleSongResultPick): SimpleSongCreateManyRequest = apply { query = query.omit(*omits) }
+
+    suspend fun exec(): List<SimpleSong> = with(RequestManager) {
+        post(
+            "/simple-songs",
+            buildJsonObject { put("_create", encode(ListSerializer(SimpleSongCreateInput.serializer()), input)) },
+            encode(SimpleSongSingleQuery.serializer(), query),
+            ListSerializer(SimpleSong.serializer()),
+        )
+    }
+}
+
+class SimpleSongUpdateManyRequest internal constructor(
+    private val input: SimpleSongQueryData,
+    private var query: SimpleSongSingleQuery = SimpleSongSingleQuery(),
+) {
+    fun pick(vararg picks: SimpleSongResultPick): SimpleSongUpdateManyRequest = apply { query = query.pick(*picks) }
+    fun omit(vararg omits: SimpleSongResultPick): SimpleSongUpdateManyRequest = apply { query = query.omit(*omits) }
+
+    suspend fun exec(): List<SimpleSong> = with(RequestManager) {
+        patch(
+            "/simple-songs",
+            buildJsonObject { put("_update", encode(SimpleSongQueryData.serializer(), input)) },
+            encode(SimpleSongSingleQuery.serializer(), query),
+            ListSerializer(SimpleSong.serializer()),
+        )
+    }
+}
+
+class SimpleSongDeleteManyRequest internal constructor(
+    private val query: SimpleSongSeekQuery,
+) {
+    suspend fun exec() = with(RequestManager) {
+        delete(
+            "/simple-songs",
+            encode(SimpleSongSeekQuery.serializer(), query),
+        )
+    }
+}
+
+class SimpleSongListRequest internal constructor(
+    private var query: SimpleSongListQuery = SimpleSongListQuery(),
+) {
+    fun order(vararg orders: SimpleSongSortOrder): SimpleSongListRequest = apply { query = query.order(*orders) }
+    fun limit(limit: Int): SimpleSongListRequest = apply { query = query.limit(limit) }
+    fun skip(skip: Int): SimpleSongListRequest = apply { query = query.skip(skip) }
+    fun pageNo(pageNo: Int): SimpleSongListRequest = apply { query = query.pageNo(pageNo) }
+    fun pageSize(pageSize: Int): SimpleSongListRequest = apply { query = query.pageSize(pageSize) }
+    fun pick(vararg picks: SimpleSongResultPick): SimpleSongListRequest = apply { query = query.pick(*picks) }
+    fun omit(vararg omits: SimpleSongResultPick): SimpleSongListRequest = apply { query = query.omit(*omits) }
+
+    suspend fun exec(): List<SimpleSong> = with(RequestManager) {
+        get(
+            "/simple-songs",
+            encode(SimpleSongListQuery.serializer(), query),
+            ListSerializer(SimpleSong.serializer()),
+        )
+    }
+
+    fun asFlow(pageSize: Int = 100): Flow<SimpleSong> = flow {
+        var skip = query._skip ?: 0
+        var remaining = query._limit
+        while (remaining == null || remaining > 0) {
+            val limit = if (remaining == null) pageSize else minOf(pageSize, remaining)
+            val page = SimpleSongListRequest(query.copy(_skip = skip, _limit = limit, _pageNo = null, _pageSize = null)).exec()
+            page.forEach { emit(it) }
+            if (page.size < limit) {
+                break
+            }
+            skip += limit
+            remaining = remaining?.minus(limit)
+        }
+    }
+}
+
+class SimpleSongClient internal constructor() {
+    fun create(input: SimpleSongCreateInput): SimpleSongCreateRequest = SimpleSongCreateRequest(input)
+
+    fun create(
+        name: String,
+    ): SimpleSongCreateRequest = create(
+        SimpleSongCreateInput(
+            name = name,
+        )
+    )
+
+    fun update(id: String, input: SimpleSongUpdateInput): SimpleSongUpdateRequest = SimpleSongUpdateRequest(id, input)
+
+    fun update(
+        id: String,
+        name: String? = null,
+    ): SimpleSongUpdateRequest = update(
+        id,
+        SimpleSongUpdateInput(
+            name = name,
+        )
+    )
+
+    suspend fun delete(id: String): Unit = SimpleSongDeleteRequest(id).exec()
+
+    fun id(id: String): SimpleSongIDRequest = SimpleSongIDRequest(id)
+
+    fun find(query: SimpleSongListQuery): SimpleSongListRequest = SimpleSongListRequest(query)
+
+    fun find(
+        id: StringQuery? = null,
+        name: StringQuery? = null,
+        createdAt: DateQuery? = null,
+        updatedAt: DateQuery? = null,
+    ): SimpleSongListRequest = find(
+        SimpleSongListQuery(
+            id = id,
+            name = name,
+            createdAt = createdAt,
+            updatedAt = updatedAt,
+        )
+    )
+
+    fun upsert(query: SimpleSongSeekQuery, data: SimpleSongUpdateInput): SimpleSongUpsertRequest =
+        SimpleSongUpsertRequest(SimpleSongQueryData(query, data))
+
+    fun createMany(input: List<SimpleSongCreateInput>): SimpleSongCreateManyRequest = SimpleSongCreateManyRequest(input)
+
+    fun updateMany(query: SimpleSongSeekQuery, data: SimpleSongUpdateInput): SimpleSongUpdateManyRequest =
+        SimpleSongUpdateManyRequest(SimpleSongQueryData(query, data))
+
+    suspend fun deleteMany(query: SimpleSongSeekQuery = SimpleSongSeekQuery()): Unit = SimpleSongDeleteManyRequest(query).exec()
+}
+
+val simpleSongs = SimpleSongClient()
+
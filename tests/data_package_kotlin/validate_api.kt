@@ -0,0 +1,682 @@
+@file:OptIn(ExperimentalSerializationApi::class)
+@file:UseSerializers(InstantSerializer::class)
+
+package api
+
+import java.io.IOException
+import java.net.URLEncoder
+import java.time.Instant
+import java.util.concurrent.TimeUnit
+import kotlin.coroutines.resume
+import kotlin.coroutines.resumeWithException
+import kotlinx.coroutines.flow.Flow
+import kotlinx.coroutines.flow.flow
+import kotlinx.coroutines.suspendCancellableCoroutine
+import kotlinx.serialization.ExperimentalSerializationApi
+import kotlinx.serialization.KSerializer
+import kotlinx.serialization.SerialName
+import kotlinx.serialization.Serializable
+import kotlinx.serialization.SerializationStrategy
+import kotlinx.serialization.UseSerializers
+import kotlinx.serialization.builtins.ListSerializer
+import kotlinx.serialization.descriptors.PrimitiveKind
+import kotlinx.serialization.descriptors.PrimitiveSerialDescriptor
+import kotlinx.serialization.descriptors.SerialDescriptor
+import kotlinx.serialization.encoding.Decoder
+import kotlinx.serialization.encoding.Encoder
+import kotlinx.serialization.json.Json
+import kotlinx.serialization.json.JsonArray
+import kotlinx.serialization.json.JsonElement
+import kotlinx.serialization.json.JsonObject
+import kotlinx.serialization.json.JsonPrimitive
+import kotlinx.serialization.json.buildJsonObject
+import okhttp3.Call
+import okhttp3.Callback
+import okhttp3.ConnectionPool
+import okhttp3.Dispatcher
+import okhttp3.HttpUrl.Companion.toHttpUrl
+import okhttp3.MediaType.Companion.toMediaType
+import okhttp3.OkHttpClient
+import okhttp3.Request
+import okhttp3.RequestBody.Companion.toRequestBody
+
+object InstantSerializer : KSerializer<Instant> {
+
+    override val descriptor: SerialDescriptor = PrimitiveSerialDescriptor("Instant", PrimitiveKind.STRING)
+
+    override fun serialize(encoder: Encoder, value: Instant) = encoder.encodeString(value.toString())
+
+    override fun deserialize(decoder: Decoder): Instant = Instant.parse(decoder.decodeString())
+}
+
+@Serializable
+enum class Mode {
+    @SerialName("default") DEFAULT,
+    @SerialName("insensitive") INSENSITIVE,
+}
+
+@Serializable
+data class StringQuery(
+    @SerialName("_eq") val eq: String? = null,
+    @SerialName("_neq") val neq: String? = null,
+    @SerialName("_null") val isNull: Boolean? = null,
+    @SerialName("_gt") val gt: String? = null,
+    @SerialName("_gte") val gte: String? = null,
+    @SerialName("_lt") val lt: String? = null,
+    @SerialName("_lte") val lte: String? = null,
+    @SerialName("_contains") val contains: String? = null,
+    @SerialName("_prefix") val prefix: String? = null,
+    @SerialName("_suffix") val suffix: String? = null,
+    @SerialName("_match") val match: String? = null,
+    @SerialName("_mode") val mode: Mode? = null,
+    @SerialName("_or") val or: List<StringQuery>? = null,
+    @SerialName("_and") val and: List<StringQuery>? = null,
+)
+
+@Serializable
+data class IntQuery(
+    @SerialName("_eq") val eq: Int? = null,
+    @SerialName("_neq") val neq: Int? = null,
+    @SerialName("_null") val isNull: Boolean? = null,
+    @SerialName("_gt") val gt: Int? = null,
+    @SerialName("_gte") val gte: Int? = null,
+    @SerialName("_lt") val lt: Int? = null,
+    @SerialName("_lte") val lte: Int? = null,
+    @SerialName("_or") val or: List<IntQuery>? = null,
+    @SerialName("_and") val and: List<IntQuery>? = null,
+)
+
+@Serializable
+data class FloatQuery(
+    @SerialName("_eq") val eq: Double? = null,
+    @SerialName("_neq") val neq: Double? = null,
+    @SerialName("_null") val isNull: Boolean? = null,
+    @SerialName("_gt") val gt: Double? = null,
+    @SerialName("_gte") val gte: Double? = null,
+    @SerialName("_lt") val lt: Double? = null,
+    @SerialName("_lte") val lte: Double? = null,
+    @SerialName("_or") val or: List<FloatQuery>? = null,
+    @SerialName("_and") val and: List<FloatQuery>? = null,
+)
+
+@Serializable
+data class BoolQuery(
+    @SerialName("_eq") val eq: Boolean? = null,
+    @SerialName("_neq") val neq: Boolean? = null,
+    @SerialName("_null") val isNull: Boolean? = null,
+    @SerialName("_or") val or: List<BoolQuery>? = null,
+    @SerialName("_and") val and: List<BoolQuery>? = null,
+)
+
+@Serializable
+data class DateQuery(
+    @SerialName("_eq") val eq: Instant? = null,
+    @SerialName("_neq") val neq: Instant? = null,
+    @SerialName("_null") val isNull: Boolean? = null,
+    @SerialName("_gt") val gt: Instant? = null,
+    @SerialName("_gte") val gte: Instant? = null,
+    @SerialName("_lt") val lt: Instant? = null,
+    @SerialName("_lte") val lte: Instant? = null,
+    @SerialName("_or") val or: List<DateQuery>? = null,
+    @SerialName("_and") val and: List<DateQuery>? = null,
+)
+
+@Serializable
+data class IDQuery(
+    @SerialName("_eq") val eq: String? = null,
+    @SerialName("_neq") val neq: String? = null,
+    @SerialName("_null") val isNull: Boolean? = null,
+)
+
+@Serializable
+data class LinkAction(
+    @SerialName("_add") val add: String? = null,
+    @SerialName("_del") val del: String? = null,
+)
+
+@Serializable(with = CreateOrLinkSerializer::class)
+sealed class CreateOrLink<out T> {
+    data class Create<T>(val input: T) : CreateOrLink<T>()
+    data class Link(val id: String) : CreateOrLink<Nothing>()
+}
+
+@Serializable(with = UpdateOrLinkSerializer::class)
+sealed class UpdateOrLink<out T> {
+    data class Update<T>(val input: T) : UpdateOrLink<T>()
+    data class Link(val id: String) : UpdateOrLink<Nothing>()
+    data class Unlink(val id: String) : UpdateOrLink<Nothing>()
+}
+
+class CreateOrLinkSerializer<T>(private val inputSerializer: KSerializer<T>) : KSerializer<CreateOrLink<T>> {
+
+    override val descriptor: SerialDescriptor = inputSerializer.descriptor
+
+    override fun serialize(encoder: Encoder, value: CreateOrLink<T>) = when (value) {
+        is CreateOrLink.Create -> encoder.encodeSerializableValue(inputSerializer, value.input)
+        is CreateOrLink.Link -> encoder.encodeSerializableValue(LinkAction.serializer(), LinkAction(add = value.id))
+    }
+
+    override fun deserialize(decoder: Decoder): CreateOrLink<T> =
+        CreateOrLink.Create(decoder.decodeSerializableValue(inputSerializer))
+}
+
+class UpdateOrLinkSerializer<T>(private val inputSerializer: KSerializer<T>) : KSerializer<UpdateOrLink<T>> {
+
+    override val descriptor: SerialDescriptor = inputSerializer.descriptor
+
+    override fun serialize(encoder: Encoder, value: UpdateOrLink<T>) = when (value) {
+        is UpdateOrLink.Update -> encoder.encodeSerializableValue(inputSerializer, value.input)
+        is UpdateOrLink.Link -> encoder.encodeSerializableValue(LinkAction.serializer(), LinkAction(add = value.id))
+        is UpdateOrLink.Unlink -> encoder.encodeSerializableValue(LinkAction.serializer(), LinkAction(del = value.id))
+    }
+
+    override fun deserialize(decoder: Decoder): UpdateOrLink<T> =
+        UpdateOrLink.Update(decoder.decodeSerializableValue(inputSerializer))
+}
+
+@Serializable
+class Response<T>(val data: T)
+
+class RequestException(val status: Int, val body: String) : IOException("request failed with status $status")
+
+internal fun <T> include(name: String, serializer: SerializationStrategy<T>, query: T?): JsonElement =
+    if (query == null) JsonPrimitive(name) else buildJsonObject { put(name, RequestManager.encode(serializer, query)) }
+
+@Serializable
+enum class Gender {
+    MALE,
+    FEMALE,
+}
+
+@Serializable
+data class SingerCreateInput(
+    val email: String,
+    val name: String,
+    val nickname: String? = null,
+    val code: String? = null,
+    val phoneNum: String? = null,
+    val gender: Gender? = null,
+    val age: Int? = null,
+    val rating: Double? = null,
+    val verified: Boolean? = null,
+)
+
+@Serializable
+data class SingerUpdateInput(
+    val email: String? = null,
+    val name: String? = null,
+    val nickname: String? = null,
+    val code: String? = null,
+    val phoneNum: String? = null,
+    val gender: Gender? = null,
+    val age: Int? = null,
+    val rating: Double? = null,
+    val verified: Boolean? = null,
+)
+
+@Serializable
+enum class SingerSortOrder {
+    @SerialName("email") EMAIL,
+    @SerialName("-email") EMAIL_DESC,
+    @SerialName("name") NAME,
+    @SerialName("-name") NAME_DESC,
+    @SerialName("nickname") NICKNAME,
+    @SerialName("-nickname") NICKNAME_DESC,
+    @SerialName("code") CODE,
+    @SerialName("-code") CODE_DESC,
+    @SerialName("phoneNum") PHONE_NUM,
+    @SerialName("-phoneNum") PHONE_NUM_DESC,
+    @SerialName("gender") GENDER,
+    @SerialName("-gender") GENDER_DESC,
+    @SerialName("age") AGE,
+    @SerialName("-age") AGE_DESC,
+    @SerialName("rating") RATING,
+    @SerialName("-rating") RATING_DESC,
+    @SerialName("verified") VERIFIED,
+    @SerialName("-verified") VERIFIED_DESC;
+
+    operator fun unaryMinus(): SingerSortOrder = when (this) {
+        EMAIL -> EMAIL_DESC
+        EMAIL_DESC -> EMAIL
+        NAME -> NAME_DESC
+        NAME_DESC -> NAME
+        NICKNAME -> NICKNAME_DESC
+        NICKNAME_DESC -> NICKNAME
+        CODE -> CODE_DESC
+        CODE_DESC -> CODE
+        PHONE_NUM -> PHONE_NUM_DESC
+        PHONE_NUM_DESC -> PHONE_NUM
+        GENDER -> GENDER_DESC
+        GENDER_DESC -> GENDER
+        AGE -> AGE_DESC
+        AGE_DESC -> AGE
+        RATING -> RATING_DESC
+        RATING_DESC -> RATING
+        VERIFIED -> VERIFIED_DESC
+        VERIFIED_DESC -> VERIFIED
+    }
+}
+
+@Serializable
+enum class SingerResultPick {
+    @SerialName("id") ID,
+    @SerialName("email") EMAIL,
+    @SerialName("name") NAME,
+    @SerialName("nickname") NICKNAME,
+    @SerialName("code") CODE,
+    @SerialName("phoneNum") PHONE_NUM,
+    @SerialName("gender") GENDER,
+    @SerialName("age") AGE,
+    @SerialName("rating") RATING,
+    @SerialName("verified") VERIFIED,
+}
+
+@Serializable
+data class SingerSingleQuery(
+    val _pick: List<SingerResultPick>? = null,
+    val _omit: List<SingerResultPick>? = null,
+) {
+    fun pick(vararg picks: SingerResultPick): SingerSingleQuery = copy(_pick = picks.toList())
+    fun omit(vararg omits: SingerResultPick): SingerSingleQuery = copy(_omit = omits.toList())
+}
+
+@Serializable
+data class SingerSeekQuery(
+    val id: StringQuery? = null,
+    val email: StringQuery? = null,
+    val name: StringQuery? = null,
+    val nickname: StringQuery? = null,
+    val code: StringQuery? = null,
+    val phoneNum: StringQuery? = null,
+    val gender: Gender? = null,
+    val age: IntQuery? = null,
+    val rating: FloatQuery? = null,
+    val verified: BoolQuery? = null,
+)
+
+@Serializable
+data class SingerQueryData(
+    val _query: SingerSeekQuery,
+    val _data: SingerUpdateInput,
+)
+
+@Serializable
+data class SingerListQuery(
+    val id: StringQuery? = null,
+    val email: StringQuery? = null,
+    val name: StringQuery? = null,
+    val nickname: StringQuery? = null,
+    val code: StringQuery? = null,
+    val phoneNum: StringQuery? = null,
+    val gender: Gender? = null,
+    val age: IntQuery? = null,
+    val rating: FloatQuery? = null,
+    val verified: BoolQuery? = null,
+    val _order: List<SingerSortOrder>? = null,
+    val _limit: Int? = null,
+    val _skip: Int? = null,
+    val _pageNo: Int? = null,
+    val _pageSize: Int? = null,
+    val _pick: List<SingerResultPick>? = null,
+    val _omit: List<SingerResultPick>? = null,
+) {
+    fun order(vararg orders: SingerSortOrder): SingerListQuery = copy(_order = _order.orEmpty() + orders)
+    fun limit(limit: Int): SingerListQuery = copy(_limit = limit)
+    fun skip(skip: Int): SingerListQuery = copy(_skip = skip)
+    fun pageNo(pageNo: Int): SingerListQuery = copy(_pageNo = pageNo)
+    fun pageSize(pageSize: Int): SingerListQuery = copy(_pageSize = pageSize)
+    fun pick(vararg picks: SingerResultPick): SingerListQuery = copy(_pick = picks.toList())
+    fun omit(vararg omits: SingerResultPick): SingerListQuery = copy(_omit = omits.toList())
+}
+
+@Serializable
+data class Singer(
+    val id: String? = null,
+    val email: String? = null,
+    val name: String? = null,
+    val nickname: String? = null,
+    val code: String? = null,
+    val phoneNum: String? = null,
+    val gender: Gender? = null,
+    val age: Int? = null,
+    val rating: Double? = null,
+    val verified: Boolean? = null,
+)
+
+object RequestManager {
+
+    var baseUrl: String = "None"
+
+    internal val json = Json {
+        ignoreUnknownKeys = true
+        explicitNulls = false
+    }
+
+    private val mediaType = "application/json; charset=utf-8".toMediaType()
+
+    private val client = OkHttpClient.Builder()
+        .connectionPool(ConnectionPool(8, 5, TimeUnit.MINUTES))
+        .dispatcher(Dispatcher().apply { maxRequestsPerHost = 8 })
+        .build()
+
+    internal fun <T> encode(serializer: SerializationStrategy<T>, value: T): JsonElement =
+        json.encodeToJsonElement(serializer, value)
+
+    internal suspend fun <T> get(url: String, query: JsonElement?, serializer: KSerializer<T>): T =
+        decode(send("GET", url, null, query), serializer)
+
+    internal suspend fun <T> post(url: String, input: JsonElement, query: JsonElement?, serializer: KSerializer<T>): T =
+        decode(send("POST", url, input, query), serializer)
+
+    internal suspend fun <T> patch(url: String, input: JsonElement, query: JsonElement?, serializer: KSerializer<T>): T =
+        decode(send("PATCH", url, input, query), serializer)
+
+    internal suspend fun delete(url: String, query: JsonElement? = null) {
+        send("DELETE", url, null, query)
+    }
+
+    private fun <T> decode(content: String, serializer: KSerializer<T>): T =
+        json.decodeFromString(Response.serializer(serializer), content).data
+
+    private suspend fun send(method: String, url: String, input: JsonElement?, query: JsonElement?): String {
+        val body = input?.let { json.encodeToString(JsonElement.serializer(), it).toRequestBody(mediaType) }
+        val builder = Request.Builder()
+            .url((baseUrl + url + qs(query)).toHttpUrl())
+            .method(method, body)
+        return client.newCall(builder.build()).await().use { response ->
+            val content = response.body?.string() ?: ""
+            if (!response.isSuccessful) {
+                throw RequestException(response.code, content)
+            }
+            content
+        }
+    }
+
+    private fun qs(query: JsonElement?): String {
+        val items = mutableListOf<String>()
+        if (query is JsonObject) {
+            query.forEach { (key, value) -> flatten(key, value, items) }
+        }
+        return if (items.isEmpty()) "" else "?" + items.joinToString("&")
+    }
+
+    private fun flatten(key: String, value: JsonElement, items: MutableList<String>) {
+        when (value) {
+            is JsonObject -> value.forEach { (k, v) -> flatten("$key[$k]", v, items) }
+            is JsonArray -> value.forEachIndexed { index, v -> flatten("$key[$index]", v, items) }
+            is JsonPrimitive -> items.add(key + "=" + URLEncoder.encode(value.content, Charsets.UTF_8).replace("+", "%20"))
+        }
+    }
+}
+
+private suspend fun Call.await(): okhttp3.Response = suspendCancellableCoroutine { continuation ->
+    continuation.invokeOnCancellation { cancel() }
+    enqueue(object : Callback {
+        override fun onResponse(call: Call, response: okhttp3.Response) {
+            continuation.resume(response)
+        }
+
+        override fun onFailure(call: Call, e: IOException) {
+            continuation.resumeWithException(e)
+        }
+    })
+}
+
+class SingerCreateRequest internal constructor(
+    private val input: SingerCreateInput,
+    private var query: SingerSingleQuery = SingerSingleQuery(),
+) {
+    fun pick(vararg picks: SingerResultPick): SingerCreateRequest = apply { query = query.pick(*picks) }
+    fun omit(vararg omits: SingerResultPick): SingerCreateRequest = apply { query = query.omit(*omits) }
+
+    suspend fun exec(): Singer = with(RequestManager) {
+        post(
+            "/singers",
+            encode(SingerCreateInput.serializer(), input),
+            encode(SingerSingleQuery.serializer(), query),
+            Singer.serializer(),
+        )
+    }
+}
+
+class SingerUpdateRequest internal constructor(
+    private val id: String,
+    private val input: SingerUpdateInput,
+    private var query: SingerSingleQuery = SingerSingleQuery(),
+) {
+    fun pick(vararg picks: SingerResultPick): SingerUpdateRequest = apply { query = query.pick(*picks) }
+    fun omit(vararg omits: SingerResultPick): SingerUpdateRequest = apply { query = query.omit(*omits) }
+
+    suspend fun exec(): Singer = with(RequestManager) {
+        patch(
+            "/singers/$id",
+            encode(SingerUpdateInput.serializer(), input),
+            encode(SingerSingleQuery.serializer(), query),
+            Singer.serializer(),
+        )
+    }
+}
+
+class SingerDeleteRequest internal constructor(
+    private val id: String,
+) {
+    suspend fun exec() = with(RequestManager) {
+        delete(
+            "/singers/$id",
+        )
+    }
+}
+
+class SingerIDRequest internal constructor(
+    private val id: String,
+    private var query: SingerSingleQuery = SingerSingleQuery(),
+) {
+    fun pick(vararg picks: SingerResultPick): SingerIDRequest = apply { query = query.pick(*picks) }
+    fun omit(vararg omits: SingerResultPick): SingerIDRequest = apply { query = query.omit(*omits) }
+
+    suspend fun exec(): Singer = with(RequestManager) {
+        get(
+            "/singers/$id",
+            encode(SingerSingleQuery.serializer(), query),
+            Singer.serializer(),
+        )
+    }
+}
+
+class SingerUpsertRequest internal constructor(
+    private val input: SingerQueryData,
+    private var query: SingerSingleQuery = SingerSingleQuery(),
+) {
+    fun pick(vararg picks: SingerResultPick): SingerUpsertRequest = apply { query = query.pick(*picks) }
+    fun omit(vararg omits: SingerResultPick): SingerUpsertRequest = apply { query = query.omit(*omits) }
+
+    suspend fun exec(): Singer = with(RequestManager) {
+        post(
+            "/singers",
+            buildJsonObject { put("_upsert", encode(SingerQueryData.serializer(), input)) },
+            encode(SingerSingleQuery.serializer(), query),
+            Singer.serializer(),
+        )
+    }
+}
+
+class SingerCreateManyRequest internal constructor(
+    private val input: List<SingerCreateInput>,
+    private var query: SingerSingleQuery = SingerSingleQuery(),
+) {
+    fun pick(vararg picks: SingerResultPick): SingerCreateManyRequest = apply { query = query.pick(*picks) }
+    fun omit(vararg omits: SingerResultPick): SingerCreateManyRequest = apply { query = query.omit(*omits) }
+
+    suspend fun exec(): List<Singer> = with(RequestManager) {
+        post(
+            "/singers",
+            buildJsonObject { put("_create", encode(ListSerializer(SingerCreateInput.serializer()), input)) },
+            encode(SingerSingleQuery.serializer(), query),
+            ListSerializer(Singer.serializer()),
+        )
+    }
+}
+
+class SingerUpdateManyRequest internal constructor(
+    private val input: SingerQueryData,
+    private var query: SingerSingleQuery = SingerSingleQuery(),
+) {
+    fun pick(vararg picks: SingerResultPick): SingerUpdateManyRequest = apply { query = query.pick(*picks) }
+    fun omit(vararg omits: SingerResultPick): SingerUpdateManyRequest = apply { query = query.omit(*omits) }
+
+    suspend fun exec(): List<Singer> = with(RequestManager) {
+        patch(
+            "/singers",
+            buildJsonObject { put("_update", encode(SingerQueryData.serializer(), input)) },
+            encode(SingerSingleQuery.serializer(), query),
+            ListSerializer(Singer.serializer()),
+        )
+    }
+}
+
+class SingerDeleteManyRequest internal constructor(
+    private val query: SingerSeekQuery,
+) {
+    suspend fun exec() = with(RequestManager) {
+        delete(
+            "/singers",
+            encode(SingerSeekQuery.serializer(), query),
+        )
+    }
+}
+
+class SingerListRequest internal constructor(
+    private var query: SingerListQuery = SingerListQuery(),
+) {
+    fun order(vararg orders: SingerSortOrder): SingerListRequest = apply { query = query.order(*orders) }
+    fun limit(limit: Int): SingerListRequest = apply { query = query.limit(limit) }
+    fun skip(skip: Int): SingerListRequest = apply { query = query.skip(skip) }
+    fun pageNo(pageNo: Int): SingerListRequest = apply { query = query.pageNo(pageNo) }
+    fun pageSize(pageSize: Int): SingerListRequest = apply { query = query.pageSize(pageSize) }
+    fun pick(vararg picks: SingerResultPick): SingerListRequest = apply { query = query.pick(*picks) }
+    fun omit(vararg omits: SingerResultPick): SingerListRequest = apply { query = query.omit(*omits) }
+
+    suspend fun exec(): List<Singer> = with(RequestManager) {
+        get(
+            "/singers",
+            encode(SingerListQuery.serializer(), query),
+            ListSerializer(Singer.serializer()),
+        )
+    }
+
+    fun asFlow(pageSize: Int = 100): Flow<Singer> = flow {
+        var skip = query._skip ?: 0
+        var remaining = query._limit
+        while (remaining == null || remaining > 0) {
+            val limit = if (remaining == null) pageSize else minOf(pageSize, remaining)
+            val page = SingerListRequest(query.copy(_skip = skip, _limit = limit, _pageNo = null, _pageSize = null)).exec()
+            page.forEach { emit(it) }
+            if (page.size < limit) {
+                break
+            }
+            skip += limit
+            remaining = remaining?.minus(limit)
+        }
+    }
+}
+
+class SingerClient internal constructor() {
+    fun create(input: SingerCreateInput): SingerCreateRequest = SingerCreateRequest(input)
+
+    fun create(
+        email: String,
+        name: String,
+        nickname: String? = null,
+        code: String? = null,
+        phoneNum: String? = null,
+        gender: Gender? = null,
+        age: Int? = null,
+        rating: Double? = null,
+        verified: Boolean? = null,
+    ): SingerCreateRequest = create(
+        SingerCreateInput(
+            email = email,
+            name = name,
+            nickname = nickname,
+            code = code,
+            phoneNum = phoneNum,
+            gender = gender,
+            age = age,
+            rating = rating,
+            verified = verified,
+        )
+    )
+
+    fun update(id: String, input: SingerUpdateInput): SingerUpdateRequest = SingerUpdateRequest(id, input)
+
+    fun update(
+        id: String,
+        email: String? = null,
+        name: String? = null,
+        nickname: String? = null,
+        code: String? = null,
+        phoneNum: String? = null,
+        gender: Gender? = null,
+        age: Int? = null,
+        rating: Double? = null,
+        verified: Boolean? = null,
+    ): SingerUpdateRequest = update(
+        id,
+        SingerUpdateInput(
+            email = email,
+            name = name,
+            nickname = nickname,
+            code = code,
+            phoneNum = phoneNum,
+            gender = gender,
+            age = age,
+            rating = rating,
+            verified = verified,
+        )
+    )
+
+    suspend fun delete(id: String): Unit = SingerDeleteRequest(id).exec()
+
+    fun id(id: String): SingerIDRequest = SingerIDRequest(id)
+
+    fun find(query: SingerListQuery): SingerListRequest = SingerListRequest(query)
+
+    fun find(
+        id: StringQuery? = null,
+        email: StringQuery? = null,
+        name: StringQuery? = null,
+        nickname: StringQuery? = null,
+        code: StringQuery? = null,
+        phoneNum: StringQuery? = null,
+        gender: Gender? = null,
+        age: IntQuery? = null,
+        rating: FloatQuery? = null,
+        verified: BoolQuery? = null,
+    ): SingerListRequest = find(
+        SingerListQuery(
+            id = id,
+            email = email,
+            name = name,
+            nickname = nickname,
+            code = code,
+            phoneNum = phoneNum,
+            gender = gender,
+            age = age,
+            rating = rating,
+            verified = verified,
+        )
+    )
+
+    fun upsert(query: SingerSeekQuery, data: SingerUpdateInput): SingerUpsertRequest =
+        SingerUpsertRequest(SingerQueryData(query, data))
+
+    fun createMany(input: List<SingerCreateInput>): SingerCreateManyRequest = SingerCreateManyRequest(input)
+
+    fun updateMany(query: SingerSeekQuery, data: SingerUpdateInput): SingerUpdateManyRequest =
+        SingerUpdateManyRequest(SingerQueryData(query, data))
+
+    suspend fun deleteMany(query: SingerSeekQuery = SingerSeekQuery()): Unit = SingerDeleteManyRequest(query).exec()
+}
+
+val singers = SingerClient()
+
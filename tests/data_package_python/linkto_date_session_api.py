@@ -0,0 +1,1061 @@
+from __future__ import annotations
+from typing import Any, AsyncIterator, Generator, Literal, NotRequired, Protocol, TypedDict
+from asyncio import Semaphore, gather
+from datetime import date, datetime, timezone
+from enum import Enum
+from json import dumps, loads
+from pathlib import Path
+from urllib.parse import quote
+from httpx import AsyncBaseTransport, AsyncClient, Limits
+
+
+class RequestError(Exception):
+
+    def __init__(self, status: int, content: str) -> None:
+        super().__init__(f'{status}: {content}')
+        self.status = status
+        self.content = content
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value.isoformat(timespec='milliseconds') + 'Z'
+    if isinstance(value, date):
+        return value.isoformat() + 'T00:00:00.000Z'
+    if isinstance(value, Enum):
+        return value.name
+    if isinstance(value, dict):
+        return {k: _encode(v) for (k, v) in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode(v) for v in value]
+    return value
+
+
+def _decode_date(value: str) -> date:
+    return datetime.fromisoformat(value).date()
+
+
+def _decode_datetime(value: str) -> datetime:
+    return datetime.fromisoformat(value)
+
+
+def _qs(query: Any) -> str:
+    items: list[str] = []
+    if isinstance(query, dict):
+        for (key, value) in _encode(query).items():
+            _flatten(key, value, items)
+    return '' if len(items) == 0 else '?' + '&'.join(items)
+
+
+def _flatten(key: str, value: Any, items: list[str]) -> None:
+    if isinstance(value, dict):
+        for (k, v) in value.items():
+            _flatten(f'{key}[{k}]', v, items)
+    elif isinstance(value, list):
+        for (index, v) in enumerate(value):
+            _flatten(f'{key}[{index}]', v, items)
+    elif value is None:
+        items.append(f'{key}=null')
+    elif isinstance(value, bool):
+        items.append(f'{key}=true' if value else f'{key}=false')
+    else:
+        items.append(f'{key}=' + quote(str(value), safe=''))
+
+
+Mode = Literal['default', 'insensitive']
+
+
+class StringValueQuery(TypedDict, total=False):
+    _eq: str
+    _neq: str
+    _null: bool
+    _gt: str
+    _gte: str
+    _lt: str
+    _lte: str
+    _contains: str
+    _prefix: str
+    _suffix: str
+    _match: str
+    _mode: Mode
+    _or: list[StringQuery]
+    _and: list[StringQuery]
+
+
+StringQuery = str | StringValueQuery
+
+
+class IntValueQuery(TypedDict, total=False):
+    _eq: int
+    _neq: int
+    _null: bool
+    _gt: int
+    _gte: int
+    _lt: int
+    _lte: int
+    _or: list[IntQuery]
+    _and: list[IntQuery]
+
+
+IntQuery = int | IntValueQuery
+
+
+class FloatValueQuery(TypedDict, total=False):
+    _eq: float
+    _neq: float
+    _null: bool
+    _gt: float
+    _gte: float
+    _lt: float
+    _lte: float
+    _or: list[FloatQuery]
+    _and: list[FloatQuery]
+
+
+FloatQuery = float | FloatValueQuery
+
+
+class BoolValueQuery(TypedDict, total=False):
+    _eq: bool
+    _neq: bool
+    _null: bool
+    _or: list[BoolQuery]
+    _and: list[BoolQuery]
+
+
+BoolQuery = bool | BoolValueQuery
+
+
+class DateValueQuery(TypedDict, total=False):
+    _eq: date | datetime
+    _neq: date | datetime
+    _null: bool
+    _gt: date | datetime
+    _gte: date | datetime
+    _lt: date | datetime
+    _lte: date | datetime
+    _or: list[DateQuery]
+    _and: list[DateQuery]
+
+
+DateQuery = date | datetime | DateValueQuery
+
+
+class IDValueQuery(TypedDict, total=False):
+    _eq: str
+    _neq: str
+    _null: bool
+
+
+IDQuery = str | IDValueQuery
+
+
+class Link(TypedDict):
+    _add: str
+
+
+class UnLink(TypedDict):
+    _del: str
+
+
+class UserCreateInput(TypedDict):
+    username: str
+    password: str
+    birthday: NotRequired[date]
+    articles: NotRequired[list[ArticleCreateInput]]
+
+
+class UserUpdateInput(TypedDict, total=False):
+    username: str
+    password: str
+    birthday: date
+    articles: list[ArticleUpdateInput]
+
+
+UserSortOrder = Literal['username', '-username', 'birthday', '-birthday', 'createdAt', '-createdAt']
+
+
+UserResultPick = Literal['id', 'username', 'birthday', 'articles', 'createdAt']
+
+
+class UserArticlesInclude(TypedDict):
+    articles: ArticleListQuery
+
+
+UserInclude = Literal['articles'] | UserArticlesInclude
+
+
+class UserSingleQuery(TypedDict, total=False):
+    _pick: list[UserResultPick]
+    _omit: list[UserResultPick]
+    _includes: list[UserInclude]
+
+
+class UserSeekQuery(TypedDict, total=False):
+    id: StringQuery
+    username: StringQuery
+    birthday: DateQuery
+    createdAt: DateQuery
+
+
+class UserQueryData(TypedDict):
+    _query: UserSeekQuery
+    _data: UserUpdateInput
+
+
+class UserListQuery(UserSeekQuery, total=False):
+    _order: list[UserSortOrder]
+    _limit: int
+    _skip: int
+    _pageNo: int
+    _pageSize: int
+    _pick: list[UserResultPick]
+    _omit: list[UserResultPick]
+    _includes: list[UserInclude]
+
+
+class User(TypedDict):
+    id: str
+    username: str
+    birthday: NotRequired[date]
+    articles: NotRequired[list[Article]]
+    createdAt: datetime
+
+
+def _decode_user(data: Any) -> Any:
+    if data is None:
+        return data
+    if data.get('birthday') is not None:
+        data['birthday'] = _decode_date(data['birthday'])
+    if data.get('articles') is not None:
+        data['articles'] = [_decode_article(v) for v in data['articles']]
+    if data.get('createdAt') is not None:
+        data['createdAt'] = _decode_datetime(data['createdAt'])
+    return data
+
+
+class ArticleCreateInput(TypedDict):
+    title: str
+    publishedAt: list[datetime]
+    author: NotRequired[UserCreateInput | Link]
+    author_id: NotRequired[str]
+
+
+class ArticleUpdateInput(TypedDict, total=False):
+    title: str
+    publishedAt: list[datetime]
+    author: UserUpdateInput | Link | UnLink
+    author_id: str
+
+
+ArticleSortOrder = Literal['title', '-title', 'publishedAt', '-publishedAt']
+
+
+ArticleResultPick = Literal['id', 'title', 'publishedAt', 'author', 'author_id']
+
+
+class ArticleAuthorInclude(TypedDict):
+    author: UserSingleQuery
+
+
+ArticleInclude = Literal['author'] | ArticleAuthorInclude
+
+
+class ArticleSingleQuery(TypedDict, total=False):
+    _pick: list[ArticleResultPick]
+    _omit: list[ArticleResultPick]
+    _includes: list[ArticleInclude]
+
+
+class ArticleSeekQuery(TypedDict, total=False):
+    id: StringQuery
+    title: StringQuery
+    publishedAt: list[DateQuery]
+    author_id: IDQuery
+
+
+class ArticleQueryData(TypedDict):
+    _query: ArticleSeekQuery
+    _data: ArticleUpdateInput
+
+
+class ArticleListQuery(ArticleSeekQuery, total=False):
+    _order: list[ArticleSortOrder]
+    _limit: int
+    _skip: int
+    _pageNo: int
+    _pageSize: int
+    _pick: list[ArticleResultPick]
+    _omit: list[ArticleResultPick]
+    _includes: list[ArticleInclude]
+
+
+class Article(TypedDict):
+    id: str
+    title: str
+    publishedAt: list[datetime]
+    author: NotRequired[User]
+    author_id: NotRequired[str]
+
+
+def _decode_article(data: Any) -> Any:
+    if data is None:
+        return data
+    if data.get('publishedAt') is not None:
+        data['publishedAt'] = [_decode_datetime(v) for v in data['publishedAt']]
+    if data.get('author') is not None:
+        data['author'] = _decode_user(data['author'])
+    return data
+
+
+class UserSessionInput(TypedDict):
+    username: str
+    password: str
+
+
+class Session(TypedDict):
+    token: str
+    user: User
+
+
+def _decode_session(data: Any) -> Any:
+    if data.get('user') is not None:
+        data['user'] = _decode_user(data['user'])
+    return data
+
+
+class SessionStorage(Protocol):
+
+    def load(self) -> str | None:
+        ...
+
+    def save(self, value: str | None) -> None:
+        ...
+
+
+class MemorySessionStorage:
+
+    def __init__(self) -> None:
+        self.value: str | None = None
+
+    def load(self) -> str | None:
+        return self.value
+
+    def save(self, value: str | None) -> None:
+        self.value = value
+
+
+class FileSessionStorage:
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+
+    def load(self) -> str | None:
+        return self.path.read_text() if self.path.is_file() else None
+
+    def save(self, value: str | None) -> None:
+        if value is None:
+            self.path.unlink(missing_ok=True)
+        else:
+            self.path.write_text(value)
+
+
+class SessionManager:
+
+    def __init__(self) -> None:
+        self.storage: SessionStorage = MemorySessionStorage()
+        self._loaded = False
+        self._session: Session | None = None
+
+    def use(self, storage: SessionStorage) -> None:
+        self.storage = storage
+        self._loaded = False
+
+    @property
+    def session(self) -> Session | None:
+        if not self._loaded:
+            self._loaded = True
+            content = self.storage.load()
+            self._session = None if content is None else _decode_session(loads(content))
+        return self._session
+
+    @session.setter
+    def session(self, session: Session | None) -> None:
+        self._loaded = True
+        self._session = session
+        self.storage.save(None if session is None else dumps(_encode(session)))
+
+    @property
+    def authorization(self) -> str | None:
+        session = self.session
+        return None if session is None else 'Bearer ' + session['token']
+
+
+session_manager = SessionManager()
+
+
+def sign_out() -> None:
+    session_manager.session = None
+
+
+class RequestManager:
+
+    def __init__(self, base_url: str, concurrency: int = 8) -> None:
+        self.base_url = base_url
+        self.concurrency = concurrency
+        self.transport: AsyncBaseTransport | None = None
+        self._client: AsyncClient | None = None
+        self._semaphore: Semaphore | None = None
+
+    def configure(self,
+                  base_url: str | None = None,
+                  concurrency: int | None = None,
+                  transport: AsyncBaseTransport | None = None) -> None:
+        if self._client is not None:
+            raise RuntimeError('cannot configure an open request manager, call aclose first')
+        if base_url is not None:
+            self.base_url = base_url
+        if concurrency is not None:
+            self.concurrency = concurrency
+        if transport is not None:
+            self.transport = transport
+
+    @property
+    def client(self) -> AsyncClient:
+        if self._client is None:
+            limits = Limits(max_connections=self.concurrency,
+                            max_keepalive_connections=self.concurrency,
+                            keepalive_expiry=30)
+            self._client = AsyncClient(base_url=self.base_url,
+                                       transport=self.transport,
+                                       limits=limits,
+                                       timeout=30)
+            self._semaphore = Semaphore(self.concurrency)
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+        self._client = None
+        self._semaphore = None
+
+    async def __aenter__(self) -> RequestManager:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    async def get(self, url: str, query: Any = None) -> Any:
+        return await self.send('GET', url, None, query)
+
+    async def post(self, url: str, input: Any, query: Any = None) -> Any:
+        return await self.send('POST', url, input, query)
+
+    async def patch(self, url: str, input: Any, query: Any = None) -> Any:
+        return await self.send('PATCH', url, input, query)
+
+    async def delete(self, url: str, query: Any = None) -> None:
+        await self.send('DELETE', url, None, query)
+
+    async def send(self, method: str, url: str, input: Any, query: Any) -> Any:
+        client = self.client
+        assert self._semaphore is not None
+        async with self._semaphore:
+            response = await client.request(method,
+                                            url + _qs(query),
+                                            json=None if input is None else _encode(input),
+                                            headers=self.headers())
+        if response.is_error:
+            raise RequestError(response.status_code, response.text)
+        if len(response.content) == 0:
+            return None
+        return response.json().get('data')
+
+    def headers(self) -> dict[str, str]:
+        authorization = session_manager.authorization
+        return {} if authorization is None else {'Authorization': authorization}
+
+
+request_manager = RequestManager('None')
+
+
+class UserCreateRequest:
+
+    def __init__(self, input: UserCreateInput, query: UserSingleQuery | None = None) -> None:
+        self._input = input
+        self._query: UserSingleQuery = query or {}
+
+    def pick(self, *picks: UserResultPick) -> UserCreateRequest:
+        self._query['_pick'] = list(picks)
+        return self
+
+    def omit(self, *omits: UserResultPick) -> UserCreateRequest:
+        self._query['_omit'] = list(omits)
+        return self
+
+    def include(self, *includes: UserInclude) -> UserCreateRequest:
+        self._query['_includes'] = [*self._query.get('_includes', []), *includes]
+        return self
+
+    async def exec(self) -> User:
+        return _decode_user(await request_manager.post('/users', self._input, self._query))
+
+    def __await__(self) -> Generator[Any, None, User]:
+        return self.exec().__await__()
+
+
+class UserUpdateRequest:
+
+    def __init__(self, id: str, input: UserUpdateInput, query: UserSingleQuery | None = None) -> None:
+        self._id = id
+        self._input = input
+        self._query: UserSingleQuery = query or {}
+
+    def pick(self, *picks: UserResultPick) -> UserUpdateRequest:
+        self._query['_pick'] = list(picks)
+        return self
+
+    def omit(self, *omits: UserResultPick) -> UserUpdateRequest:
+        self._query['_omit'] = list(omits)
+        return self
+
+    def include(self, *includes: UserInclude) -> UserUpdateRequest:
+        self._query['_includes'] = [*self._query.get('_includes', []), *includes]
+        return self
+
+    async def exec(self) -> User:
+        return _decode_user(await request_manager.patch('/users/' + self._id, self._input, self._query))
+
+    def __await__(self) -> Generator[Any, None, User]:
+        return self.exec().__await__()
+
+
+class UserDeleteRequest:
+
+    def __init__(self, id: str) -> None:
+        self._id = id
+
+    async def exec(self) -> None:
+        return await request_manager.delete('/users/' + self._id)
+
+    def __await__(self) -> Generator[Any, None, None]:
+        return self.exec().__await__()
+
+
+class UserIDRequest:
+
+    def __init__(self, id: str, query: UserSingleQuery | None = None) -> None:
+        self._id = id
+        self._query: UserSingleQuery = query or {}
+
+    def pick(self, *picks: UserResultPick) -> UserIDRequest:
+        self._query['_pick'] = list(picks)
+        return self
+
+    def omit(self, *omits: UserResultPick) -> UserIDRequest:
+        self._query['_omit'] = list(omits)
+        return self
+
+    def include(self, *includes: UserInclude) -> UserIDRequest:
+        self._query['_includes'] = [*self._query.get('_includes', []), *includes]
+        return self
+
+    async def exec(self) -> User:
+        return _decode_user(await request_manager.get('/users/' + self._id, self._query))
+
+    def __await__(self) -> Generator[Any, None, User]:
+        return self.exec().__await__()
+
+
+class UserUpsertRequest:
+
+    def __init__(self, input: UserQueryData, query: UserSingleQuery | None = None) -> None:
+        self._input = input
+        self._query: UserSingleQuery = query or {}
+
+    def pick(self, *picks: UserResultPick) -> UserUpsertRequest:
+        self._query['_pick'] = list(picks)
+        return self
+
+    def omit(self, *omits: UserResultPick) -> UserUpsertRequest:
+        self._query['_omit'] = list(omits)
+        return self
+
+    def include(self, *includes: UserInclude) -> UserUpsertRequest:
+        self._query['_includes'] = [*self._query.get('_includes', []), *includes]
+        return self
+
+    async def exec(self) -> User:
+        return _decode_user(await request_manager.post('/users', {'_upsert': self._input}, self._query))
+
+    def __await__(self) -> Generator[Any, None, User]:
+        return self.exec().__await__()
+
+
+class UserCreateManyRequest:
+
+    def __init__(self, input: list[UserCreateInput], chunk_size: int | None = None, query: UserSingleQuery | None = None) -> None:
+        self._input = input
+        self._chunk_size = chunk_size
+        self._query: UserSingleQuery = query or {}
+
+    def pick(self, *picks: UserResultPick) -> UserCreateManyRequest:
+        self._query['_pick'] = list(picks)
+        return self
+
+    def omit(self, *omits: UserResultPick) -> UserCreateManyRequest:
+        self._query['_omit'] = list(omits)
+        return self
+
+    def include(self, *includes: UserInclude) -> UserCreateManyRequest:
+        self._query['_includes'] = [*self._query.get('_includes', []), *includes]
+        return self
+
+    async def exec(self) -> list[User]:
+        size = self._chunk_size or len(self._input) or 1
+        chunks = [self._input[i:i + size] for i in range(0, len(self._input), size)]
+        pages = await gather(*[request_manager.post('/users', {'_create': c}, self._query) for c in chunks])
+        return [_decode_user(v) for page in pages for v in page]
+
+    def __await__(self) -> Generator[Any, None, list[User]]:
+        return self.exec().__await__()
+
+
+class UserUpdateManyRequest:
+
+    def __init__(self, input: UserQueryData, query: UserSingleQuery | None = None) -> None:
+        self._input = input
+        self._query: UserSingleQuery = query or {}
+
+    def pick(self, *picks: UserResultPick) -> UserUpdateManyRequest:
+        self._query['_pick'] = list(picks)
+        return self
+
+    def omit(self, *omits: UserResultPick) -> UserUpdateManyRequest:
+        self._query['_omit'] = list(omits)
+        return self
+
+    def include(self, *includes: UserInclude) -> UserUpdateManyRequest:
+        self._query['_includes'] = [*self._query.get('_includes', []), *includes]
+        return self
+
+    async def exec(self) -> list[User]:
+        return [_decode_user(v) for v in await request_manager.patch('/users', {'_update': self._input}, self._query)]
+
+    def __await__(self) -> Generator[Any, None, list[User]]:
+        return self.exec().__await__()
+
+
+class UserDeleteManyRequest:
+
+    def __init__(self, query: UserSeekQuery) -> None:
+        self._query = query
+
+    async def exec(self) -> None:
+        return await request_manager.delete('/users', self._query)
+
+    def __await__(self) -> Generator[Any, None, None]:
+        return self.exec().__await__()
+
+
+class UserListRequest:
+
+    def __init__(self, query: UserListQuery | None = None) -> None:
+        self._query: UserListQuery = query or {}
+
+    def order(self, *orders: UserSortOrder) -> UserListRequest:
+        self._query['_order'] = [*self._query.get('_order', []), *orders]
+        return self
+
+    def limit(self, limit: int) -> UserListRequest:
+        self._query['_limit'] = limit
+        return self
+
+    def skip(self, skip: int) -> UserListRequest:
+        self._query['_skip'] = skip
+        return self
+
+    def page_no(self, page_no: int) -> UserListRequest:
+        self._query['_pageNo'] = page_no
+        return self
+
+    def page_size(self, page_size: int) -> UserListRequest:
+        self._query['_pageSize'] = page_size
+        return self
+
+    def pick(self, *picks: UserResultPick) -> UserListRequest:
+        self._query['_pick'] = list(picks)
+        return self
+
+    def omit(self, *omits: UserResultPick) -> UserListRequest:
+        self._query['_omit'] = list(omits)
+        return self
+
+    def include(self, *includes: UserInclude) -> UserListRequest:
+        self._query['_includes'] = [*self._query.get('_includes', []), *includes]
+        return self
+
+    async def exec(self) -> list[User]:
+        return [_decode_user(v) for v in await request_manager.get('/users', self._query)]
+
+    def __await__(self) -> Generator[Any, None, list[User]]:
+        return self.exec().__await__()
+
+    async def iter(self, page_size: int = 100) -> AsyncIterator[User]:
+        query: UserListQuery = {**self._query}
+        query.pop('_pageNo', None)
+        query.pop('_pageSize', None)
+        skip = query.get('_skip', 0)
+        remaining = query.get('_limit')
+        while remaining is None or remaining > 0:
+            limit = page_size if remaining is None else min(page_size, remaining)
+            page = await UserListRequest({**query, '_skip': skip, '_limit': limit})
+            for item in page:
+                yield item
+            if len(page) < limit:
+                break
+            skip += limit
+            remaining = None if remaining is None else remaining - limit
+
+    def __aiter__(self) -> AsyncIterator[User]:
+        return self.iter()
+
+
+class UserSignInRequest:
+
+    def __init__(self, input: UserSessionInput, query: UserSingleQuery | None = None) -> None:
+        self._input = input
+        self._query: UserSingleQuery = query or {}
+
+    def pick(self, *picks: UserResultPick) -> UserSignInRequest:
+        self._query['_pick'] = list(picks)
+        return self
+
+    def omit(self, *omits: UserResultPick) -> UserSignInRequest:
+        self._query['_omit'] = list(omits)
+        return self
+
+    def include(self, *includes: UserInclude) -> UserSignInRequest:
+        self._query['_includes'] = [*self._query.get('_includes', []), *includes]
+        return self
+
+    async def exec(self) -> Session:
+        session = _decode_session(await request_manager.post('/users/session', self._input, self._query))
+        session_manager.session = session
+        return session
+
+    def __await__(self) -> Generator[Any, None, Session]:
+        return self.exec().__await__()
+
+
+class UserClient:
+
+    def create(self, input: UserCreateInput) -> UserCreateRequest:
+        return UserCreateRequest(input)
+
+    def update(self, id: str, input: UserUpdateInput) -> UserUpdateRequest:
+        return UserUpdateRequest(id, input)
+
+    async def delete(self, id: str) -> None:
+        await UserDeleteRequest(id)
+
+    def id(self, id: str) -> UserIDRequest:
+        return UserIDRequest(id)
+
+    def find(self, query: UserListQuery | None = None) -> UserListRequest:
+        return UserListRequest(query)
+
+    def upsert(self, query: UserSeekQuery, data: UserUpdateInput) -> UserUpsertRequest:
+        return UserUpsertRequest({'_query': query, '_data': data})
+
+    def create_many(self, input: list[UserCreateInput], chunk_size: int | None = None) -> UserCreateManyRequest:
+        return UserCreateManyRequest(input, chunk_size)
+
+    def update_many(self, query: UserSeekQuery, data: UserUpdateInput) -> UserUpdateManyRequest:
+        return UserUpdateManyRequest({'_query': query, '_data': data})
+
+    async def delete_many(self, query: UserSeekQuery | None = None) -> None:
+        await UserDeleteManyRequest(query or {})
+
+    def sign_in(self, input: UserSessionInput) -> UserSignInRequest:
+        return UserSignInRequest(input)
+
+
+class ArticleCreateRequest:
+
+    def __init__(self, input: ArticleCreateInput, query: ArticleSingleQuery | None = None) -> None:
+        self._input = input
+        self._query: ArticleSingleQuery = query or {}
+
+    def pick(self, *picks: ArticleResultPick) -> ArticleCreateRequest:
+        self._query['_pick'] = list(picks)
+        return self
+
+    def omit(self, *omits: ArticleResultPick) -> ArticleCreateRequest:
+        self._query['_omit'] = list(omits)
+        return self
+
+    def include(self, *includes: ArticleInclude) -> ArticleCreateRequest:
+        self._query['_includes'] = [*self._query.get('_includes', []), *includes]
+        return self
+
+    async def exec(self) -> Article:
+        return _decode_article(await request_manager.post('/articles', self._input, self._query))
+
+    def __await__(self) -> Generator[Any, None, Article]:
+        return self.exec().__await__()
+
+
+class ArticleUpdateRequest:
+
+    def __init__(self, id: str, input: ArticleUpdateInput, query: ArticleSingleQuery | None = None) -> None:
+        self._id = id
+        self._input = input
+        self._query: ArticleSingleQuery = query or {}
+
+    def pick(self, *picks: ArticleResultPick) -> ArticleUpdateRequest:
+        self._query['_pick'] = list(picks)
+        return self
+
+    def omit(self, *omits: ArticleResultPick) -> ArticleUpdateRequest:
+        self._query['_omit'] = list(omits)
+        return self
+
+    def include(self, *includes: ArticleInclude) -> ArticleUpdateRequest:
+        self._query['_includes'] = [*self._query.get('_includes', []), *includes]
+        return self
+
+    async def exec(self) -> Article:
+        return _decode_article(await request_manager.patch('/articles/' + self._id, self._input, self._query))
+
+    def __await__(self) -> Generator[Any, None, Article]:
+        return self.exec().__await__()
+
+
+class ArticleDeleteRequest:
+
+    def __init__(self, id: str) -> None:
+        self._id = id
+
+    async def exec(self) -> None:
+        return await request_manager.delete('/articles/' + self._id)
+
+    def __await__(self) -> Generator[Any, None, None]:
+        return self.exec().__await__()
+
+
+class ArticleIDRequest:
+
+    def __init__(self, id: str, query: ArticleSingleQuery | None = None) -> None:
+        self._id = id
+        self._query: ArticleSingleQuery = query or {}
+
+    def pick(self, *picks: ArticleResultPick) -> ArticleIDRequest:
+        self._query['_pick'] = list(picks)
+        return self
+
+    def omit(self, *omits: ArticleResultPick) -> ArticleIDRequest:
+        self._query['_omit'] = list(omits)
+        return self
+
+    def include(self, *includes: ArticleInclude) -> ArticleIDRequest:
+        self._query['_includes'] = [*self._query.get('_includes', []), *includes]
+        return self
+
+    async def exec(self) -> Article:
+        return _decode_article(await request_manager.get('/articles/' + self._id, self._query))
+
+    def __await__(self) -> Generator[Any, None, Article]:
+        return self.exec().__await__()
+
+
+class ArticleUpsertRequest:
+
+    def __init__(self, input: ArticleQueryData, query: ArticleSingleQuery | None = None) -> None:
+        self._input = input
+        self._query: ArticleSingleQuery = query or {}
+
+    def pick(self, *picks: ArticleResultPick) -> ArticleUpsertRequest:
+        self._query['_pick'] = list(picks)
+        return self
+
+    def omit(self, *omits: ArticleResultPick) -> ArticleUpsertRequest:
+        self._query['_omit'] = list(omits)
+        return self
+
+    def include(self, *includes: ArticleInclude) -> ArticleUpsertRequest:
+        self._query['_includes'] = [*self._query.get('_includes', []), *includes]
+        return self
+
+    async def exec(self) -> Article:
+        return _decode_article(await request_manager.post('/articles', {'_upsert': self._input}, self._query))
+
+    def __await__(self) -> Generator[Any, None, Article]:
+        return self.exec().__await__()
+
+
+class ArticleCreateManyRequest:
+
+    def __init__(self, input: list[ArticleCreateInput], chunk_size: int | None = None, query: ArticleSingleQuery | None = None) -> None:
+        self._input = input
+        self._chunk_size = chunk_size
+        self._query: ArticleSingleQuery = query or {}
+
+    def pick(self, *picks: ArticleResultPick) -> ArticleCreateManyRequest:
+        self._query['_pick'] = list(picks)
+        return self
+
+    def omit(self, *omits: ArticleResultPick) -> ArticleCreateManyRequest:
+        self._query['_omit'] = list(omits)
+        return self
+
+    def include(self, *includes: ArticleInclude) -> ArticleCreateManyRequest:
+        self._query['_includes'] = [*self._query.get('_includes', []), *includes]
+        return self
+
+    async def exec(self) -> list[Article]:
+        size = self._chunk_size or len(self._input) or 1
+        chunks = [self._input[i:i + size] for i in range(0, len(self._input), size)]
+        pages = await gather(*[request_manager.post('/articles', {'_create': c}, self._query) for c in chunks])
+        return [_decode_article(v) for page in pages for v in page]
+
+    def __await__(self) -> Generator[Any, None, list[Article]]:
+        return self.exec().__await__()
+
+
+class ArticleUpdateManyRequest:
+
+    def __init__(self, input: ArticleQueryData, query: ArticleSingleQuery | None = None) -> None:
+        self._input = input
+        self._query: ArticleSingleQuery = query or {}
+
+    def pick(self, *picks: ArticleResultPick) -> ArticleUpdateManyRequest:
+        self._query['_pick'] = list(picks)
+        return self
+
+    def omit(self, *omits: ArticleResultPick) -> ArticleUpdateManyRequest:
+        self._query['_omit'] = list(omits)
+        return self
+
+    def include(self, *includes: ArticleInclude) -> ArticleUpdateManyRequest:
+        self._query['_includes'] = [*self._query.get('_includes', []), *includes]
+        return self
+
+    async def exec(self) -> list[Article]:
+        return [_decode_article(v) for v in await request_manager.patch('/articles', {'_update': self._input}, self._query)]
+
+    def __await__(self) -> Generator[Any, None, list[Article]]:
+        return self.exec().__await__()
+
+
+class ArticleDeleteManyRequest:
+
+    def __init__(self, query: ArticleSeekQuery) -> None:
+        self._query = query
+
+    async def exec(self) -> None:
+        return await request_manager.delete('/articles', self._query)
+
+    def __await__(self) -> Generator[Any, None, None]:
+        return self.exec().__await__()
+
+
+class ArticleListRequest:
+
+    def __init__(self, query: ArticleListQuery | None = None) -> None:
+        self._query: ArticleListQuery = query or {}
+
+    def order(self, *orders: ArticleSortOrder) -> ArticleListRequest:
+        self._query['_order'] = [*self._query.get('_order', []), *orders]
+        return self
+
+    def limit(self, limit: int) -> ArticleListRequest:
+        self._query['_limit'] = limit
+        return self
+
+    def skip(self, skip: int) -> ArticleListRequest:
+        self._query['_skip'] = skip
+        return self
+
+    def page_no(self, page_no: int) -> ArticleListRequest:
+        self._query['_pageNo'] = page_no
+        return self
+
+    def page_size(self, page_size: int) -> ArticleListRequest:
+        self._query['_pageSize'] = page_size
+        return self
+
+    def pick(self, *picks: ArticleResultPick) -> ArticleListRequest:
+        self._query['_pick'] = list(picks)
+        return self
+
+    def omit(self, *omits: ArticleResultPick) -> ArticleListRequest:
+        self._query['_omit'] = list(omits)
+        return self
+
+    def include(self, *includes: ArticleInclude) -> ArticleListRequest:
+        self._query['_includes'] = [*self._query.get('_includes', []), *includes]
+        return self
+
+    async def exec(self) -> list[Article]:
+        return [_decode_article(v) for v in await request_manager.get('/articles', self._query)]
+
+    def __await__(self) -> Generator[Any, None, list[Article]]:
+        return self.exec().__await__()
+
+    async def iter(self, page_size: int = 100) -> AsyncIterator[Article]:
+        query: ArticleListQuery = {**self._query}
+        query.pop('_pageNo', None)
+        query.pop('_pageSize', None)
+        skip = query.get('_skip', 0)
+        remaining = query.get('_limit')
+        while remaining is None or remaining > 0:
+            limit = page_size if remaining is None else min(page_size, remaining)
+            page = await ArticleListRequest({**query, '_skip': skip, '_limit': limit})
+            for item in page:
+                yield item
+            if len(page) < limit:
+                break
+            skip += limit
+            remaining = None if remaining is None else remaining - limit
+
+    def __aiter__(self) -> AsyncIterator[Article]:
+        return self.iter()
+
+
+class ArticleClient:
+
+    def create(self, input: ArticleCreateInput) -> ArticleCreateRequest:
+        return ArticleCreateRequest(input)
+
+    def update(self, id: str, input: ArticleUpdateInput) -> ArticleUpdateRequest:
+        return ArticleUpdateRequest(id, input)
+
+    async def delete(self, id: str) -> None:
+        await ArticleDeleteRequest(id)
+
+    def id(self, id: str) -> ArticleIDRequest:
+        return ArticleIDRequest(id)
+
+    def find(self, query: ArticleListQuery | None = None) -> ArticleListRequest:
+        return ArticleListRequest(query)
+
+    def upsert(self, query: ArticleSeekQuery, data: ArticleUpdateInput) -> ArticleUpsertRequest:
+        return ArticleUpsertRequest({'_query': query, '_data': data})
+
+    def create_many(self, input: list[ArticleCreateInput], chunk_size: int | None = None) -> ArticleCreateManyRequest:
+        return ArticleCreateManyRequest(input, chunk_size)
+
+    def update_many(self, query: ArticleSeekQuery, data: ArticleUpdateInput) -> ArticleUpdateManyRequest:
+        return ArticleUpdateManyRequest({'_query': query, '_data': data})
+
+    async def delete_many(self, query: ArticleSeekQuery | None = None) -> None:
+        await ArticleDeleteManyRequest(query or {})
+
+
+users = UserClient()
+articles = ArticleClient()
+
+
@@ -0,0 +1,545 @@
+from __future__ import annotations
+from typing import Any, AsyncIterator, Generator, Literal, NotRequired, Protocol, TypedDict
+from asyncio import Semaphore, gather
+from datetime import date, datetime, timezone
+from enum import Enum
+from urllib.parse import quote
+from httpx import AsyncBaseTransport, AsyncClient, Limits
+
+
+class RequestError(Exception):
+
+    def __init__(self, status: int, content: str) -> None:
+        super().__init__(f'{status}: {content}')
+        self.status = status
+        self.content = content
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value.isoformat(timespec='milliseconds') + 'Z'
+    if isinstance(value, date):
+        return value.isoformat() + 'T00:00:00.000Z'
+    if isinstance(value, Enum):
+        return value.name
+    if isinstance(value, dict):
+        return {k: _encode(v) for (k, v) in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode(v) for v in value]
+    return value
+
+
+def _decode_date(value: str) -> date:
+    return datetime.fromisoformat(value).date()
+
+
+def _decode_datetime(value: str) -> datetime:
+    return datetime.fromisoformat(value)
+
+
+def _qs(query: Any) -> str:
+    items: list[str] = []
+    if isinstance(query, dict):
+        for (key, value) in _encode(query).items():
+            _flatten(key, value, items)
+    return '' if len(items) == 0 else '?' + '&'.join(items)
+
+
+def _flatten(key: str, value: Any, items: list[str]) -> None:
+    if isinstance(value, dict):
+        for (k, v) in value.items():
+            _flatten(f'{key}[{k}]', v, items)
+    elif isinstance(value, list):
+        for (index, v) in enumerate(value):
+            _flatten(f'{key}[{index}]', v, items)
+    elif value is None:
+        items.append(f'{key}=null')
+    elif isinstance(value, bool):
+        items.append(f'{key}=true' if value else f'{key}=false')
+    else:
+        items.append(f'{key}=' + quote(str(value), safe=''))
+
+
+Mode = Literal['default', 'insensitive']
+
+
+class StringValueQuery(TypedDict, total=False):
+    _eq: str
+    _neq: str
+    _null: bool
+    _gt: str
+    _gte: str
+    _lt: str
+    _lte: str
+    _contains: str
+    _prefix: str
+    _suffix: str
+    _match: str
+    _mode: Mode
+    _or: list[StringQuery]
+    _and: list[StringQuery]
+
+
+StringQuery = str | StringValueQuery
+
+
+class IntValueQuery(TypedDict, total=False):
+    _eq: int
+    _neq: int
+    _null: bool
+    _gt: int
+    _gte: int
+    _lt: int
+    _lte: int
+    _or: list[IntQuery]
+    _and: list[IntQuery]
+
+
+IntQuery = int | IntValueQuery
+
+
+class FloatValueQuery(TypedDict, total=False):
+    _eq: float
+    _neq: float
+    _null: bool
+    _gt: float
+    _gte: float
+    _lt: float
+    _lte: float
+    _or: list[FloatQuery]
+    _and: list[FloatQuery]
+
+
+FloatQuery = float | FloatValueQuery
+
+
+class BoolValueQuery(TypedDict, total=False):
+    _eq: bool
+    _neq: bool
+    _null: bool
+    _or: list[BoolQuery]
+    _and: list[BoolQuery]
+
+
+BoolQuery = bool | BoolValueQuery
+
+
+class DateValueQuery(TypedDict, total=False):
+    _eq: date | datetime
+    _neq: date | datetime
+    _null: bool
+    _gt: date | datetime
+    _gte: date | datetime
+    _lt: date | datetime
+    _lte: date | datetime
+    _or: list[DateQuery]
+    _and: list[DateQuery]
+
+
+DateQuery = date | datetime | DateValueQuery
+
+
+class IDValueQuery(TypedDict, total=False):
+    _eq: str
+    _neq: str
+    _null: bool
+
+
+IDQuery = str | IDValueQuery
+
+
+class Link(TypedDict):
+    _add: str
+
+
+class UnLink(TypedDict):
+    _del: str
+
+
+class SimpleSongCreateInput(TypedDict):
+    name: str
+
+
+class SimpleSongUpdateInput(TypedDict, total=False):
+    name: str
+
+
+SimpleSongSortOrder = Literal['name', '-name', 'createdAt', '-createdAt', 'updatedAt', '-updatedAt']
+
+
+SimpleSongResultPick = Literal['id', 'name', 'createdAt', 'updatedAt']
+
+
+class SimpleSongSingleQuery(TypedDict, total=False):
+    _pick: list[SimpleSongResultPick]
+    _omit: list[SimpleSongResultPick]
+
+
+class SimpleSongSeekQuery(TypedDict, total=False):
+    id: StringQuery
+    name: StringQuery
+    createdAt: DateQuery
+    updatedAt: DateQuery
+
+
+class SimpleSongQueryData(TypedDict):
+    _query: SimpleSongSeekQuery
+    _data: SimpleSongUpdateInput
+
+
+class SimpleSongListQuery(SimpleSongSeekQuery, total=False):
+    _order: list[SimpleSongSortOrder]
+    _limit: int
+    _skip: int
+    _pageNo: int
+    _pageSize: int
+    _pick: list[SimpleSongResultPick]
+    _omit: list[SimpleSongResultPick]
+
+
+class SimpleSong(TypedDict):
+    id: str
+    name: str
+    createdAt: datetime
+    updatedAt: datetime
+
+
+def _decode_simple_song(data: Any) -> Any:
+    if data is None:
+        return data
+    if data.get('createdAt') is not None:
+        data['createdAt'] = _decode_datetime(data['createdAt'])
+    if data.get('updatedAt') is not None:
+        data['updatedAt'] = _decode_datetime(data['updatedAt'])
+    return data
+
+
+class RequestManager:
+
+    def __init__(self, base_url: str, concurrency: int = 8) -> None:
+        self.base_url = base_url
+        self.concurrency = concurrency
+        self.transport: AsyncBaseTransport | None = None
+        self._client: AsyncClient | None = None
+        self._semaphore: Semaphore | None = None
+
+    def configure(self,
+                  base_url: str | None = None,
+                  concurrency: int | None = None,
+                  transport: AsyncBaseTransport | None = None) -> None:
+        if self._client is not None:
+            raise RuntimeError('cannot configure an open request manager, call aclose first')
+        if base_url is not None:
+            self.base_url = base_url
+        if concurrency is not None:
+            self.concurrency = concurrency
+        if transport is not None:
+            self.transport = transport
+
+    @property
+    def client(self) -> AsyncClient:
+        if self._client is None:
+            limits = Limits(max_connections=self.concurrency,
+                            max_keepalive_connections=self.concurrency,
+                            keepalive_expiry=30)
+            self._client = AsyncClient(base_url=self.base_url,
+                                       transport=self.transport,
+                                       limits=limits,
+                                       timeout=30)
+            self._semaphore = Semaphore(self.concurrency)
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+        self._client = None
+        self._semaphore = None
+
+    async def __aenter__(self) -> RequestManager:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    async def get(self, url: str, query: Any = None) -> Any:
+        return await self.send('GET', url, None, query)
+
+    async def post(self, url: str, input: Any, query: Any = None) -> Any:
+        return await self.send('POST', url, input, query)
+
+    async def patch(self, url: str, input: Any, query: Any = None) -> Any:
+        return await self.send('PATCH', url, input, query)
+
+    async def delete(self, url: str, query: Any = None) -> None:
+        await self.send('DELETE', url, None, query)
+
+    async def send(self, method: str, url: str, input: Any, query: Any) -> Any:
+        client = self.client
+        assert self._semaphore is not None
+        async with self._semaphore:
+            response = await client.request(method,
+                                            url + _qs(query),
+                                            json=None if input is None else _encode(input),
+                                            headers=self.headers())
+        if response.is_error:
+            raise RequestError(response.status_code, response.text)
+        if len(response.content) == 0:
+            return None
+        return response.json().get('data')
+
+    def headers(self) -> dict[str, str]:
+        return {}
+
+
+request_manager = RequestManager('None')
+
+
+class SimpleSongCreateRequest:
+
+    def __init__(self, input: SimpleSongCreateInput, query: SimpleSongSingleQuery | None = None) -> None:
+        self._input = input
+        self._query: SimpleSongSingleQuery = query or {}
+
+    def pick(self, *picks: SimpleSongResultPick) -> SimpleSongCreateRequest:
+        self._query['_pick'] = list(picks)
+        return self
+
+    def omit(self, *omits: SimpleSongResultPick) -> SimpleSongCreateRequest:
+        self._query['_omit'] = list(omits)
+        return self
+
+    async def exec(self) -> SimpleSong:
+        return _decode_simple_song(await request_manager.post('/simple-songs', self._input, self._query))
+
+    def __await__(self) -> Generator[Any, None, SimpleSong]:
+        return self.exec().__await__()
+
+
+class SimpleSongUpdateRequest:
+
+    def __init__(self, id: str, input: SimpleSongUpdateInput, query: SimpleSongSingleQuery | None = None) -> None:
+        self._id = id
+        self._input = input
+        self._query: SimpleSongSingleQuery = query or {}
+
+    def pick(self, *picks: SimpleSongResultPick) -> SimpleSongUpdateRequest:
+        self._query['_pick'] = list(picks)
+        return self
+
+    def omit(self, *omits: SimpleSongResultPick) -> SimpleSongUpdateRequest:
+        self._query['_omit'] = list(omits)
+        return self
+
+    async def exec(self) -> SimpleSong:
+        return _decode_simple_song(await request_manager.patch('/simple-songs/' + self._id, self._input, self._query))
+
+    def __await__(self) -> Generator[Any, None, SimpleSong]:
+        return self.exec().__await__()
+
+
+class SimpleSongDeleteRequest:
+
+    def __init__(self, id: str) -> None:
+        self._id = id
+
+    async def exec(self) -> None:
+        return await request_manager.delete('/simple-songs/' + self._id)
+
+    def __await__(self) -> Generator[Any, None, None]:
+        return self.exec().__await__()
+
+
+class SimpleSongIDRequest:
+
+    def __init__(self, id: str, query: SimpleSongSingleQuery | None = None) -> None:
+        self._id = id
+        self._query: SimpleSongSingleQuery = query or {}
+
+    def pick(self, *picks: SimpleSongResultPick) -> SimpleSongIDRequest:
+        self._query['_pick'] = list(picks)
+        return self
+
+    def omit(self, *omits: SimpleSongResultPick) -> SimpleSongIDRequest:
+        self._query['_omit'] = list(omits)
+        return self
+
+    async def exec(self) -> SimpleSong:
+        return _decode_simple_song(await request_manager.get('/simple-songs/' + self._id, self._query))
+
+    def __await__(self) -> Generator[Any, None, SimpleSong]:
+        return self.exec().__await__()
+
+
+class SimpleSongUpsertRequest:
+
+    def __init__(self, input: SimpleSongQueryData, query: SimpleSongSingleQuery | None = None) -> None:
+        self._input = input
+        self._query: SimpleSongSingleQuery = query or {}
+
+    def pick(self, *picks: SimpleSongResultPick) -> SimpleSongUpsertRequest:
+        self._query['_pick'] = list(picks)
+        return self
+
+    def omit(self, *omits: SimpleSongResultPick) -> SimpleSongUpsertRequest:
+        self._query['_omit'] = list(omits)
+        return self
+
+    async def exec(self) -> SimpleSong:
+        return _decode_simple_song(await request_manager.post('/simple-songs', {'_upsert': self._input}, self._query))
+
+    def __await__(self) -> Generator[Any, None, SimpleSong]:
+        return self.exec().__await__()
+
+
+class SimpleSongCreateManyRequest:
+
+    def __init__(self, input: list[SimpleSongCreateInput], chunk_size: int | None = None, query: SimpleSongSingleQuery | None = None) -> None:
+        self._input = input
+        self._chunk_size = chunk_size
+        self._query: SimpleSongSingleQuery = query or {}
+
+    def pick(self, *picks: SimpleSongResultPick) -> SimpleSongCreateManyRequest:
+        self._query['_pick'] = list(picks)
+        return self
+
+    def omit(self, *omits: SimpleSongResultPick) -> SimpleSongCreateManyRequest:
+        self._query['_omit'] = list(omits)
+        return self
+
+    async def exec(self) -> list[SimpleSong]:
+        size = self._chunk_size or len(self._input) or 1
+        chunks = [self._input[i:i + size] for i in range(0, len(self._input), size)]
+        pages = await gather(*[request_manager.post('/simple-songs', {'_create': c}, self._query) for c in chunks])
+        return [_decode_simple_song(v) for page in pages for v in page]
+
+    def __await__(self) -> Generator[Any, None, list[SimpleSong]]:
+        return self.exec().__await__()
+
+
+class SimpleSongUpdateManyRequest:
+
+    def __init__(self, input: SimpleSongQueryData, query: SimpleSongSingleQuery | None = None) -> None:
+        self._input = input
+        self._query: SimpleSongSingleQuery = query or {}
+
+    def pick(self, *picks: SimpleSongResultPick) -> SimpleSongUpdateManyRequest:
+        self._query['_pick'] = list(picks)
+        return self
+
+    def omit(self, *omits: SimpleSongResultPick) -> SimpleSongUpdateManyRequest:
+        self._query['_omit'] = list(omits)
+        return self
+
+    async def exec(self) -> list[SimpleSong]:
+        return [_decode_simple_song(v) for v in await request_manager.patch('/simple-songs', {'_update': self._input}, self._query)]
+
+    def __await__(self) -> Generator[Any, None, list[SimpleSong]]:
+        return self.exec().__await__()
+
+
+class SimpleSongDeleteManyRequest:
+
+    def __init__(self, query: SimpleSongSeekQuery) -> None:
+        self._query = query
+
+    async def exec(self) -> None:
+        return await request_manager.delete('/simple-songs', self._query)
+
+    def __await__(self) -> Generator[Any, None, None]:
+        return self.exec().__await__()
+
+
+class SimpleSongListRequest:
+
+    def __init__(self, query: SimpleSongListQuery | None = None) -> None:
+        self._query: SimpleSongListQuery = query or {}
+
+    def order(self, *orders: SimpleSongSortOrder) -> SimpleSongListRequest:
+        self._query['_order'] = [*self._query.get('_order', []), *orders]
+        return self
+
+    def limit(self, limit: int) -> SimpleSongListRequest:
+        self._query['_limit'] = limit
+        return self
+
+    def skip(self, skip: int) -> SimpleSongListRequest:
+        self._query['_skip'] = skip
+        return self
+
+    def page_no(self, page_no: int) -> SimpleSongListRequest:
+        self._query['_pageNo'] = page_no
+        return self
+
+    def page_size(self, page_size: int) -> SimpleSongListRequest:
+        self._query['_pageSize'] = page_size
+        return self
+
+    def pick(self, *picks: SimpleSongResultPick) -> SimpleSongListRequest:
+        self._query['_pick'] = list(picks)
+        return self
+
+    def omit(self, *omits: SimpleSongResultPick) -> SimpleSongListRequest:
+        self._query['_omit'] = list(omits)
+        return self
+
+    async def exec(self) -> list[SimpleSong]:
+        return [_decode_simple_song(v) for v in await request_manager.get('/simple-songs', self._query)]
+
+    def __await__(self) -> Generator[Any, None, list[SimpleSong]]:
+        return self.exec().__await__()
+
+    async def iter(self, page_size: int = 100) -> AsyncIterator[SimpleSong]:
+        query: SimpleSongListQuery = {**self._query}
+        query.pop('_pageNo', None)
+        query.pop('_pageSize', None)
+        skip = query.get('_skip', 0)
+        remaining = query.get('_limit')
+        while remaining is None or remaining > 0:
+            limit = page_size if remaining is None else min(page_size, remaining)
+            page = await SimpleSongListRequest({**query, '_skip': skip, '_limit': limit})
+            for item in page:
+                yield item
+            if len(page) < limit:
+                break
+            skip += limit
+            remaining = None if remaining is None else remaining - limit
+
+    def __aiter__(self) -> AsyncIterator[SimpleSong]:
+        return self.iter()
+
+
+class SimpleSongClient:
+
+    def create(self, input: SimpleSongCreateInput) -> SimpleSongCreateRequest:
+        return SimpleSongCreateRequest(input)
+
+    def update(self, id: str, input: SimpleSongUpdateInput) -> SimpleSongUpdateRequest:
+        return SimpleSongUpdateRequest(id, input)
+
+    async def delete(self, id: str) -> None:
+        await SimpleSongDeleteRequest(id)
+
+    def id(self, id: str) -> SimpleSongIDRequest:
+        return SimpleSongIDRequest(id)
+
+    def find(self, query: SimpleSongListQuery | None = None) -> SimpleSongListRequest:
+        return SimpleSongListRequest(query)
+
+    def upsert(self, query: SimpleSongSeekQuery, data: SimpleSongUpdateInput) -> SimpleSongUpsertRequest:
+        return SimpleSongUpsertRequest({'_query': query, '_data': data})
+
+    def create_many(self, input: list[SimpleSongCreateInput], chunk_size: int | None = None) -> SimpleSongCreateManyRequest:
+        return SimpleSongCreateManyRequest(input, chunk_size)
+
+    def update_many(self, query: SimpleSongSeekQuery, data: SimpleSongUpdateInput) -> SimpleSongUpdateManyRequest:
+        return SimpleSongUpdateManyRequest({'_query': query, '_data': data})
+
+    async def delete_many(self, query: SimpleSongSeekQuery | None = None) -> None:
+        await SimpleSongDeleteManyRequest(query or {})
+
+
+simple_songs = SimpleSongClient()
+
+
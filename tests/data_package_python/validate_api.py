@@ -0,0 +1,576 @@
+from __future__ import annotations
+from typing import Any, AsyncIterator, Generator, Literal, NotRequired, Protocol, TypedDict
+from asyncio import Semaphore, gather
+from datetime import date, datetime, timezone
+from enum import Enum
+from urllib.parse import quote
+from httpx import AsyncBaseTransport, AsyncClient, Limits
+
+
+class RequestError(Exception):
+
+    def __init__(self, status: int, content: str) -> None:
+        super().__init__(f'{status}: {content}')
+        self.status = status
+        self.content = content
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value.isoformat(timespec='milliseconds') + 'Z'
+    if isinstance(value, date):
+        return value.isoformat() + 'T00:00:00.000Z'
+    if isinstance(value, Enum):
+        return value.name
+    if isinstance(value, dict):
+        return {k: _encode(v) for (k, v) in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode(v) for v in value]
+    return value
+
+
+def _decode_date(value: str) -> date:
+    return datetime.fromisoformat(value).date()
+
+
+def _decode_datetime(value: str) -> datetime:
+    return datetime.fromisoformat(value)
+
+
+def _qs(query: Any) -> str:
+    items: list[str] = []
+    if isinstance(query, dict):
+        for (key, value) in _encode(query).items():
+            _flatten(key, value, items)
+    return '' if len(items) == 0 else '?' + '&'.join(items)
+
+
+def _flatten(key: str, value: Any, items: list[str]) -> None:
+    if isinstance(value, dict):
+        for (k, v) in value.items():
+            _flatten(f'{key}[{k}]', v, items)
+    elif isinstance(value, list):
+        for (index, v) in enumerate(value):
+            _flatten(f'{key}[{index}]', v, items)
+    elif value is None:
+        items.append(f'{key}=null')
+    elif isinstance(value, bool):
+        items.append(f'{key}=true' if value else f'{key}=false')
+    else:
+        items.append(f'{key}=' + quote(str(value), safe=''))
+
+
+Mode = Literal['default', 'insensitive']
+
+
+class StringValueQuery(TypedDict, total=False):
+    _eq: str
+    _neq: str
+    _null: bool
+    _gt: str
+    _gte: str
+    _lt: str
+    _lte: str
+    _contains: str
+    _prefix: str
+    _suffix: str
+    _match: str
+    _mode: Mode
+    _or: list[StringQuery]
+    _and: list[StringQuery]
+
+
+StringQuery = str | StringValueQuery
+
+
+class IntValueQuery(TypedDict, total=False):
+    _eq: int
+    _neq: int
+    _null: bool
+    _gt: int
+    _gte: int
+    _lt: int
+    _lte: int
+    _or: list[IntQuery]
+    _and: list[IntQuery]
+
+
+IntQuery = int | IntValueQuery
+
+
+class FloatValueQuery(TypedDict, total=False):
+    _eq: float
+    _neq: float
+    _null: bool
+    _gt: float
+    _gte: float
+    _lt: float
+    _lte: float
+    _or: list[FloatQuery]
+    _and: list[FloatQuery]
+
+
+FloatQuery = float | FloatValueQuery
+
+
+class BoolValueQuery(TypedDict, total=False):
+    _eq: bool
+    _neq: bool
+    _null: bool
+    _or: list[BoolQuery]
+    _and: list[BoolQuery]
+
+
+BoolQuery = bool | BoolValueQuery
+
+
+class DateValueQuery(TypedDict, total=False):
+    _eq: date | datetime
+    _neq: date | datetime
+    _null: bool
+    _gt: date | datetime
+    _gte: date | datetime
+    _lt: date | datetime
+    _lte: date | datetime
+    _or: list[DateQuery]
+    _and: list[DateQuery]
+
+
+DateQuery = date | datetime | DateValueQuery
+
+
+class IDValueQuery(TypedDict, total=False):
+    _eq: str
+    _neq: str
+    _null: bool
+
+
+IDQuery = str | IDValueQuery
+
+
+class Link(TypedDict):
+    _add: str
+
+
+class UnLink(TypedDict):
+    _del: str
+
+
+class Gender(str, Enum):
+    MALE = 'MALE'
+    FEMALE = 'FEMALE'
+
+
+class SingerCreateInput(TypedDict):
+    email: str
+    name: str
+    nickname: NotRequired[str]
+    code: NotRequired[str]
+    phoneNum: NotRequired[str]
+    gender: NotRequired[Gender]
+    age: NotRequired[int]
+    rating: NotRequired[float]
+    verified: NotRequired[bool]
+
+
+class SingerUpdateInput(TypedDict, total=False):
+    email: str
+    name: str
+    nickname: str
+    code: str
+    phoneNum: str
+    gender: Gender
+    age: int
+    rating: float
+    verified: bool
+
+
+SingerSortOrder = Literal['email', '-email', 'name', '-name', 'nickname', '-nickname', 'code', '-code', 'phoneNum', '-phoneNum', 'gender', '-gender', 'age', '-age', 'rating', '-rating', 'verified', '-verified']
+
+
+SingerResultPick = Literal['id', 'email', 'name', 'nickname', 'code', 'phoneNum', 'gender', 'age', 'rating', 'verified']
+
+
+class SingerSingleQuery(TypedDict, total=False):
+    _pick: list[SingerResultPick]
+    _omit: list[SingerResultPick]
+
+
+class SingerSeekQuery(TypedDict, total=False):
+    id: StringQuery
+    email: StringQuery
+    name: StringQuery
+    nickname: StringQuery
+    code: StringQuery
+    phoneNum: StringQuery
+    gender: Gender
+    age: IntQuery
+    rating: FloatQuery
+    verified: BoolQuery
+
+
+class SingerQueryData(TypedDict):
+    _query: SingerSeekQuery
+    _data: SingerUpdateInput
+
+
+class SingerListQuery(SingerSeekQuery, total=False):
+    _order: list[SingerSortOrder]
+    _limit: int
+    _skip: int
+    _pageNo: int
+    _pageSize: int
+    _pick: list[SingerResultPick]
+    _omit: list[SingerResultPick]
+
+
+class Singer(TypedDict):
+    id: str
+    email: str
+    name: str
+    nickname: NotRequired[str]
+    code: NotRequired[str]
+    phoneNum: NotRequired[str]
+    gender: NotRequired[Gender]
+    age: NotRequired[int]
+    rating: NotRequired[float]
+    verified: bool
+
+
+def _decode_singer(data: Any) -> Any:
+    if data is None:
+        return data
+    if data.get('gender') is not None:
+        data['gender'] = Gender(data['gender'])
+    return data
+
+
+class RequestManager:
+
+    def __init__(self, base_url: str, concurrency: int = 8) -> None:
+        self.base_url = base_url
+        self.concurrency = concurrency
+        self.transport: AsyncBaseTransport | None = None
+        self._client: AsyncClient | None = None
+        self._semaphore: Semaphore | None = None
+
+    def configure(self,
+                  base_url: str | None = None,
+                  concurrency: int | None = None,
+                  transport: AsyncBaseTransport | None = None) -> None:
+        if self._client is not None:
+            raise RuntimeError('cannot configure an open request manager, call aclose first')
+        if base_url is not None:
+            self.base_url = base_url
+        if concurrency is not None:
+            self.concurrency = concurrency
+        if transport is not None:
+            self.transport = transport
+
+    @property
+    def client(self) -> AsyncClient:
+        if self._client is None:
+            limits = Limits(max_connections=self.concurrency,
+                            max_keepalive_connections=self.concurrency,
+                            keepalive_expiry=30)
+            self._client = AsyncClient(base_url=self.base_url,
+                                       transport=self.transport,
+                                       limits=limits,
+                                       timeout=30)
+            self._semaphore = Semaphore(self.concurrency)
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+        self._client = None
+        self._semaphore = None
+
+    async def __aenter__(self) -> RequestManager:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    async def get(self, url: str, query: Any = None) -> Any:
+        return await self.send('GET', url, None, query)
+
+    async def post(self, url: str, input: Any, query: Any = None) -> Any:
+        return await self.send('POST', url, input, query)
+
+    async def patch(self, url: str, input: Any, query: Any = None) -> Any:
+        return await self.send('PATCH', url, input, query)
+
+    async def delete(self, url: str, query: Any = None) -> None:
+        await self.send('DELETE', url, None, query)
+
+    async def send(self, method: str, url: str, input: Any, query: Any) -> Any:
+        client = self.client
+        assert self._semaphore is not None
+        async with self._semaphore:
+            response = await client.request(method,
+                                            url + _qs(query),
+                                            json=None if input is None else _encode(input),
+                                            headers=self.headers())
+        if response.is_error:
+            raise RequestError(response.status_code, response.text)
+        if len(response.content) == 0:
+            return None
+        return response.json().get('data')
+
+    def headers(self) -> dict[str, str]:
+        return {}
+
+
+request_manager = RequestManager('None')
+
+
+class SingerCreateRequest:
+
+    def __init__(self, input: SingerCreateInput, query: SingerSingleQuery | None = None) -> None:
+        self._input = input
+        self._query: SingerSingleQuery = query or {}
+
+    def pick(self, *picks: SingerResultPick) -> SingerCreateRequest:
+        self._query['_pick'] = list(picks)
+        return self
+
+    def omit(self, *omits: SingerResultPick) -> SingerCreateRequest:
+        self._query['_omit'] = list(omits)
+        return self
+
+    async def exec(self) -> Singer:
+        return _decode_singer(await request_manager.post('/singers', self._input, self._query))
+
+    def __await__(self) -> Generator[Any, None, Singer]:
+        return self.exec().__await__()
+
+
+class SingerUpdateRequest:
+
+    def __init__(self, id: str, input: SingerUpdateInput, query: SingerSingleQuery | None = None) -> None:
+        self._id = id
+        self._input = input
+        self._query: SingerSingleQuery = query or {}
+
+    def pick(self, *picks: SingerResultPick) -> SingerUpdateRequest:
+        self._query['_pick'] = list(picks)
+        return self
+
+    def omit(self, *omits: SingerResultPick) -> SingerUpdateRequest:
+        self._query['_omit'] = list(omits)
+        return self
+
+    async def exec(self) -> Singer:
+        return _decode_singer(await request_manager.patch('/singers/' + self._id, self._input, self._query))
+
+    def __await__(self) -> Generator[Any, None, Singer]:
+        return self.exec().__await__()
+
+
+class SingerDeleteRequest:
+
+    def __init__(self, id: str) -> None:
+        self._id = id
+
+    async def exec(self) -> None:
+        return await request_manager.delete('/singers/' + self._id)
+
+    def __await__(self) -> Generator[Any, None, None]:
+        return self.exec().__await__()
+
+
+class SingerIDRequest:
+
+    def __init__(self, id: str, query: SingerSingleQuery | None = None) -> None:
+        self._id = id
+        self._query: SingerSingleQuery = query or {}
+
+    def pick(self, *picks: SingerResultPick) -> SingerIDRequest:
+        self._query['_pick'] = list(picks)
+        return self
+
+    def omit(self, *omits: SingerResultPick) -> SingerIDRequest:
+        self._query['_omit'] = list(omits)
+        return self
+
+    async def exec(self) -> Singer:
+        return _decode_singer(await request_manager.get('/singers/' + self._id, self._query))
+
+    def __await__(self) -> Generator[Any, None, Singer]:
+        return self.exec().__await__()
+
+
+class SingerUpsertRequest:
+
+    def __init__(self, input: SingerQueryData, query: SingerSingleQuery | None = None) -> None:
+        self._input = input
+        self._query: SingerSingleQuery = query or {}
+
+    def pick(self, *picks: SingerResultPick) -> SingerUpsertRequest:
+        self._query['_pick'] = list(picks)
+        return self
+
+    def omit(self, *omits: SingerResultPick) -> SingerUpsertRequest:
+        self._query['_omit'] = list(omits)
+        return self
+
+    async def exec(self) -> Singer:
+        return _decode_singer(await request_manager.post('/singers', {'_upsert': self._input}, self._query))
+
+    def __await__(self) -> Generator[Any, None, Singer]:
+        return self.exec().__await__()
+
+
+class SingerCreateManyRequest:
+
+    def __init__(self, input: list[SingerCreateInput], chunk_size: int | None = None, query: SingerSingleQuery | None = None) -> None:
+        self._input = input
+        self._chunk_size = chunk_size
+        self._query: SingerSingleQuery = query or {}
+
+    def pick(self, *picks: SingerResultPick) -> SingerCreateManyRequest:
+        self._query['_pick'] = list(picks)
+        return self
+
+    def omit(self, *omits: SingerResultPick) -> SingerCreateManyRequest:
+        self._query['_omit'] = list(omits)
+        return self
+
+    async def exec(self) -> list[Singer]:
+        size = self._chunk_size or len(self._input) or 1
+        chunks = [self._input[i:i + size] for i in range(0, len(self._input), size)]
+        pages = await gather(*[request_manager.post('/singers', {'_create': c}, self._query) for c in chunks])
+        return [_decode_singer(v) for page in pages for v in page]
+
+    def __await__(self) -> Generator[Any, None, list[Singer]]:
+        return self.exec().__await__()
+
+
+class SingerUpdateManyRequest:
+
+    def __init__(self, input: SingerQueryData, query: SingerSingleQuery | None = None) -> None:
+        self._input = input
+        self._query: SingerSingleQuery = query or {}
+
+    def pick(self, *picks: SingerResultPick) -> SingerUpdateManyRequest:
+        self._query['_pick'] = list(picks)
+        return self
+
+    def omit(self, *omits: SingerResultPick) -> SingerUpdateManyRequest:
+        self._query['_omit'] = list(omits)
+        return self
+
+    async def exec(self) -> list[Singer]:
+        return [_decode_singer(v) for v in await request_manager.patch('/singers', {'_update': self._input}, self._query)]
+
+    def __await__(self) -> Generator[Any, None, list[Singer]]:
+        return self.exec().__await__()
+
+
+class SingerDeleteManyRequest:
+
+    def __init__(self, query: SingerSeekQuery) -> None:
+        self._query = query
+
+    async def exec(self) -> None:
+        return await request_manager.delete('/singers', self._query)
+
+    def __await__(self) -> Generator[Any, None, None]:
+        return self.exec().__await__()
+
+
+class SingerListRequest:
+
+    def __init__(self, query: SingerListQuery | None = None) -> None:
+        self._query: SingerListQuery = query or {}
+
+    def order(self, *orders: SingerSortOrder) -> SingerListRequest:
+        self._query['_order'] = [*self._query.get('_order', []), *orders]
+        return self
+
+    def limit(self, limit: int) -> SingerListRequest:
+        self._query['_limit'] = limit
+        return self
+
+    def skip(self, skip: int) -> SingerListRequest:
+        self._query['_skip'] = skip
+        return self
+
+    def page_no(self, page_no: int) -> SingerListRequest:
+        self._query['_pageNo'] = page_no
+        return self
+
+    def page_size(self, page_size: int) -> SingerListRequest:
+        self._query['_pageSize'] = page_size
+        return self
+
+    def pick(self, *picks: SingerResultPick) -> SingerListRequest:
+        self._query['_pick'] = list(picks)
+        return self
+
+    def omit(self, *omits: SingerResultPick) -> SingerListRequest:
+        self._query['_omit'] = list(omits)
+        return self
+
+    async def exec(self) -> list[Singer]:
+        return [_decode_singer(v) for v in await request_manager.get('/singers', self._query)]
+
+    def __await__(self) -> Generator[Any, None, list[Singer]]:
+        return self.exec().__await__()
+
+    async def iter(self, page_size: int = 100) -> AsyncIterator[Singer]:
+        query: SingerListQuery = {**self._query}
+        query.pop('_pageNo', None)
+        query.pop('_pageSize', None)
+        skip = query.get('_skip', 0)
+        remaining = query.get('_limit')
+        while remaining is None or remaining > 0:
+            limit = page_size if remaining is None else min(page_size, remaining)
+            page = await SingerListRequest({**query, '_skip': skip, '_limit': limit})
+            for item in page:
+                yield item
+            if len(page) < limit:
+                break
+            skip += limit
+            remaining = None if remaining is None else remaining - limit
+
+    def __aiter__(self) -> AsyncIterator[Singer]:
+        return self.iter()
+
+
+class SingerClient:
+
+    def create(self, input: SingerCreateInput) -> SingerCreateRequest:
+        return SingerCreateRequest(input)
+
+    def update(self, id: str, input: SingerUpdateInput) -> SingerUpdateRequest:
+        return SingerUpdateRequest(id, input)
+
+    async def delete(self, id: str) -> None:
+        await SingerDeleteRequest(id)
+
+    def id(self, id: str) -> SingerIDRequest:
+        return SingerIDRequest(id)
+
+    def find(self, query: SingerListQuery | None = None) -> SingerListRequest:
+        return SingerListRequest(query)
+
+    def upsert(self, query: SingerSeekQuery, data: SingerUpdateInput) -> SingerUpsertRequest:
+        return SingerUpsertRequest({'_query': query, '_data': data})
+
+    def create_many(self, input: list[SingerCreateInput], chunk_size: int | None = None) -> SingerCreateManyRequest:
+        return SingerCreateManyRequest(input, chunk_size)
+
+    def update_many(self, query: SingerSeekQuery, data: SingerUpdateInput) -> SingerUpdateManyRequest:
+        return SingerUpdateManyRequest({'_query': query, '_data': data})
+
+    async def delete_many(self, query: SingerSeekQuery | None = None) -> None:
+        await SingerDeleteManyRequest(query or {})
+
+
+singers = SingerClient()
+
+
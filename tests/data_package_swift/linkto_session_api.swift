@@ -1,5 +1,6 @@
 import Foundation
 import QSParser
+import Security
 
 public enum StringQuery: Codable {
     case eq(_ value: String)
@@ -1201,41 +1202,150 @@ public struct Response<T: Codable>: Codable {
     let data: T
 }
 
-@propertyWrapper
-public struct UserDefault<T: Codable> {
+public protocol SessionStorage {
+    func load() -> Data?
+    func save(_ data: Data?)
+}
 
-    private var key: String
+public struct UserDefaultsSessionStorage: SessionStorage {
 
-    public var wrappedValue: T? {
-        didSet {
-            if let wrappedValue = wrappedValue {
-                let data = try! JSONEncoder().encode(wrappedValue)
-                let string = String(data: data, encoding: .utf8)
-                UserDefaults.standard.setValue(string, forKey: key)
-            } else {
-                UserDefaults.standard.removeObject(forKey: key)
-            }
-        }
-    }
+    private let key: String
 
-    fileprivate init(key: String) {
+    public init(key: String = "session") {
         self.key = key
-        if let string = UserDefaults.standard.value(forKey: key) as? String {
-            let data = string.data(using: .utf8)!
-            self.wrappedValue = try! JSONDecoder().decode(T.self, from: data)
+    }
+
+    public func load() -> Data? {
+        return UserDefaults.standard.string(forKey: key)?.data(using: .utf8)
+    }
+
+    public func save(_ data: Data?) {
+        if let data = data {
+            UserDefaults.standard.setValue(String(data: data, encoding: .utf8), forKey: key)
         } else {
-            self.wrappedValue = nil
+            UserDefaults.standard.removeObject(forKey: key)
+        }
+    }
+}
+
+public struct KeychainSessionStorage: SessionStorage {
+
+    private let service: String
+    private let account: String
+
+    public init(service: String = "jsonclasses", account: String = "session") {
+        self.service = service
+        self.account = account
+    }
+
+    private var query: [String: Any] {
+        return [
+            kSecClass as String: kSecClassGenericPassword,
+            kSecAttrService as String: service,
+            kSecAttrAccount as String: account
+        ]
+    }
+
+    public func load() -> Data? {
+        var query = self.query
+        query[kSecReturnData as String] = true
+        query[kSecMatchLimit as String] = kSecMatchLimitOne
+        var result: AnyObject?
+        guard SecItemCopyMatching(query as CFDictionary, &result) == errSecSuccess else {
+            return nil
+        }
+        return result as? Data
+    }
+
+    public func save(_ data: Data?) {
+        SecItemDelete(query as CFDictionary)
+        if let data = data {
+            var query = self.query
+            query[kSecValueData as String] = data
+            query[kSecAttrAccessible as String] = kSecAttrAccessibleAfterFirstUnlock
+            SecItemAdd(query as CFDictionary, nil)
         }
     }
 }
 
-public struct SessionManager {
+public final class SessionManager {
 
-    public static var shared = SessionManager()
+    public static let shared = SessionManager()
 
-    @UserDefault(key: "session") public fileprivate(set) var session: Session?
+    private let lock = NSLock()
+    private let queue = DispatchQueue(label: "jsonclasses.session", qos: .utility)
+    private var storage: SessionStorage = UserDefaultsSessionStorage()
+    private var pendingSave: DispatchWorkItem?
+    private var loaded = false
+    private var cachedSession: Session?
+    private var cachedAuthorization: String?
 
     private init() { }
+
+    public fileprivate(set) var session: Session? {
+        get {
+            lock.lock()
+            defer { lock.unlock() }
+            loadIfNeeded()
+            return cachedSession
+        }
+        set {
+            lock.lock()
+            defer { lock.unlock() }
+            loaded = true
+            cache(newValue)
+            scheduleSave(newValue)
+        }
+    }
+
+    internal var authorization: String? {
+        lock.lock()
+        defer { lock.unlock() }
+        loadIfNeeded()
+        return cachedAuthorization
+    }
+
+    public func use(storage: SessionStorage) {
+        lock.lock()
+        defer { lock.unlock() }
+        self.storage = storage
+        loaded = false
+    }
+
+    private func loadIfNeeded() {
+        if loaded {
+            return
+        }
+        loaded = true
+        if let data = storage.load() {
+            cache(try? JSONDecoder().decode(Session.self, from: data))
+        } else {
+            cache(nil)
+        }
+    }
+
+    private func cache(_ session: Session?) {
+        cachedSession = session
+        if let session = session {
+            cachedAuthorization = "Bearer \(session.token)"
+        } else {
+            cachedAuthorization = nil
+        }
+    }
+
+    private func scheduleSave(_ session: Session?) {
+        pendingSave?.cancel()
+        let storage = self.storage
+        let item = DispatchWorkItem {
+            if let session = session {
+                storage.save(try? JSONEncoder().encode(session))
+            } else {
+                storage.save(nil)
+            }
+        }
+        pendingSave = item
+        queue.asyncAfter(deadline: .now() + .milliseconds(100), execute: item)
+    }
 }
 
 public func signOut() {
@@ -1292,8 +1402,8 @@ struct RequestManager {
         if let input = input {
             request.httpBody = try! JSONEncoder().encode(input)
         }
-        if let session = SessionManager.shared.session {
-            request.setValue("Bearer \(session.token)", forHTTPHeaderField: "Authorization")
+        if let authorization = SessionManager.shared.authorization {
+            request.setValue(authorization, forHTTPHeaderField: "Authorization")
         }
         let (data, response) = try await URLSession.shared.data(for: request)
         if let response = response as? HTTPURLResponse {
@@ -281,20 +281,20 @@ interface ArticleQueryData {
 }
 
 
-class RequestManager {
+export interface APIConfig {
+    baseURL?: string
+}
 
-    static share = new RequestManager()
+class RequestManager {
 
-    #baseURL: string = "None"
+    #baseURL: string
 
+    constructor(config: APIConfig = {}) {
+        this.#baseURL = config.baseURL ?? "None"
+    }
 
-    get headers() {
-        const token =  undefined 
-        return token ? {
-            headers: {
-                'Authorization': `Bearer ${token}`
-            }
-        } : undefined
+    get headers(): { headers: { Authorization: string } } | undefined {
+        return undefined
     }
 
     qs(val: any): string {
@@ -331,11 +331,13 @@ class RequestManager {
 
 class UserCreateRequest<T extends Partial<User>> extends Promise<T> {
 
+    #manager: RequestManager
     #input: UserCreateInput
     #query?: UserSingleQuery
 
-    constructor(input: UserCreateInput, query?:UserSingleQuery){
+    constructor(manager: RequestManager, input: UserCreateInput, query?: UserSingleQuery) {
         super(() => {})
+        this.#manager = manager
         this.#input = input
         this.#query = query
     }
@@ -351,23 +353,25 @@ class UserCreateRequest<T extends Partial<User>> extends Promise<T> {
     }
 
     include(includes: UserInclude[]): UserCreateRequest<T> {
-        this.#query = {...this.#query, _includes: includes }
+        this.#query = {...this.#query, _includes: includes}
         return this
     }
 
     async exec(): Promise<T> {
-        return await RequestManager.share.post('/users', this.#input, this.#query)
+        return await this.#manager.post('/users', this.#input, this.#query)
     }
 }
 
 class UserUpdateRequest<T extends Partial<User>> extends Promise<T> {
 
+    #manager: RequestManager
     #id: string
     #input: UserUpdateInput
     #query?: UserSingleQuery
 
-    constructor(id:string, input: UserUpdateInput, query?: UserSingleQuery,) {
+    constructor(manager: RequestManager, id: string, input: UserUpdateInput, query?: UserSingleQuery) {
         super(() => {})
+        this.#manager = manager
         this.#id = id
         this.#input = input
         this.#query = query
@@ -384,36 +388,41 @@ class UserUpdateRequest<T extends Partial<User>> extends Promise<T> {
     }
 
     include(includes: UserInclude[]): UserUpdateRequest<T> {
-        this.#query = {...this.#query, _includes: includes }
+        this.#query = {...this.#query, _includes: includes}
         return this
     }
 
     async exec(): Promise<User> {
-        return await RequestManager.share.patch(`/users/${this.#id}`, this.#input, this.#query)
+        return await this.#manager.patch(`/users/${this.#id}`, this.#input, this.#query)
     }
 }
 
 class UserDeleteRequest extends Promise<void> {
 
+    #manager: RequestManager
     #id: string
 
-    constructor(id: string) {
+    constructor(manager: RequestManager, id: string) {
         super(() => {})
+        this.#manager = manager
         this.#id = id
     }
+
     async exec(): Promise<void> {
-        return await RequestManager.share.delete(`/users/${this.#id}`)
+        return await this.#manager.delete(`/users/${this.#id}`)
     }
 }
 
 class UserIDRequest<T extends Partial<User>> extends Promise<T> {
 
+    #manager: RequestManager
     #id: string
     #query?: UserSingleQuery
 
-    constructor(id: string, query?: UserSingleQuery) {
+    constructor(manager: RequestManager, id: string, query?: UserSingleQuery) {
         super(() => {})
-        this.#id = id,
+        this.#manager = manager
+        this.#id = id
         this.#query = query
     }
 
@@ -428,37 +437,40 @@ class UserIDRequest<T extends Partial<User>> extends Promise<T> {
     }
 
     include(includes: UserInclude[]): UserIDRequest<T> {
-        this.#query = {...this.#query, _includes: includes }
+        this.#query = {...this.#query, _includes: includes}
         return this
     }
 
     async exec(): Promise<User> {
-        return await RequestManager.share.get(`/users/${this.#id}`, this.#query)
+        return await this.#manager.get(`/users/${this.#id}`, this.#query)
     }
 }
 
 class UserUpsertRequest<T extends Partial<User>> extends Promise<T> {
 
+    #manager: RequestManager
     #input: UserQueryData
 
-    constructor(input: UserQueryData){
+    constructor(manager: RequestManager, input: UserQueryData) {
         super(() => {})
+        this.#manager = manager
         this.#input = input
     }
 
     async exec(): Promise<T> {
-        return await RequestManager.share.post('/users', { '_upsert': this.#input })
+        return await this.#manager.post('/users', { '_upsert': this.#input })
     }
 }
-    
 
 class UserCreateManyRequest<T extends Partial<User>> extends Promise<T> {
 
+    #manager: RequestManager
     #input: UserCreateInput[]
     #query?: UserSingleQuery
 
-     constructor(input: UserCreateInput[], query?:UserSingleQuery){
+    constructor(manager: RequestManager, input: UserCreateInput[], query?: UserSingleQuery) {
         super(() => {})
+        this.#manager = manager
         this.#input = input
         this.#query = query
     }
@@ -474,23 +486,24 @@ class UserCreateManyRequest<T extends Partial<User>> extends Promise<T> {
     }
 
     include(includes: UserInclude[]): UserCreateManyRequest<T> {
-        this.#query = {...this.#query, _includes: includes }
+        this.#query = {...this.#query, _includes: includes}
         return this
     }
 
     async exec(): Promise<T[]> {
-        return await RequestManager.share.post('/users', { '_create': this.#input })
+        return await this.#manager.post('/users', { '_create': this.#input })
     }
 }
-    
 
 class UserUpdateManyRequest<T extends Partial<User>> extends Promise<T> {
 
+    #manager: RequestManager
     #input: UserQueryData
     #query?: UserSingleQuery
 
-    constructor(input: UserQueryData, query?:UserSingleQuery) {
+    constructor(manager: RequestManager, input: UserQueryData, query?: UserSingleQuery) {
         super(() => {})
+        this.#manager = manager
         this.#input = input
         this.#query = query
     }
@@ -506,37 +519,39 @@ class UserUpdateManyRequest<T extends Partial<User>> extends Promise<T> {
     }
 
     include(includes: UserInclude[]): UserUpdateManyRequest<T> {
-        this.#query = {...this.#query, _includes: includes }
+        this.#query = {...this.#query, _includes: includes}
         return this
     }
 
     async exec(): Promise<User> {
-        return await RequestManager.share.patch('/users', { '_update': this.#input })
+        return await this.#manager.patch('/users', { '_update': this.#input })
     }
 }
-    
 
 class UserDeleteManyRequest extends Promise<void> {
 
+    #manager: RequestManager
     #query?: UserSeekQuery
 
-    constructor(query?: UserSeekQuery) {
+    constructor(manager: RequestManager, query?: UserSeekQuery) {
         super(() => {})
+        this.#manager = manager
         this.#query = query
     }
 
     async exec(): Promise<void> {
-        return await RequestManager.share.delete('/users', this.#query)
+        return await this.#manager.delete('/users', this.#query)
     }
 }
-    
 
 class UserListRequest<T extends Partial<User>> extends Promise<T[]> {
 
+    #manager: RequestManager
     #query?: UserListQuery
 
-    constructor(query?: UserListQuery) {
+    constructor(manager: RequestManager, query?: UserListQuery) {
         super(() => {})
+        this.#manager = manager
         this.#query = query
     }
 
@@ -551,7 +566,7 @@ class UserListRequest<T extends Partial<User>> extends Promise<T[]> {
     }
 
     limt(limit: number): UserListRequest<T> {
-        this.#query = {...this.#query, _limit:limit}
+        this.#query = {...this.#query, _limit: limit}
         return this
     }
 
@@ -576,63 +591,70 @@ class UserListRequest<T extends Partial<User>> extends Promise<T[]> {
     }
 
     include(includes: UserInclude[]): UserListRequest<T> {
-        this.#query = {...this.#query, _includes: includes }
+        this.#query = {...this.#query, _includes: includes}
         return this
     }
 
     async exec(): Promise<User[]> {
-        return await RequestManager.share.get('/users',this.#query)
+        return await this.#manager.get('/users', this.#query)
     }
 }
 
 class UserClient {
 
+    #manager: RequestManager
+
+    constructor(manager: RequestManager) {
+        this.#manager = manager
+    }
+
     create(input: UserCreateInput, query?: UserSingleQuery): UserCreateRequest<User> {
-        return new UserCreateRequest(input, query)
+        return new UserCreateRequest(this.#manager, input, query)
     }
 
     createMany(input: UserCreateInput[]): UserCreateManyRequest<User> {
-        return new UserCreateManyRequest(input)
+        return new UserCreateManyRequest(this.#manager, input)
     }
 
-    id(id: string, query?: UserSingleQuery) {
-        return new UserIDRequest(id, query)
+    id(id: string, query?: UserSingleQuery): UserIDRequest<User> {
+        return new UserIDRequest(this.#manager, id, query)
     }
 
     update(id: string, input: UserUpdateInput, query?: UserSingleQuery): UserUpdateRequest<User> {
-        return new UserUpdateRequest(id, input, query)
+        return new UserUpdateRequest(this.#manager, id, input, query)
     }
 
     updateMany(input: UserQueryData): UserUpdateManyRequest<User> {
-        return new UserUpdateManyRequest(input)
+        return new UserUpdateManyRequest(this.#manager, input)
     }
 
     upsert(input: UserQueryData): UserUpsertRequest<User> {
-        return new UserUpsertRequest(input)
+        return new UserUpsertRequest(this.#manager, input)
     }
 
     find(query?: UserListQuery): UserListRequest<User> {
-        return new UserListRequest(query)
+        return new UserListRequest(this.#manager, query)
     }
 
     delete(id: string): UserDeleteRequest {
-        return new UserDeleteRequest(id)
+        return new UserDeleteRequest(this.#manager, id)
     }
 
     deleteMany(query?: UserSeekQuery): UserDeleteManyRequest {
-        return new UserDeleteManyRequest(query)
+        return new UserDeleteManyRequest(this.#manager, query)
     }
-
 }
 
 
 class ArticleCreateRequest<T extends Partial<Article>> extends Promise<T> {
 
+    #manager: RequestManager
     #input: ArticleCreateInput
     #query?: ArticleSingleQuery
 
-    constructor(input: ArticleCreateInput, query?:ArticleSingleQuery){
+    constructor(manager: RequestManager, input: ArticleCreateInput, query?: ArticleSingleQuery) {
         super(() => {})
+        this.#manager = manager
         this.#input = input
         this.#query = query
     }
@@ -648,23 +670,25 @@ class ArticleCreateRequest<T extends Partial<Article>> extends Promise<T> {
     }
 
     include(includes: ArticleInclude[]): ArticleCreateRequest<T> {
-        this.#query = {...this.#query, _includes: includes }
+        this.#query = {...this.#query, _includes: includes}
         return this
     }
 
     async exec(): Promise<T> {
-        return await RequestManager.share.post('/articles', this.#input, this.#query)
+        return await this.#manager.post('/articles', this.#input, this.#query)
     }
 }
 
 class ArticleUpdateRequest<T extends Partial<Article>> extends Promise<T> {
 
+    #manager: RequestManager
     #id: string
     #input: ArticleUpdateInput
     #query?: ArticleSingleQuery
 
-    constructor(id:string, input: ArticleUpdateInput, query?: ArticleSingleQuery,) {
+    constructor(manager: RequestManager, id: string, input: ArticleUpdateInput, query?: ArticleSingleQuery) {
         super(() => {})
+        this.#manager = manager
         this.#id = id
         this.#input = input
         this.#query = query
@@ -681,36 +705,41 @@ class ArticleUpdateRequest<T extends Partial<Article>> extends Promise<T> {
     }
 
     include(includes: ArticleInclude[]): ArticleUpdateRequest<T> {
-        this.#query = {...this.#query, _includes: includes }
+        this.#query = {...this.#query, _includes: includes}
         return this
     }
 
     async exec(): Promise<Article> {
-        return await RequestManager.share.patch(`/articles/${this.#id}`, this.#input, this.#query)
+        return await this.#manager.patch(`/articles/${this.#id}`, this.#input, this.#query)
     }
 }
 
 class ArticleDeleteRequest extends Promise<void> {
 
+    #manager: RequestManager
     #id: string
 
-    constructor(id: string) {
+    constructor(manager: RequestManager, id: string) {
         super(() => {})
+        this.#manager = manager
         this.#id = id
     }
+
     async exec(): Promise<void> {
-        return await RequestManager.share.delete(`/articles/${this.#id}`)
+        return await this.#manager.delete(`/articles/${this.#id}`)
     }
 }
 
 class ArticleIDRequest<T extends Partial<Article>> extends Promise<T> {
 
+    #manager: RequestManager
     #id: string
     #query?: ArticleSingleQuery
 
-    constructor(id: string, query?: ArticleSingleQuery) {
+    constructor(manager: RequestManager, id: string, query?: ArticleSingleQuery) {
         super(() => {})
-        this.#id = id,
+        this.#manager = manager
+        this.#id = id
         this.#query = query
     }
 
@@ -725,37 +754,40 @@ class ArticleIDRequest<T extends Partial<Article>> extends Promise<T> {
     }
 
     include(includes: ArticleInclude[]): ArticleIDRequest<T> {
-        this.#query = {...this.#query, _includes: includes }
+        this.#query = {...this.#query, _includes: includes}
         return this
     }
 
     async exec(): Promise<Article> {
-        return await RequestManager.share.get(`/articles/${this.#id}`, this.#query)
+        return await this.#manager.get(`/articles/${this.#id}`, this.#query)
     }
 }
 
 class ArticleUpsertRequest<T extends Partial<Article>> extends Promise<T> {
 
+    #manager: RequestManager
     #input: ArticleQueryData
 
-    constructor(input: ArticleQueryData){
+    constructor(manager: RequestManager, input: ArticleQueryData) {
         super(() => {})
+        this.#manager = manager
         this.#input = input
     }
 
     async exec(): Promise<T> {
-        return await RequestManager.share.post('/articles', { '_upsert': this.#input })
+        return await this.#manager.post('/articles', { '_upsert': this.#input })
     }
 }
-    
 
 class ArticleCreateManyRequest<T extends Partial<Article>> extends Promise<T> {
 
+    #manager: RequestManager
     #input: ArticleCreateInput[]
     #query?: ArticleSingleQuery
 
-     constructor(input: ArticleCreateInput[], query?:ArticleSingleQuery){
+    constructor(manager: RequestManager, input: ArticleCreateInput[], query?: ArticleSingleQuery) {
         super(() => {})
+        this.#manager = manager
         this.#input = input
         this.#query = query
     }
@@ -771,23 +803,24 @@ class ArticleCreateManyRequest<T extends Partial<Article>> extends Promise<T> {
     }
 
     include(includes: ArticleInclude[]): ArticleCreateManyRequest<T> {
-        this.#query = {...this.#query, _includes: includes }
+        this.#query = {...this.#query, _includes: includes}
         return this
     }
 
     async exec(): Promise<T[]> {
-        return await RequestManager.share.post('/articles', { '_create': this.#input })
+        return await this.#manager.post('/articles', { '_create': this.#input })
     }
 }
-    
 
 class ArticleUpdateManyRequest<T extends Partial<Article>> extends Promise<T> {
 
+    #manager: RequestManager
     #input: ArticleQueryData
     #query?: ArticleSingleQuery
 
-    constructor(input: ArticleQueryData, query?:ArticleSingleQuery) {
+    constructor(manager: RequestManager, input: ArticleQueryData, query?: ArticleSingleQuery) {
         super(() => {})
+        this.#manager = manager
         this.#input = input
         this.#query = query
     }
@@ -803,37 +836,39 @@ class ArticleUpdateManyRequest<T extends Partial<Article>> extends Promise<T> {
     }
 
     include(includes: ArticleInclude[]): ArticleUpdateManyRequest<T> {
-        this.#query = {...this.#query, _includes: includes }
+        this.#query = {...this.#query, _includes: includes}
         return this
     }
 
     async exec(): Promise<Article> {
-        return await RequestManager.share.patch('/articles', { '_update': this.#input })
+        return await this.#manager.patch('/articles', { '_update': this.#input })
     }
 }
-    
 
 class ArticleDeleteManyRequest extends Promise<void> {
 
+    #manager: RequestManager
     #query?: ArticleSeekQuery
 
-    constructor(query?: ArticleSeekQuery) {
+    constructor(manager: RequestManager, query?: ArticleSeekQuery) {
         super(() => {})
+        this.#manager = manager
         this.#query = query
     }
 
     async exec(): Promise<void> {
-        return await RequestManager.share.delete('/articles', this.#query)
+        return await this.#manager.delete('/articles', this.#query)
     }
 }
-    
 
 class ArticleListRequest<T extends Partial<Article>> extends Promise<T[]> {
 
+    #manager: RequestManager
     #query?: ArticleListQuery
 
-    constructor(query?: ArticleListQuery) {
+    constructor(manager: RequestManager, query?: ArticleListQuery) {
         super(() => {})
+        this.#manager = manager
         this.#query = query
     }
 
@@ -848,7 +883,7 @@ class ArticleListRequest<T extends Partial<Article>> extends Promise<T[]> {
     }
 
     limt(limit: number): ArticleListRequest<T> {
-        this.#query = {...this.#query, _limit:limit}
+        this.#query = {...this.#query, _limit: limit}
         return this
     }
 
@@ -873,69 +908,79 @@ class ArticleListRequest<T extends Partial<Article>> extends Promise<T[]> {
     }
 
     include(includes: ArticleInclude[]): ArticleListRequest<T> {
-        this.#query = {...this.#query, _includes: includes }
+        this.#query = {...this.#query, _includes: includes}
         return this
     }
 
     async exec(): Promise<Article[]> {
-        return await RequestManager.share.get('/articles',this.#query)
+        return await this.#manager.get('/articles', this.#query)
     }
 }
 
 class ArticleClient {
 
+    #manager: RequestManager
+
+    constructor(manager: RequestManager) {
+        this.#manager = manager
+    }
+
     create(input: ArticleCreateInput, query?: ArticleSingleQuery): ArticleCreateRequest<Article> {
-        return new ArticleCreateRequest(input, query)
+        return new ArticleCreateRequest(this.#manager, input, query)
     }
 
     createMany(input: ArticleCreateInput[]): ArticleCreateManyRequest<Article> {
-        return new ArticleCreateManyRequest(input)
+        return new ArticleCreateManyRequest(this.#manager, input)
     }
 
-    id(id: string, query?: ArticleSingleQuery) {
-        return new ArticleIDRequest(id, query)
+    id(id: string, query?: ArticleSingleQuery): ArticleIDRequest<Article> {
+        return new ArticleIDRequest(this.#manager, id, query)
     }
 
     update(id: string, input: ArticleUpdateInput, query?: ArticleSingleQuery): ArticleUpdateRequest<Article> {
-        return new ArticleUpdateRequest(id, input, query)
+        return new ArticleUpdateRequest(this.#manager, id, input, query)
     }
 
     updateMany(input: ArticleQueryData): ArticleUpdateManyRequest<Article> {
-        return new ArticleUpdateManyRequest(input)
+        return new ArticleUpdateManyRequest(this.#manager, input)
     }
 
     upsert(input: ArticleQueryData): ArticleUpsertRequest<Article> {
-        return new ArticleUpsertRequest(input)
+        return new ArticleUpsertRequest(this.#manager, input)
     }
 
     find(query?: ArticleListQuery): ArticleListRequest<Article> {
-        return new ArticleListRequest(query)
+        return new ArticleListRequest(this.#manager, query)
     }
 
     delete(id: string): ArticleDeleteRequest {
-        return new ArticleDeleteRequest(id)
+        return new ArticleDeleteRequest(this.#manager, id)
     }
 
     deleteMany(query?: ArticleSeekQuery): ArticleDeleteManyRequest {
-        return new ArticleDeleteManyRequest(query)
+        return new ArticleDeleteManyRequest(this.#manager, query)
     }
-
 }
 
 
-class API {
+export class API {
+
+    #manager: RequestManager
+    #users?: UserClient
+    #articles?: ArticleClient
+
+    constructor(config: APIConfig = {}) {
+        this.#manager = new RequestManager(config)
+    }
 
     get users(): UserClient {
-        return new UserClient()
+        return this.#users ??= new UserClient(this.#manager)
     }
 
     get articles(): ArticleClient {
-        return new ArticleClient()
+        return this.#articles ??= new ArticleClient(this.#manager)
     }
-
 }
 
 
 export const api = new API()
-
-
@@ -0,0 +1,1197 @@
+import axios from 'axios'
+import { stringify } from 'qsparser-js'
+
+
+type Mode = 'default' | 'insensitive'
+
+interface StringContainsQuery {
+    _contains: string
+    _mode?: Mode
+}
+
+interface StringPrefixQuery {
+    _prefix: string
+    _mode?: Mode
+}
+
+interface StringSuffixQuery {
+    _suffix: string
+    _mode?: Mode
+}
+
+interface StringMatchQuery {
+    _match: string
+    _mode?: Mode
+}
+
+interface StringEqQuery {
+    _eq: string
+}
+
+interface StringNeqQuery {
+    _neq: string
+}
+
+interface StringNullQuery {
+    _null: boolean
+}
+
+interface StringCompareQuery {
+    _gt?: string
+    _gte?: string
+    _lt?: string
+    _lte?: string
+}
+
+interface StringOrQuery {
+    _or: StringQuery[]
+}
+
+interface StringAndQuery {
+    _and: StringQuery[]
+}
+
+export type StringQuery = string | StringContainsQuery | StringPrefixQuery | StringSuffixQuery | StringMatchQuery |
+                          StringEqQuery | StringNeqQuery | StringNullQuery | StringCompareQuery | StringOrQuery | StringAndQuery
+
+
+interface NumberValueQuery {
+    _gt?: number
+    _gte?: number
+    _lt?: number
+    _lte?: number
+}
+
+interface NumberEqQuery {
+    _eq: number
+}
+
+interface NumberNeqQuery {
+    _neq: number
+}
+
+interface NumberNullQuery {
+    _null: boolean
+}
+
+interface NumberOrQuery {
+    _or: NumberQuery[]
+}
+
+interface NumberAndQuery {
+    _and: NumberQuery[]
+}
+
+export type NumberQuery = number | NumberEqQuery | NumberNeqQuery | NumberNullQuery | NumberValueQuery | NumberOrQuery | NumberAndQuery
+
+
+interface BooleanEqQuery {
+    _eq: boolean
+}
+
+interface BooleanNeqQuery {
+    _neq: boolean
+}
+
+interface BooleanNullQuery {
+    _null: boolean
+}
+
+interface BooleanOrQuery {
+    _or: BooleanQuery[]
+}
+
+interface BooleanAndQuery {
+    _and: BooleanQuery[]
+}
+
+export type BooleanQuery = boolean | BooleanEqQuery | BooleanNeqQuery | BooleanNullQuery | BooleanOrQuery | BooleanAndQuery
+
+
+interface DateValueQuery {
+    _gt?: Date
+    _gte?: Date
+    _lt?: Date
+    _lte?: Date
+    _on?: Date
+}
+
+interface DateEqQuery {
+    _eq: Date
+}
+
+interface DateNeqQuery {
+    _neq: Date
+}
+
+interface DateNullQuery {
+    _null: boolean
+}
+
+interface DateOrQuery {
+    _or: DateQuery[]
+}
+
+interface DateAndQuery {
+    _and: DateQuery[]
+}
+
+interface DateBeforeQuery {
+    _before: Date
+}
+
+interface DateAfterQuery {
+    _after: Date
+}
+
+export type DateQuery = Date | DateValueQuery | DateEqQuery | DateNeqQuery | DateNullQuery | DateOrQuery | DateAndQuery |
+                        DateBeforeQuery | DateAfterQuery
+
+
+interface IDQuery {
+    _eq: String
+    _neq: String
+    _null: boolean
+}
+
+
+interface Link {
+    _add: String
+}
+
+interface UnLink {
+    _del: String
+}
+
+
+export interface User {
+    id: string
+    username: string
+    birthday?: Date
+    articles: Article[]
+    createdAt: Date
+}
+
+export interface UserCreateInput {
+    username: string
+    password: string
+    birthday?: Date
+    articles: ArticleCreateInput[]
+}
+
+export interface UserUpdateInput {
+    username?: string
+    password?: string
+    birthday?: Date | null
+    articles?: ArticleUpdateInput[]
+}
+
+type UserSortOrder = 'username' | '-username' | 'birthday' | '-birthday' | 'createdAt' | '-createdAt'
+
+type UserResultPick = 'id' | 'username' | 'birthday' | 'articles' | 'createdAt'
+
+interface UserArticlesInclude {
+    articles?: ArticleListQuery
+}
+
+type UserInclude = UserArticlesInclude
+
+interface UserSingleQuery {
+    _pick?: UserResultPick[]
+    _omit?: UserResultPick[]
+    _includes?: UserInclude[]
+}
+
+interface UserListQuery {
+    id?: StringQuery
+    username?: StringQuery
+    birthday?: DateQuery
+    createdAt?: DateQuery
+    _order?: UserSortOrder | UserSortOrder[]
+    _limit?: number
+    _skip?: number
+    _pageNo?: number
+    _pageSize?: number
+    _pick?: UserResultPick[]
+    _omit?: UserResultPick[]
+    _includes?: UserInclude[]
+}
+
+interface UserSeekQuery {
+    id?: StringQuery
+    username?: StringQuery
+    birthday?: DateQuery
+    createdAt?: DateQuery
+}
+
+interface UserQueryData {
+    _query: UserSeekQuery
+    _data: UserUpdateInput
+}
+
+
+export interface Article {
+    id: string
+    title: string
+    publishedAt: Date[]
+    author: User
+    author_id: string
+}
+
+export interface ArticleCreateInput {
+    title: string
+    publishedAt: Date[]
+    author: (UserCreateInput | Link)
+    author_id: string
+}
+
+export interface ArticleUpdateInput {
+    title?: string
+    publishedAt?: Date[]
+    author?: (UserUpdateInput | Link | UnLink)
+    author_id?: string
+}
+
+type ArticleSortOrder = 'title' | '-title' | 'publishedAt' | '-publishedAt'
+
+type ArticleResultPick = 'id' | 'title' | 'publishedAt' | 'author' | 'author_id'
+
+interface ArticleAuthorInclude {
+    author?: UserSingleQuery
+}
+
+type ArticleInclude = ArticleAuthorInclude
+
+interface ArticleSingleQuery {
+    _pick?: ArticleResultPick[]
+    _omit?: ArticleResultPick[]
+    _includes?: ArticleInclude[]
+}
+
+interface ArticleListQuery {
+    id?: StringQuery
+    title?: StringQuery
+    publishedAt?: DateQuery[]
+    author_id?: IDQuery
+    _order?: ArticleSortOrder | ArticleSortOrder[]
+    _limit?: number
+    _skip?: number
+    _pageNo?: number
+    _pageSize?: number
+    _pick?: ArticleResultPick[]
+    _omit?: ArticleResultPick[]
+    _includes?: ArticleInclude[]
+}
+
+interface ArticleSeekQuery {
+    id?: StringQuery
+    title?: StringQuery
+    publishedAt?: DateQuery[]
+    author_id?: IDQuery
+}
+
+interface ArticleQueryData {
+    _query: ArticleSeekQuery
+    _data: ArticleUpdateInput
+}
+
+
+interface UserSessionInput {
+    username: string
+    password: string
+}
+
+
+interface UserSession {
+    token: string
+    user: User
+}
+
+
+function decodeUser(data: any): any {
+    if (data == null) {
+        return data
+    }
+    if (data.birthday != null) {
+        data.birthday = new Date(data.birthday)
+    }
+    if (data.articles != null) {
+        data.articles = data.articles.map(decodeArticle)
+    }
+    if (data.createdAt != null) {
+        data.createdAt = new Date(data.createdAt)
+    }
+    return data
+}
+
+
+function decodeArticle(data: any): any {
+    if (data == null) {
+        return data
+    }
+    if (data.publishedAt != null) {
+        data.publishedAt = data.publishedAt.map((v: any) => new Date(v))
+    }
+    if (data.author != null) {
+        data.author = decodeUser(data.author)
+    }
+    return data
+}
+
+
+function decodeSession(data: any): any {
+    data.user = decodeUser(data.user)
+    return data
+}
+
+
+export interface SessionStorage {
+    getItem(key: string): string | null
+    setItem(key: string, value: string): void
+    removeItem(key: string): void
+}
+
+export class MemoryStorage implements SessionStorage {
+
+    #items = new Map<string, string>()
+
+    getItem(key: string): string | null {
+        return this.#items.get(key) ?? null
+    }
+
+    setItem(key: string, value: string): void {
+        this.#items.set(key, value)
+    }
+
+    removeItem(key: string): void {
+        this.#items.delete(key)
+    }
+}
+
+class SessionManager {
+
+    #sessionKey = '_jsonclasses_session'
+    #storage: SessionStorage | undefined
+    #loaded = false
+    #session: UserSession | undefined
+    #headers: { headers: { Authorization: string } } | undefined
+    static share = new SessionManager()
+
+    get storage(): SessionStorage {
+        if (this.#storage === undefined) {
+            this.#storage = typeof localStorage !== 'undefined' ? localStorage : new MemoryStorage()
+        }
+        return this.#storage
+    }
+
+    useStorage(storage: SessionStorage): void {
+        this.#storage = storage
+        this.#loaded = false
+    }
+
+    #load() {
+        if (this.#loaded) {
+            return
+        }
+        this.#loaded = true
+        const item = this.storage.getItem(this.#sessionKey)
+        if (item && item !== null && item !== '') {
+            this.#cache(decodeSession(JSON.parse(item)))
+        } else {
+            this.#cache(undefined)
+        }
+    }
+
+    #cache(session: UserSession | undefined) {
+        this.#session = session
+        this.#headers = session ? { headers: { Authorization: `Bearer ${session.token}` } } : undefined
+    }
+
+    setSession(session: UserSession | undefined | null): void {
+        this.#loaded = true
+        if (session) {
+            this.#cache(session)
+            this.storage.setItem(this.#sessionKey, JSON.stringify(session))
+        } else {
+            this.#cache(undefined)
+            this.storage.removeItem(this.#sessionKey)
+        }
+    }
+
+    hasSession(): boolean {
+        this.#load()
+        return this.#session !== undefined
+    }
+
+    getToken(): string | undefined {
+        this.#load()
+        return this.#session?.token
+    }
+
+    getSession(): UserSession | undefined {
+        this.#load()
+        return this.#session
+    }
+
+    get headers(): { headers: { Authorization: string } } | undefined {
+        this.#load()
+        return this.#headers
+    }
+
+    clearSession(): void {
+        this.setSession(undefined)
+    }
+}
+
+
+export interface APIConfig {
+    baseURL?: string
+}
+
+class RequestManager {
+
+    #baseURL: string
+
+    constructor(config: APIConfig = {}) {
+        this.#baseURL = config.baseURL ?? "None"
+    }
+
+    get headers(): { headers: { Authorization: string } } | undefined {
+        return SessionManager.share.headers
+    }
+
+    qs(val: any): string {
+        if (!val) {
+            return ''
+        }
+        if (Object.keys(val).length === 0) {
+            return ''
+        }
+        return '?' + stringify(val)
+    }
+
+    async post<T, U, V>(url: string, input: T, query: V | undefined = undefined): Promise<U> {
+        const response = await axios.post(this.#baseURL + url + this.qs(query), input, this.headers)
+        return response.data.data
+    }
+
+    async patch<T, U, V>(url: string, input: T, query: V | undefined = undefined): Promise<U> {
+        const response = await axios.patch(this.#baseURL + url + this.qs(query), input, this.headers)
+        return response.data.data
+    }
+
+    async delete<V>(url: string, query: V | undefined = undefined): Promise<void> {
+        await axios.delete(this.#baseURL + url + this.qs(query), this.headers)
+        return
+    }
+
+    async get<U, V>(url: string, query: V | undefined = undefined): Promise<U> {
+        const response = await axios.get(this.#baseURL + url + this.qs(query), this.headers)
+        return response.data.data
+    }
+}
+
+
+class UserCreateRequest<T extends Partial<User>> extends Promise<T> {
+
+    #manager: RequestManager
+    #input: UserCreateInput
+    #query?: UserSingleQuery
+
+    constructor(manager: RequestManager, input: UserCreateInput, query?: UserSingleQuery) {
+        super(() => {})
+        this.#manager = manager
+        this.#input = input
+        this.#query = query
+    }
+
+    pick(picks: UserResultPick[]): UserCreateRequest<Pick<T, typeof picks[number]>> {
+        this.#query = {...this.#query, _pick: picks}
+        return this
+    }
+
+    omit(omits: UserResultPick[]): UserCreateRequest<Omit<T, typeof omits[number]>> {
+        this.#query = {...this.#query, _omit: omits}
+        return this
+    }
+
+    include(includes: UserInclude[]): UserCreateRequest<T> {
+        this.#query = {...this.#query, _includes: includes}
+        return this
+    }
+
+    async exec(): Promise<T> {
+        return decodeUser(await this.#manager.post('/users', this.#input, this.#query))
+    }
+}
+
+class UserUpdateRequest<T extends Partial<User>> extends Promise<T> {
+
+    #manager: RequestManager
+    #id: string
+    #input: UserUpdateInput
+    #query?: UserSingleQuery
+
+    constructor(manager: RequestManager, id: string, input: UserUpdateInput, query?: UserSingleQuery) {
+        super(() => {})
+        this.#manager = manager
+        this.#id = id
+        this.#input = input
+        this.#query = query
+    }
+
+    pick(picks: UserResultPick[]): UserUpdateRequest<Pick<T, typeof picks[number]>> {
+        this.#query = {...this.#query, _pick: picks}
+        return this
+    }
+
+    omit(omits: UserResultPick[]): UserUpdateRequest<Omit<T, typeof omits[number]>> {
+        this.#query = {...this.#query, _omit: omits}
+        return this
+    }
+
+    include(includes: UserInclude[]): UserUpdateRequest<T> {
+        this.#query = {...this.#query, _includes: includes}
+        return this
+    }
+
+    async exec(): Promise<User> {
+        return decodeUser(await this.#manager.patch(`/users/${this.#id}`, this.#input, this.#query))
+    }
+}
+
+class UserDeleteRequest extends Promise<void> {
+
+    #manager: RequestManager
+    #id: string
+
+    constructor(manager: RequestManager, id: string) {
+        super(() => {})
+        this.#manager = manager
+        this.#id = id
+    }
+
+    async exec(): Promise<void> {
+        return await this.#manager.delete(`/users/${this.#id}`)
+    }
+}
+
+class UserIDRequest<T extends Partial<User>> extends Promise<T> {
+
+    #manager: RequestManager
+    #id: string
+    #query?: UserSingleQuery
+
+    constructor(manager: RequestManager, id: string, query?: UserSingleQuery) {
+        super(() => {})
+        this.#manager = manager
+        this.#id = id
+        this.#query = query
+    }
+
+    pick(picks: UserResultPick[]): UserIDRequest<Pick<T, typeof picks[number]>> {
+        this.#query = {...this.#query, _pick: picks}
+        return this
+    }
+
+    omit(omits: UserResultPick[]): UserIDRequest<Omit<T, typeof omits[number]>> {
+        this.#query = {...this.#query, _omit: omits}
+        return this
+    }
+
+    include(includes: UserInclude[]): UserIDRequest<T> {
+        this.#query = {...this.#query, _includes: includes}
+        return this
+    }
+
+    async exec(): Promise<User> {
+        return decodeUser(await this.#manager.get(`/users/${this.#id}`, this.#query))
+    }
+}
+
+class UserUpsertRequest<T extends Partial<User>> extends Promise<T> {
+
+    #manager: RequestManager
+    #input: UserQueryData
+
+    constructor(manager: RequestManager, input: UserQueryData) {
+        super(() => {})
+        this.#manager = manager
+        this.#input = input
+    }
+
+    async exec(): Promise<T> {
+        return decodeUser(await this.#manager.post('/users', { '_upsert': this.#input }))
+    }
+}
+
+class UserCreateManyRequest<T extends Partial<User>> extends Promise<T> {
+
+    #manager: RequestManager
+    #input: UserCreateInput[]
+    #query?: UserSingleQuery
+
+    constructor(manager: RequestManager, input: UserCreateInput[], query?: UserSingleQuery) {
+        super(() => {})
+        this.#manager = manager
+        this.#input = input
+        this.#query = query
+    }
+
+    pick(picks: UserResultPick[]): UserCreateManyRequest<Pick<T, typeof picks[number]>> {
+        this.#query = {...this.#query, _pick: picks}
+        return this
+    }
+
+    omit(omits: UserResultPick[]): UserCreateManyRequest<Omit<T, typeof omits[number]>> {
+        this.#query = {...this.#query, _omit: omits}
+        return this
+    }
+
+    include(includes: UserInclude[]): UserCreateManyRequest<T> {
+        this.#query = {...this.#query, _includes: includes}
+        return this
+    }
+
+    async exec(): Promise<T[]> {
+        return (await this.#manager.post('/users', { '_create': this.#input }) as any[]).map(decodeUser)
+    }
+}
+
+class UserUpdateManyRequest<T extends Partial<User>> extends Promise<T> {
+
+    #manager: RequestManager
+    #input: UserQueryData
+    #query?: UserSingleQuery
+
+    constructor(manager: RequestManager, input: UserQueryData, query?: UserSingleQuery) {
+        super(() => {})
+        this.#manager = manager
+        this.#input = input
+        this.#query = query
+    }
+
+    pick(picks: UserResultPick[]): UserUpdateManyRequest<Pick<T, typeof picks[number]>> {
+        this.#query = {...this.#query, _pick: picks}
+        return this
+    }
+
+    omit(omits: UserResultPick[]): UserUpdateManyRequest<Omit<T, typeof omits[number]>> {
+        this.#query = {...this.#query, _omit: omits}
+        return this
+    }
+
+    include(includes: UserInclude[]): UserUpdateManyRequest<T> {
+        this.#query = {...this.#query, _includes: includes}
+        return this
+    }
+
+    async exec(): Promise<User> {
+        return (await this.#manager.patch('/users', { '_update': this.#input }) as any[]).map(decodeUser)
+    }
+}
+
+class UserDeleteManyRequest extends Promise<void> {
+
+    #manager: RequestManager
+    #query?: UserSeekQuery
+
+    constructor(manager: RequestManager, query?: UserSeekQuery) {
+        super(() => {})
+        this.#manager = manager
+        this.#query = query
+    }
+
+    async exec(): Promise<void> {
+        return await this.#manager.delete('/users', this.#query)
+    }
+}
+
+class UserListRequest<T extends Partial<User>> extends Promise<T[]> {
+
+    #manager: RequestManager
+    #query?: UserListQuery
+
+    constructor(manager: RequestManager, query?: UserListQuery) {
+        super(() => {})
+        this.#manager = manager
+        this.#query = query
+    }
+
+    order(order: UserSortOrder | UserSortOrder[]): UserListRequest<T> {
+        this.#query = {...this.#query, _order: order}
+        return this
+    }
+
+    skip(skip: number): UserListRequest<T> {
+        this.#query = {...this.#query, _skip: skip}
+        return this
+    }
+
+    limt(limit: number): UserListRequest<T> {
+        this.#query = {...this.#query, _limit: limit}
+        return this
+    }
+
+    pageSize(pageSize: number): UserListRequest<T> {
+        this.#query = {...this.#query, _pageSize: pageSize}
+        return this
+    }
+
+    pageNo(pageNo: number): UserListRequest<T> {
+        this.#query = {...this.#query, _pageNo: pageNo}
+        return this
+    }
+
+    pick(picks: UserResultPick[]): UserListRequest<Pick<T, typeof picks[number]>> {
+        this.#query = {...this.#query, _pick: picks}
+        return this
+    }
+
+    omit(omits: UserResultPick[]): UserListRequest<Omit<T, typeof omits[number]>> {
+        this.#query = {...this.#query, _omit: omits}
+        return this
+    }
+
+    include(includes: UserInclude[]): UserListRequest<T> {
+        this.#query = {...this.#query, _includes: includes}
+        return this
+    }
+
+    async exec(): Promise<User[]> {
+        return (await this.#manager.get('/users', this.#query) as any[]).map(decodeUser)
+    }
+}
+
+class UserSignInRequest<T extends Partial<UserSession>> extends Promise<T> {
+
+    #manager: RequestManager
+    #input: UserSessionInput
+    #query?: UserSingleQuery
+
+    constructor(manager: RequestManager, input: UserSessionInput, query?: UserSingleQuery) {
+        super(() => {})
+        this.#manager = manager
+        this.#input = input
+        this.#query = query
+    }
+
+    pick(picks: UserResultPick[]): UserSignInRequest<T> {
+        this.#query = {...this.#query, _pick: picks}
+        return this
+    }
+
+    omit(omits: UserResultPick[]): UserSignInRequest<T> {
+        this.#query = {...this.#query, _omit: omits}
+        return this
+    }
+
+    include(includes: UserInclude[]): UserSignInRequest<T> {
+        this.#query = {...this.#query, _includes: includes}
+        return this
+    }
+
+    async exec(): Promise<UserSession> {
+        const session = await this.#manager.post('/users/session', this.#input, this.#query) as UserSession
+        session.user = decodeUser(session.user)
+        SessionManager.share.setSession(session)
+        return session
+    }
+}
+
+class UserClient {
+
+    #manager: RequestManager
+
+    constructor(manager: RequestManager) {
+        this.#manager = manager
+    }
+
+    create(input: UserCreateInput, query?: UserSingleQuery): UserCreateRequest<User> {
+        return new UserCreateRequest(this.#manager, input, query)
+    }
+
+    createMany(input: UserCreateInput[]): UserCreateManyRequest<User> {
+        return new UserCreateManyRequest(this.#manager, input)
+    }
+
+    id(id: string, query?: UserSingleQuery): UserIDRequest<User> {
+        return new UserIDRequest(this.#manager, id, query)
+    }
+
+    update(id: string, input: UserUpdateInput, query?: UserSingleQuery): UserUpdateRequest<User> {
+        return new UserUpdateRequest(this.#manager, id, input, query)
+    }
+
+    updateMany(input: UserQueryData): UserUpdateManyRequest<User> {
+        return new UserUpdateManyRequest(this.#manager, input)
+    }
+
+    upsert(input: UserQueryData): UserUpsertRequest<User> {
+        return new UserUpsertRequest(this.#manager, input)
+    }
+
+    find(query?: UserListQuery): UserListRequest<User> {
+        return new UserListRequest(this.#manager, query)
+    }
+
+    delete(id: string): UserDeleteRequest {
+        return new UserDeleteRequest(this.#manager, id)
+    }
+
+    deleteMany(query?: UserSeekQuery): UserDeleteManyRequest {
+        return new UserDeleteManyRequest(this.#manager, query)
+    }
+
+    signIn(input: UserSessionInput, query?: UserSingleQuery): UserSignInRequest<UserSession> {
+        return new UserSignInRequest(this.#manager, input, query)
+    }
+}
+
+
+class ArticleCreateRequest<T extends Partial<Article>> extends Promise<T> {
+
+    #manager: RequestManager
+    #input: ArticleCreateInput
+    #query?: ArticleSingleQuery
+
+    constructor(manager: RequestManager, input: ArticleCreateInput, query?: ArticleSingleQuery) {
+        super(() => {})
+        this.#manager = manager
+        this.#input = input
+        this.#query = query
+    }
+
+    pick(picks: ArticleResultPick[]): ArticleCreateRequest<Pick<T, typeof picks[number]>> {
+        this.#query = {...this.#query, _pick: picks}
+        return this
+    }
+
+    omit(omits: ArticleResultPick[]): ArticleCreateRequest<Omit<T, typeof omits[number]>> {
+        this.#query = {...this.#query, _omit: omits}
+        return this
+    }
+
+    include(includes: ArticleInclude[]): ArticleCreateRequest<T> {
+        this.#query = {...this.#query, _includes: includes}
+        return this
+    }
+
+    async exec(): Promise<T> {
+        return decodeArticle(await this.#manager.post('/articles', this.#input, this.#query))
+    }
+}
+
+class ArticleUpdateRequest<T extends Partial<Article>> extends Promise<T> {
+
+    #manager: RequestManager
+    #id: string
+    #input: ArticleUpdateInput
+    #query?: ArticleSingleQuery
+
+    constructor(manager: RequestManager, id: string, input: ArticleUpdateInput, query?: ArticleSingleQuery) {
+        super(() => {})
+        this.#manager = manager
+        this.#id = id
+        this.#input = input
+        this.#query = query
+    }
+
+    pick(picks: ArticleResultPick[]): ArticleUpdateRequest<Pick<T, typeof picks[number]>> {
+        this.#query = {...this.#query, _pick: picks}
+        return this
+    }
+
+    omit(omits: ArticleResultPick[]): ArticleUpdateRequest<Omit<T, typeof omits[number]>> {
+        this.#query = {...this.#query, _omit: omits}
+        return this
+    }
+
+    include(includes: ArticleInclude[]): ArticleUpdateRequest<T> {
+        this.#query = {...this.#query, _includes: includes}
+        return this
+    }
+
+    async exec(): Promise<Article> {
+        return decodeArticle(await this.#manager.patch(`/articles/${this.#id}`, this.#input, this.#query))
+    }
+}
+
+class ArticleDeleteRequest extends Promise<void> {
+
+    #manager: RequestManager
+    #id: string
+
+    constructor(manager: RequestManager, id: string) {
+        super(() => {})
+        this.#manager = manager
+        this.#id = id
+    }
+
+    async exec(): Promise<void> {
+        return await this.#manager.delete(`/articles/${this.#id}`)
+    }
+}
+
+class ArticleIDRequest<T extends Partial<Article>> extends Promise<T> {
+
+    #manager: RequestManager
+    #id: string
+    #query?: ArticleSingleQuery
+
+    constructor(manager: RequestManager, id: string, query?: ArticleSingleQuery) {
+        super(() => {})
+        this.#manager = manager
+        this.#id = id
+        this.#query = query
+    }
+
+    pick(picks: ArticleResultPick[]): ArticleIDRequest<Pick<T, typeof picks[number]>> {
+        this.#query = {...this.#query, _pick: picks}
+        return this
+    }
+
+    omit(omits: ArticleResultPick[]): ArticleIDRequest<Omit<T, typeof omits[number]>> {
+        this.#query = {...this.#query, _omit: omits}
+        return this
+    }
+
+    include(includes: ArticleInclude[]): ArticleIDRequest<T> {
+        this.#query = {...this.#query, _includes: includes}
+        return this
+    }
+
+    async exec(): Promise<Article> {
+        return decodeArticle(await this.#manager.get(`/articles/${this.#id}`, this.#query))
+    }
+}
+
+class ArticleUpsertRequest<T extends Partial<Article>> extends Promise<T> {
+
+    #manager: RequestManager
+    #input: ArticleQueryData
+
+    constructor(manager: RequestManager, input: ArticleQueryData) {
+        super(() => {})
+        this.#manager = manager
+        this.#input = input
+    }
+
+    async exec(): Promise<T> {
+        return decodeArticle(await this.#manager.post('/articles', { '_upsert': this.#input }))
+    }
+}
+
+class ArticleCreateManyRequest<T extends Partial<Article>> extends Promise<T> {
+
+    #manager: RequestManager
+    #input: ArticleCreateInput[]
+    #query?: ArticleSingleQuery
+
+    constructor(manager: RequestManager, input: ArticleCreateInput[], query?: ArticleSingleQuery) {
+        super(() => {})
+        this.#manager = manager
+        this.#input = input
+        this.#query = query
+    }
+
+    pick(picks: ArticleResultPick[]): ArticleCreateManyRequest<Pick<T, typeof picks[number]>> {
+        this.#query = {...this.#query, _pick: picks}
+        return this
+    }
+
+    omit(omits: ArticleResultPick[]): ArticleCreateManyRequest<Omit<T, typeof omits[number]>> {
+        this.#query = {...this.#query, _omit: omits}
+        return this
+    }
+
+    include(includes: ArticleInclude[]): ArticleCreateManyRequest<T> {
+        this.#query = {...this.#query, _includes: includes}
+        return this
+    }
+
+    async exec(): Promise<T[]> {
+        return (await this.#manager.post('/articles', { '_create': this.#input }) as any[]).map(decodeArticle)
+    }
+}
+
+class ArticleUpdateManyRequest<T extends Partial<Article>> extends Promise<T> {
+
+    #manager: RequestManager
+    #input: ArticleQueryData
+    #query?: ArticleSingleQuery
+
+    constructor(manager: RequestManager, input: ArticleQueryData, query?: ArticleSingleQuery) {
+        super(() => {})
+        this.#manager = manager
+        this.#input = input
+        this.#query = query
+    }
+
+    pick(picks: ArticleResultPick[]): ArticleUpdateManyRequest<Pick<T, typeof picks[number]>> {
+        this.#query = {...this.#query, _pick: picks}
+        return this
+    }
+
+    omit(omits: ArticleResultPick[]): ArticleUpdateManyRequest<Omit<T, typeof omits[number]>> {
+        this.#query = {...this.#query, _omit: omits}
+        return this
+    }
+
+    include(includes: ArticleInclude[]): ArticleUpdateManyRequest<T> {
+        this.#query = {...this.#query, _includes: includes}
+        return this
+    }
+
+    async exec(): Promise<Article> {
+        return (await this.#manager.patch('/articles', { '_update': this.#input }) as any[]).map(decodeArticle)
+    }
+}
+
+class ArticleDeleteManyRequest extends Promise<void> {
+
+    #manager: RequestManager
+    #query?: ArticleSeekQuery
+
+    constructor(manager: RequestManager, query?: ArticleSeekQuery) {
+        super(() => {})
+        this.#manager = manager
+        this.#query = query
+    }
+
+    async exec(): Promise<void> {
+        return await this.#manager.delete('/articles', this.#query)
+    }
+}
+
+class ArticleListRequest<T extends Partial<Article>> extends Promise<T[]> {
+
+    #manager: RequestManager
+    #query?: ArticleListQuery
+
+    constructor(manager: RequestManager, query?: ArticleListQuery) {
+        super(() => {})
+        this.#manager = manager
+        this.#query = query
+    }
+
+    order(order: ArticleSortOrder | ArticleSortOrder[]): ArticleListRequest<T> {
+        this.#query = {...this.#query, _order: order}
+        return this
+    }
+
+    skip(skip: number): ArticleListRequest<T> {
+        this.#query = {...this.#query, _skip: skip}
+        return this
+    }
+
+    limt(limit: number): ArticleListRequest<T> {
+        this.#query = {...this.#query, _limit: limit}
+        return this
+    }
+
+    pageSize(pageSize: number): ArticleListRequest<T> {
+        this.#query = {...this.#query, _pageSize: pageSize}
+        return this
+    }
+
+    pageNo(pageNo: number): ArticleListRequest<T> {
+        this.#query = {...this.#query, _pageNo: pageNo}
+        return this
+    }
+
+    pick(picks: ArticleResultPick[]): ArticleListRequest<Pick<T, typeof picks[number]>> {
+        this.#query = {...this.#query, _pick: picks}
+        return this
+    }
+
+    omit(omits: ArticleResultPick[]): ArticleListRequest<Omit<T, typeof omits[number]>> {
+        this.#query = {...this.#query, _omit: omits}
+        return this
+    }
+
+    include(includes: ArticleInclude[]): ArticleListRequest<T> {
+        this.#query = {...this.#query, _includes: includes}
+        return this
+    }
+
+    async exec(): Promise<Article[]> {
+        return (await this.#manager.get('/articles', this.#query) as any[]).map(decodeArticle)
+    }
+}
+
+class ArticleClient {
+
+    #manager: RequestManager
+
+    constructor(manager: RequestManager) {
+        this.#manager = manager
+    }
+
+    create(input: ArticleCreateInput, query?: ArticleSingleQuery): ArticleCreateRequest<Article> {
+        return new ArticleCreateRequest(this.#manager, input, query)
+    }
+
+    createMany(input: ArticleCreateInput[]): ArticleCreateManyRequest<Article> {
+        return new ArticleCreateManyRequest(this.#manager, input)
+    }
+
+    id(id: string, query?: ArticleSingleQuery): ArticleIDRequest<Article> {
+        return new ArticleIDRequest(this.#manager, id, query)
+    }
+
+    update(id: string, input: ArticleUpdateInput, query?: ArticleSingleQuery): ArticleUpdateRequest<Article> {
+        return new ArticleUpdateRequest(this.#manager, id, input, query)
+    }
+
+    updateMany(input: ArticleQueryData): ArticleUpdateManyRequest<Article> {
+        return new ArticleUpdateManyRequest(this.#manager, input)
+    }
+
+    upsert(input: ArticleQueryData): ArticleUpsertRequest<Article> {
+        return new ArticleUpsertRequest(this.#manager, input)
+    }
+
+    find(query?: ArticleListQuery): ArticleListRequest<Article> {
+        return new ArticleListRequest(this.#manager, query)
+    }
+
+    delete(id: string): ArticleDeleteRequest {
+        return new ArticleDeleteRequest(this.#manager, id)
+    }
+
+    deleteMany(query?: ArticleSeekQuery): ArticleDeleteManyRequest {
+        return new ArticleDeleteManyRequest(this.#manager, query)
+    }
+}
+
+
+export class API {
+
+    #manager: RequestManager
+    #users?: UserClient
+    #articles?: ArticleClient
+
+    constructor(config: APIConfig = {}) {
+        this.#manager = new RequestManager(config)
+    }
+
+    get users(): UserClient {
+        return this.#users ??= new UserClient(this.#manager)
+    }
+
+    get articles(): ArticleClient {
+        return this.#articles ??= new ArticleClient(this.#manager)
+    }
+
+    get session(): SessionManager {
+        return SessionManager.share
+    }
+
+    signOut(): void {
+        SessionManager.share.clearSession()
+    }
+}
+
+
+export const api = new API()
@@ -305,65 +305,119 @@ interface UserSession {
 }
 
 
+export interface SessionStorage {
+    getItem(key: string): string | null
+    setItem(key: string, value: string): void
+    removeItem(key: string): void
+}
+
+export class MemoryStorage implements SessionStorage {
+
+    #items = new Map<string, string>()
+
+    getItem(key: string): string | null {
+        return this.#items.get(key) ?? null
+    }
+
+    setItem(key: string, value: string): void {
+        this.#items.set(key, value)
+    }
+
+    removeItem(key: string): void {
+        this.#items.delete(key)
+    }
+}
+
 class SessionManager {
 
     #sessionKey = '_jsonclasses_session'
+    #storage: SessionStorage | undefined
+    #loaded = false
     #session: UserSession | undefined
-
+    #headers: { headers: { Authorization: string } } | undefined
     static share = new SessionManager()
 
-    constructor() {
-        const item = localStorage.getItem(this.#sessionKey)
+    get storage(): SessionStorage {
+        if (this.#storage === undefined) {
+            this.#storage = typeof localStorage !== 'undefined' ? localStorage : new MemoryStorage()
+        }
+        return this.#storage
+    }
+
+    useStorage(storage: SessionStorage): void {
+        this.#storage = storage
+        this.#loaded = false
+    }
+
+    #load() {
+        if (this.#loaded) {
+            return
+        }
+        this.#loaded = true
+        const item = this.storage.getItem(this.#sessionKey)
         if (item && item !== null && item !== '') {
-            this.#session = JSON.parse(item)
+            this.#cache(JSON.parse(item))
         } else {
-            this.#session = undefined
+            this.#cache(undefined)
         }
     }
 
-    setSession(session: UserSession | undefined | null) {
+    #cache(session: UserSession | undefined) {
+        this.#session = session
+        this.#headers = session ? { headers: { Authorization: `Bearer ${session.token}` } } : undefined
+    }
+
+    setSession(session: UserSession | undefined | null): void {
+        this.#loaded = true
         if (session) {
-            this.#session = session
-            localStorage.setItem(this.#sessionKey, JSON.stringify(session))
+            this.#cache(session)
+            this.storage.setItem(this.#sessionKey, JSON.stringify(session))
         } else {
-            this.#session = undefined
-            localStorage.removeItem(this.#sessionKey)
+            this.#cache(undefined)
+            this.storage.removeItem(this.#sessionKey)
         }
     }
 
     hasSession(): boolean {
+        this.#load()
         return this.#session !== undefined
     }
 
     getToken(): string | undefined {
+        this.#load()
         return this.#session?.token
     }
 
     getSession(): UserSession | undefined {
+        this.#load()
         return this.#session
     }
 
-    clearSession() {
-        this.#session = undefined
-        localStorage.removeItem(this.#sessionKey)
+    get headers(): { headers: { Authorization: string } } | undefined {
+        this.#load()
+        return this.#headers
+    }
+
+    clearSession(): void {
+        this.setSession(undefined)
     }
 }
 
 
-class RequestManager {
+export interface APIConfig {
+    baseURL?: string
+}
 
-    static share = new RequestManager()
+class RequestManager {
 
-    #baseURL: string = "None"
+    #baseURL: string
 
+    constructor(config: APIConfig = {}) {
+        this.#baseURL = config.baseURL ?? "None"
+    }
 
-    get headers() {
-        const token = SessionManager.share.hasSession() ? SessionManager.share.getToken() :  undefined 
-        return token ? {
-            headers: {
-                'Authorization': `Bearer ${token}`
-            }
-        } : undefined
+    get headers(): { headers: { Authorization: string } } | undefined {
+        return SessionManager.share.headers
     }
 
     qs(val: any): string {
@@ -400,11 +454,13 @@ class RequestManager {
 
 class UserCreateRequest<T extends Partial<User>> extends Promise<T> {
 
+    #manager: RequestManager
     #input: UserCreateInput
     #query?: UserSingleQuery
 
-    constructor(input: UserCreateInput, query?:UserSingleQuery){
+    constructor(manager: RequestManager, input: UserCreateInput, query?: UserSingleQuery) {
         super(() => {})
+        this.#manager = manager
         this.#input = input
         this.#query = query
     }
@@ -420,23 +476,25 @@ class UserCreateRequest<T extends Partial<User>> extends Promise<T> {
     }
 
     include(includes: UserInclude[]): UserCreateRequest<T> {
-        this.#query = {...this.#query, _includes: includes }
+        this.#query = {...this.#query, _includes: includes}
         return this
     }
 
     async exec(): Promise<T> {
-        return await RequestManager.share.post('/users', this.#input, this.#query)
+        return await this.#manager.post('/users', this.#input, this.#query)
     }
 }
 
 class UserUpdateRequest<T extends Partial<User>> extends Promise<T> {
 
+    #manager: RequestManager
     #id: string
     #input: UserUpdateInput
     #query?: UserSingleQuery
 
-    constructor(id:string, input: UserUpdateInput, query?: UserSingleQuery,) {
+    constructor(manager: RequestManager, id: string, input: UserUpdateInput, query?: UserSingleQuery) {
         super(() => {})
+        this.#manager = manager
         this.#id = id
         this.#input = input
         this.#query = query
@@ -453,36 +511,41 @@ class UserUpdateRequest<T extends Partial<User>> extends Promise<T> {
     }
 
     include(includes: UserInclude[]): UserUpdateRequest<T> {
-        this.#query = {...this.#query, _includes: includes }
+        this.#query = {...this.#query, _includes: includes}
         return this
     }
 
     async exec(): Promise<User> {
-        return await RequestManager.share.patch(`/users/${this.#id}`, this.#input, this.#query)
+        return await this.#manager.patch(`/users/${this.#id}`, this.#input, this.#query)
     }
 }
 
 class UserDeleteRequest extends Promise<void> {
 
+    #manager: RequestManager
     #id: string
 
-    constructor(id: string) {
+    constructor(manager: RequestManager, id: string) {
         super(() => {})
+        this.#manager = manager
         this.#id = id
     }
+
     async exec(): Promise<void> {
-        return await RequestManager.share.delete(`/users/${this.#id}`)
+        return await this.#manager.delete(`/users/${this.#id}`)
     }
 }
 
 class UserIDRequest<T extends Partial<User>> extends Promise<T> {
 
+    #manager: RequestManager
     #id: string
     #query?: UserSingleQuery
 
-    constructor(id: string, query?: UserSingleQuery) {
+    constructor(manager: RequestManager, id: string, query?: UserSingleQuery) {
         super(() => {})
-        this.#id = id,
+        this.#manager = manager
+        this.#id = id
         this.#query = query
     }
 
@@ -497,37 +560,40 @@ class UserIDRequest<T extends Partial<User>> extends Promise<T> {
     }
 
     include(includes: UserInclude[]): UserIDRequest<T> {
-        this.#query = {...this.#query, _includes: includes }
+        this.#query = {...this.#query, _includes: includes}
         return this
     }
 
     async exec(): Promise<User> {
-        return await RequestManager.share.get(`/users/${this.#id}`, this.#query)
+        return await this.#manager.get(`/users/${this.#id}`, this.#query)
     }
 }
 
 class UserUpsertRequest<T extends Partial<User>> extends Promise<T> {
 
+    #manager: RequestManager
     #input: UserQueryData
 
-    constructor(input: UserQueryData){
+    constructor(manager: RequestManager, input: UserQueryData) {
         super(() => {})
+        this.#manager = manager
         this.#input = input
     }
 
     async exec(): Promise<T> {
-        return await RequestManager.share.post('/users', { '_upsert': this.#input })
+        return await this.#manager.post('/users', { '_upsert': this.#input })
     }
 }
-    
 
 class UserCreateManyRequest<T extends Partial<User>> extends Promise<T> {
 
+    #manager: RequestManager
     #input: UserCreateInput[]
     #query?: UserSingleQuery
 
-     constructor(input: UserCreateInput[], query?:UserSingleQuery){
+    constructor(manager: RequestManager, input: UserCreateInput[], query?: UserSingleQuery) {
         super(() => {})
+        this.#manager = manager
         this.#input = input
         this.#query = query
     }
@@ -543,23 +609,24 @@ class UserCreateManyRequest<T extends Partial<User>> extends Promise<T> {
     }
 
     include(includes: UserInclude[]): UserCreateManyRequest<T> {
-        this.#query = {...this.#query, _includes: includes }
+        this.#query = {...this.#query, _includes: includes}
         return this
     }
 
     async exec(): Promise<T[]> {
-        return await RequestManager.share.post('/users', { '_create': this.#input })
+        return await this.#manager.post('/users', { '_create': this.#input })
     }
 }
-    
 
 class UserUpdateManyRequest<T extends Partial<User>> extends Promise<T> {
 
+    #manager: RequestManager
     #input: UserQueryData
     #query?: UserSingleQuery
 
-    constructor(input: UserQueryData, query?:UserSingleQuery) {
+    constructor(manager: RequestManager, input: UserQueryData, query?: UserSingleQuery) {
         super(() => {})
+        this.#manager = manager
         this.#input = input
         this.#query = query
     }
@@ -575,37 +642,39 @@ class UserUpdateManyRequest<T extends Partial<User>> extends Promise<T> {
     }
 
     include(includes: UserInclude[]): UserUpdateManyRequest<T> {
-        this.#query = {...this.#query, _includes: includes }
+        this.#query = {...this.#query, _includes: includes}
         return this
     }
 
     async exec(): Promise<User> {
-        return await RequestManager.share.patch('/users', { '_update': this.#input })
+        return await this.#manager.patch('/users', { '_update': this.#input })
     }
 }
-    
 
 class UserDeleteManyRequest extends Promise<void> {
 
+    #manager: RequestManager
     #query?: UserSeekQuery
 
-    constructor(query?: UserSeekQuery) {
+    constructor(manager: RequestManager, query?: UserSeekQuery) {
         super(() => {})
+        this.#manager = manager
         this.#query = query
     }
 
     async exec(): Promise<void> {
-        return await RequestManager.share.delete('/users', this.#query)
+        return await this.#manager.delete('/users', this.#query)
     }
 }
-    
 
 class UserListRequest<T extends Partial<User>> extends Promise<T[]> {
 
+    #manager: RequestManager
     #query?: UserListQuery
 
-    constructor(query?: UserListQuery) {
+    constructor(manager: RequestManager, query?: UserListQuery) {
         super(() => {})
+        this.#manager = manager
         this.#query = query
     }
 
@@ -620,7 +689,7 @@ class UserListRequest<T extends Partial<User>> extends Promise<T[]> {
     }
 
     limt(limit: number): UserListRequest<T> {
-        this.#query = {...this.#query, _limit:limit}
+        this.#query = {...this.#query, _limit: limit}
         return this
     }
 
@@ -645,22 +714,24 @@ class UserListRequest<T extends Partial<User>> extends Promise<T[]> {
     }
 
     include(includes: UserInclude[]): UserListRequest<T> {
-        this.#query = {...this.#query, _includes: includes }
+        this.#query = {...this.#query, _includes: includes}
         return this
     }
 
     async exec(): Promise<User[]> {
-        return await RequestManager.share.get('/users',this.#query)
+        return await this.#manager.get('/users', this.#query)
     }
 }
 
 class UserSignInRequest<T extends Partial<UserSession>> extends Promise<T> {
 
+    #manager: RequestManager
     #input: UserSessionInput
     #query?: UserSingleQuery
 
-    constructor(input: UserSessionInput, query?:UserSingleQuery){
+    constructor(manager: RequestManager, input: UserSessionInput, query?: UserSingleQuery) {
         super(() => {})
+        this.#manager = manager
         this.#input = input
         this.#query = query
     }
@@ -676,12 +747,12 @@ class UserSignInRequest<T extends Partial<UserSession>> extends Promise<T> {
     }
 
     include(includes: UserInclude[]): UserSignInRequest<T> {
-        this.#query = {...this.#query, _includes: includes }
+        this.#query = {...this.#query, _includes: includes}
         return this
     }
 
     async exec(): Promise<UserSession> {
-        const session = await RequestManager.share.post('/users/session', this.#input, this.#query) as UserSession
+        const session = await this.#manager.post('/users/session', this.#input, this.#query) as UserSession
         SessionManager.share.setSession(session)
         return session
     }
@@ -689,56 +760,63 @@ class UserSignInRequest<T extends Partial<UserSession>> extends Promise<T> {
 
 class UserClient {
 
+    #manager: RequestManager
+
+    constructor(manager: RequestManager) {
+        this.#manager = manager
+    }
+
     create(input: UserCreateInput, query?: UserSingleQuery): UserCreateRequest<User> {
-        return new UserCreateRequest(input, query)
+        return new UserCreateRequest(this.#manager, input, query)
     }
 
     createMany(input: UserCreateInput[]): UserCreateManyRequest<User> {
-        return new UserCreateManyRequest(input)
+        return new UserCreateManyRequest(this.#manager, input)
     }
 
-    id(id: string, query?: UserSingleQuery) {
-        return new UserIDRequest(id, query)
+    id(id: string, query?: UserSingleQuery): UserIDRequest<User> {
+        return new UserIDRequest(this.#manager, id, query)
     }
 
     update(id: string, input: UserUpdateInput, query?: UserSingleQuery): UserUpdateRequest<User> {
-        return new UserUpdateRequest(id, input, query)
+        return new UserUpdateRequest(this.#manager, id, input, query)
     }
 
     updateMany(input: UserQueryData): UserUpdateManyRequest<User> {
-        return new UserUpdateManyRequest(input)
+        return new UserUpdateManyRequest(this.#manager, input)
     }
 
     upsert(input: UserQueryData): UserUpsertRequest<User> {
-        return new UserUpsertRequest(input)
+        return new UserUpsertRequest(this.#manager, input)
     }
 
     find(query?: UserListQuery): UserListRequest<User> {
-        return new UserListRequest(query)
+        return new UserListRequest(this.#manager, query)
     }
 
     delete(id: string): UserDeleteRequest {
-        return new UserDeleteRequest(id)
+        return new UserDeleteRequest(this.#manager, id)
     }
 
     deleteMany(query?: UserSeekQuery): UserDeleteManyRequest {
-        return new UserDeleteManyRequest(query)
+        return new UserDeleteManyRequest(this.#manager, query)
     }
 
-    signIn(input: UserSessionInput, query?: UserSingleQuery): UserSignInRequest<UserSession>{
-       return new UserSignInRequest(input, query)
+    signIn(input: UserSessionInput, query?: UserSingleQuery): UserSignInRequest<UserSession> {
+        return new UserSignInRequest(this.#manager, input, query)
     }
-
 }
 
 
 class ArticleCreateRequest<T extends Partial<Article>> extends Promise<T> {
 
+    #manager: RequestManager
     #input: ArticleCreateInput
     #query?: ArticleSingleQuery
 
-    constructor(input: ArticleCreateInput, query?:ArticleSingleQuery){
+    constructor(manager: RequestManager, input: ArticleCreateInput, query?: ArticleSingleQuery) {
         super(() => {})
+        this.#manager = manager
         this.#input = input
         this.#query = query
     }
@@ -754,23 +832,25 @@ class ArticleCreateRequest<T extends Partial<Article>> extends Promise<T> {
     }
 
     include(includes: ArticleInclude[]): ArticleCreateRequest<T> {
-        this.#query = {...this.#query, _includes: includes }
+        this.#query = {...this.#query, _includes: includes}
         return this
     }
 
     async exec(): Promise<T> {
-        return await RequestManager.share.post('/articles', this.#input, this.#query)
+        return await this.#manager.post('/articles', this.#input, this.#query)
     }
 }
 
 class ArticleUpdateRequest<T extends Partial<Article>> extends Promise<T> {
 
+    #manager: RequestManager
     #id: string
     #input: ArticleUpdateInput
     #query?: ArticleSingleQuery
 
-    constructor(id:string, input: ArticleUpdateInput, query?: ArticleSingleQuery,) {
+    constructor(manager: RequestManager, id: string, input: ArticleUpdateInput, query?: ArticleSingleQuery) {
         super(() => {})
+        this.#manager = manager
         this.#id = id
         this.#input = input
         this.#query = query
@@ -787,36 +867,41 @@ class ArticleUpdateRequest<T extends Partial<Article>> extends Promise<T> {
     }
 
     include(includes: ArticleInclude[]): ArticleUpdateRequest<T> {
-        this.#query = {...this.#query, _includes: includes }
+        this.#query = {...this.#query, _includes: includes}
         return this
     }
 
     async exec(): Promise<Article> {
-        return await RequestManager.share.patch(`/articles/${this.#id}`, this.#input, this.#query)
+        return await this.#manager.patch(`/articles/${this.#id}`, this.#input, this.#query)
     }
 }
 
 class ArticleDeleteRequest extends Promise<void> {
 
+    #manager: RequestManager
     #id: string
 
-    constructor(id: string) {
+    constructor(manager: RequestManager, id: string) {
         super(() => {})
+        this.#manager = manager
         this.#id = id
     }
+
     async exec(): Promise<void> {
-        return await RequestManager.share.delete(`/articles/${this.#id}`)
+        return await this.#manager.delete(`/articles/${this.#id}`)
     }
 }
 
 class ArticleIDRequest<T extends Partial<Article>> extends Promise<T> {
 
+    #manager: RequestManager
     #id: string
     #query?: ArticleSingleQuery
 
-    constructor(id: string, query?: ArticleSingleQuery) {
+    constructor(manager: RequestManager, id: string, query?: ArticleSingleQuery) {
         super(() => {})
-        this.#id = id,
+        this.#manager = manager
+        this.#id = id
         this.#query = query
     }
 
@@ -831,37 +916,40 @@ class ArticleIDRequest<T extends Partial<Article>> extends Promise<T> {
     }
 
     include(includes: ArticleInclude[]): ArticleIDRequest<T> {
-        this.#query = {...this.#query, _includes: includes }
+        this.#query = {...this.#query, _includes: includes}
         return this
     }
 
     async exec(): Promise<Article> {
-        return await RequestManager.share.get(`/articles/${this.#id}`, this.#query)
+        return await this.#manager.get(`/articles/${this.#id}`, this.#query)
     }
 }
 
 class ArticleUpsertRequest<T extends Partial<Article>> extends Promise<T> {
 
+    #manager: RequestManager
     #input: ArticleQueryData
 
-    constructor(input: ArticleQueryData){
+    constructor(manager: RequestManager, input: ArticleQueryData) {
         super(() => {})
+        this.#manager = manager
         this.#input = input
     }
 
     async exec(): Promise<T> {
-        return await RequestManager.share.post('/articles', { '_upsert': this.#input })
+        return await this.#manager.post('/articles', { '_upsert': this.#input })
     }
 }
-    
 
 class ArticleCreateManyRequest<T extends Partial<Article>> extends Promise<T> {
 
+    #manager: RequestManager
     #input: ArticleCreateInput[]
     #query?: ArticleSingleQuery
 
-     constructor(input: ArticleCreateInput[], query?:ArticleSingleQuery){
+    constructor(manager: RequestManager, input: ArticleCreateInput[], query?: ArticleSingleQuery) {
         super(() => {})
+        this.#manager = manager
         this.#input = input
         this.#query = query
     }
@@ -877,23 +965,24 @@ class ArticleCreateManyRequest<T extends Partial<Article>> extends Promise<T> {
     }
 
     include(includes: ArticleInclude[]): ArticleCreateManyRequest<T> {
-        this.#query = {...this.#query, _includes: includes }
+        this.#query = {...this.#query, _includes: includes}
         return this
     }
 
     async exec(): Promise<T[]> {
-        return await RequestManager.share.post('/articles', { '_create': this.#input })
+        return await this.#manager.post('/articles', { '_create': this.#input })
     }
 }
-    
 
 class ArticleUpdateManyRequest<T extends Partial<Article>> extends Promise<T> {
 
+    #manager: RequestManager
     #input: ArticleQueryData
     #query?: ArticleSingleQuery
 
-    constructor(input: ArticleQueryData, query?:ArticleSingleQuery) {
+    constructor(manager: RequestManager, input: ArticleQueryData, query?: ArticleSingleQuery) {
         super(() => {})
+        this.#manager = manager
         this.#input = input
         this.#query = query
     }
@@ -909,37 +998,39 @@ class ArticleUpdateManyRequest<T extends Partial<Article>> extends Promise<T> {
     }
 
     include(includes: ArticleInclude[]): ArticleUpdateManyRequest<T> {
-        this.#query = {...this.#query, _includes: includes }
+        this.#query = {...this.#query, _includes: includes}
         return this
     }
 
     async exec(): Promise<Article> {
-        return await RequestManager.share.patch('/articles', { '_update': this.#input })
+        return await this.#manager.patch('/articles', { '_update': this.#input })
     }
 }
-    
 
 class ArticleDeleteManyRequest extends Promise<void> {
 
+    #manager: RequestManager
     #query?: ArticleSeekQuery
 
-    constructor(query?: ArticleSeekQuery) {
+    constructor(manager: RequestManager, query?: ArticleSeekQuery) {
         super(() => {})
+        this.#manager = manager
         this.#query = query
     }
 
     async exec(): Promise<void> {
-        return await RequestManager.share.delete('/articles', this.#query)
+        return await this.#manager.delete('/articles', this.#query)
     }
 }
-    
 
 class ArticleListRequest<T extends Partial<Article>> extends Promise<T[]> {
 
+    #manager: RequestManager
     #query?: ArticleListQuery
 
-    constructor(query?: ArticleListQuery) {
+    constructor(manager: RequestManager, query?: ArticleListQuery) {
         super(() => {})
+        this.#manager = manager
         this.#query = query
     }
 
@@ -954,7 +1045,7 @@ class ArticleListRequest<T extends Partial<Article>> extends Promise<T[]> {
     }
 
     limt(limit: number): ArticleListRequest<T> {
-        this.#query = {...this.#query, _limit:limit}
+        this.#query = {...this.#query, _limit: limit}
         return this
     }
 
@@ -979,77 +1070,87 @@ class ArticleListRequest<T extends Partial<Article>> extends Promise<T[]> {
     }
 
     include(includes: ArticleInclude[]): ArticleListRequest<T> {
-        this.#query = {...this.#query, _includes: includes }
+        this.#query = {...this.#query, _includes: includes}
         return this
     }
 
     async exec(): Promise<Article[]> {
-        return await RequestManager.share.get('/articles',this.#query)
+        return await this.#manager.get('/articles', this.#query)
     }
 }
 
 class ArticleClient {
 
+    #manager: RequestManager
+
+    constructor(manager: RequestManager) {
+        this.#manager = manager
+    }
+
     create(input: ArticleCreateInput, query?: ArticleSingleQuery): ArticleCreateRequest<Article> {
-        return new ArticleCreateRequest(input, query)
+        return new ArticleCreateRequest(this.#manager, input, query)
     }
 
     createMany(input: ArticleCreateInput[]): ArticleCreateManyRequest<Article> {
-        return new ArticleCreateManyRequest(input)
+        return new ArticleCreateManyRequest(this.#manager, input)
     }
 
-    id(id: string, query?: ArticleSingleQuery) {
-        return new ArticleIDRequest(id, query)
+    id(id: string, query?: ArticleSingleQuery): ArticleIDRequest<Article> {
+        return new ArticleIDRequest(this.#manager, id, query)
     }
 
     update(id: string, input: ArticleUpdateInput, query?: ArticleSingleQuery): ArticleUpdateRequest<Article> {
-        return new ArticleUpdateRequest(id, input, query)
+        return new ArticleUpdateRequest(this.#manager, id, input, query)
     }
 
     updateMany(input: ArticleQueryData): ArticleUpdateManyRequest<Article> {
-        return new ArticleUpdateManyRequest(input)
+        return new ArticleUpdateManyRequest(this.#manager, input)
     }
 
     upsert(input: ArticleQueryData): ArticleUpsertRequest<Article> {
-        return new ArticleUpsertRequest(input)
+        return new ArticleUpsertRequest(this.#manager, input)
     }
 
     find(query?: ArticleListQuery): ArticleListRequest<Article> {
-        return new ArticleListRequest(query)
+        return new ArticleListRequest(this.#manager, query)
     }
 
     delete(id: string): ArticleDeleteRequest {
-        return new ArticleDeleteRequest(id)
+        return new ArticleDeleteRequest(this.#manager, id)
     }
 
     deleteMany(query?: ArticleSeekQuery): ArticleDeleteManyRequest {
-        return new ArticleDeleteManyRequest(query)
+        return new ArticleDeleteManyRequest(this.#manager, query)
     }
-
 }
 
 
-class API {
+export class API {
+
+    #manager: RequestManager
+    #users?: UserClient
+    #articles?: ArticleClient
+
+    constructor(config: APIConfig = {}) {
+        this.#manager = new RequestManager(config)
+    }
 
     get users(): UserClient {
-        return new UserClient()
+        return this.#users ??= new UserClient(this.#manager)
     }
 
     get articles(): ArticleClient {
-        return new ArticleClient()
+        return this.#articles ??= new ArticleClient(this.#manager)
     }
 
     get session(): SessionManager {
-       return SessionManager.share
+        return SessionManager.share
     }
 
     signOut(): void {
-       SessionManager.share.clearSession()
+        SessionManager.share.clearSession()
     }
-
 }
 
 
 export const api = new API()
-
-
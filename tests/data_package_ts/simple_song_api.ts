@@ -167,8 +167,8 @@ interface UnLink {
 export interface SimpleSong {
     id: string
     name: string
-    createdAt: string
-    updatedAt: string
+    createdAt: Date
+    updatedAt: Date
 }
 
 export interface SimpleSongCreateInput {
@@ -215,20 +215,34 @@ interface SimpleSongQueryData {
 }
 
 
-class RequestManager {
+function decodeSimpleSong(data: any): any {
+    if (data == null) {
+        return data
+    }
+    if (data.createdAt != null) {
+        data.createdAt = new Date(data.createdAt)
+    }
+    if (data.updatedAt != null) {
+        data.updatedAt = new Date(data.updatedAt)
+    }
+    return data
+}
 
-    static share = new RequestManager()
 
-    #baseURL: string = "None"
+export interface APIConfig {
+    baseURL?: string
+}
 
+class RequestManager {
+
+    #baseURL: string
 
-    get headers() {
-        const token =  undefined 
-        return token ? {
-            headers: {
-                'Authorization': `Bearer ${token}`
-            }
-        } : undefined
+    constructor(config: APIConfig = {}) {
+        this.#baseURL = config.baseURL ?? "None"
+    }
+
+    get headers(): { headers: { Authorization: string } } | undefined {
+        return undefined
     }
 
     qs(val: any): string {
@@ -265,11 +279,13 @@ class RequestManager {
 
 class SimpleSongCreateRequest<T extends Partial<SimpleSong>> extends Promise<T> {
 
+    #manager: RequestManager
     #input: SimpleSongCreateInput
     #query?: SimpleSongSingleQuery
 
-    constructor(input: SimpleSongCreateInput, query?:SimpleSongSingleQuery){
+    constructor(manager: RequestManager, input: SimpleSongCreateInput, query?: SimpleSongSingleQuery) {
         super(() => {})
+        this.#manager = manager
         this.#input = input
         this.#query = query
     }
@@ -284,20 +300,21 @@ class SimpleSongCreateRequest<T extends Partial<SimpleSong>> extends Promise<T>
         return this
     }
 
-    
     async exec(): Promise<T> {
-        return await RequestManager.share.post('/simple-songs', this.#input, this.#query)
+        return decodeSimpleSong(await this.#manager.post('/simple-songs', this.#input, this.#query))
     }
 }
 
 class SimpleSongUpdateRequest<T extends Partial<SimpleSong>> extends Promise<T> {
 
+    #manager: RequestManager
     #id: string
     #input: SimpleSongUpdateInput
     #query?: SimpleSongSingleQuery
 
-    constructor(id:string, input: SimpleSongUpdateInput, query?: SimpleSongSingleQuery,) {
+    constructor(manager: RequestManager, id: string, input: SimpleSongUpdateInput, query?: SimpleSongSingleQuery) {
         super(() => {})
+        this.#manager = manager
         this.#id = id
         this.#input = input
         this.#query = query
@@ -313,33 +330,37 @@ class SimpleSongUpdateRequest<T extends Partial<SimpleSong>> extends Promise<T>
         return this
     }
 
-    
     async exec(): Promise<SimpleSong> {
-        return await RequestManager.share.patch(`/simple-songs/${this.#id}`, this.#input, this.#query)
+        return decodeSimpleSong(await this.#manager.patch(`/simple-songs/${this.#id}`, this.#input, this.#query))
     }
 }
 
 class SimpleSongDeleteRequest extends Promise<void> {
 
+    #manager: RequestManager
     #id: string
 
-    constructor(id: string) {
+    constructor(manager: RequestManager, id: string) {
         super(() => {})
+        this.#manager = manager
         this.#id = id
     }
+
     async exec(): Promise<void> {
-        return await RequestManager.share.delete(`/simple-songs/${this.#id}`)
+        return await this.#manager.delete(`/simple-songs/${this.#id}`)
     }
 }
 
 class SimpleSongIDRequest<T extends Partial<SimpleSong>> extends Promise<T> {
 
+    #manager: RequestManager
     #id: string
     #query?: SimpleSongSingleQuery
 
-    constructor(id: string, query?: SimpleSongSingleQuery) {
+    constructor(manager: RequestManager, id: string, query?: SimpleSongSingleQuery) {
         super(() => {})
-        this.#id = id,
+        this.#manager = manager
+        this.#id = id
         this.#query = query
     }
 
@@ -353,34 +374,36 @@ class SimpleSongIDRequest<T extends Partial<SimpleSong>> extends Promise<T> {
         return this
     }
 
-    
     async exec(): Promise<SimpleSong> {
-        return await RequestManager.share.get(`/simple-songs/${this.#id}`, this.#query)
+        return decodeSimpleSong(await this.#manager.get(`/simple-songs/${this.#id}`, this.#query))
     }
 }
 
 class SimpleSongUpsertRequest<T extends Partial<SimpleSong>> extends Promise<T> {
 
+    #manager: RequestManager
     #input: SimpleSongQueryData
 
-    constructor(input: SimpleSongQueryData){
+    constructor(manager: RequestManager, input: SimpleSongQueryData) {
         super(() => {})
+        this.#manager = manager
         this.#input = input
     }
 
     async exec(): Promise<T> {
-        return await RequestManager.share.post('/simple-songs', { '_upsert': this.#input })
+        return decodeSimpleSong(await this.#manager.post('/simple-songs', { '_upsert': this.#input }))
     }
 }
-    
 
 class SimpleSongCreateManyRequest<T extends Partial<SimpleSong>> extends Promise<T> {
 
+    #manager: RequestManager
     #input: SimpleSongCreateInput[]
     #query?: SimpleSongSingleQuery
 
-     constructor(input: SimpleSongCreateInput[], query?:SimpleSongSingleQuery){
+    constructor(manager: RequestManager, input: SimpleSongCreateInput[], query?: SimpleSongSingleQuery) {
         super(() => {})
+        this.#manager = manager
         this.#input = input
         this.#query = query
     }
@@ -395,20 +418,20 @@ class SimpleSongCreateManyRequest<T extends Partial<SimpleSong>> extends Promise
         return this
     }
 
-    
     async exec(): Promise<T[]> {
-        return await RequestManager.share.post('/simple-songs', { '_create': this.#input })
+        return (await this.#manager.post('/simple-songs', { '_create': this.#input }) as any[]).map(decodeSimpleSong)
     }
 }
-    
 
 class SimpleSongUpdateManyRequest<T extends Partial<SimpleSong>> extends Promise<T> {
 
+    #manager: RequestManager
     #input: SimpleSongQueryData
     #query?: SimpleSongSingleQuery
 
-    constructor(input: SimpleSongQueryData, query?:SimpleSongSingleQuery) {
+    constructor(manager: RequestManager, input: SimpleSongQueryData, query?: SimpleSongSingleQuery) {
         super(() => {})
+        this.#manager = manager
         this.#input = input
         this.#query = query
     }
@@ -423,34 +446,35 @@ class SimpleSongUpdateManyRequest<T extends Partial<SimpleSong>> extends Promise
         return this
     }
 
-    
     async exec(): Promise<SimpleSong> {
-        return await RequestManager.share.patch('/simple-songs', { '_update': this.#input })
+        return (await this.#manager.patch('/simple-songs', { '_update': this.#input }) as any[]).map(decodeSimpleSong)
     }
 }
-    
 
 class SimpleSongDeleteManyRequest extends Promise<void> {
 
+    #manager: RequestManager
     #query?: SimpleSongSeekQuery
 
-    constructor(query?: SimpleSongSeekQuery) {
+    constructor(manager: RequestManager, query?: SimpleSongSeekQuery) {
         super(() => {})
+        this.#manager = manager
         this.#query = query
     }
 
     async exec(): Promise<void> {
-        return await RequestManager.share.delete('/simple-songs', this.#query)
+        return await this.#manager.delete('/simple-songs', this.#query)
     }
 }
-    
 
 class SimpleSongListRequest<T extends Partial<SimpleSong>> extends Promise<T[]> {
 
+    #manager: RequestManager
     #query?: SimpleSongListQuery
 
-    constructor(query?: SimpleSongListQuery) {
+    constructor(manager: RequestManager, query?: SimpleSongListQuery) {
         super(() => {})
+        this.#manager = manager
         this.#query = query
     }
 
@@ -465,7 +489,7 @@ class SimpleSongListRequest<T extends Partial<SimpleSong>> extends Promise<T[]>
     }
 
     limt(limit: number): SimpleSongListRequest<T> {
-        this.#query = {...this.#query, _limit:limit}
+        this.#query = {...this.#query, _limit: limit}
         return this
     }
 
@@ -489,62 +513,70 @@ class SimpleSongListRequest<T extends Partial<SimpleSong>> extends Promise<T[]>
         return this
     }
 
-    
     async exec(): Promise<SimpleSong[]> {
-        return await RequestManager.share.get('/simple-songs',this.#query)
+        return (await this.#manager.get('/simple-songs', this.#query) as any[]).map(decodeSimpleSong)
     }
 }
 
 class SimpleSongClient {
 
+    #manager: RequestManager
+
+    constructor(manager: RequestManager) {
+        this.#manager = manager
+    }
+
     create(input: SimpleSongCreateInput, query?: SimpleSongSingleQuery): SimpleSongCreateRequest<SimpleSong> {
-        return new SimpleSongCreateRequest(input, query)
+        return new SimpleSongCreateRequest(this.#manager, input, query)
     }
 
     createMany(input: SimpleSongCreateInput[]): SimpleSongCreateManyRequest<SimpleSong> {
-        return new SimpleSongCreateManyRequest(input)
+        return new SimpleSongCreateManyRequest(this.#manager, input)
     }
 
-    id(id: string, query?: SimpleSongSingleQuery) {
-        return new SimpleSongIDRequest(id, query)
+    id(id: string, query?: SimpleSongSingleQuery): SimpleSongIDRequest<SimpleSong> {
+        return new SimpleSongIDRequest(this.#manager, id, query)
     }
 
     update(id: string, input: SimpleSongUpdateInput, query?: SimpleSongSingleQuery): SimpleSongUpdateRequest<SimpleSong> {
-        return new SimpleSongUpdateRequest(id, input, query)
+        return new SimpleSongUpdateRequest(this.#manager, id, input, query)
     }
 
     updateMany(input: SimpleSongQueryData): SimpleSongUpdateManyRequest<SimpleSong> {
-        return new SimpleSongUpdateManyRequest(input)
+        return new SimpleSongUpdateManyRequest(this.#manager, input)
     }
 
     upsert(input: SimpleSongQueryData): SimpleSongUpsertRequest<SimpleSong> {
-        return new SimpleSongUpsertRequest(input)
+        return new SimpleSongUpsertRequest(this.#manager, input)
     }
 
     find(query?: SimpleSongListQuery): SimpleSongListRequest<SimpleSong> {
-        return new SimpleSongListRequest(query)
+        return new SimpleSongListRequest(this.#manager, query)
     }
 
     delete(id: string): SimpleSongDeleteRequest {
-        return new SimpleSongDeleteRequest(id)
+        return new SimpleSongDeleteRequest(this.#manager, id)
     }
 
     deleteMany(query?: SimpleSongSeekQuery): SimpleSongDeleteManyRequest {
-        return new SimpleSongDeleteManyRequest(query)
+        return new SimpleSongDeleteManyRequest(this.#manager, query)
     }
-
 }
 
 
-class API {
+export class API {
 
-    get simpleSongs(): SimpleSongClient {
-        return new SimpleSongClient()
+    #manager: RequestManager
+    #simpleSongs?: SimpleSongClient
+
+    constructor(config: APIConfig = {}) {
+        this.#manager = new RequestManager(config)
     }
 
+    get simpleSongs(): SimpleSongClient {
+        return this.#simpleSongs ??= new SimpleSongClient(this.#manager)
+    }
 }
 
 
 export const api = new API()
-
-
@@ -0,0 +1,794 @@
+import axios from 'axios'
+import { stringify } from 'qsparser-js'
+
+
+enum Gender {
+    male = 'MALE',
+    female = 'FEMALE',
+}
+
+
+type Mode = 'default' | 'insensitive'
+
+interface StringContainsQuery {
+    _contains: string
+    _mode?: Mode
+}
+
+interface StringPrefixQuery {
+    _prefix: string
+    _mode?: Mode
+}
+
+interface StringSuffixQuery {
+    _suffix: string
+    _mode?: Mode
+}
+
+interface StringMatchQuery {
+    _match: string
+    _mode?: Mode
+}
+
+interface StringEqQuery {
+    _eq: string
+}
+
+interface StringNeqQuery {
+    _neq: string
+}
+
+interface StringNullQuery {
+    _null: boolean
+}
+
+interface StringCompareQuery {
+    _gt?: string
+    _gte?: string
+    _lt?: string
+    _lte?: string
+}
+
+interface StringOrQuery {
+    _or: StringQuery[]
+}
+
+interface StringAndQuery {
+    _and: StringQuery[]
+}
+
+export type StringQuery = string | StringContainsQuery | StringPrefixQuery | StringSuffixQuery | StringMatchQuery |
+                          StringEqQuery | StringNeqQuery | StringNullQuery | StringCompareQuery | StringOrQuery | StringAndQuery
+
+
+interface NumberValueQuery {
+    _gt?: number
+    _gte?: number
+    _lt?: number
+    _lte?: number
+}
+
+interface NumberEqQuery {
+    _eq: number
+}
+
+interface NumberNeqQuery {
+    _neq: number
+}
+
+interface NumberNullQuery {
+    _null: boolean
+}
+
+interface NumberOrQuery {
+    _or: NumberQuery[]
+}
+
+interface NumberAndQuery {
+    _and: NumberQuery[]
+}
+
+export type NumberQuery = number | NumberEqQuery | NumberNeqQuery | NumberNullQuery | NumberValueQuery | NumberOrQuery | NumberAndQuery
+
+
+interface BooleanEqQuery {
+    _eq: boolean
+}
+
+interface BooleanNeqQuery {
+    _neq: boolean
+}
+
+interface BooleanNullQuery {
+    _null: boolean
+}
+
+interface BooleanOrQuery {
+    _or: BooleanQuery[]
+}
+
+interface BooleanAndQuery {
+    _and: BooleanQuery[]
+}
+
+export type BooleanQuery = boolean | BooleanEqQuery | BooleanNeqQuery | BooleanNullQuery | BooleanOrQuery | BooleanAndQuery
+
+
+interface DateValueQuery {
+    _gt?: Date
+    _gte?: Date
+    _lt?: Date
+    _lte?: Date
+    _on?: Date
+}
+
+interface DateEqQuery {
+    _eq: Date
+}
+
+interface DateNeqQuery {
+    _neq: Date
+}
+
+interface DateNullQuery {
+    _null: boolean
+}
+
+interface DateOrQuery {
+    _or: DateQuery[]
+}
+
+interface DateAndQuery {
+    _and: DateQuery[]
+}
+
+interface DateBeforeQuery {
+    _before: Date
+}
+
+interface DateAfterQuery {
+    _after: Date
+}
+
+export type DateQuery = Date | DateValueQuery | DateEqQuery | DateNeqQuery | DateNullQuery | DateOrQuery | DateAndQuery |
+                        DateBeforeQuery | DateAfterQuery
+
+
+interface IDQuery {
+    _eq: String
+    _neq: String
+    _null: boolean
+}
+
+
+interface Link {
+    _add: String
+}
+
+interface UnLink {
+    _del: String
+}
+
+
+export interface Singer {
+    id: string
+    email: string
+    name: string
+    nickname?: string
+    code?: string
+    phoneNum?: string
+    gender?: Gender
+    age?: number
+    rating?: number
+    verified: boolean
+}
+
+export interface SingerCreateInput {
+    email: string
+    name: string
+    nickname?: string
+    code?: string
+    phoneNum?: string
+    gender?: Gender
+    age?: number
+    rating?: number
+    verified: boolean
+}
+
+export interface SingerUpdateInput {
+    email?: string
+    name?: string
+    nickname?: string | null
+    code?: string | null
+    phoneNum?: string | null
+    gender?: Gender | null
+    age?: number | null
+    rating?: number | null
+    verified?: boolean
+}
+
+type SingerSortOrder = 'email' | '-email' | 'name' | '-name' | 'nickname' | '-nickname' | 'code' | '-code' | 'phoneNum' | '-phoneNum' | 'gender' | '-gender' | 'age' | '-age' | 'rating' | '-rating' | 'verified' | '-verified'
+
+type SingerResultPick = 'id' | 'email' | 'name' | 'nickname' | 'code' | 'phoneNum' | 'gender' | 'age' | 'rating' | 'verified'
+
+interface SingerSingleQuery {
+    _pick?: SingerResultPick[]
+    _omit?: SingerResultPick[]
+}
+
+interface SingerListQuery {
+    id?: StringQuery
+    email?: StringQuery
+    name?: StringQuery
+    nickname?: StringQuery
+    code?: StringQuery
+    phoneNum?: StringQuery
+    gender?: Gender
+    age?: NumberQuery
+    rating?: NumberQuery
+    verified?: BooleanQuery
+    _order?: SingerSortOrder | SingerSortOrder[]
+    _limit?: number
+    _skip?: number
+    _pageNo?: number
+    _pageSize?: number
+    _pick?: SingerResultPick[]
+    _omit?: SingerResultPick[]
+}
+
+interface SingerSeekQuery {
+    id?: StringQuery
+    email?: StringQuery
+    name?: StringQuery
+    nickname?: StringQuery
+    code?: StringQuery
+    phoneNum?: StringQuery
+    gender?: Gender
+    age?: NumberQuery
+    rating?: NumberQuery
+    verified?: BooleanQuery
+}
+
+interface SingerQueryData {
+    _query: SingerSeekQuery
+    _data: SingerUpdateInput
+}
+
+
+export type ValidationErrors = {[key: string]: string}
+
+export class ValidationError extends Error {
+
+    keypathMessages: ValidationErrors
+
+    constructor(keypathMessages: ValidationErrors) {
+        super('Client side validation failed.')
+        this.keypathMessages = keypathMessages
+    }
+}
+
+const emailPattern = /^\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b/
+
+const alnumPattern = new RegExp('^[\\p{L}\\p{N}]+$', 'u')
+
+const genderValues = new Set<string>(Object.values(Gender))
+
+
+const singerCodePattern = new RegExp("^[A-Z]{3}$")
+
+export function validateSingerCreateInput(input: SingerCreateInput): ValidationErrors | undefined {
+    let errors: ValidationErrors | undefined
+    if (input.email == null) {
+        (errors ??= {})['email'] = 'value required'
+    } else {
+        if (typeof input.email !== 'string') {
+            (errors ??= {})['email'] = 'value is not str'
+        } else if (!emailPattern.test(input.email)) {
+            (errors ??= {})['email'] = 'value is not email string'
+        }
+    }
+    if (input.name == null) {
+        (errors ??= {})['name'] = 'value required'
+    } else {
+        if (typeof input.name !== 'string') {
+            (errors ??= {})['name'] = 'value is not str'
+        } else if (input.name.length < 2 || input.name.length > 20) {
+            (errors ??= {})['name'] = 'length of value is not between 2 and 20'
+        }
+    }
+    if (input.nickname != null) {
+        if (typeof input.nickname !== 'string') {
+            (errors ??= {})['nickname'] = 'value is not str'
+        }
+    }
+    if (input.code != null) {
+        if (typeof input.code !== 'string') {
+            (errors ??= {})['code'] = 'value is not str'
+        } else if (!singerCodePattern.test(input.code)) {
+            (errors ??= {})['code'] = 'value does not match pattern'
+        }
+    }
+    if (input.phoneNum != null) {
+        if (typeof input.phoneNum !== 'string') {
+            (errors ??= {})['phoneNum'] = 'value is not str'
+        } else if (!alnumPattern.test(input.phoneNum)) {
+            (errors ??= {})['phoneNum'] = 'value is not alnum str'
+        }
+    }
+    if (input.gender != null) {
+        if (!genderValues.has(input.gender)) {
+            (errors ??= {})['gender'] = 'unknown enum value'
+        }
+    }
+    if (input.age != null) {
+        if (!Number.isInteger(input.age)) {
+            (errors ??= {})['age'] = 'value is not int'
+        } else if (input.age < 0) {
+            (errors ??= {})['age'] = 'value is not greater than or equal 0'
+        } else if (input.age > 150) {
+            (errors ??= {})['age'] = 'value is not less than or equal 150'
+        }
+    }
+    if (input.rating != null) {
+        if (typeof input.rating !== 'number') {
+            (errors ??= {})['rating'] = 'value is not float'
+        } else if (input.rating < 0) {
+            (errors ??= {})['rating'] = 'value is not greater than or equal 0'
+        } else if (input.rating > 5) {
+            (errors ??= {})['rating'] = 'value is not less than or equal 5'
+        }
+    }
+    if (input.verified != null) {
+        if (typeof input.verified !== 'boolean') {
+            (errors ??= {})['verified'] = 'value is not bool'
+        }
+    }
+    return errors
+}
+
+export function validateSingerUpdateInput(input: SingerUpdateInput): ValidationErrors | undefined {
+    let errors: ValidationErrors | undefined
+    if (input.email === null) {
+        (errors ??= {})['email'] = 'value required'
+    } else if (input.email !== undefined) {
+        if (typeof input.email !== 'string') {
+            (errors ??= {})['email'] = 'value is not str'
+        } else if (!emailPattern.test(input.email)) {
+            (errors ??= {})['email'] = 'value is not email string'
+        }
+    }
+    if (input.name === null) {
+        (errors ??= {})['name'] = 'value required'
+    } else if (input.name !== undefined) {
+        if (typeof input.name !== 'string') {
+            (errors ??= {})['name'] = 'value is not str'
+        } else if (input.name.length < 2 || input.name.length > 20) {
+            (errors ??= {})['name'] = 'length of value is not between 2 and 20'
+        }
+    }
+    if (input.nickname != null) {
+        if (typeof input.nickname !== 'string') {
+            (errors ??= {})['nickname'] = 'value is not str'
+        }
+    }
+    if (input.code != null) {
+        if (typeof input.code !== 'string') {
+            (errors ??= {})['code'] = 'value is not str'
+        } else if (!singerCodePattern.test(input.code)) {
+            (errors ??= {})['code'] = 'value does not match pattern'
+        }
+    }
+    if (input.phoneNum != null) {
+        if (typeof input.phoneNum !== 'string') {
+            (errors ??= {})['phoneNum'] = 'value is not str'
+        } else if (!alnumPattern.test(input.phoneNum)) {
+            (errors ??= {})['phoneNum'] = 'value is not alnum str'
+        }
+    }
+    if (input.gender != null) {
+        if (!genderValues.has(input.gender)) {
+            (errors ??= {})['gender'] = 'unknown enum value'
+        }
+    }
+    if (input.age != null) {
+        if (!Number.isInteger(input.age)) {
+            (errors ??= {})['age'] = 'value is not int'
+        } else if (input.age < 0) {
+            (errors ??= {})['age'] = 'value is not greater than or equal 0'
+        } else if (input.age > 150) {
+            (errors ??= {})['age'] = 'value is not less than or equal 150'
+        }
+    }
+    if (input.rating != null) {
+        if (typeof input.rating !== 'number') {
+            (errors ??= {})['rating'] = 'value is not float'
+        } else if (input.rating < 0) {
+            (errors ??= {})['rating'] = 'value is not greater than or equal 0'
+        } else if (input.rating > 5) {
+            (errors ??= {})['rating'] = 'value is not less than or equal 5'
+        }
+    }
+    if (input.verified === null) {
+        (errors ??= {})['verified'] = 'value required'
+    } else if (input.verified !== undefined) {
+        if (typeof input.verified !== 'boolean') {
+            (errors ??= {})['verified'] = 'value is not bool'
+        }
+    }
+    return errors
+}
+
+
+export interface APIConfig {
+    baseURL?: string
+}
+
+class RequestManager {
+
+    #baseURL: string
+
+    constructor(config: APIConfig = {}) {
+        this.#baseURL = config.baseURL ?? "None"
+    }
+
+    get headers(): { headers: { Authorization: string } } | undefined {
+        return undefined
+    }
+
+    qs(val: any): string {
+        if (!val) {
+            return ''
+        }
+        if (Object.keys(val).length === 0) {
+            return ''
+        }
+        return '?' + stringify(val)
+    }
+
+    async post<T, U, V>(url: string, input: T, query: V | undefined = undefined): Promise<U> {
+        const response = await axios.post(this.#baseURL + url + this.qs(query), input, this.headers)
+        return response.data.data
+    }
+
+    async patch<T, U, V>(url: string, input: T, query: V | undefined = undefined): Promise<U> {
+        const response = await axios.patch(this.#baseURL + url + this.qs(query), input, this.headers)
+        return response.data.data
+    }
+
+    async delete<V>(url: string, query: V | undefined = undefined): Promise<void> {
+        await axios.delete(this.#baseURL + url + this.qs(query), this.headers)
+        return
+    }
+
+    async get<U, V>(url: string, query: V | undefined = undefined): Promise<U> {
+        const response = await axios.get(this.#baseURL + url + this.qs(query), this.headers)
+        return response.data.data
+    }
+}
+
+
+class SingerCreateRequest<T extends Partial<Singer>> extends Promise<T> {
+
+    #manager: RequestManager
+    #input: SingerCreateInput
+    #query?: SingerSingleQuery
+
+    constructor(manager: RequestManager, input: SingerCreateInput, query?: SingerSingleQuery) {
+        super(() => {})
+        this.#manager = manager
+        this.#input = input
+        this.#query = query
+    }
+
+    pick(picks: SingerResultPick[]): SingerCreateRequest<Pick<T, typeof picks[number]>> {
+        this.#query = {...this.#query, _pick: picks}
+        return this
+    }
+
+    omit(omits: SingerResultPick[]): SingerCreateRequest<Omit<T, typeof omits[number]>> {
+        this.#query = {...this.#query, _omit: omits}
+        return this
+    }
+
+    async exec(): Promise<T> {
+        const errors = validateSingerCreateInput(this.#input)
+        if (errors) {
+            throw new ValidationError(errors)
+        }
+        return await this.#manager.post('/singers', this.#input, this.#query)
+    }
+}
+
+class SingerUpdateRequest<T extends Partial<Singer>> extends Promise<T> {
+
+    #manager: RequestManager
+    #id: string
+    #input: SingerUpdateInput
+    #query?: SingerSingleQuery
+
+    constructor(manager: RequestManager, id: string, input: SingerUpdateInput, query?: SingerSingleQuery) {
+        super(() => {})
+        this.#manager = manager
+        this.#id = id
+        this.#input = input
+        this.#query = query
+    }
+
+    pick(picks: SingerResultPick[]): SingerUpdateRequest<Pick<T, typeof picks[number]>> {
+        this.#query = {...this.#query, _pick: picks}
+        return this
+    }
+
+    omit(omits: SingerResultPick[]): SingerUpdateRequest<Omit<T, typeof omits[number]>> {
+        this.#query = {...this.#query, _omit: omits}
+        return this
+    }
+
+    async exec(): Promise<Singer> {
+        const errors = validateSingerUpdateInput(this.#input)
+        if (errors) {
+            throw new ValidationError(errors)
+        }
+        return await this.#manager.patch(`/singers/${this.#id}`, this.#input, this.#query)
+    }
+}
+
+class SingerDeleteRequest extends Promise<void> {
+
+    #manager: RequestManager
+    #id: string
+
+    constructor(manager: RequestManager, id: string) {
+        super(() => {})
+        this.#manager = manager
+        this.#id = id
+    }
+
+    async exec(): Promise<void> {
+        return await this.#manager.delete(`/singers/${this.#id}`)
+    }
+}
+
+class SingerIDRequest<T extends Partial<Singer>> extends Promise<T> {
+
+    #manager: RequestManager
+    #id: string
+    #query?: SingerSingleQuery
+
+    constructor(manager: RequestManager, id: string, query?: SingerSingleQuery) {
+        super(() => {})
+        this.#manager = manager
+        this.#id = id
+        this.#query = query
+    }
+
+    pick(picks: SingerResultPick[]): SingerIDRequest<Pick<T, typeof picks[number]>> {
+        this.#query = {...this.#query, _pick: picks}
+        return this
+    }
+
+    omit(omits: SingerResultPick[]): SingerIDRequest<Omit<T, typeof omits[number]>> {
+        this.#query = {...this.#query, _omit: omits}
+        return this
+    }
+
+    async exec(): Promise<Singer> {
+        return await this.#manager.get(`/singers/${this.#id}`, this.#query)
+    }
+}
+
+class SingerUpsertRequest<T extends Partial<Singer>> extends Promise<T> {
+
+    #manager: RequestManager
+    #input: SingerQueryData
+
+    constructor(manager: RequestManager, input: SingerQueryData) {
+        super(() => {})
+        this.#manager = manager
+        this.#input = input
+    }
+
+    async exec(): Promise<T> {
+        const errors = validateSingerUpdateInput(this.#input._data)
+        if (errors) {
+            throw new ValidationError(errors)
+        }
+        return await this.#manager.post('/singers', { '_upsert': this.#input })
+    }
+}
+
+class SingerCreateManyRequest<T extends Partial<Singer>> extends Promise<T> {
+
+    #manager: RequestManager
+    #input: SingerCreateInput[]
+    #query?: SingerSingleQuery
+
+    constructor(manager: RequestManager, input: SingerCreateInput[], query?: SingerSingleQuery) {
+        super(() => {})
+        this.#manager = manager
+        this.#input = input
+        this.#query = query
+    }
+
+    pick(picks: SingerResultPick[]): SingerCreateManyRequest<Pick<T, typeof picks[number]>> {
+        this.#query = {...this.#query, _pick: picks}
+        return this
+    }
+
+    omit(omits: SingerResultPick[]): SingerCreateManyRequest<Omit<T, typeof omits[number]>> {
+        this.#query = {...this.#query, _omit: omits}
+        return this
+    }
+
+    async exec(): Promise<T[]> {
+        for (const input of this.#input) {
+            const errors = validateSingerCreateInput(input)
+            if (errors) {
+                throw new ValidationError(errors)
+            }
+        }
+        return await this.#manager.post('/singers', { '_create': this.#input })
+    }
+}
+
+class SingerUpdateManyRequest<T extends Partial<Singer>> extends Promise<T> {
+
+    #manager: RequestManager
+    #input: SingerQueryData
+    #query?: SingerSingleQuery
+
+    constructor(manager: RequestManager, input: SingerQueryData, query?: SingerSingleQuery) {
+        super(() => {})
+        this.#manager = manager
+        this.#input = input
+        this.#query = query
+    }
+
+    pick(picks: SingerResultPick[]): SingerUpdateManyRequest<Pick<T, typeof picks[number]>> {
+        this.#query = {...this.#query, _pick: picks}
+        return this
+    }
+
+    omit(omits: SingerResultPick[]): SingerUpdateManyRequest<Omit<T, typeof omits[number]>> {
+        this.#query = {...this.#query, _omit: omits}
+        return this
+    }
+
+    async exec(): Promise<Singer> {
+        const errors = validateSingerUpdateInput(this.#input._data)
+        if (errors) {
+            throw new ValidationError(errors)
+        }
+        return await this.#manager.patch('/singers', { '_update': this.#input })
+    }
+}
+
+class SingerDeleteManyRequest extends Promise<void> {
+
+    #manager: RequestManager
+    #query?: SingerSeekQuery
+
+    constructor(manager: RequestManager, query?: SingerSeekQuery) {
+        super(() => {})
+        this.#manager = manager
+        this.#query = query
+    }
+
+    async exec(): Promise<void> {
+        return await this.#manager.delete('/singers', this.#query)
+    }
+}
+
+class SingerListRequest<T extends Partial<Singer>> extends Promise<T[]> {
+
+    #manager: RequestManager
+    #query?: SingerListQuery
+
+    constructor(manager: RequestManager, query?: SingerListQuery) {
+        super(() => {})
+        this.#manager = manager
+        this.#query = query
+    }
+
+    order(order: SingerSortOrder | SingerSortOrder[]): SingerListRequest<T> {
+        this.#query = {...this.#query, _order: order}
+        return this
+    }
+
+    skip(skip: number): SingerListRequest<T> {
+        this.#query = {...this.#query, _skip: skip}
+        return this
+    }
+
+    limt(limit: number): SingerListRequest<T> {
+        this.#query = {...this.#query, _limit: limit}
+        return this
+    }
+
+    pageSize(pageSize: number): SingerListRequest<T> {
+        this.#query = {...this.#query, _pageSize: pageSize}
+        return this
+    }
+
+    pageNo(pageNo: number): SingerListRequest<T> {
+        this.#query = {...this.#query, _pageNo: pageNo}
+        return this
+    }
+
+    pick(picks: SingerResultPick[]): SingerListRequest<Pick<T, typeof picks[number]>> {
+        this.#query = {...this.#query, _pick: picks}
+        return this
+    }
+
+    omit(omits: SingerResultPick[]): SingerListRequest<Omit<T, typeof omits[number]>> {
+        this.#query = {...this.#query, _omit: omits}
+        return this
+    }
+
+    async exec(): Promise<Singer[]> {
+        return await this.#manager.get('/singers', this.#query)
+    }
+}
+
+class SingerClient {
+
+    #manager: RequestManager
+
+    constructor(manager: RequestManager) {
+        this.#manager = manager
+    }
+
+    create(input: SingerCreateInput, query?: SingerSingleQuery): SingerCreateRequest<Singer> {
+        return new SingerCreateRequest(this.#manager, input, query)
+    }
+
+    createMany(input: SingerCreateInput[]): SingerCreateManyRequest<Singer> {
+        return new SingerCreateManyRequest(this.#manager, input)
+    }
+
+    id(id: string, query?: SingerSingleQuery): SingerIDRequest<Singer> {
+        return new SingerIDRequest(this.#manager, id, query)
+    }
+
+    update(id: string, input: SingerUpdateInput, query?: SingerSingleQuery): SingerUpdateRequest<Singer> {
+        return new SingerUpdateRequest(this.#manager, id, input, query)
+    }
+
+    updateMany(input: SingerQueryData): SingerUpdateManyRequest<Singer> {
+        return new SingerUpdateManyRequest(this.#manager, input)
+    }
+
+    upsert(input: SingerQueryData): SingerUpsertRequest<Singer> {
+        return new SingerUpsertRequest(this.#manager, input)
+    }
+
+    find(query?: SingerListQuery): SingerListRequest<Singer> {
+        return new SingerListRequest(this.#manager, query)
+    }
+
+    delete(id: string): SingerDeleteRequest {
+        return new SingerDeleteRequest(this.#manager, id)
+    }
+
+    deleteMany(query?: SingerSeekQuery): SingerDeleteManyRequest {
+        return new SingerDeleteManyRequest(this.#manager, query)
+    }
+}
+
+
+export class API {
+
+    #manager: RequestManager
+    #singers?: SingerClient
+
+    constructor(config: APIConfig = {}) {
+        this.#manager = new RequestManager(config)
+    }
+
+    get singers(): SingerClient {
+        return this.#singers ??= new SingerClient(this.#manager)
+    }
+}
+
+
+export const api = new API()
@@ -0,0 +1,25 @@
+from __future__ import annotations
+from os import getcwd
+from sys import executable
+from json import loads
+from subprocess import run
+from unittest import TestCase
+
+
+class TestBenchmarks(TestCase):
+
+    def test_benchmark_emits_stage_results(self) -> None:
+        result = run([executable, 'benchmarks/run.py', '--models', '4', '--fields', '6',
+                      '--enums', '2', '--links', '1', '--join-table-ratio', '0.5',
+                      '--lang', 'ts', '--lang', 'swift', '--validate', '--repeat', '1'],
+                     cwd=getcwd(), capture_output=True, text=True, check=True)
+        output = loads(result.stdout)
+        self.assertEqual(output['schema']['models'], 4)
+        self.assertEqual(output['schema']['enums'], 2)
+        self.assertEqual(list(output['stages'].keys()),
+                         ['import', 'analysis', 'render.ts', 'render.swift', 'write'])
+        for stage in output['stages'].values():
+            self.assertEqual(len(stage['runs']), 1)
+            self.assertGreater(stage['peak_bytes'], 0)
+        self.assertGreater(output['output_bytes']['ts'], 0)
+        self.assertGreater(output['output_bytes']['swift'], 0)
@@ -0,0 +1,172 @@
+from __future__ import annotations
+from os import getcwd
+from io import StringIO
+from pathlib import Path
+from contextlib import redirect_stdout
+from importlib.util import find_spec
+from unittest import TestCase, skipIf
+from jsonclasses_cli.console.helpers import (
+    Timings, bench, explain_summary, format_size, install, profile, sizeof
+)
+
+
+class TestConsoleHelpers(TestCase):
+
+    def test_bench_reports_percentiles_and_result_size(self) -> None:
+        timings = bench(lambda: list(range(100)), n=50)
+        self.assertEqual(len(timings.seconds), 50)
+        self.assertLessEqual(timings.percentile(50), timings.percentile(99))
+        self.assertEqual(timings.size, sizeof(list(range(100))))
+        self.assertRegex(repr(timings), r'^<lambda>: 50 runs  mean .*ms  p50 .*  p99 .*  result \d')
+
+    def test_bench_evaluates_strings_in_console_namespace(self) -> None:
+        namespace = install({'items': [1, 2, 3]})
+        self.assertIs(namespace['bench'], bench)
+        timings = bench('sum(items)', n=3, warmup=0)
+        self.assertEqual(timings.name, 'sum(items)')
+        self.assertEqual(timings.size, sizeof(6))
+
+    def test_timings_percentile(self) -> None:
+        timings = Timings('t', [i / 1000 for i in range(100, 0, -1)], 0)
+        self.assertEqual(timings.percentile(50), 0.05)
+        self.assertEqual(timings.percentile(99), 0.099)
+        self.assertEqual(timings.percentile(100), 0.1)
+
+    def test_profile_prints_stats_and_returns_result(self) -> None:
+        output = StringIO()
+        with redirect_stdout(output):
+            result = profile(lambda: sorted(range(1000), key=str), top=5)
+        self.assertEqual(result, sorted(range(1000), key=str))
+        self.assertIn('function calls', output.getvalue())
+        self.assertIn('<lambda>: ', output.getvalue())
+
+    def test_sizeof_counts_nested_values_once(self) -> None:
+        item = 'x' * 1000
+        self.assertGreater(sizeof({'a': [item, item]}), 1000)
+        self.assertLess(sizeof({'a': [item, item]}), 2000)
+        self.assertEqual(format_size(512), '512B')
+        self.assertEqual(format_size(1536), '1.5KB')
+
+    def test_explain_summary_shows_plan_and_scans(self) -> None:
+        result = {'stages': [{'$cursor': {
+            'queryPlanner': {'winningPlan': {'stage': 'FETCH', 'inputStage': {
+                'stage': 'IXSCAN', 'indexName': 'authorId_1'}}},
+            'executionStats': {'nReturned': 2, 'totalKeysExamined': 2, 'totalDocsExamined': 2,
+                               'executionTimeMillis': 1}}}]}
+        summary = explain_summary('posts', [{'$match': {'authorId': 1}}], result)
+        self.assertIn('plan: FETCH <- IXSCAN(authorId_1)', summary)
+        self.assertIn('returned: 2  keys examined: 2  docs examined: 2  time: 1ms', summary)
+        self.assertNotIn('warning', summary)
+        summary = explain_summary('posts', [], {'queryPlanner': {'winningPlan': {'stage': 'COLLSCAN'}}})
+        self.assertIn('warning: collection scan', summary)
+
+
+class TestConsoleDisplay(TestCase):
+
+    def display(self, pager, value) -> list[str]:
+        output = StringIO()
+        with redirect_stdout(output):
+            if value is more:
+                pager.more()
+            else:
+                pager(value)
+        return output.getvalue().splitlines()
+
+    def test_short_lists_use_default_display(self) -> None:
+        from jsonclasses_cli.console.display import Pager
+        self.assertEqual(self.display(Pager(3), [1, 2]), ['[1, 2]'])
+
+    def test_long_lists_are_paged(self) -> None:
+        from jsonclasses_cli.console.display import Pager
+        pager = Pager(3)
+        self.assertEqual(self.display(pager, list(range(7))),
+                         ['[0] 0', '[1] 1', '[2] 2', '-- 3 of 7, more() to show the next 3 --'])
+        self.assertEqual(self.display(pager, more),
+                         ['[3] 3', '[4] 4', '[5] 5', '-- 6 of 7, more() to show the next 3 --'])
+        self.assertEqual(self.display(pager, more), ['[6] 6', '-- 7 of 7 --'])
+        self.assertEqual(self.display(pager, more), ['nothing to show, display a list or a query first'])
+
+    @skipIf(find_spec('jsonclasses_pymongo') is None, 'jsonclasses-pymongo is not installed')
+    def test_queries_fetch_pages_lazily(self) -> None:
+        from bson.objectid import ObjectId
+        from jsonclasses_cli.console.display import Pager, QuerySource
+        from jsonclasses_cli.utils.import_app import import_app
+        app = import_app(Path(getcwd()) / 'tests' / 'classes' / 'seed.py')
+        pipelines: list[list[dict]] = []
+
+        class StandInSource(QuerySource):
+            def aggregate(self, pipeline, **kwargs):
+                pipelines.append(pipeline)
+                if pipeline[-1] == {'$count': 'count'}:
+                    return [{'count': 1000}]
+                (skip, limit) = (pipeline[-2]['$skip'], pipeline[-1]['$limit'])
+                return [{'_id': ObjectId(), 'name': f'a{i}'} for i in range(skip, skip + limit)]
+
+        pager = Pager(2)
+        pager.source = StandInSource(app.Author.find(role='READER'))
+        output = self.display(pager, more)
+        self.assertEqual(len(output), 3)
+        self.assertRegex(output[0], r"^\[0\] Author\(id='[0-9a-f]{24}', name='a0'")
+        self.assertEqual(output[2], '-- 2 of 1000, more() to show the next 2 --')
+        self.assertEqual(self.display(pager, more)[2], '-- 4 of 1000, more() to show the next 2 --')
+        self.assertEqual(pipelines, [
+            [{'$match': {'role': 'reader'}}, {'$skip': 0}, {'$limit': 3}],
+            [{'$match': {'role': 'reader'}}, {'$count': 'count'}],
+            [{'$match': {'role': 'reader'}}, {'$skip': 2}, {'$limit': 3}]
+        ])
+
+def more():
+    pass
+
+
+class TestConsoleFastStart(TestCase):
+
+    def setUp(self) -> None:
+        from tempfile import TemporaryDirectory
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.dest = Path(temp_dir.name)
+        self.app_file = self.dest / 'slow_console_app.py'
+        self.app_file.write_text('\n'.join([
+            'from time import sleep',
+            'from jsonclasses import jsonclass',
+            'sleep(0.3)',
+            '',
+            '@jsonclass(class_graph=\'slow_console_app\')',
+            'class Song:',
+            '    name: str',
+            ''
+        ]))
+        self.addCleanup(self.unload)
+
+    def unload(self) -> None:
+        from sys import modules
+        from jsonclasses.cgraph import CGraph
+        modules.pop('slow_console_app', None)
+        CGraph._graph_map.pop('slow_console_app', None)
+        CGraph._initialized_map.pop('slow_console_app', None)
+
+    def test_fast_start_uses_snapshot_and_imports_in_background(self) -> None:
+        from time import perf_counter
+        from jsonclasses_cli.console import console_namespace
+        (namespace, models) = console_namespace(self.dest, self.app_file, True)
+        self.assertEqual(models, 'Song')
+        self.assertTrue((self.dest / '.jsonclasses.console.json').is_file())
+        self.unload()
+        start = perf_counter()
+        (namespace, models) = console_namespace(self.dest, self.app_file, True)
+        self.assertLess(perf_counter() - start, 0.2)
+        self.assertEqual(models, 'Song (loading app in background)')
+        with self.assertRaises(KeyError):
+            namespace['print']
+        self.assertEqual(eval('Song(name="a").name', namespace), 'a')
+        self.assertGreater(perf_counter() - start, 0.3)
+
+    def test_changed_app_invalidates_snapshot(self) -> None:
+        from os import utime
+        from jsonclasses_cli.console import console_namespace
+        from jsonclasses_cli.console.snapshot import read_snapshot
+        console_namespace(self.dest, self.app_file, True)
+        self.assertEqual(read_snapshot(self.dest, self.app_file), ['Song'])
+        utime(self.app_file, (1, 1))
+        self.assertIsNone(read_snapshot(self.dest, self.app_file))
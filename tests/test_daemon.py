@@ -0,0 +1,87 @@
+from __future__ import annotations
+from os import getcwd
+from unittest import TestCase
+from tempfile import TemporaryDirectory
+from threading import Thread
+from socket import socket, AF_UNIX, SOCK_STREAM
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+from time import sleep
+from jsonclasses_cli.daemon.server import daemon
+from jsonclasses_cli.daemon.client import request, generate
+
+
+class TestDaemon(TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.temp_dir = TemporaryDirectory()
+        cls.temp_path = Path(str(cls.temp_dir.name))
+        cls.data_dir = Path(getcwd()) / 'tests' / 'data_package_ts'
+        cls.socket_path = cls.temp_path / '.jsonclasses.sock'
+        cls.app_file = cls.temp_path / 'daemon_app.py'
+        source = (Path(getcwd()) / 'tests' / 'classes' / 'simple_song.py').read_text()
+        cls.app_file.write_text(source.replace("class_graph='simple'", "class_graph='daemon'"))
+        cls.thread = Thread(target=daemon, args=(cls.temp_path, cls.app_file, cls.socket_path, 'daemon'))
+        cls.thread.start()
+        while not cls.socket_path.exists():
+            sleep(0.01)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        request(cls.socket_path, {'command': 'stop'})
+        cls.thread.join()
+        cls.temp_dir.cleanup()
+
+    def test_daemon_generates_package(self) -> None:
+        response = request(self.socket_path, {'command': 'generate', 'lang': 'ts'})
+        self.assertTrue(response['ok'])
+        self.assertIn('packages/ts/src/index.ts', [f['path'] for f in response['files']])
+        result = self.temp_path / 'packages' / 'ts' / 'src' / 'index.ts'
+        expect = self.data_dir / 'simple_song_api.ts'
+        self.assertEqual(result.read_text(), expect.read_text())
+        response = request(self.socket_path, {'command': 'diff', 'lang': 'ts'})
+        self.assertEqual(response['diff'], '')
+
+    def test_daemon_returns_schema(self) -> None:
+        response = request(self.socket_path, {'command': 'schema'})
+        fields = response['schema']['models']['SimpleSong']['fields']
+        self.assertEqual(fields['id'], {'type': 'str', 'store': 'embedded', 'required': True, 'primary': True})
+        self.assertEqual(fields['name']['type'], 'str')
+
+    def test_daemon_reports_errors(self) -> None:
+        response = request(self.socket_path, {'command': 'unknown'})
+        self.assertFalse(response['ok'])
+        self.assertEqual(response['error'], 'ValueError: unknown command: unknown')
+
+    def test_client_falls_back_when_daemon_closes_without_reply(self) -> None:
+        local_path = self.temp_path / 'local'
+        local_path.mkdir()
+        app_file = local_path / 'daemon_local_app.py'
+        app_file.write_text(self.app_file.read_text().replace("class_graph='daemon'", "class_graph='daemon_local'"))
+        socket_path = local_path / '.jsonclasses.sock'
+        with socket(AF_UNIX, SOCK_STREAM) as server:
+            server.bind(str(socket_path))
+            server.listen(1)
+
+            def close_without_reply() -> None:
+                (connection, _) = server.accept()
+                connection.recv(1024)
+                connection.close()
+
+            thread = Thread(target=close_without_reply)
+            thread.start()
+            with self.assertRaises(ConnectionResetError):
+                request(socket_path, {'command': 'ping'})
+            thread.join()
+            thread = Thread(target=close_without_reply)
+            thread.start()
+            out = StringIO()
+            with redirect_stdout(out):
+                self.assertTrue(generate(socket_path, 'ts', False, app_file, 'daemon_local'))
+            thread.join()
+        self.assertIn('closed the connection without replying, running in process', ' '.join(out.getvalue().split()))
+        result = local_path / 'packages' / 'ts' / 'src' / 'index.ts'
+        expect = self.data_dir / 'simple_song_api.ts'
+        self.assertEqual(result.read_text(), expect.read_text())
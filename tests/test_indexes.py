@@ -0,0 +1,51 @@
+from __future__ import annotations
+from os import getcwd
+from importlib.util import find_spec
+from unittest import TestCase, skipIf
+from tempfile import TemporaryDirectory
+from pathlib import Path
+
+
+@skipIf(find_spec('jsonclasses_pymongo') is None, 'jsonclasses-pymongo is not installed')
+class TestIndexes(TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.temp_dir = TemporaryDirectory()
+        cls.temp_path = Path(str(cls.temp_dir.name))
+        cls.app_file = Path(getcwd()) / 'tests' / 'classes' / 'indexes.py'
+        cls.data_path = Path(getcwd()) / 'tests' / 'data_indexes'
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.temp_dir.cleanup()
+
+    def test_indexes_generate_script(self) -> None:
+        from jsonclasses_cli.indexes import indexes
+        indexes(self.temp_path, self.app_file, Path('indexes.py'), 'mongodb://localhost:27017/app',
+                cgraph_name='indexes', silent=True)
+        expect = self.data_path / 'indexes_script.py'
+        self.assertEqual((self.temp_path / 'indexes.py').read_text(), expect.read_text())
+
+    def test_indexes_compare_with_live_indexes(self) -> None:
+        from jsonclasses_cli.indexes import indexes
+        from jsonclasses_cli.indexes.compare import compare
+        plan = indexes(self.temp_path, self.app_file, cgraph_name='indexes', silent=True)
+        live = {
+            'users': {'_id_': ['_id'], 'email_1': ['email'], 'firstName_1': ['firstName'],
+                      'full_name': ['firstName', 'lastName'], 'lastName_1': ['lastName'],
+                      'createdAt_1_name_1': ['createdAt', 'name'], 'legacy': ['legacy']},
+            'posts': {'_id_': ['_id']},
+            'tags': {'_id_': ['_id'], 'name_1': ['name']},
+            'poststagstagsposts': {'_id_': ['_id'], 'ref': ['tagId', 'postId']}
+        }
+        rows = {(r[0], r[1]): r[3] for r in compare(plan, live)}
+        self.assertEqual(rows[('users', 'email_1')], 'ok')
+        self.assertEqual(rows[('users', 'name_1')], 'missing')
+        self.assertEqual(rows[('users', 'createdAt_1')], 'covered')
+        self.assertEqual(rows[('users', 'firstName_1')], 'redundant')
+        self.assertEqual(rows[('users', 'legacy')], 'unplanned')
+        self.assertEqual(rows[('posts', 'authorId_1')], 'missing')
+        self.assertEqual(rows[('poststagstagsposts', 'ref')], 'ok')
+        self.assertEqual(rows[('poststagstagsposts', 'tagId_1')], 'covered')
+        self.assertNotIn(('users', '_id_'), rows)
@@ -0,0 +1,121 @@
+from __future__ import annotations
+from os import getcwd
+from sys import modules
+from asyncio import run, sleep
+from importlib.util import find_spec, module_from_spec, spec_from_file_location
+from json import dumps, loads
+from unittest import TestCase, skipIf
+from tempfile import TemporaryDirectory
+from pathlib import Path
+from jsonclasses_cli.loadtest import generate
+
+
+class TestLoadtest(TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.temp_dir = TemporaryDirectory()
+        cls.temp_path = Path(str(cls.temp_dir.name))
+        cls.cls_dir = Path(getcwd()) / 'tests' / 'classes'
+        cls.data_path = Path(getcwd()) / 'tests' / 'data_loadtest'
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.temp_dir.cleanup()
+
+    def test_loadtest_generate_with_links_and_session(self) -> None:
+        generate(self.temp_path, self.cls_dir / 'linkto_date_session.py', Path('loadtest.py'),
+                 cgraph_name='linkto_date_session', silent=True)
+        expect = self.data_path / 'linkto_date_session_loadtest.py'
+        self.assertEqual((self.temp_path / 'loadtest.py').read_text(), expect.read_text())
+
+    def test_loadtest_generate_with_enum_and_modifiers(self) -> None:
+        generate(self.temp_path, self.cls_dir / 'validate.py', Path('loadtest.py'),
+                 cgraph_name='validate', silent=True)
+        expect = self.data_path / 'validate_loadtest.py'
+        self.assertEqual((self.temp_path / 'loadtest.py').read_text(), expect.read_text())
+
+    @skipIf(find_spec('httpx') is None, 'httpx is not installed')
+    def test_loadtest_script_runs_against_server(self) -> None:
+        from httpx import ASGITransport
+        path = self.data_path / 'linkto_date_session_loadtest.py'
+        spec = spec_from_file_location('linkto_date_session_loadtest', path)
+        script = modules[spec.name] = module_from_spec(spec)
+        self.addCleanup(modules.pop, spec.name)
+        spec.loader.exec_module(script)
+        server = StandInServer()
+        mix = script.parse_mix('C=1,R=4,U=1,D=1,L=2')
+        stats = run(script.load('http://test', mix, 4, 0.2, 3, 0, ASGITransport(server)))
+        self.assertEqual(set(stats.latencies.keys()), {
+            'POST /users', 'GET /users/:id', 'PATCH /users/:id', 'DELETE /users/:id', 'GET /users',
+            'POST /articles', 'GET /articles/:id', 'PATCH /articles/:id', 'DELETE /articles/:id',
+            'GET /articles'
+        })
+        self.assertEqual(stats.errors['POST /users'] + stats.errors['POST /articles'], 0)
+        self.assertTrue(all(a == 'Bearer token' for a in server.authorizations[7:]))
+        self.assertIsNotNone(server.articles[0].get('author_id'))
+        report = stats.report().split('\n')
+        self.assertEqual(report[0].split(), ['route', 'count', 'errors', 'rps', 'p50', 'p90', 'p99', 'max'])
+        self.assertEqual(len(report), 11)
+
+
+    @skipIf(find_spec('httpx') is None, 'httpx is not installed')
+    def test_loadtest_runner_drops_models_outside_the_mix(self) -> None:
+        path = self.data_path / 'linkto_date_session_loadtest.py'
+        spec = spec_from_file_location('linkto_date_session_loadtest', path)
+        script = modules[spec.name] = module_from_spec(spec)
+        self.addCleanup(modules.pop, spec.name)
+        spec.loader.exec_module(script)
+        models = [script.Model('users', 'CR', 'id', None, None, None),
+                  script.Model('articles', 'L', 'id', None, None, None)]
+        runner = script.Runner(None, models, script.parse_mix('C=0,R=1'), 0)
+        self.assertEqual([m.name for m in runner.models], ['users'])
+        self.assertEqual(set(runner.ids), {'users', 'articles'})
+        with self.assertRaises(ValueError):
+            script.Runner(None, models, script.parse_mix('U=1,D=1'), 0)
+
+class StandInServer:
+
+    def __init__(self) -> None:
+        self.store: dict[str, dict[str, dict]] = {'users': {}, 'articles': {}}
+        self.articles: list[dict] = []
+        self.authorizations: list[str | None] = []
+        self.next_id = 0
+
+    async def __call__(self, scope, receive, send) -> None:
+        body = b''
+        while True:
+            message = await receive()
+            body += message.get('body', b'')
+            if not message.get('more_body'):
+                break
+        authorization = dict(scope['headers']).get(b'authorization')
+        self.authorizations.append(authorization.decode() if authorization else None)
+        await sleep(0)
+        (status, data) = self.handle(scope['method'], scope['path'].split('/')[1:], loads(body) if body else None)
+        await send({'type': 'http.response.start', 'status': status,
+                    'headers': [(b'content-type', b'application/json')]})
+        await send({'type': 'http.response.body', 'body': dumps({'data': data}).encode()})
+
+    def handle(self, method: str, path: list[str], body: dict | None) -> tuple[int, object]:
+        match (method, path):
+            case ('POST', ['users', 'session']):
+                return (200, {'token': 'token'})
+            case ('POST', [name]):
+                self.next_id += 1
+                item = {**body, 'id': str(self.next_id)}
+                self.store[name][item['id']] = item
+                if name == 'articles':
+                    self.articles.append(item)
+                return (200, item)
+            case ('GET', [name]):
+                return (200, list(self.store[name].values())[:20])
+            case ('GET', [name, id]) if id in self.store[name]:
+                return (200, self.store[name][id])
+            case ('PATCH', [name, id]) if id in self.store[name]:
+                self.store[name][id].update(body)
+                return (200, self.store[name][id])
+            case ('DELETE', [name, id]) if id in self.store[name]:
+                del self.store[name][id]
+                return (200, None)
+        return (404, None)
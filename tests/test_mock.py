@@ -0,0 +1,116 @@
+from __future__ import annotations
+from os import getcwd
+from asyncio import run
+from time import perf_counter
+from importlib.util import find_spec, module_from_spec, spec_from_file_location
+from unittest import TestCase, skipIf
+from pathlib import Path
+from jsonclasses_cli.mock import mock_server
+
+
+@skipIf(find_spec('httpx') is None, 'httpx is not installed')
+class TestMock(TestCase):
+
+    def setUp(self) -> None:
+        self.server = mock_server(Path(getcwd()) / 'tests' / 'classes' / 'mock.py',
+                                  count=5, counts={'Post': 20}, cgraph_name='mock')
+
+    def request(self, method: str, url: str, body: object = None):
+        from httpx import ASGITransport, AsyncClient
+        async def main():
+            async with AsyncClient(transport=ASGITransport(self.server), base_url='http://test') as client:
+                return await client.request(method, url, json=body)
+        return run(main())
+
+    def test_mock_seeds_records_with_references(self) -> None:
+        posts = self.request('GET', '/posts').json()['data']
+        authors = {a['id'] for a in self.request('GET', '/authors').json()['data']}
+        self.assertEqual(len(posts), 20)
+        self.assertEqual(len(authors), 5)
+        self.assertTrue(all(p.get('authorId') in authors for p in posts if 'authorId' in p))
+        self.assertNotIn('password', self.request('GET', '/authors').json()['data'][0])
+
+    def test_mock_list_query_semantics(self) -> None:
+        data = self.request('GET', '/posts?_order[0]=-title&_skip=2&_limit=3&_pick[0]=title').json()['data']
+        titles = sorted((p['title'] for p in self.request('GET', '/posts').json()['data']), reverse=True)
+        self.assertEqual([p['title'] for p in data], titles[2:5])
+        self.assertEqual(set(data[0].keys()), {'id', 'title'})
+        data = self.request('GET', '/posts?_omit[0]=title&_limit=1').json()['data']
+        self.assertNotIn('title', data[0])
+
+    def test_mock_list_query_pages(self) -> None:
+        ids = [p['id'] for p in self.request('GET', '/posts').json()['data']]
+        data = self.request('GET', '/posts?_pageSize=3&_pageNo=2').json()['data']
+        self.assertEqual([p['id'] for p in data], ids[3:6])
+        data = self.request('GET', '/posts?_page_size=4&_page_number=5&_limit=1').json()['data']
+        self.assertEqual([p['id'] for p in data], ids[16:20])
+
+    def test_mock_filters_by_field_matchers(self) -> None:
+        self.request('POST', '/posts', {'title': 'Hello World', 'rating': 4.5})
+        self.request('POST', '/posts', {'title': 'hello there', 'rating': 1})
+        data = self.request('GET', '/posts?title[_prefix]=hello&title[_mode]=insensitive').json()['data']
+        self.assertEqual({p['title'] for p in data}, {'Hello World', 'hello there'})
+        data = self.request('GET', '/posts?title[_prefix]=hello&rating[_gt]=2').json()['data']
+        self.assertEqual(data, [])
+
+    def test_mock_includes_both_sides_of_a_reference(self) -> None:
+        author = self.request('POST', '/authors', {'email': 'a@b.com', 'password': 'pw', 'role': 'WRITER'}).json()['data']
+        post = self.request('POST', '/posts?_includes[0]=author', {'title': 'Mine', 'authorId': author['id']}).json()['data']
+        self.assertEqual(post['author']['email'], 'a@b.com')
+        url = f'/authors/{author["id"]}?_includes[0][posts][_pick][0]=title'
+        data = self.request('GET', url).json()['data']
+        self.assertEqual(data['posts'], [{'id': post['id'], 'title': 'Mine'}])
+
+    def test_mock_create_many_update_and_delete(self) -> None:
+        created = self.request('POST', '/authors', {'_create': [
+            {'email': 'x@y.com', 'password': 'pw', 'role': 'READER'},
+            {'email': 'z@y.com', 'password': 'pw', 'role': 'READER', 'createdAt': '2000-01-01'}
+        ]}).json()['data']
+        self.assertEqual(len(created), 2)
+        self.assertTrue(created[1]['createdAt'].endswith('Z'))
+        id = created[0]['id']
+        updated = self.request('PATCH', f'/authors/{id}', {'role': 'WRITER'}).json()['data']
+        self.assertEqual(updated['role'], 'WRITER')
+        self.assertEqual(self.request('DELETE', f'/authors/{id}').status_code, 204)
+        self.assertEqual(self.request('GET', f'/authors/{id}').status_code, 404)
+        self.assertEqual(self.request('DELETE', '/posts/000000000000000000000001').status_code, 404)
+
+    def test_mock_update_many_requires_query(self) -> None:
+        before = self.request('GET', '/posts').json()['data']
+        self.assertEqual(self.request('PATCH', '/posts', {'title': 'All'}).status_code, 400)
+        self.assertEqual(self.request('PATCH', '/posts', {'_update': {'_data': {'title': 'All'}}}).status_code, 400)
+        self.assertEqual(self.request('GET', '/posts').json()['data'], before)
+        data = self.request('PATCH', '/posts', {'_update': {'_query': {}, '_data': {'title': 'All'}}}).json()['data']
+        self.assertEqual({p['title'] for p in data}, {'All'})
+
+    def test_mock_sign_in_returns_token_and_object(self) -> None:
+        self.request('POST', '/authors', {'email': 'me@b.com', 'password': 'pw', 'role': 'READER'})
+        data = self.request('POST', '/authors/session', {'email': 'me@b.com', 'password': 'pw'}).json()['data']
+        self.assertEqual(set(data.keys()), {'token', 'author'})
+        self.assertEqual(data['author']['email'], 'me@b.com')
+        self.assertEqual(self.request('POST', '/authors/session', {'password': 'pw'}).status_code, 400)
+
+    def test_mock_injects_latency(self) -> None:
+        self.server.latency = 0.05
+        start = perf_counter()
+        self.request('GET', '/authors')
+        self.assertGreaterEqual(perf_counter() - start, 0.05)
+
+    def test_mock_serves_generated_python_client(self) -> None:
+        from httpx import ASGITransport
+        server = mock_server(Path(getcwd()) / 'tests' / 'classes' / 'linkto_date_session.py',
+                             count=3, cgraph_name='linkto_date_session')
+        path = Path(getcwd()) / 'tests' / 'data_package_python' / 'linkto_date_session_api.py'
+        spec = spec_from_file_location('linkto_date_session_api', path)
+        api = module_from_spec(spec)
+        spec.loader.exec_module(api)
+        api.request_manager.configure(base_url='http://test', transport=ASGITransport(server))
+        async def main():
+            async with api.request_manager:
+                await api.users.create({'username': 'John', 'password': 'secret'})
+                session = await api.users.sign_in({'username': 'John', 'password': 'secret'})
+                users = await api.users.find().order('-createdAt').limit(2)
+                return (session, users)
+        (session, users) = run(main())
+        self.assertEqual(session['user']['username'], 'John')
+        self.assertEqual(len(users), 2)
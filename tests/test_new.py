@@ -1,10 +1,14 @@
 from __future__ import annotations
 import re
-from os import getcwd
+from os import getcwd, utime
+from time import time
+from sys import executable
 from unittest import TestCase
 from tempfile import TemporaryDirectory
 from pathlib import Path
 from jsonclasses_cli.new import new
+from jsonclasses_cli.new.bootstrap import CACHE_TTL, wheel_cache_dir, build_wheels
+from jsonclasses_cli.new.req_content import req_content
 
 
 class TestNew(TestCase):
@@ -91,3 +95,50 @@ class TestNew(TestCase):
         self.assertEqual(mypy.read_text(), expect_mypy.read_text())
         self.assertEqual(gitignore.read_text(), expect_gitignore.read_text())
         self.assertEqual(read_me.read_text(), expect_read_me.read_text())
+
+    def test_new_genarate_production_config_and_service(self) -> None:
+        new(self.temp_path, None, True, True, None, None, True, True)
+        config = re.sub(r'\"secretKey\": \".*\"', '', (self.temp_path / 'config.json').read_text())
+        requirements = (self.temp_path / 'requirements.txt').read_text()
+        read_me = (self.temp_path / 'README.md').read_text()
+        service = (self.temp_path / 'deploy' / 'new_app.service').read_text()
+        self.assertEqual(config, (self.data_path / 'config_production.json').read_text())
+        self.assertEqual(requirements, (self.data_path / 'requirements_production.txt').read_text())
+        self.assertEqual(read_me, (self.data_path / 'README_production.md').read_text())
+        self.assertEqual(service.replace(str(self.temp_path), '/srv/new_app'),
+                         (self.data_path / 'new_app.service').read_text())
+
+    def test_new_service_runs_the_chosen_environment(self) -> None:
+        dest = Path(str(self.temp_dir.name)) / 'venv_app'
+        (dest / 'venv').mkdir(parents=True)
+        new(dest, None, False, False, False, None, True, True)
+        service = (dest / 'deploy' / 'venv_app.service').read_text()
+        self.assertIn(f'ExecStart={dest}/venv/bin/jsonclasses serve app.py', service)
+        new(dest, None, False, False, False, False, True, True)
+        service = (dest / 'deploy' / 'venv_app.service').read_text()
+        self.assertIn(f'ExecStart={Path(executable).parent}/jsonclasses serve app.py', service)
+
+    def test_new_wheel_cache_is_keyed_by_requirements(self) -> None:
+        plain = wheel_cache_dir(req_content(False, False))
+        self.assertEqual(plain, wheel_cache_dir(req_content(False, False)))
+        self.assertNotEqual(plain, wheel_cache_dir(req_content(True, False)))
+        self.assertEqual(plain.parent.name, 'wheels')
+
+    def test_new_build_wheels_reuses_complete_cache(self) -> None:
+        cache_dir = Path(str(self.temp_dir.name)) / 'wheels' / 'key'
+        cache_dir.mkdir(parents=True)
+        (cache_dir / '.complete').touch()
+        self.assertTrue(build_wheels(self.temp_path / 'requirements.txt', cache_dir))
+        self.assertEqual([p.name for p in cache_dir.iterdir()], ['.complete'])
+
+    def test_new_build_wheels_rebuilds_expired_or_refreshed_cache(self) -> None:
+        cache_dir = Path(str(self.temp_dir.name)) / 'wheels' / 'expired'
+        cache_dir.mkdir(parents=True)
+        (cache_dir / '.complete').touch()
+        req_file = Path(str(self.temp_dir.name)) / 'missing_requirements.txt'
+        req_file.write_text('./missing-package-dir\n')
+        self.assertFalse(build_wheels(req_file, cache_dir, refresh=True))
+        self.assertTrue(build_wheels(req_file, cache_dir))
+        stale = time() - CACHE_TTL - 1
+        utime(cache_dir / '.complete', (stale, stale))
+        self.assertFalse(build_wheels(req_file, cache_dir))
@@ -0,0 +1,57 @@
+from __future__ import annotations
+from os import getcwd
+from shutil import which
+from subprocess import run
+from unittest import TestCase, skipIf
+from tempfile import TemporaryDirectory
+from pathlib import Path
+from jsonclasses_cli.package import package
+
+
+class TestPackageJs(TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.temp_dir = TemporaryDirectory()
+        cls.temp_path = Path(str(cls.temp_dir.name)) / "app_path"
+        cls.cls_dir = Path(getcwd()) / 'tests' / 'classes'
+        cls.data_dir = Path(getcwd()) / 'tests' / 'data_package_js'
+        cls.js_path = cls.temp_path / 'packages' / 'ts'
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.temp_dir.cleanup()
+
+    def test_package_content_of_packagejson(self) -> None:
+        package(self.temp_path, self.cls_dir / 'simple_song.py', 'js', 'simple', True)
+        result = self.js_path / 'package.json'
+        expect = self.data_dir / 'package.json'
+        self.assertEqual(result.read_text(), expect.read_text())
+
+    def test_package_create_with_linkto_date_and_session(self) -> None:
+        package(self.temp_path, self.cls_dir / 'linkto_date_session.py', 'js', 'linkto_date_session', True)
+        self.assertEqual((self.js_path / 'lib' / 'index.js').read_text(),
+                         (self.data_dir / 'linkto_date_session_api.js').read_text())
+        self.assertEqual((self.js_path / 'lib' / 'index.d.ts').read_text(),
+                         (self.data_dir / 'linkto_date_session_api.d.ts').read_text())
+
+    def test_package_create_with_validators(self) -> None:
+        package(self.temp_path, self.cls_dir / 'validate.py', 'js', 'validate', True, True)
+        self.assertEqual((self.js_path / 'lib' / 'index.js').read_text(),
+                         (self.data_dir / 'validate_api.js').read_text())
+        self.assertEqual((self.js_path / 'lib' / 'index.d.ts').read_text(),
+                         (self.data_dir / 'validate_api.d.ts').read_text())
+
+    @skipIf(which('node') is None, 'node is not installed')
+    def test_package_js_is_valid_module(self) -> None:
+        for name in ['linkto_date_session_api.js', 'validate_api.js']:
+            result = run(['node', '--check', '--input-type=module'],
+                         input=(self.data_dir / name).read_text(), capture_output=True, text=True)
+            self.assertEqual(result.returncode, 0, result.stderr)
+
+    @skipIf(which('tsc') is None, 'tsc is not installed')
+    def test_package_declarations_type_check(self) -> None:
+        for name in ['linkto_date_session_api.d.ts', 'validate_api.d.ts']:
+            result = run(['tsc', '--noEmit', '--strict', '--lib', 'ESNext,DOM', str(self.data_dir / name)],
+                         capture_output=True, text=True)
+            self.assertEqual(result.returncode, 0, result.stdout)
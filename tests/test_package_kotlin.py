@@ -0,0 +1,76 @@
+from __future__ import annotations
+from os import getcwd
+from shutil import which
+from subprocess import run
+from unittest import TestCase, skipIf
+from tempfile import TemporaryDirectory
+from pathlib import Path
+from jsonclasses_cli.package import package
+
+
+class TestPackageKotlin(TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.temp_dir = TemporaryDirectory()
+        cls.temp_path = Path(str(cls.temp_dir.name)) / "kotlin_path"
+        cls.cls_dir = Path(getcwd()) / 'tests' / 'classes'
+        cls.data_path = Path(getcwd()) / 'tests' / 'data_package_kotlin'
+        cls.kotlin_path = cls.temp_path / 'packages' / 'kotlin'
+        cls.api_path = cls.kotlin_path / 'src' / 'main' / 'kotlin' / 'API.kt'
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.temp_dir.cleanup()
+
+    def test_package_kotlin_create_all_files(self) -> None:
+        package(self.temp_path, self.cls_dir / 'simple_song', 'kotlin', 'simple', True)
+        for name in ['build.gradle.kts', 'settings.gradle.kts', 'README.md', '.gitignore']:
+            file = self.kotlin_path / name
+            self.assertTrue(file.is_file(), file.name)
+            self.assertEqual(file.read_text(), (self.data_path / name).read_text())
+        self.assertTrue(self.api_path.is_file(), self.api_path.name)
+
+    def test_package_create_without_link_and_session(self) -> None:
+        package(self.temp_path, self.cls_dir / 'simple_song', 'kotlin', 'simple', True)
+        expect = self.data_path / 'simple_api.kt'
+        self.assertEqual(self.api_path.read_text(), expect.read_text())
+
+    def test_package_create_with_session(self) -> None:
+        package(self.temp_path, self.cls_dir / 'session.py', 'kotlin', 'session', True)
+        expect = self.data_path / 'session_api.kt'
+        self.assertEqual(self.api_path.read_text(), expect.read_text())
+
+    def test_package_create_with_linkedthru_and_session(self) -> None:
+        package(self.temp_path, self.cls_dir / 'linkedthru_session.py', 'kotlin', 'linkedthru_session', True)
+        expect = self.data_path / 'linkedthru_session_api.kt'
+        self.assertEqual(self.api_path.read_text(), expect.read_text())
+
+    def test_package_create_with_linkto_and_session(self) -> None:
+        package(self.temp_path, self.cls_dir / 'linkto_session.py', 'kotlin', 'linkto_session', True)
+        expect = self.data_path / 'linkto_session_api.kt'
+        self.assertEqual(self.api_path.read_text(), expect.read_text())
+
+    def test_package_create_with_enum(self) -> None:
+        package(self.temp_path, self.cls_dir / 'validate.py', 'kotlin', 'validate', True)
+        expect = self.data_path / 'validate_api.kt'
+        self.assertEqual(self.api_path.read_text(), expect.read_text())
+
+    def test_package_create_with_jobs_is_identical(self) -> None:
+        package(self.temp_path, self.cls_dir / 'linkto_session.py', 'kotlin', 'linkto_session', True, False, 2)
+        expect = self.data_path / 'linkto_session_api.kt'
+        self.assertEqual(self.api_path.read_text(), expect.read_text())
+
+    def test_package_result_fields_are_nullable_for_pick_and_omit(self) -> None:
+        package(self.temp_path, self.cls_dir / 'simple_song', 'kotlin', 'simple', True)
+        content = self.api_path.read_text()
+        self.assertIn('data class SimpleSong(\n    val id: String? = null,\n    val name: String? = null,', content)
+        self.assertIn('data class SimpleSongCreateInput(\n    val name: String,', content)
+
+    @skipIf(which('gradle') is None, 'gradle is not installed')
+    def test_package_kotlin_compiles(self) -> None:
+        for (name, graph) in [('linkto_session.py', 'linkto_session'), ('validate.py', 'validate')]:
+            package(self.temp_path, self.cls_dir / name, 'kotlin', graph, True)
+            result = run(['gradle', '--quiet', 'compileKotlin'], cwd=self.kotlin_path,
+                         capture_output=True, text=True)
+            self.assertEqual(result.returncode, 0, result.stderr)
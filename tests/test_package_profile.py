@@ -0,0 +1,42 @@
+from __future__ import annotations
+from os import getcwd
+from json import loads
+from pstats import Stats
+from unittest import TestCase
+from tempfile import TemporaryDirectory
+from pathlib import Path
+from io import StringIO
+from contextlib import redirect_stdout
+from jsonclasses_cli.package.profile import profile
+
+
+class TestPackageProfile(TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.temp_dir = TemporaryDirectory()
+        cls.temp_path = Path(str(cls.temp_dir.name)) / "app_path"
+        cls.cls_dir = Path(getcwd()) / 'tests' / 'classes'
+        cls.data_dir = Path(getcwd()) / 'tests' / 'data_package_ts'
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.temp_dir.cleanup()
+
+    def test_profile_writes_trace_and_stats(self) -> None:
+        trace_file = Path(str(self.temp_dir.name)) / 'trace.json'
+        stats_file = Path(str(self.temp_dir.name)) / 'stats.prof'
+        out = StringIO()
+        with redirect_stdout(out):
+            profile(self.temp_path, self.cls_dir / 'simple_song.py', 'ts', 'simple', True,
+                    trace_file=trace_file, stats_file=stats_file)
+        self.assertEqual(out.getvalue(), '')
+        events = loads(trace_file.read_text())['traceEvents']
+        phases = [e['name'] for e in events if e['cat'] == 'phase']
+        self.assertEqual(phases, ['import', 'resolve', 'render', 'write'])
+        models = {e['args']['model'] for e in events if e['cat'] == 'model'}
+        self.assertEqual(models, {'SimpleSong'})
+        self.assertGreater(Stats(str(stats_file)).total_calls, 0)
+        result = self.temp_path / 'packages' / 'ts' / 'src' / 'index.ts'
+        expect = self.data_dir / 'simple_song_api.ts'
+        self.assertEqual(result.read_text(), expect.read_text())
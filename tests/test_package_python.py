@@ -0,0 +1,205 @@
+from __future__ import annotations
+from os import getcwd
+from asyncio import run, sleep
+from datetime import date, datetime, timezone
+from importlib.util import find_spec, module_from_spec, spec_from_file_location
+from json import dumps, loads
+from unittest import TestCase, skipIf
+from tempfile import TemporaryDirectory
+from pathlib import Path
+from jsonclasses_cli.package import package
+
+
+class TestPackagePython(TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.temp_dir = TemporaryDirectory()
+        cls.temp_path = Path(str(cls.temp_dir.name)) / "app_path"
+        cls.cls_dir = Path(getcwd()) / 'tests' / 'classes'
+        cls.data_path = Path(getcwd()) / 'tests' / 'data_package_python'
+        cls.python_path = cls.temp_path / 'packages' / 'python'
+        cls.api_path = cls.python_path / 'api' / '__init__.py'
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.temp_dir.cleanup()
+
+    def test_package_python_create_all_files(self) -> None:
+        package(self.temp_path, self.cls_dir / 'simple_song.py', 'python', 'simple', True)
+        for name in ['pyproject.toml', 'README.md', '.gitignore']:
+            file = self.python_path / name
+            self.assertTrue(file.is_file(), file.name)
+            self.assertEqual(file.read_text(), (self.data_path / name).read_text())
+        self.assertTrue(self.api_path.is_file(), self.api_path.name)
+        self.assertTrue((self.python_path / 'api' / 'py.typed').is_file())
+
+    def test_package_create_without_link_and_session(self) -> None:
+        package(self.temp_path, self.cls_dir / 'simple_song.py', 'python', 'simple', True)
+        expect = self.data_path / 'simple_api.py'
+        self.assertEqual(self.api_path.read_text(), expect.read_text())
+
+    def test_package_create_with_session(self) -> None:
+        package(self.temp_path, self.cls_dir / 'session.py', 'python', 'session', True)
+        expect = self.data_path / 'session_api.py'
+        self.assertEqual(self.api_path.read_text(), expect.read_text())
+
+    def test_package_create_with_linkedthru_and_session(self) -> None:
+        package(self.temp_path, self.cls_dir / 'linkedthru_session.py', 'python', 'linkedthru_session', True)
+        expect = self.data_path / 'linkedthru_session_api.py'
+        self.assertEqual(self.api_path.read_text(), expect.read_text())
+
+    def test_package_create_with_linkto_date_and_session(self) -> None:
+        package(self.temp_path, self.cls_dir / 'linkto_date_session.py', 'python', 'linkto_date_session', True)
+        expect = self.data_path / 'linkto_date_session_api.py'
+        self.assertEqual(self.api_path.read_text(), expect.read_text())
+
+    def test_package_create_with_enum(self) -> None:
+        package(self.temp_path, self.cls_dir / 'validate.py', 'python', 'validate', True)
+        expect = self.data_path / 'validate_api.py'
+        self.assertEqual(self.api_path.read_text(), expect.read_text())
+
+    def test_package_create_with_jobs_is_identical(self) -> None:
+        package(self.temp_path, self.cls_dir / 'linkto_date_session.py', 'python', 'linkto_date_session', True, False, 2)
+        expect = self.data_path / 'linkto_date_session_api.py'
+        self.assertEqual(self.api_path.read_text(), expect.read_text())
+
+
+@skipIf(find_spec('httpx') is None, 'httpx is not installed')
+class TestPackagePythonRuntime(TestCase):
+
+    def setUp(self) -> None:
+        from httpx import ASGITransport
+        path = Path(getcwd()) / 'tests' / 'data_package_python' / 'linkto_date_session_api.py'
+        spec = spec_from_file_location('linkto_date_session_api', path)
+        self.api = module_from_spec(spec)
+        spec.loader.exec_module(self.api)
+        self.server = StandInServer()
+        self.api.request_manager.configure(base_url='http://test',
+                                           concurrency=2,
+                                           transport=ASGITransport(self.server))
+
+    def test_create_encodes_and_decodes_dates(self) -> None:
+        async def main():
+            async with self.api.request_manager:
+                return await self.api.users.create({
+                    'username': 'John', 'password': 'secret', 'birthday': date(2000, 1, 2)
+                }).pick('id', 'birthday')
+        user = run(main())
+        self.assertEqual(self.server.users['1']['birthday'], '2000-01-02T00:00:00.000Z')
+        self.assertEqual(user['birthday'], date(2000, 1, 2))
+        self.assertEqual(user['createdAt'], datetime(2020, 1, 2, tzinfo=timezone.utc))
+        self.assertEqual(self.server.paths[-1], '/users?_pick[0]=id&_pick[1]=birthday')
+
+    def test_find_encodes_query_string(self) -> None:
+        async def main():
+            async with self.api.request_manager:
+                return await self.api.users.find({'username': {'_contains': 'a b&c'}, 'birthday': None}) \
+                    .order('-createdAt').include({'articles': {'_limit': 2}}).limit(5)
+        run(main())
+        self.assertEqual(self.server.paths[-1],
+                         '/users?username[_contains]=a%20b%26c&birthday=null&_order[0]=-createdAt'
+                         '&_includes[0][articles][_limit]=2&_limit=5')
+
+    def test_sign_in_authorizes_later_requests(self) -> None:
+        async def main():
+            async with self.api.request_manager:
+                await self.api.users.create({'username': 'John', 'password': 'secret'})
+                session = await self.api.users.sign_in({'username': 'John', 'password': 'secret'})
+                await self.api.users.id(session['user']['id'])
+                return session
+        session = run(main())
+        self.assertEqual(session['token'], 'token-1')
+        self.assertEqual(session['user']['createdAt'], datetime(2020, 1, 2, tzinfo=timezone.utc))
+        self.assertEqual(self.server.authorizations, [None, None, 'Bearer token-1'])
+        self.api.sign_out()
+        self.assertIsNone(self.api.session_manager.authorization)
+
+    def test_create_many_chunks_under_bounded_concurrency(self) -> None:
+        inputs = [{'username': f'user{i}', 'password': 'secret'} for i in range(20)]
+        async def main():
+            async with self.api.request_manager:
+                return await self.api.users.create_many(inputs, chunk_size=3)
+        users = run(main())
+        self.assertEqual([u['username'] for u in users], [i['username'] for i in inputs])
+        self.assertEqual(len(self.server.paths), 7)
+        self.assertEqual(self.server.max_active, 2)
+
+    def test_list_iterates_pages(self) -> None:
+        for i in range(25):
+            self.server.create('users', {'username': f'user{i}', 'password': 'secret'})
+        async def main():
+            async with self.api.request_manager:
+                return [u async for u in self.api.users.find().skip(2).iter(page_size=10)]
+        users = run(main())
+        self.assertEqual([u['username'] for u in users], [f'user{i}' for i in range(2, 25)])
+        self.assertEqual(self.server.paths, [
+            '/users?_skip=2&_limit=10', '/users?_skip=12&_limit=10', '/users?_skip=22&_limit=10'
+        ])
+
+    def test_request_error_is_raised(self) -> None:
+        async def main():
+            async with self.api.request_manager:
+                await self.api.users.id('404')
+        with self.assertRaises(self.api.RequestError) as context:
+            run(main())
+        self.assertEqual(context.exception.status, 404)
+
+
+class StandInServer:
+
+    def __init__(self) -> None:
+        self.users: dict[str, dict] = {}
+        self.paths: list[str] = []
+        self.authorizations: list[str | None] = []
+        self.active = 0
+        self.max_active = 0
+
+    def create(self, name: str, data: dict) -> dict:
+        item = {**data, 'id': str(len(self.users) + 1), 'createdAt': '2020-01-02T00:00:00.000Z'}
+        self.users[item['id']] = item
+        return {k: v for (k, v) in item.items() if k != 'password'}
+
+    def query(self, qs: str) -> dict[str, str]:
+        return dict(item.split('=', 1) for item in qs.split('&') if item != '')
+
+    async def __call__(self, scope, receive, send) -> None:
+        body = b''
+        while True:
+            message = await receive()
+            body += message.get('body', b'')
+            if not message.get('more_body'):
+                break
+        qs = scope['query_string'].decode()
+        self.paths.append(scope['path'] + ('?' + qs if qs else ''))
+        headers = dict(scope['headers'])
+        authorization = headers.get(b'authorization')
+        self.authorizations.append(authorization.decode() if authorization else None)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await sleep(0.01)
+        self.active -= 1
+        (status, data) = self.handle(scope['method'], scope['path'].split('/')[1:], self.query(qs),
+                                     loads(body) if body else None)
+        content = dumps({'data': data}).encode()
+        await send({'type': 'http.response.start', 'status': status,
+                    'headers': [(b'content-type', b'application/json')]})
+        await send({'type': 'http.response.body', 'body': content})
+
+    def handle(self, method: str, path: list[str], query: dict[str, str], body: dict | None) -> tuple[int, object]:
+        public = lambda item: {k: v for (k, v) in item.items() if k != 'password'}
+        match (method, path):
+            case ('POST', ['users', 'session']):
+                user = next(u for u in self.users.values() if u['username'] == body['username'])
+                return (200, {'token': f'token-{user["id"]}', 'user': public(user)})
+            case ('POST', ['users']) if '_create' in body:
+                return (200, [self.create('users', item) for item in body['_create']])
+            case ('POST', ['users']):
+                return (200, self.create('users', body))
+            case ('GET', ['users']):
+                items = [public(u) for u in self.users.values()]
+                skip = int(query.get('_skip', 0))
+                return (200, items[skip:skip + int(query.get('_limit', len(items)))])
+            case ('GET', ['users', id]) if id in self.users:
+                return (200, public(self.users[id]))
+        return (404, None)
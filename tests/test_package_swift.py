@@ -80,3 +80,9 @@ class TestPackageSwift(TestCase):
         self.assertEqual(result.read_text(), expect.read_text())
         self.assertEqual(result.read_text(), expect.read_text())
 
+
+    def test_package_create_with_jobs_is_identical(self) -> None:
+        package(self.temp_path, self.cls_dir / 'linkto_session.py', 'swift', 'linkto_session', True, False, 2)
+        result = self.swift_path / 'Sources' / 'API' / 'API.swift'
+        expect = self.data_path / 'linkto_session_api.swift'
+        self.assertEqual(result.read_text(), expect.read_text())
@@ -78,3 +78,21 @@ class TestPackageTs(TestCase):
         result = self.ts_path / 'src' / 'index.ts'
         expect = self.data_dir / 'linkto_api.ts'
         self.assertEqual(result.read_text(), expect.read_text())
+
+    def test_package_create_with_dates_linkto_and_session(self) -> None:
+        package(self.temp_path, self.cls_dir / 'linkto_date_session.py', 'ts', 'linkto_date_session', True)
+        result = self.ts_path / 'src' / 'index.ts'
+        expect = self.data_dir / 'linkto_date_session_api.ts'
+        self.assertEqual(result.read_text(), expect.read_text())
+
+    def test_package_create_with_validators(self) -> None:
+        package(self.temp_path, self.cls_dir / 'validate.py', 'ts', 'validate', True, True)
+        result = self.ts_path / 'src' / 'index.ts'
+        expect = self.data_dir / 'validate_api.ts'
+        self.assertEqual(result.read_text(), expect.read_text())
+
+    def test_package_create_with_jobs_is_identical(self) -> None:
+        package(self.temp_path, self.cls_dir / 'validate.py', 'ts', 'validate', True, True, 2)
+        result = self.ts_path / 'src' / 'index.ts'
+        expect = self.data_dir / 'validate_api.ts'
+        self.assertEqual(result.read_text(), expect.read_text())
@@ -0,0 +1,106 @@
+from __future__ import annotations
+from typing import Callable
+from os import getcwd, utime
+from io import StringIO
+from unittest import TestCase
+from tempfile import TemporaryDirectory
+from threading import Thread, Event
+from contextlib import redirect_stdout, redirect_stderr
+from pathlib import Path
+from time import sleep, monotonic
+from jsonclasses.cgraph import CGraph
+from jsonclasses_cli.package import render
+from jsonclasses_cli.package.watch import watch, _rebuild
+from jsonclasses_cli.utils.import_app import reload_app
+from jsonclasses_cli.utils.write_file import write_file
+
+
+class TestPackageWatch(TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = TemporaryDirectory()
+        self.temp_path = Path(str(self.temp_dir.name))
+        source = (Path(getcwd()) / 'tests' / 'classes' / 'simple_song.py').read_text()
+        self.source = source.replace("class_graph='simple'", "class_graph='watch'")
+        self.output = self.temp_path / 'packages' / 'ts' / 'src' / 'index.ts'
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def write_app(self, app_file: Path, content: str) -> None:
+        mtime = app_file.stat().st_mtime if app_file.exists() else 0
+        app_file.write_text(content)
+        if app_file.stat().st_mtime <= mtime:
+            utime(app_file, (mtime + 1, mtime + 1))
+
+    def add_field(self) -> str:
+        return self.source.replace('    name: str\n', '    name: str\n    artist: str\n')
+
+    def test_reload_app_picks_up_new_field(self) -> None:
+        app_file = self.temp_path / 'watch_reload_app.py'
+        self.write_app(app_file, self.source)
+        with redirect_stdout(StringIO()):
+            self.assertTrue(_rebuild(self.temp_path, app_file, 'ts', 'watch', False, True))
+        before = self.output.read_text()
+        self.assertNotIn('artist', before)
+        self.write_app(app_file, self.add_field())
+        reload_app(app_file, 'watch')
+        self.assertIn('artist', [f.name for f in CGraph('watch').fetch('SimpleSong').fields])
+        with redirect_stdout(StringIO()):
+            self.assertTrue(_rebuild(self.temp_path, app_file, 'ts', 'watch', False, True))
+        after = self.output.read_text()
+        self.assertNotEqual(before, after)
+        self.assertIn('artist: string', after)
+
+    def test_rebuild_without_changes_writes_nothing(self) -> None:
+        app_file = self.temp_path / 'watch_identical_app.py'
+        self.write_app(app_file, self.source)
+        with redirect_stdout(StringIO()):
+            self.assertTrue(_rebuild(self.temp_path, app_file, 'ts', 'watch', False, True))
+        files = render(self.temp_path, CGraph('watch'), 'ts')
+        mtimes = {path: path.stat().st_mtime_ns for path in files}
+        out = StringIO()
+        with redirect_stdout(out):
+            self.assertTrue(_rebuild(self.temp_path, app_file, 'ts', 'watch', False, True))
+        self.assertEqual(out.getvalue(), '')
+        self.assertEqual({path: path.stat().st_mtime_ns for path in files}, mtimes)
+        for (path, content) in files.items():
+            self.assertFalse(write_file(path, content, True))
+        self.assertTrue(write_file(self.output, self.output.read_text() + '\n', True))
+
+    def test_watch_survives_syntax_error(self) -> None:
+        app_file = self.temp_path / 'watch_loop_app.py'
+        self.write_app(app_file, self.source)
+        stopped = Event()
+        out = StringIO()
+        thread = Thread(target=watch, args=(self.temp_path, app_file, 'ts', 'watch'),
+                        kwargs={'interval': 0.02, 'debounce': 0.02, 'silent': True, 'stopped': stopped})
+        with redirect_stdout(out), redirect_stderr(StringIO()):
+            thread.start()
+            try:
+                self.wait_for(lambda: self.output.is_file(), 'initial build')
+                self.write_app(app_file, self.source + '\nclass Broken(\n')
+                sleep(0.2)
+                self.assertTrue(thread.is_alive())
+                self.write_app(app_file, self.add_field())
+                self.wait_for(lambda: 'artist: string' in self.output.read_text(), 'rebuild after fix')
+                self.assertTrue(thread.is_alive())
+            finally:
+                stopped.set()
+                thread.join()
+        self.assertEqual(out.getvalue(), '')
+
+    def test_rebuild_reports_syntax_error(self) -> None:
+        app_file = self.temp_path / 'watch_broken_app.py'
+        self.write_app(app_file, self.source + '\nclass Broken(\n')
+        out = StringIO()
+        with redirect_stdout(out), redirect_stderr(StringIO()):
+            self.assertFalse(_rebuild(self.temp_path, app_file, 'ts', 'watch', False))
+        self.assertIn('FAILED waiting for changes', out.getvalue())
+
+    def wait_for(self, condition: Callable[[], bool], what: str) -> None:
+        deadline = monotonic() + 10
+        while not condition():
+            if monotonic() > deadline:
+                self.fail(f'timed out waiting for {what}')
+            sleep(0.01)
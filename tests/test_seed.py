@@ -0,0 +1,62 @@
+from __future__ import annotations
+from os import getcwd
+from random import Random
+from datetime import datetime
+from importlib.util import find_spec
+from unittest import TestCase, skipIf
+from pathlib import Path
+
+
+@skipIf(find_spec('jsonclasses_pymongo') is None, 'jsonclasses-pymongo is not installed')
+class TestSeed(TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.app_file = Path(getcwd()) / 'tests' / 'classes' / 'seed.py'
+        from jsonclasses_cli.utils.import_app import import_app
+        cls.app = import_app(cls.app_file)
+
+    def test_seed_generates_models_in_reference_order(self) -> None:
+        from jsonclasses_cli.seed import seed
+        stats = seed(self.app_file, 30, {'Post': 50}, 8, dry_run=True, cgraph_name='seed', silent=True)
+        self.assertEqual(list(stats.keys()), ['Author', 'Post'])
+        self.assertEqual([stats['Author'][:2], stats['Post'][:2]], [(30, 0), (50, 0)])
+
+    def test_seed_with_jobs_generates_same_counts(self) -> None:
+        from jsonclasses_cli.seed import seed
+        stats = seed(self.app_file, 30, {'Post': 50}, 8, 2, True, cgraph_name='seed', silent=True)
+        self.assertEqual([stats['Author'][:2], stats['Post'][:2]], [(30, 0), (50, 0)])
+
+    def test_seed_rejects_unknown_model(self) -> None:
+        from jsonclasses_cli.seed import seed
+        with self.assertRaises(ValueError):
+            seed(self.app_file, 1, {'Comment': 1}, dry_run=True, cgraph_name='seed', silent=True)
+
+    def test_fake_input_honors_modifiers_and_links(self) -> None:
+        from jsonclasses_cli.seed.fake import fake_input
+        (author, post) = (self.app.Author.cdef, self.app.Post.cdef)
+        rng = Random(0)
+        for _ in range(200):
+            data = fake_input(author, rng, {})
+            self.assertTrue(2 <= len(data['name']) <= 20)
+            self.assertTrue(data['email'].endswith('@example.com'))
+            self.assertTrue(author.cls(**data).is_valid)
+            data = fake_input(post, rng, {'Author': ['6ad60962388b5a5f25a5db5e']})
+            self.assertTrue(len(data['title']) <= 40)
+            self.assertEqual(data['author_id'], '6ad60962388b5a5f25a5db5e')
+            self.assertTrue(post.cls(**data).is_valid)
+
+    def test_document_matches_stored_layout(self) -> None:
+        from bson.objectid import ObjectId
+        from jsonclasses_cli.seed.document import document
+        doc = document(self.app.Author(name='John', email='j@example.com', role=self.app.Role.WRITER,
+                                       birthday='2000-01-02'))
+        self.assertIsInstance(doc['_id'], ObjectId)
+        self.assertEqual(doc['role'], 'writer')
+        self.assertEqual(doc['birthday'], datetime.fromisoformat('2000-01-02T00:00:00+00:00'))
+        self.assertIn('createdAt', doc)
+        self.assertNotIn('posts', doc)
+        doc = document(self.app.Post(title='Hi', tags=['a'], author_id='6ad60962388b5a5f25a5db5e'))
+        self.assertEqual(doc['authorId'], ObjectId('6ad60962388b5a5f25a5db5e'))
+        self.assertEqual(doc['tags'], ['a'])
+        self.assertNotIn('rating', doc)
@@ -0,0 +1,170 @@
+from __future__ import annotations
+from os import environ, getcwd
+from sys import executable
+from asyncio import run
+from json import dumps, loads
+from socket import socket
+from signal import SIGINT
+from subprocess import Popen, PIPE, STDOUT
+from time import sleep
+from urllib.request import urlopen
+from unittest import TestCase
+from tempfile import TemporaryDirectory
+from pathlib import Path
+from jsonclasses.uconf import UserConf
+from jsonclasses_cli.serve import serve_conf, cpu_cores
+from jsonclasses_cli.serve.supervisor import Supervisor
+from jsonclasses_cli.serve.stats import Recorder, StatsMiddleware, Window, SAMPLE_SIZE, format_summary
+
+
+class TestServe(TestCase):
+
+    def test_serve_conf_uses_defaults_without_serve_section(self) -> None:
+        conf = serve_conf(UserConf({}))
+        self.assertEqual(conf['host'], '127.0.0.1')
+        self.assertEqual(conf['workers'], 1)
+        self.assertEqual(conf['keep_alive'], 5)
+
+    def test_serve_conf_resolves_auto_workers_to_cpu_cores(self) -> None:
+        conf = serve_conf(UserConf({'serve': {'workers': 'auto', 'loop': 'uvloop', 'max_requests': 1000}}))
+        self.assertEqual(conf['workers'], cpu_cores())
+        self.assertEqual(conf['loop'], 'uvloop')
+        self.assertEqual(conf['max_requests'], 1000)
+
+    def test_serve_conf_prefers_overrides(self) -> None:
+        conf = serve_conf(UserConf({'serve': {'port': 8000, 'workers': 4}}), port=9000, workers=None)
+        self.assertEqual(conf['port'], 9000)
+        self.assertEqual(conf['workers'], 4)
+
+    def test_recorder_keeps_a_bounded_sample(self) -> None:
+        recorder = Recorder()
+        for i in range(SAMPLE_SIZE * 3):
+            recorder.record(i / 1000)
+        (count, latencies) = recorder.take()
+        self.assertEqual(count, SAMPLE_SIZE * 3)
+        self.assertEqual(len(latencies), SAMPLE_SIZE)
+        self.assertEqual(recorder.take(), (0, []))
+        self.assertEqual(recorder.total, SAMPLE_SIZE * 3)
+
+    def test_middleware_records_http_requests_only(self) -> None:
+        async def app(scope, receive, send):
+            pass
+        recorder = Recorder()
+        middleware = StatsMiddleware(app, recorder)
+        run(middleware({'type': 'http'}, None, None))
+        run(middleware({'type': 'lifespan'}, None, None))
+        self.assertEqual(recorder.total, 1)
+
+    def test_window_summarizes_workers(self) -> None:
+        window = Window()
+        window.add(1, 3, [0.001, 0.002, 0.003], 10 * 1024 * 1024, 3)
+        window.add(2, 1, [0.004], 30 * 1024 * 1024, 1)
+        window.remove(3)
+        summary = window.summary(2)
+        self.assertEqual(summary['requests'], 4)
+        self.assertEqual(summary['p50'], 0.002)
+        self.assertEqual(summary['max'], 0.004)
+        self.assertEqual(summary['rss_max'], 30 * 1024 * 1024)
+        self.assertIn('rss 20.0MB avg 30.0MB max', format_summary(summary))
+
+
+class TestSupervisorReap(TestCase):
+
+    def test_failed_replacement_respawns_a_gone_worker(self) -> None:
+        supervisor = StubSupervisor(Path(getcwd()), Path(getcwd()) / 'app.py',
+                                    {'host': '127.0.0.1', 'port': 0, 'backlog': 16, 'graceful_timeout': 5})
+        supervisor.processes = {1: StubProcess(False, 1), 2: StubProcess(True, 0), 3: StubProcess(False, 1)}
+        supervisor.ready = {1, 2}
+        supervisor.replacing = {3: 1}
+        supervisor.reap()
+        self.assertEqual(supervisor.spawned, 1)
+        self.assertEqual(supervisor.replacing, {})
+        supervisor.processes[4] = StubProcess(False, 1)
+        supervisor.replacing = {4: 2}
+        supervisor.reap()
+        self.assertEqual(supervisor.spawned, 1)
+        self.assertIn(2, supervisor.processes)
+
+
+class StubSupervisor(Supervisor):
+
+    spawned = 0
+
+    def spawn(self) -> int:
+        self.spawned += 1
+        return 0
+
+
+class StubProcess:
+
+    def __init__(self, alive: bool, exitcode: int) -> None:
+        self.alive = alive
+        self.exitcode = exitcode
+
+    def is_alive(self) -> bool:
+        return self.alive
+
+    def join(self) -> None:
+        pass
+
+
+class TestServeRecycle(TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.dest = Path(self.temp_dir.name)
+        self.port = free_port()
+        self.stats_port = free_port()
+        (self.dest / 'app.py').write_text(APP)
+        (self.dest / 'config.json').write_text(dumps({'serve': {
+            'port': self.port, 'workers': 2, 'maxRequests': 10, 'statsInterval': 1,
+            'statsPort': self.stats_port, 'gracefulTimeout': 5
+        }}))
+
+    def test_serve_recycles_workers_without_dropping_requests(self) -> None:
+        env = {**environ, 'PYTHONPATH': getcwd()}
+        process = Popen([executable, '-c', 'from jsonclasses_cli import app; app()', 'serve'],
+                        cwd=self.dest, env=env, stdout=PIPE, stderr=STDOUT, text=True)
+        try:
+            wait_for(self.port)
+            pids = set()
+            for _ in range(60):
+                pids.add(urlopen(f'http://127.0.0.1:{self.port}/').read())
+                sleep(0.05)
+            stats = loads(urlopen(f'http://127.0.0.1:{self.stats_port}/').read())
+        finally:
+            process.send_signal(SIGINT)
+            output = process.communicate(timeout=20)[0]
+        self.assertGreater(len(pids), 2)
+        self.assertIn('Recycling worker', output)
+        self.assertEqual(stats['workers'], 2)
+        self.assertIn('Stats: 2 workers', output)
+        self.assertEqual(process.returncode, 0)
+
+
+APP = """
+from os import getpid
+
+
+async def app(scope, receive, send):
+    if scope['type'] != 'http':
+        return
+    await send({'type': 'http.response.start', 'status': 200, 'headers': []})
+    await send({'type': 'http.response.body', 'body': str(getpid()).encode()})
+"""
+
+
+def free_port() -> int:
+    with socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def wait_for(port: int) -> None:
+    for _ in range(100):
+        try:
+            urlopen(f'http://127.0.0.1:{port}/')
+            return
+        except OSError:
+            sleep(0.1)
@@ -0,0 +1,35 @@
+from __future__ import annotations
+from os import environ, getcwd
+from sys import executable
+from subprocess import run
+from unittest import TestCase, skipUnless
+
+
+class TestStartup(TestCase):
+
+    heavy_modules = ['jsonclasses', 'jsonclasses_server', 'rich', 'rich.table', 'inflection',
+                     'jsonclasses_cli.package', 'jsonclasses_cli.loadtest', 'jsonclasses_cli.mock',
+                     'jsonclasses_cli.seed', 'jsonclasses_cli.serve']
+
+    def import_times(self, code: str) -> dict[str, int]:
+        result = run([executable, '-X', 'importtime', '-c', code],
+                     cwd=getcwd(), capture_output=True, text=True)
+        times: dict[str, int] = {}
+        for line in result.stderr.splitlines():
+            if not line.startswith('import time:') or 'cumulative' in line:
+                continue
+            (_, cumulative, name) = line.removeprefix('import time:').split('|')
+            times[name.strip()] = int(cumulative)
+        return times
+
+    def test_startup_does_not_import_heavy_modules(self) -> None:
+        for code in ['import jsonclasses_cli', "from jsonclasses_cli import app; app(['--version'])"]:
+            times = self.import_times(code)
+            self.assertIn('jsonclasses_cli', times)
+            for name in self.heavy_modules:
+                self.assertNotIn(name, times)
+
+    @skipUnless(environ.get('STARTUP_BUDGET_MS'), 'STARTUP_BUDGET_MS is not set')
+    def test_startup_is_within_budget(self) -> None:
+        times = self.import_times('import jsonclasses_cli')
+        self.assertLess(times['jsonclasses_cli'], float(environ['STARTUP_BUDGET_MS']) * 1000)
@@ -0,0 +1,101 @@
+from __future__ import annotations
+from os import getcwd
+from time import sleep
+from threading import Lock
+from datetime import datetime, timezone
+from importlib.util import find_spec
+from unittest import TestCase, skipIf
+from tempfile import TemporaryDirectory
+from pathlib import Path
+
+
+@skipIf(find_spec('jsonclasses_pymongo') is None, 'jsonclasses-pymongo is not installed')
+class TestTransfer(TestCase):
+
+    def setUp(self) -> None:
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_path = Path(str(temp_dir.name))
+        self.app_file = Path(getcwd()) / 'tests' / 'classes' / 'indexes.py'
+
+    def documents(self, count: int) -> list[dict]:
+        from bson.objectid import ObjectId
+        created_at = datetime(2021, 5, 6, 7, 8, 9, 123000, tzinfo=timezone.utc)
+        return [{'_id': ObjectId(), 'title': f'post {i}', 'views': i, 'authorId': ObjectId(),
+                 'tags': ['a', 'b'], 'createdAt': created_at} for i in range(count)]
+
+    def test_dump_and_restore_round_trip(self) -> None:
+        from jsonclasses_cli.transfer.ndjson import dump_collection, restore_collection
+        documents = self.documents(25)
+        for name in ['posts.ndjson', 'posts.ndjson.gz']:
+            source = StandInCollection(list(reversed(documents)))
+            self.assertEqual(dump_collection(source, self.temp_path / name, 10), 25)
+            self.assertEqual(source.batch_size, 10)
+            dest = StandInCollection()
+            self.assertEqual(restore_collection(dest, self.temp_path / name, 10, 2), (25, 0))
+            self.assertEqual(sorted(dest.documents, key=lambda d: d['_id']), documents)
+            self.assertEqual(sorted(len(b) for b in dest.batches), [5, 10, 10])
+        self.assertEqual(len((self.temp_path / 'posts.ndjson').read_text().splitlines()), 25)
+
+    def test_restore_counts_rejected_rows(self) -> None:
+        from jsonclasses_cli.transfer.ndjson import dump_collection, restore_collection
+        documents = self.documents(10)
+        dump_collection(StandInCollection(documents), self.temp_path / 'posts.ndjson')
+        dest = StandInCollection(documents[:3])
+        self.assertEqual(restore_collection(dest, self.temp_path / 'posts.ndjson', 4, 2), (7, 3))
+
+    def test_restore_bounds_writes_in_flight(self) -> None:
+        from jsonclasses_cli.transfer.ndjson import dump_collection, restore_collection
+        dump_collection(StandInCollection(self.documents(40)), self.temp_path / 'posts.ndjson')
+        dest = StandInCollection(delay=0.01)
+        self.assertEqual(restore_collection(dest, self.temp_path / 'posts.ndjson', 2, 3), (40, 0))
+        self.assertEqual(dest.max_active, 3)
+
+    def test_restore_raises_writer_errors(self) -> None:
+        from jsonclasses_cli.transfer.ndjson import dump_collection, restore_collection
+        dump_collection(StandInCollection(self.documents(40)), self.temp_path / 'posts.ndjson')
+        with self.assertRaises(ConnectionError):
+            restore_collection(StandInCollection(fail=True), self.temp_path / 'posts.ndjson', 2, 2)
+
+    def test_import_checks_models_and_files(self) -> None:
+        from jsonclasses_cli.transfer import import_models
+        with self.assertRaisesRegex(ValueError, 'unknown models: Comment'):
+            import_models(self.temp_path, self.app_file, ['Comment'], 'mongodb://localhost:1/app',
+                          cgraph_name='indexes', silent=True)
+        with self.assertRaisesRegex(ValueError, 'collection \'posts\''):
+            import_models(self.temp_path, self.app_file, ['Post'], 'mongodb://localhost:1/app',
+                          cgraph_name='indexes', silent=True)
+
+
+class StandInCollection:
+
+    def __init__(self, documents: list[dict] | None = None, delay: float = 0, fail: bool = False) -> None:
+        self.documents = list(documents or [])
+        self.batches: list[list[dict]] = []
+        self.batch_size = None
+        self.delay = delay
+        self.fail = fail
+        self.active = 0
+        self.max_active = 0
+        self.lock = Lock()
+
+    def find(self, filter: dict, batch_size: int, sort: list[tuple[str, int]]):
+        self.batch_size = batch_size
+        return iter(sorted(self.documents, key=lambda d: d[sort[0][0]]))
+
+    def insert_many(self, documents: list[dict], ordered: bool) -> None:
+        from pymongo.errors import BulkWriteError
+        if self.fail:
+            raise ConnectionError('connection refused')
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+            self.batches.append(documents)
+            ids = {d['_id'] for d in self.documents}
+            errors = [{'index': i} for (i, d) in enumerate(documents) if d['_id'] in ids]
+            self.documents.extend(d for d in documents if d['_id'] not in ids)
+        if len(errors) > 0:
+            raise BulkWriteError({'writeErrors': errors, 'nInserted': len(documents) - len(errors)})